@@ -33,7 +33,7 @@ antsibull_nox.load_antsibull_nox_toml()
 @nox.session(name="update-docs", default=True)
 def update_docs_fragments(session: nox.Session) -> None:
     """
-    Update/check auto-generated parts of docs fragments.
+    Update/check auto-generated parts of docs fragments and the API data cache.
     """
     session.install("ansible-core")
     prepare = antsibull_nox.sessions.prepare_collections(
@@ -41,10 +41,39 @@ def update_docs_fragments(session: nox.Session) -> None:
     )
     if not prepare:
         return
-    data = ["python", "tests/update-docs.py"]
-    if IN_CI:
-        data.append("--lint")
-    session.run(*data)
+    for script in ("tests/update-docs.py", "tests/update-api-data-cache.py"):
+        data = ["python", script]
+        if IN_CI:
+            data.append("--lint")
+        session.run(*data)
+
+
+@nox.session(name="benchmark-api-data", default=False)
+def benchmark_api_data(session: nox.Session) -> None:
+    """
+    Measure import time, creation time, and memory use of the API data.
+    """
+    session.install("ansible-core")
+    prepare = antsibull_nox.sessions.prepare_collections(
+        session, install_in_site_packages=True
+    )
+    if not prepare:
+        return
+    session.run("python", "tests/benchmark-api-data.py", *session.posargs)
+
+
+@nox.session(name="benchmark-api-modify", default=False)
+def benchmark_api_modify(session: nox.Session) -> None:
+    """
+    Count the API calls of api_modify for generated tables.
+    """
+    session.install("ansible-core")
+    prepare = antsibull_nox.sessions.prepare_collections(
+        session, install_in_site_packages=True
+    )
+    if not prepare:
+        return
+    session.run("python", "tests/benchmark-api-modify.py", *session.posargs)
 
 
 # Allow to run the noxfile with `python noxfile.py`, `pipx run noxfile.py`, or similar.
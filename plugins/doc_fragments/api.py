@@ -116,6 +116,9 @@ options:
           - 'Note that the types of the values are important. If you provide a string V("0"), and librouteros converts the
             value returned by the API to the integer V(0), then this will not match. If you are not sure, better include both
             variants: both the string and the integer.'
+          - If a rule only has non-empty string values, is not inverted, does not match disabled values, has no regular expression,
+            and its field has no default value, the modules let the router select the entries with these values. The entries
+            returned by the router are always checked against all rules again.
         type: list
         elements: raw
       regex:
@@ -9,354 +9,21 @@
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
-from ansible_collections.community.routeros.plugins.module_utils.version import LooseVersion
-
-
-# ---------------------------------------------------------------------------
-# Value sanitizers
-#
-# A value sanitizer is a callable (any) -> any that normalises a user-supplied
-# field value so it matches the form RouterOS stores and returns.  Sanitizers
-# are registered on individual KeyInfo instances via the ``value_sanitizer``
-# kwarg and are applied by ``polish_entry()`` in api_modify.py before any
-# comparison or API call is made.
-#
-# CONTRACT: a sanitizer must be idempotent – applying it twice must yield the
-# same result as applying it once.
-# CONTRACT: a sanitizer must pass through any value type it does not
-# explicitly handle, leaving it unchanged.
-# ---------------------------------------------------------------------------
-
-def _sanitize_ensure_leading_slash(value):
-    # type: (any) -> any
-    """Prepend ``/`` when absent, mirroring RouterOS's implicit normalisation.
-
-    RouterOS silently prepends ``/`` to certain path fields (e.g.
-    ``container/mounts`` ``src`` and ``dst``) when entries are created or
-    updated.  Without this sanitizer Ansible would always detect a diff
-    between the user-supplied value ``usb1/data`` and the RouterOS-stored
-    value ``/usb1/data``, making the module non-idempotent.
-
-    Edge cases:
-    * Non-string value → returned as-is (type checking is the caller's
-      responsibility; this sanitizer only operates on strings).
-    * Empty string → returned as-is (RouterOS maps a missing ``src`` to ``/``,
-      but that is represented separately via the field default).
-    * Already starts with ``/`` → returned unchanged.
-    """
-    if value and isinstance(value, str) and not value.startswith('/'):
-        return '/' + value
-    return value
-
-
-# Registry of detection strategy names -> callables
-# Callables are NOT defined here (they need API access);
-# they're registered by the modules at runtime.
-# _api_data.py only stores the string keys.
-HARDWARE_DETECTOR_KEYS = {
-    'switch_chip_type',
-    # Future: 'wireless_chip_type', etc.
-}
-
-
-def _compare(a, b, comparator):
-    if comparator == '==':
-        return a == b
-    if comparator == '!=':
-        return a != b
-    if comparator == '<':
-        return a < b
-    if comparator == '<=':
-        return a <= b
-    if comparator == '>':
-        return a > b
-    if comparator == '>=':
-        return a >= b
-    raise ValueError('Unknown comparator "{comparator}"'.format(comparator=comparator))
-
-
-class Depr(object):
-    def __init__(self, version, msg, context="all"):
-        if context not in ("all", "read", "write"):
-            raise ValueError('context must be all, read, or write, but not {context!r}'.format(context=context))
-        self.context = context
-        self.version = version
-        self.msg = msg
-
-    def applies(self, context):
-        return context == self.context or self.context == "all"
-
-    def emit(self, module):
-        module.deprecate(self.msg, version=self.version, collection_name="community.routeros")
-
-
-class APIData(object):
-    def __init__(self,
-                 unversioned=None,
-                 versioned=None,
-                 hardware_detect=None,
-                 hardware_variants=None):
-
-        # --- Validation ---
-        if hardware_variants is not None:
-            if unversioned is not None or versioned is not None:
-                raise ValueError('Cannot combine hardware_variants with unversioned/versioned')
-            if hardware_detect is None:
-                raise ValueError('hardware_detect required when hardware_variants is set')
-            for key, variant in hardware_variants.items():
-                if not isinstance(variant, APIData):
-                    raise ValueError('hardware_variants[{key!r}] must be an APIData instance'.format(key=key))
-                if variant.hardware_variants is not None:
-                    raise ValueError('hardware_variants[{key!r}] must not itself have hardware_variants'.format(key=key))
-        elif hardware_detect is not None:
-            raise ValueError('hardware_detect requires hardware_variants')
-        else:
-            if (unversioned is None) == (versioned is None):
-                raise ValueError('either unversioned or versioned must be provided')
-
-        self.unversioned = unversioned
-        self.versioned = versioned
-        self.hardware_detect = hardware_detect
-        self.hardware_variants = hardware_variants
-
-        # --- Derive fully_understood, needs_version, has_identifier, modify_not_supported ---
-        if self.hardware_variants is not None:
-            # fully_understood if ANY variant is fully_understood
-            self.fully_understood = any(
-                v.fully_understood for v in self.hardware_variants.values()
-            )
-            # needs_version if ANY variant needs_version
-            self.needs_version = any(
-                v.needs_version for v in self.hardware_variants.values()
-            )
-            # has_identifier / modify_not_supported: only True when ALL variants have it
-            self.has_identifier = all(
-                v.has_identifier for v in self.hardware_variants.values()
-            )
-            self.modify_not_supported = all(
-                v.modify_not_supported for v in self.hardware_variants.values()
-            )
-        elif self.unversioned is not None:
-            self.needs_version = self.unversioned.needs_version
-            self.fully_understood = self.unversioned.fully_understood
-            self.has_identifier = self.unversioned.has_identifier
-            self.modify_not_supported = self.unversioned.modify_not_supported
-        else:
-            self.needs_version = self.versioned is not None
-            # Mark as 'fully understood' if it is for at least one version
-            self.fully_understood = False
-            for dummy, dummy, unversioned in self.versioned:
-                if unversioned and not isinstance(unversioned, str) and unversioned.fully_understood:
-                    self.fully_understood = True
-                    break
-            # Mark as 'has_identifier' only if it is for all versions
-            self.has_identifier = True
-            for dummy, dummy, unversioned in self.versioned:
-                if unversioned and not isinstance(unversioned, str) and not unversioned.has_identifier:
-                    self.has_identifier = False
-                    break
-            # Mark as 'modify_not_supported' only if it is for all versions
-            self.modify_not_supported = True
-            for dummy, dummy, unversioned in self.versioned:
-                if unversioned and not isinstance(unversioned, str) and not unversioned.modify_not_supported:
-                    self.modify_not_supported = False
-                    break
-        self._current = None if self.needs_version else self.unversioned
-
-    def _select(self, data, api_version):
-        if data is None:
-            self._current = None
-            return False, None
-        if isinstance(data, str):
-            self._current = None
-            return False, data
-        self._current = data.specialize_for_version(api_version)
-        return self._current.fully_understood, None
-
-    def provide_version(self, version):
-        if not self.needs_version:
-            return self.unversioned.fully_understood, None
-        api_version = LooseVersion(version)
-        if self.unversioned is not None:
-            self._current = self.unversioned.specialize_for_version(api_version)
-            return self._current.fully_understood, None
-        for other_version, comparator, data in self.versioned:
-            if other_version == '*' and comparator == '*':
-                return self._select(data, api_version)
-            other_api_version = LooseVersion(other_version)
-            if _compare(api_version, other_api_version, comparator):
-                return self._select(data, api_version)
-        self._current = None
-        return False, None
-
-    def get_data(self):
-        if self._current is None:
-            raise ValueError('either provide_version() was not called or it returned False')
-        return self._current
-
-
-class VersionedAPIData(object):
-    def __init__(self,
-                 primary_keys=None,
-                 stratify_keys=None,
-                 required_one_of=None,
-                 mutually_exclusive=None,
-                 has_identifier=False,
-                 modify_not_supported=False,
-                 single_value=False,
-                 unknown_mechanism=False,
-                 fully_understood=False,
-                 fixed_entries=False,
-                 fields=None,
-                 versioned_fields=None):
-        if sum([primary_keys is not None, stratify_keys is not None, has_identifier, single_value, unknown_mechanism]) > 1:
-            raise ValueError('primary_keys, stratify_keys, has_identifier, single_value, and unknown_mechanism are mutually exclusive')
-        if unknown_mechanism and fully_understood:
-            raise ValueError('unknown_mechanism and fully_understood cannot be combined')
-        self.primary_keys = primary_keys
-        self.stratify_keys = stratify_keys
-        self.required_one_of = required_one_of or []
-        self.mutually_exclusive = mutually_exclusive or []
-        self.has_identifier = has_identifier
-        self.modify_not_supported = modify_not_supported
-        self.single_value = single_value
-        self.unknown_mechanism = unknown_mechanism
-        self.fully_understood = fully_understood
-        if single_value:
-            fixed_entries = False
-        self.fixed_entries = fixed_entries
-        if fixed_entries and primary_keys is None:
-            raise ValueError('fixed_entries can only be used with primary_keys')
-        if fields is None:
-            raise ValueError('fields must be provided')
-        self.fields = fields
-        if versioned_fields is not None:
-            if not isinstance(versioned_fields, list):
-                raise ValueError('unversioned_fields must be a list')
-            for conditions, name, field in versioned_fields:
-                if not isinstance(conditions, (tuple, list)):
-                    raise ValueError('conditions must be a list or tuple')
-                if not isinstance(field, KeyInfo):
-                    raise ValueError('field must be a KeyInfo object')
-                if name in fields:
-                    raise ValueError('"{name}" appears both in fields and versioned_fields'.format(name=name))
-        self.versioned_fields = versioned_fields or []
-        if primary_keys:
-            for pk in primary_keys:
-                if pk not in fields:
-                    raise ValueError('Primary key {pk} must be in fields!'.format(pk=pk))
-        if stratify_keys:
-            for sk in stratify_keys:
-                if sk not in fields:
-                    raise ValueError('Stratify key {sk} must be in fields!'.format(sk=sk))
-        if required_one_of:
-            for index, require_list in enumerate(required_one_of):
-                if not isinstance(require_list, list):
-                    raise ValueError('Require one of element at index #{index} must be a list!'.format(index=index + 1))
-                for rk in require_list:
-                    if rk not in fields:
-                        raise ValueError('Require one of key {rk} must be in fields!'.format(rk=rk))
-        if mutually_exclusive:
-            for index, exclusive_list in enumerate(mutually_exclusive):
-                if not isinstance(exclusive_list, list):
-                    raise ValueError('Mutually exclusive element at index #{index} must be a list!'.format(index=index + 1))
-                for ek in exclusive_list:
-                    if ek not in fields:
-                        raise ValueError('Mutually exclusive key {ek} must be in fields!'.format(ek=ek))
-        self.needs_version = len(self.versioned_fields) > 0
-
-    def specialize_for_version(self, api_version):
-        fields = self.fields.copy()
-        for conditions, name, field in self.versioned_fields:
-            matching = True
-            for other_version, comparator in conditions:
-                other_api_version = LooseVersion(other_version)
-                if not _compare(api_version, other_api_version, comparator):
-                    matching = False
-                    break
-            if matching:
-                if name in fields:
-                    raise ValueError(
-                        'Internal error: field "{field}" already exists for {version}'.format(field=name, version=api_version)
-                    )
-                fields[name] = field
-        return VersionedAPIData(
-            primary_keys=self.primary_keys,
-            stratify_keys=self.stratify_keys,
-            required_one_of=self.required_one_of,
-            mutually_exclusive=self.mutually_exclusive,
-            has_identifier=self.has_identifier,
-            single_value=self.single_value,
-            unknown_mechanism=self.unknown_mechanism,
-            fully_understood=self.fully_understood,
-            fixed_entries=self.fixed_entries,
-            fields=fields,
-            modify_not_supported=self.modify_not_supported,
-        )
-
-
-class KeyInfo(object):
-    def __init__(self,
-                 _dummy=None,
-                 can_disable=False,
-                 remove_value=None,
-                 absent_value=None,
-                 default=None,
-                 required=False,
-                 automatically_computed_from=None,
-                 read_only=False,
-                 write_only=False,
-                 value_sanitizer=None,
-                 depr=None):
-        if _dummy is not None:
-            raise ValueError('KeyInfo() does not have positional arguments')
-        if sum([required, default is not None or can_disable, automatically_computed_from is not None]) > 1:
-            raise ValueError(
-                'required, default, automatically_computed_from, and can_disable are mutually exclusive '
-                'besides default and can_disable which can be set together')
-        if not can_disable and remove_value is not None:
-            raise ValueError('remove_value can only be specified if can_disable=True')
-        if absent_value is not None and any([default is not None, automatically_computed_from is not None, can_disable]):
-            raise ValueError('absent_value can not be combined with default, automatically_computed_from, can_disable=True, or absent_value')
-        if read_only and write_only:
-            raise ValueError('read_only and write_only cannot be used at the same time')
-        if read_only and any([can_disable, remove_value is not None, absent_value is not None, default is not None, required]):
-            raise ValueError('read_only can not be combined with can_disable, remove_value, absent_value, default, or required')
-
-        if value_sanitizer is not None and not callable(value_sanitizer):
-            raise ValueError('value_sanitizer must be a callable or None')
-        if value_sanitizer is not None and read_only:
-            raise ValueError(
-                'value_sanitizer cannot be combined with read_only: '
-                'read-only fields are never written so sanitisation has no effect'
-            )
-        if value_sanitizer is not None and write_only:
-            raise ValueError(
-                'value_sanitizer cannot be combined with write_only: '
-                'write-only fields cannot be read back from RouterOS so '
-                'the sanitised value cannot be verified'
-            )
-        if depr is not None and not isinstance(depr, Depr):
-            raise ValueError('depr must be a Depr instance, but got {depr!r}'.format(depr=depr))
-
-        self.can_disable = can_disable
-        self.remove_value = remove_value
-        self.automatically_computed_from = automatically_computed_from
-        self.default = default
-        self.required = required
-        self.absent_value = absent_value
-        self.read_only = read_only
-        self.write_only = write_only
-        self.value_sanitizer = value_sanitizer
-        self.depr = depr
-
-
-def split_path(path):
-    return path.split()
-
-
-def join_path(path):
-    return ' '.join(path)
+from ansible_collections.community.routeros.plugins.module_utils._api_data_base import (  # noqa: F401, pylint: disable=unused-import
+    HARDWARE_DETECTOR_KEYS,
+    APIData,
+    Depr,
+    KeyInfo,
+    LazyPathDict,
+    VersionedAPIData,
+    _canonicalize_duration,
+    _canonicalize_ip,
+    _canonicalize_mac,
+    _canonicalize_name_list,
+    _sanitize_ensure_leading_slash,
+    join_path,
+    split_path,
+)
 
 
 # How to obtain this information:
@@ -364,9 +31,13 @@ def join_path(path):
 # 2. All attributes listed there go into the `fields` list;
 #    attributes which can have a `!` ahead should have `canDisable=True`
 # 3. All bold attributes go into the `primary_keys` list -- this is not always true!
+#
+# The modules do not use PATHS directly, but the cache in _api_data_cache.py which is
+# generated from it. After modifying PATHS, run `nox -Re update-docs` to update the cache
+# and the list of paths in the module documentation.
 
-PATHS = {
-    ('app',): APIData(
+PATHS = LazyPathDict({
+    ('app',): lambda: APIData(
         versioned=[
             ('7.21', '>=', VersionedAPIData(
                 # fixed_entries=True,
@@ -410,7 +81,7 @@ PATHS = {
         ],
     ),
 
-    ('app', 'settings'): APIData(
+    ('app', 'settings'): lambda: APIData(
         versioned=[
             ('7.21', '>=', VersionedAPIData(
                 fixed_entries=True,
@@ -433,7 +104,7 @@ PATHS = {
         ],
     ),
 
-    ('caps-man', 'aaa'): APIData(
+    ('caps-man', 'aaa'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -448,7 +119,7 @@ PATHS = {
         ),
     ),
 
-    ('caps-man', 'access-list'): APIData(
+    ('caps-man', 'access-list'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             versioned_fields=[
@@ -478,7 +149,7 @@ PATHS = {
         ),
     ),
 
-    ('caps-man', 'actual-interface-configuration'): APIData(
+    ('caps-man', 'actual-interface-configuration'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 # fixed_entries=True,
@@ -548,7 +219,7 @@ PATHS = {
         ],
     ),
 
-    ('caps-man', 'channel'): APIData(
+    ('caps-man', 'channel'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -572,7 +243,7 @@ PATHS = {
         ),
     ),
 
-    ('caps-man', 'configuration'): APIData(
+    ('caps-man', 'configuration'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -645,7 +316,7 @@ PATHS = {
         ),
     ),
 
-    ('caps-man', 'datapath'): APIData(
+    ('caps-man', 'datapath'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -672,7 +343,7 @@ PATHS = {
         ),
     ),
 
-    ('caps-man', 'interface'): APIData(
+    ('caps-man', 'interface'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -754,7 +425,7 @@ PATHS = {
         ],
     ),
 
-    ('caps-man', 'manager'): APIData(
+    ('caps-man', 'manager'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -770,7 +441,7 @@ PATHS = {
         ),
     ),
 
-    ('caps-man', 'manager', 'interface'): APIData(
+    ('caps-man', 'manager', 'interface'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('interface',),
@@ -788,7 +459,7 @@ PATHS = {
         ),
     ),
 
-    ('caps-man', 'provisioning'): APIData(
+    ('caps-man', 'provisioning'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             versioned_fields=[
@@ -813,7 +484,7 @@ PATHS = {
         ),
     ),
 
-    ('caps-man', 'rates'): APIData(
+    ('caps-man', 'rates'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -835,7 +506,7 @@ PATHS = {
         ],
     ),
 
-    ('caps-man', 'security'): APIData(
+    ('caps-man', 'security'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -860,7 +531,7 @@ PATHS = {
         ),
     ),
 
-    ('certificate',): APIData(
+    ('certificate',): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -888,7 +559,7 @@ PATHS = {
         ],
     ),
 
-    ('certificate', 'crl'): APIData(
+    ('certificate', 'crl'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -901,7 +572,7 @@ PATHS = {
         ],
     ),
 
-    ('certificate', 'scep-server'): APIData(
+    ('certificate', 'scep-server'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -919,7 +590,7 @@ PATHS = {
         ],
     ),
 
-    ('certificate', 'scep-server', 'ra'): APIData(
+    ('certificate', 'scep-server', 'ra'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -941,7 +612,7 @@ PATHS = {
         ],
     ),
 
-    ('certificate', 'settings'): APIData(
+    ('certificate', 'settings'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -959,7 +630,7 @@ PATHS = {
         ),
     ),
 
-    ('console', 'settings'): APIData(
+    ('console', 'settings'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fixed_entries=True,
@@ -976,7 +647,7 @@ PATHS = {
         ],
     ),
 
-    ('container',): APIData(
+    ('container',): lambda: APIData(
         versioned=[
             ('7.19', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -1054,7 +725,7 @@ PATHS = {
         ],
     ),
 
-    ('container', 'config'): APIData(
+    ('container', 'config'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fixed_entries=True,
@@ -1075,7 +746,7 @@ PATHS = {
         ],
     ),
 
-    ('container', 'envs'): APIData(
+    ('container', 'envs'): lambda: APIData(
         versioned=[
             ('7.20', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -1106,7 +777,7 @@ PATHS = {
         ],
     ),
 
-    ('container', 'mounts'): APIData(
+    ('container', 'mounts'): lambda: APIData(
         versioned=[
             ('7.22', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -1141,7 +812,7 @@ PATHS = {
         ],
     ),
 
-    ('disk',): APIData(
+    ('disk',): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -1219,7 +890,7 @@ PATHS = {
         ],
     ),
 
-    ('disk', 'btrfs', 'filesystem'): APIData(
+    ('disk', 'btrfs', 'filesystem'): lambda: APIData(
         versioned=[
             ('7.18', '>=', VersionedAPIData(
                 # fixed_entries=True,
@@ -1235,7 +906,7 @@ PATHS = {
         ],
     ),
 
-    ('disk', 'btrfs', 'subvolume'): APIData(
+    ('disk', 'btrfs', 'subvolume'): lambda: APIData(
         versioned=[
             ('7.18', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -1253,7 +924,7 @@ PATHS = {
         ],
     ),
 
-    ('disk', 'btrfs', 'transfer'): APIData(
+    ('disk', 'btrfs', 'transfer'): lambda: APIData(
         versioned=[
             ('7.18', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -1273,7 +944,7 @@ PATHS = {
         ],
     ),
 
-    ('disk', 'settings'): APIData(
+    ('disk', 'settings'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -1290,7 +961,7 @@ PATHS = {
         ),
     ),
 
-    ('dude',): APIData(
+    ('dude',): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fixed_entries=True,
@@ -1304,7 +975,7 @@ PATHS = {
         ],
     ),
 
-    ('dude', 'agent'): APIData(
+    ('dude', 'agent'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -1318,7 +989,7 @@ PATHS = {
         ],
     ),
 
-    ('dude', 'device'): APIData(
+    ('dude', 'device'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -1332,7 +1003,7 @@ PATHS = {
         ],
     ),
 
-    ('dude', 'device-type'): APIData(
+    ('dude', 'device-type'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -1346,7 +1017,7 @@ PATHS = {
         ],
     ),
 
-    ('dude', 'notification'): APIData(
+    ('dude', 'notification'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -1360,7 +1031,7 @@ PATHS = {
         ],
     ),
 
-    ('dude', 'probe'): APIData(
+    ('dude', 'probe'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -1374,7 +1045,7 @@ PATHS = {
         ],
     ),
 
-    ('dude', 'ros', 'address'): APIData(
+    ('dude', 'ros', 'address'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -1394,7 +1065,7 @@ PATHS = {
         ],
     ),
 
-    ('dude', 'ros', 'arp'): APIData(
+    ('dude', 'ros', 'arp'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -1413,7 +1084,7 @@ PATHS = {
         ],
     ),
 
-    ('dude', 'ros', 'health'): APIData(
+    ('dude', 'ros', 'health'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 # fixed_entries=True,
@@ -1438,7 +1109,7 @@ PATHS = {
         ],
     ),
 
-    ('dude', 'ros', 'interface'): APIData(
+    ('dude', 'ros', 'interface'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 # fixed_entries=True,
@@ -1458,7 +1129,7 @@ PATHS = {
         ],
     ),
 
-    ('dude', 'ros', 'lease'): APIData(
+    ('dude', 'ros', 'lease'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -1486,7 +1157,7 @@ PATHS = {
         ],
     ),
 
-    ('dude', 'ros', 'neighbor'): APIData(
+    ('dude', 'ros', 'neighbor'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 # fixed_entries=True,
@@ -1501,7 +1172,7 @@ PATHS = {
         ],
     ),
 
-    ('dude', 'ros', 'queue'): APIData(
+    ('dude', 'ros', 'queue'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -1538,7 +1209,7 @@ PATHS = {
         ],
     ),
 
-    ('dude', 'ros', 'resource'): APIData(
+    ('dude', 'ros', 'resource'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 # fixed_entries=True,
@@ -1553,7 +1224,7 @@ PATHS = {
         ],
     ),
 
-    ('dude', 'ros', 'route'): APIData(
+    ('dude', 'ros', 'route'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -1586,7 +1257,7 @@ PATHS = {
         ],
     ),
 
-    ('dude', 'ros', 'routerboard'): APIData(
+    ('dude', 'ros', 'routerboard'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 # fixed_entries=True,
@@ -1601,7 +1272,7 @@ PATHS = {
         ],
     ),
 
-    ('dude', 'service'): APIData(
+    ('dude', 'service'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -1615,7 +1286,7 @@ PATHS = {
         ],
     ),
 
-    ('file',): APIData(
+    ('file',): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -1632,7 +1303,7 @@ PATHS = {
         ],
     ),
 
-    ('file', 'rsync-daemon'): APIData(
+    ('file', 'rsync-daemon'): lambda: APIData(
         versioned=[
             ('7.16', '>=', VersionedAPIData(
                 fixed_entries=True,
@@ -1645,7 +1316,7 @@ PATHS = {
         ],
     ),
 
-    ('file', 'sync'): APIData(
+    ('file', 'sync'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -1669,7 +1340,7 @@ PATHS = {
         ],
     ),
 
-    ('interface',): APIData(
+    ('interface',): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 # fixed_entries=True,
@@ -1688,7 +1359,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', '6to4'): APIData(
+    ('interface', '6to4'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -1712,7 +1383,7 @@ PATHS = {
         ),
     ),
 
-    ('interface', 'amt'): APIData(
+    ('interface', 'amt'): lambda: APIData(
         versioned=[
             ('7.19', '>=', 'Not supported anymore in version  >= 7.19'),
             ('7.18', '>=', VersionedAPIData(
@@ -1737,7 +1408,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'bonding'): APIData(
+    ('interface', 'bonding'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -1774,7 +1445,7 @@ PATHS = {
         ),
     ),
 
-    ('interface', 'bridge'): APIData(
+    ('interface', 'bridge'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -1812,7 +1483,7 @@ PATHS = {
                 ([('7.20', '>=')], 'startup-query-interval', KeyInfo(default='31s250ms')),
             ],
             fields={
-                'admin-mac': KeyInfo(default=''),
+                'admin-mac': KeyInfo(default='', value_canonicalizer=_canonicalize_mac),
                 'ageing-time': KeyInfo(default='5m'),
                 'arp': KeyInfo(default='enabled'),
                 'arp-timeout': KeyInfo(default='auto'),
@@ -1839,7 +1510,7 @@ PATHS = {
         ),
     ),
 
-    ('interface', 'bridge', 'calea'): APIData(
+    ('interface', 'bridge', 'calea'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -1909,7 +1580,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'bridge', 'filter'): APIData(
+    ('interface', 'bridge', 'filter'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -1980,7 +1651,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'bridge', 'host'): APIData(
+    ('interface', 'bridge', 'host'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -1998,7 +1669,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'bridge', 'mdb'): APIData(
+    ('interface', 'bridge', 'mdb'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -2019,7 +1690,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'bridge', 'mlag'): APIData(
+    ('interface', 'bridge', 'mlag'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -2035,7 +1706,7 @@ PATHS = {
         ),
     ),
 
-    ('interface', 'bridge', 'msti'): APIData(
+    ('interface', 'bridge', 'msti'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -2053,7 +1724,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'bridge', 'nat'): APIData(
+    ('interface', 'bridge', 'nat'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -2127,7 +1798,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'bridge', 'port'): APIData(
+    ('interface', 'bridge', 'port'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('interface',),
@@ -2174,7 +1845,7 @@ PATHS = {
         ),
     ),
 
-    ('interface', 'bridge', 'port', 'mst-override'): APIData(
+    ('interface', 'bridge', 'port', 'mst-override'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -2192,7 +1863,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'bridge', 'port-controller'): APIData(
+    ('interface', 'bridge', 'port-controller'): lambda: APIData(
         versioned=[
             ('7.18', '>=', 'Not supported anymore in version  >= 7.18'),
             ('7.18', '<', VersionedAPIData(
@@ -2208,7 +1879,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'bridge', 'port-controller', 'device'): APIData(
+    ('interface', 'bridge', 'port-controller', 'device'): lambda: APIData(
         versioned=[
             ('7.18', '>=', 'Not supported anymore in version  >= 7.18'),
             ('7.15', '>=', VersionedAPIData(
@@ -2222,7 +1893,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'bridge', 'port-controller', 'port'): APIData(
+    ('interface', 'bridge', 'port-controller', 'port'): lambda: APIData(
         versioned=[
             ('7.18', '>=', 'Not supported anymore in version  >= 7.18'),
             ('7.15', '>=', VersionedAPIData(
@@ -2239,7 +1910,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'bridge', 'port-extender'): APIData(
+    ('interface', 'bridge', 'port-extender'): lambda: APIData(
         versioned=[
             ('7.18', '>=', 'Not supported anymore in version  >= 7.18'),
             ('7.18', '<', VersionedAPIData(
@@ -2255,7 +1926,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'bridge', 'settings'): APIData(
+    ('interface', 'bridge', 'settings'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -2269,7 +1940,7 @@ PATHS = {
         ),
     ),
 
-    ('interface', 'bridge', 'vlan'): APIData(
+    ('interface', 'bridge', 'vlan'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('bridge', 'vlan-ids'),
@@ -2289,7 +1960,7 @@ PATHS = {
         ),
     ),
 
-    ('interface', 'detect-internet'): APIData(
+    ('interface', 'detect-internet'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -2306,7 +1977,7 @@ PATHS = {
         ),
     ),
 
-    ('interface', 'dot1x', 'client'): APIData(
+    ('interface', 'dot1x', 'client'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('eap-methods', 'identity', 'interface'),
@@ -2327,7 +1998,7 @@ PATHS = {
         ),
     ),
 
-    ('interface', 'dot1x', 'server'): APIData(
+    ('interface', 'dot1x', 'server'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             stratify_keys=('interface',),
@@ -2354,7 +2025,7 @@ PATHS = {
         ),
     ),
 
-    ('interface', 'dot1x', 'server', 'active'): APIData(
+    ('interface', 'dot1x', 'server', 'active'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -2372,7 +2043,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'eoip'): APIData(
+    ('interface', 'eoip'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -2404,7 +2075,7 @@ PATHS = {
         ),
     ),
 
-    ('interface', 'eoipv6'): APIData(
+    ('interface', 'eoipv6'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -2436,7 +2107,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'ethernet'): APIData(
+    ('interface', 'ethernet'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -2484,7 +2155,7 @@ PATHS = {
         ),
     ),
 
-    ('interface', 'ethernet', 'poe'): APIData(
+    ('interface', 'ethernet', 'poe'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -2505,7 +2176,7 @@ PATHS = {
         ),
     ),
 
-    ('interface', 'ethernet', 'switch'): APIData(
+    ('interface', 'ethernet', 'switch'): lambda: APIData(
         hardware_detect='switch_chip_type',
         hardware_variants={
             'single_entry_switch': APIData(
@@ -2572,7 +2243,7 @@ PATHS = {
         },
     ),
 
-    ('interface', 'ethernet', 'switch', 'acl'): APIData(
+    ('interface', 'ethernet', 'switch', 'acl'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -2643,7 +2314,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'ethernet', 'switch', 'acl', 'policer'): APIData(
+    ('interface', 'ethernet', 'switch', 'acl', 'policer'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -2672,7 +2343,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'ethernet', 'switch', 'dscp-qos-map'): APIData(
+    ('interface', 'ethernet', 'switch', 'dscp-qos-map'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 # fixed_entries=True,
@@ -2688,7 +2359,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'ethernet', 'switch', 'dscp-to-dscp'): APIData(
+    ('interface', 'ethernet', 'switch', 'dscp-to-dscp'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 # fixed_entries=True,
@@ -2701,7 +2372,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'ethernet', 'switch', 'egress-vlan-tag'): APIData(
+    ('interface', 'ethernet', 'switch', 'egress-vlan-tag'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -2717,7 +2388,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'ethernet', 'switch', 'egress-vlan-translation'): APIData(
+    ('interface', 'ethernet', 'switch', 'egress-vlan-translation'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -2745,7 +2416,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'ethernet', 'switch', 'host'): APIData(
+    ('interface', 'ethernet', 'switch', 'host'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -2768,7 +2439,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'ethernet', 'switch', 'ingress-port-policer'): APIData(
+    ('interface', 'ethernet', 'switch', 'ingress-port-policer'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -2791,7 +2462,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'ethernet', 'switch', 'ingress-vlan-translation'): APIData(
+    ('interface', 'ethernet', 'switch', 'ingress-vlan-translation'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -2821,7 +2492,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'ethernet', 'switch', 'l3hw-settings'): APIData(
+    ('interface', 'ethernet', 'switch', 'l3hw-settings'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fixed_entries=True,
@@ -2839,7 +2510,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'ethernet', 'switch', 'l3hw-settings', 'advanced'): APIData(
+    ('interface', 'ethernet', 'switch', 'l3hw-settings', 'advanced'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fixed_entries=True,
@@ -2864,7 +2535,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'ethernet', 'switch', 'mac-based-vlan'): APIData(
+    ('interface', 'ethernet', 'switch', 'mac-based-vlan'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -2881,7 +2552,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'ethernet', 'switch', 'multicast-fdb'): APIData(
+    ('interface', 'ethernet', 'switch', 'multicast-fdb'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -2901,7 +2572,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'ethernet', 'switch', 'one2one-vlan-switching'): APIData(
+    ('interface', 'ethernet', 'switch', 'one2one-vlan-switching'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -2918,7 +2589,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'ethernet', 'switch', 'policer-qos-map'): APIData(
+    ('interface', 'ethernet', 'switch', 'policer-qos-map'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 # fixed_entries=True,
@@ -2936,7 +2607,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'ethernet', 'switch', 'port'): APIData(
+    ('interface', 'ethernet', 'switch', 'port'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -3007,7 +2678,7 @@ PATHS = {
         ),
     ),
 
-    ('interface', 'ethernet', 'switch', 'port-isolation'): APIData(
+    ('interface', 'ethernet', 'switch', 'port-isolation'): lambda: APIData(
         hardware_detect='switch_chip_type',
         hardware_variants={
             'single_entry_switch': APIData(
@@ -3052,7 +2723,7 @@ PATHS = {
         },
     ),
 
-    ('interface', 'ethernet', 'switch', 'port-leakage'): APIData(
+    ('interface', 'ethernet', 'switch', 'port-leakage'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -3077,7 +2748,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'ethernet', 'switch', 'protocol-based-vlan'): APIData(
+    ('interface', 'ethernet', 'switch', 'protocol-based-vlan'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -3100,7 +2771,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'ethernet', 'switch', 'qos', 'map'): APIData(
+    ('interface', 'ethernet', 'switch', 'qos', 'map'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -3117,7 +2788,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'ethernet', 'switch', 'qos', 'map', 'ip'): APIData(
+    ('interface', 'ethernet', 'switch', 'qos', 'map', 'ip'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -3134,7 +2805,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'ethernet', 'switch', 'qos', 'map', 'vlan'): APIData(
+    ('interface', 'ethernet', 'switch', 'qos', 'map', 'vlan'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -3152,7 +2823,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'ethernet', 'switch', 'qos', 'port'): APIData(
+    ('interface', 'ethernet', 'switch', 'qos', 'port'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 # fixed_entries=True,
@@ -3182,7 +2853,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'ethernet', 'switch', 'qos', 'priority-flow-control'): APIData(
+    ('interface', 'ethernet', 'switch', 'qos', 'priority-flow-control'): lambda: APIData(
         versioned=[
             ('7.16', '>=', 'Not supported anymore in version  >= 7.16'),
             ('7.15', '>=', VersionedAPIData(
@@ -3202,7 +2873,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'ethernet', 'switch', 'qos', 'profile'): APIData(
+    ('interface', 'ethernet', 'switch', 'qos', 'profile'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -3223,7 +2894,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'ethernet', 'switch', 'qos', 'settings'): APIData(
+    ('interface', 'ethernet', 'switch', 'qos', 'settings'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fixed_entries=True,
@@ -3253,7 +2924,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'ethernet', 'switch', 'qos', 'tx-manager'): APIData(
+    ('interface', 'ethernet', 'switch', 'qos', 'tx-manager'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -3272,7 +2943,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'ethernet', 'switch', 'qos', 'tx-manager', 'queue'): APIData(
+    ('interface', 'ethernet', 'switch', 'qos', 'tx-manager', 'queue'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 # fixed_entries=True,
@@ -3295,7 +2966,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'ethernet', 'switch', 'qos-group'): APIData(
+    ('interface', 'ethernet', 'switch', 'qos-group'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -3314,7 +2985,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'ethernet', 'switch', 'reserved-fdb'): APIData(
+    ('interface', 'ethernet', 'switch', 'reserved-fdb'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -3333,7 +3004,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'ethernet', 'switch', 'rule'): APIData(
+    ('interface', 'ethernet', 'switch', 'rule'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -3376,7 +3047,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'ethernet', 'switch', 'shaper'): APIData(
+    ('interface', 'ethernet', 'switch', 'shaper'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -3395,7 +3066,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'ethernet', 'switch', 'stats'): APIData(
+    ('interface', 'ethernet', 'switch', 'stats'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -3451,7 +3122,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'ethernet', 'switch', 'trunk'): APIData(
+    ('interface', 'ethernet', 'switch', 'trunk'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -3467,7 +3138,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'ethernet', 'switch', 'unicast-fdb'): APIData(
+    ('interface', 'ethernet', 'switch', 'unicast-fdb'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -3489,7 +3160,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'ethernet', 'switch', 'vlan'): APIData(
+    ('interface', 'ethernet', 'switch', 'vlan'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -3514,7 +3185,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'gre'): APIData(
+    ('interface', 'gre'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -3539,7 +3210,7 @@ PATHS = {
         ),
     ),
 
-    ('interface', 'gre6'): APIData(
+    ('interface', 'gre6'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -3563,7 +3234,7 @@ PATHS = {
         ),
     ),
 
-    ('interface', 'ipip'): APIData(
+    ('interface', 'ipip'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -3587,7 +3258,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'ipipv6'): APIData(
+    ('interface', 'ipipv6'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -3612,7 +3283,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'l2tp-client'): APIData(
+    ('interface', 'l2tp-client'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -3650,7 +3321,7 @@ PATHS = {
         ),
     ),
 
-    ('interface', 'l2tp-ether'): APIData(
+    ('interface', 'l2tp-ether'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -3684,7 +3355,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'l2tp-server'): APIData(
+    ('interface', 'l2tp-server'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -3700,7 +3371,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'l2tp-server', 'server'): APIData(
+    ('interface', 'l2tp-server', 'server'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -3731,7 +3402,7 @@ PATHS = {
         ),
     ),
 
-    ('interface', 'list'): APIData(
+    ('interface', 'list'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -3748,7 +3419,7 @@ PATHS = {
         ),
     ),
 
-    ('interface', 'list', 'member'): APIData(
+    ('interface', 'list', 'member'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('list', 'interface'),
@@ -3765,7 +3436,7 @@ PATHS = {
         ),
     ),
 
-    ('interface', 'lte'): APIData(
+    ('interface', 'lte'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 # fixed_entries=True,
@@ -3795,7 +3466,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'lte', 'apn'): APIData(
+    ('interface', 'lte', 'apn'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             versioned_fields=[
@@ -3823,7 +3494,7 @@ PATHS = {
         ),
     ),
 
-    ('interface', 'lte', 'settings'): APIData(
+    ('interface', 'lte', 'settings'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fixed_entries=True,
@@ -3842,7 +3513,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'macsec'): APIData(
+    ('interface', 'macsec'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -3862,7 +3533,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'macsec', 'profile'): APIData(
+    ('interface', 'macsec', 'profile'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -3876,7 +3547,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'macvlan'): APIData(
+    ('interface', 'macvlan'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -3900,7 +3571,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'mesh'): APIData(
+    ('interface', 'mesh'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -3931,7 +3602,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'mesh', 'port'): APIData(
+    ('interface', 'mesh', 'port'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -3950,7 +3621,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'ovpn-client'): APIData(
+    ('interface', 'ovpn-client'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -3984,7 +3655,7 @@ PATHS = {
         ),
     ),
 
-    ('interface', 'ovpn-server'): APIData(
+    ('interface', 'ovpn-server'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -4000,7 +3671,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'ovpn-server', 'server'): APIData(
+    ('interface', 'ovpn-server', 'server'): lambda: APIData(
         versioned=[
             ('7.17', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -4068,7 +3739,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'ppp-client'): APIData(
+    ('interface', 'ppp-client'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -4107,7 +3778,7 @@ PATHS = {
         ),
     ),
 
-    ('interface', 'ppp-server'): APIData(
+    ('interface', 'ppp-server'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -4132,7 +3803,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'pppoe-client'): APIData(
+    ('interface', 'pppoe-client'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -4164,7 +3835,7 @@ PATHS = {
         ),
     ),
 
-    ('interface', 'pppoe-server'): APIData(
+    ('interface', 'pppoe-server'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -4181,7 +3852,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'pppoe-server', 'server'): APIData(
+    ('interface', 'pppoe-server', 'server'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('interface',),
@@ -4210,7 +3881,7 @@ PATHS = {
         ),
     ),
 
-    ('interface', 'pptp-client'): APIData(
+    ('interface', 'pptp-client'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -4238,7 +3909,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'pptp-server'): APIData(
+    ('interface', 'pptp-server'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -4254,7 +3925,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'pptp-server', 'server'): APIData(
+    ('interface', 'pptp-server', 'server'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -4271,7 +3942,7 @@ PATHS = {
         ),
     ),
 
-    ('interface', 'sstp-client'): APIData(
+    ('interface', 'sstp-client'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -4308,7 +3979,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'sstp-server'): APIData(
+    ('interface', 'sstp-server'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -4324,7 +3995,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'sstp-server', 'server'): APIData(
+    ('interface', 'sstp-server', 'server'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -4350,7 +4021,7 @@ PATHS = {
         ),
     ),
 
-    ('interface', 'veth'): APIData(
+    ('interface', 'veth'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -4374,7 +4045,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'vlan'): APIData(
+    ('interface', 'vlan'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -4401,7 +4072,7 @@ PATHS = {
         ),
     ),
 
-    ('interface', 'vpls'): APIData(
+    ('interface', 'vpls'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -4434,7 +4105,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'vrrp'): APIData(
+    ('interface', 'vrrp'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -4472,7 +4143,7 @@ PATHS = {
         ),
     ),
 
-    ('interface', 'vxlan'): APIData(
+    ('interface', 'vxlan'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -4514,7 +4185,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'vxlan', 'vteps'): APIData(
+    ('interface', 'vxlan', 'vteps'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -4533,7 +4204,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'wifi'): APIData(
+    ('interface', 'wifi'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -4800,7 +4471,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'wifi', 'aaa'): APIData(
+    ('interface', 'wifi', 'aaa'): lambda: APIData(
         versioned=[
             ('7.13', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -4825,7 +4496,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'wifi', 'access-list'): APIData(
+    ('interface', 'wifi', 'access-list'): lambda: APIData(
         versioned=[
             ('7.13', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -4856,7 +4527,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'wifi', 'cap'): APIData(
+    ('interface', 'wifi', 'cap'): lambda: APIData(
         versioned=[
             ('7.13', '>=', VersionedAPIData(
                 fixed_entries=True,
@@ -4881,7 +4552,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'wifi', 'capsman'): APIData(
+    ('interface', 'wifi', 'capsman'): lambda: APIData(
         versioned=[
             ('7.13', '>=', VersionedAPIData(
                 fixed_entries=True,
@@ -4900,7 +4571,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'wifi', 'channel'): APIData(
+    ('interface', 'wifi', 'channel'): lambda: APIData(
         versioned=[
             ('7.13', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -4927,7 +4598,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'wifi', 'configuration'): APIData(
+    ('interface', 'wifi', 'configuration'): lambda: APIData(
         versioned=[
             ('7.13', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -5063,7 +4734,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'wifi', 'datapath'): APIData(
+    ('interface', 'wifi', 'datapath'): lambda: APIData(
         versioned=[
             ('7.13', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -5089,7 +4760,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'wifi', 'interworking'): APIData(
+    ('interface', 'wifi', 'interworking'): lambda: APIData(
         versioned=[
             ('7.13', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -5136,7 +4807,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'wifi', 'network'): APIData(
+    ('interface', 'wifi', 'network'): lambda: APIData(
         versioned=[
             ('7.22', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -5202,7 +4873,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'wifi', 'network', 'radio'): APIData(
+    ('interface', 'wifi', 'network', 'radio'): lambda: APIData(
         versioned=[
             ('7.22', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -5235,7 +4906,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'wifi', 'provisioning'): APIData(
+    ('interface', 'wifi', 'provisioning'): lambda: APIData(
         versioned=[
             ('7.13', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -5264,7 +4935,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'wifi', 'radio', 'settings'): APIData(
+    ('interface', 'wifi', 'radio', 'settings'): lambda: APIData(
         versioned=[
             ('7.17', '>=', VersionedAPIData(
                 fixed_entries=True,
@@ -5278,7 +4949,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'wifi', 'security'): APIData(
+    ('interface', 'wifi', 'security'): lambda: APIData(
         versioned=[
             ('7.13', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -5328,7 +4999,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'wifi', 'security', 'multi-passphrase'): APIData(
+    ('interface', 'wifi', 'security', 'multi-passphrase'): lambda: APIData(
         versioned=[
             ('7.17', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -5347,7 +5018,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'wifi', 'steering'): APIData(
+    ('interface', 'wifi', 'steering'): lambda: APIData(
         versioned=[
             ('7.13', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -5374,7 +5045,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'wifi', 'steering', 'neighbor-group'): APIData(
+    ('interface', 'wifi', 'steering', 'neighbor-group'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 # fixed_entries=True,
@@ -5390,7 +5061,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'wifiwave2'): APIData(
+    ('interface', 'wifiwave2'): lambda: APIData(
         versioned=[
             ('7.13', '>=', 'RouterOS 7.13 uses WiFi package'),
             ('7.8', '>=', VersionedAPIData(
@@ -5419,7 +5090,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'wifiwave2', 'aaa'): APIData(
+    ('interface', 'wifiwave2', 'aaa'): lambda: APIData(
         versioned=[
             ('7.13', '>=', 'RouterOS 7.13 uses WiFi package'),
             ('7.8', '>=', VersionedAPIData(
@@ -5441,7 +5112,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'wifiwave2', 'access-list'): APIData(
+    ('interface', 'wifiwave2', 'access-list'): lambda: APIData(
         versioned=[
             ('7.13', '>=', 'RouterOS 7.13 uses WiFi package'),
             ('7.8', '>=', VersionedAPIData(
@@ -5466,7 +5137,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'wifiwave2', 'cap'): APIData(
+    ('interface', 'wifiwave2', 'cap'): lambda: APIData(
         versioned=[
             ('7.13', '>=', 'RouterOS 7.13 uses WiFi package'),
             ('7.8', '>=', VersionedAPIData(
@@ -5487,7 +5158,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'wifiwave2', 'capsman'): APIData(
+    ('interface', 'wifiwave2', 'capsman'): lambda: APIData(
         versioned=[
             ('7.13', '>=', 'RouterOS 7.13 uses WiFi package'),
             ('7.8', '>=', VersionedAPIData(
@@ -5506,7 +5177,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'wifiwave2', 'channel'): APIData(
+    ('interface', 'wifiwave2', 'channel'): lambda: APIData(
         versioned=[
             ('7.13', '>=', 'RouterOS 7.13 uses WiFi package'),
             ('7.8', '>=', VersionedAPIData(
@@ -5524,7 +5195,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'wifiwave2', 'configuration'): APIData(
+    ('interface', 'wifiwave2', 'configuration'): lambda: APIData(
         versioned=[
             ('7.13', '>=', 'RouterOS 7.13 uses WiFi package'),
             ('7.8', '>=', VersionedAPIData(
@@ -5554,7 +5225,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'wifiwave2', 'datapath'): APIData(
+    ('interface', 'wifiwave2', 'datapath'): lambda: APIData(
         versioned=[
             ('7.13', '>=', 'RouterOS 7.13 uses WiFi package'),
             ('7.8', '>=', VersionedAPIData(
@@ -5574,7 +5245,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'wifiwave2', 'interworking'): APIData(
+    ('interface', 'wifiwave2', 'interworking'): lambda: APIData(
         versioned=[
             ('7.13', '>=', 'RouterOS 7.13 uses WiFi package'),
             ('7.8', '>=', VersionedAPIData(
@@ -5616,7 +5287,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'wifiwave2', 'provisioning'): APIData(
+    ('interface', 'wifiwave2', 'provisioning'): lambda: APIData(
         versioned=[
             ('7.13', '>=', 'RouterOS 7.13 uses WiFi package'),
             ('7.8', '>=', VersionedAPIData(
@@ -5639,7 +5310,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'wifiwave2', 'security'): APIData(
+    ('interface', 'wifiwave2', 'security'): lambda: APIData(
         versioned=[
             ('7.13', '>=', 'RouterOS 7.13 uses WiFi package'),
             ('7.8', '>=', VersionedAPIData(
@@ -5682,7 +5353,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'wifiwave2', 'steering'): APIData(
+    ('interface', 'wifiwave2', 'steering'): lambda: APIData(
         versioned=[
             ('7.13', '>=', 'RouterOS 7.13 uses WiFi package'),
             ('7.8', '>=', VersionedAPIData(
@@ -5700,7 +5371,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'wireguard'): APIData(
+    ('interface', 'wireguard'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -5720,7 +5391,7 @@ PATHS = {
         ),
     ),
 
-    ('interface', 'wireguard', 'peers'): APIData(
+    ('interface', 'wireguard', 'peers'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('public-key', 'interface'),
@@ -5753,7 +5424,7 @@ PATHS = {
         ),
     ),
 
-    ('interface', 'wireless'): APIData(
+    ('interface', 'wireless'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -5863,7 +5534,7 @@ PATHS = {
         ),
     ),
 
-    ('interface', 'wireless', 'access-list'): APIData(
+    ('interface', 'wireless', 'access-list'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             versioned_fields=[
@@ -5893,7 +5564,7 @@ PATHS = {
         ),
     ),
 
-    ('interface', 'wireless', 'align'): APIData(
+    ('interface', 'wireless', 'align'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -5912,7 +5583,7 @@ PATHS = {
         ),
     ),
 
-    ('interface', 'wireless', 'cap'): APIData(
+    ('interface', 'wireless', 'cap'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -5932,7 +5603,7 @@ PATHS = {
         ),
     ),
 
-    ('interface', 'wireless', 'channels'): APIData(
+    ('interface', 'wireless', 'channels'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -5955,7 +5626,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'wireless', 'connect-list'): APIData(
+    ('interface', 'wireless', 'connect-list'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             versioned_fields=[
@@ -5996,7 +5667,7 @@ PATHS = {
         ),
     ),
 
-    ('interface', 'wireless', 'interworking-profiles'): APIData(
+    ('interface', 'wireless', 'interworking-profiles'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -6042,7 +5713,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'wireless', 'manual-tx-power-table'): APIData(
+    ('interface', 'wireless', 'manual-tx-power-table'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 # fixed_entries=True,
@@ -6058,7 +5729,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'wireless', 'nstreme'): APIData(
+    ('interface', 'wireless', 'nstreme'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 # fixed_entries=True,
@@ -6078,7 +5749,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'wireless', 'nstreme-dual'): APIData(
+    ('interface', 'wireless', 'nstreme-dual'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -6118,7 +5789,7 @@ PATHS = {
         ],
     ),
 
-    ('interface', 'wireless', 'security-profiles'): APIData(
+    ('interface', 'wireless', 'security-profiles'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -6169,7 +5840,7 @@ PATHS = {
         ),
     ),
 
-    ('interface', 'wireless', 'sniffer'): APIData(
+    ('interface', 'wireless', 'sniffer'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -6189,7 +5860,7 @@ PATHS = {
         ),
     ),
 
-    ('interface', 'wireless', 'snooper'): APIData(
+    ('interface', 'wireless', 'snooper'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -6202,7 +5873,7 @@ PATHS = {
         ),
     ),
 
-    ('interface', 'wireless', 'wds'): APIData(
+    ('interface', 'wireless', 'wds'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -6226,7 +5897,7 @@ PATHS = {
         ],
     ),
 
-    ('iot', 'bluetooth'): APIData(
+    ('iot', 'bluetooth'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 # fixed_entries=True,
@@ -6243,7 +5914,7 @@ PATHS = {
         ],
     ),
 
-    ('iot', 'bluetooth', 'advertisers'): APIData(
+    ('iot', 'bluetooth', 'advertisers'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 # fixed_entries=True,
@@ -6267,7 +5938,7 @@ PATHS = {
         ],
     ),
 
-    ('iot', 'bluetooth', 'advertisers', 'ad-structures'): APIData(
+    ('iot', 'bluetooth', 'advertisers', 'ad-structures'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -6282,7 +5953,7 @@ PATHS = {
         ],
     ),
 
-    ('iot', 'bluetooth', 'peripheral-devices'): APIData(
+    ('iot', 'bluetooth', 'peripheral-devices'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 # fixed_entries=True,
@@ -6301,7 +5972,7 @@ PATHS = {
         ],
     ),
 
-    ('iot', 'bluetooth', 'scanners'): APIData(
+    ('iot', 'bluetooth', 'scanners'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 # fixed_entries=True,
@@ -6325,7 +5996,7 @@ PATHS = {
         ],
     ),
 
-    ('iot', 'bluetooth', 'whitelist'): APIData(
+    ('iot', 'bluetooth', 'whitelist'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -6342,7 +6013,7 @@ PATHS = {
         ],
     ),
 
-    ('iot', 'lora'): APIData(
+    ('iot', 'lora'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 # fixed_entries=True,
@@ -6375,7 +6046,7 @@ PATHS = {
         ],
     ),
 
-    ('iot', 'lora', 'channels'): APIData(
+    ('iot', 'lora', 'channels'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 # fixed_entries=True,
@@ -6395,7 +6066,7 @@ PATHS = {
         ],
     ),
 
-    ('iot', 'lora', 'joineui'): APIData(
+    ('iot', 'lora', 'joineui'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -6413,7 +6084,7 @@ PATHS = {
         ],
     ),
 
-    ('iot', 'lora', 'netid'): APIData(
+    ('iot', 'lora', 'netid'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -6431,7 +6102,7 @@ PATHS = {
         ],
     ),
 
-    ('iot', 'lora', 'radios'): APIData(
+    ('iot', 'lora', 'radios'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 # fixed_entries=True,
@@ -6453,7 +6124,7 @@ PATHS = {
         ],
     ),
 
-    ('iot', 'lora', 'servers'): APIData(
+    ('iot', 'lora', 'servers'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -6477,7 +6148,7 @@ PATHS = {
         ],
     ),
 
-    ('iot', 'lora', 'traffic', 'options'): APIData(
+    ('iot', 'lora', 'traffic', 'options'): lambda: APIData(
         versioned=[
             ('7.17', '>=', VersionedAPIData(
                 fixed_entries=True,
@@ -6493,7 +6164,7 @@ PATHS = {
         ],
     ),
 
-    ('iot', 'modbus'): APIData(
+    ('iot', 'modbus'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -6512,7 +6183,7 @@ PATHS = {
         ),
     ),
 
-    ('iot', 'modbus', 'security-rules'): APIData(
+    ('iot', 'modbus', 'security-rules'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -6528,7 +6199,7 @@ PATHS = {
         ],
     ),
 
-    ('iot', 'mqtt', 'brokers'): APIData(
+    ('iot', 'mqtt', 'brokers'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -6557,7 +6228,7 @@ PATHS = {
         ],
     ),
 
-    ('iot', 'mqtt', 'subscriptions'): APIData(
+    ('iot', 'mqtt', 'subscriptions'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -6573,7 +6244,7 @@ PATHS = {
         ],
     ),
 
-    ('ip', 'accounting'): APIData(
+    ('ip', 'accounting'): lambda: APIData(
         versioned=[
             ('7.15', '>=', 'Not supported anymore in version  >= 7.15'),
             ('7.15', '<', VersionedAPIData(
@@ -6588,7 +6259,7 @@ PATHS = {
         ],
     ),
 
-    ('ip', 'accounting', 'web-access'): APIData(
+    ('ip', 'accounting', 'web-access'): lambda: APIData(
         versioned=[
             ('7.15', '>=', 'Not supported anymore in version  >= 7.15'),
             ('7.15', '<', VersionedAPIData(
@@ -6602,7 +6273,7 @@ PATHS = {
         ],
     ),
 
-    ('ip', 'address'): APIData(
+    ('ip', 'address'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('address', 'interface'),
@@ -6622,7 +6293,7 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'arp'): APIData(
+    ('ip', 'arp'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             versioned_fields=[
@@ -6634,13 +6305,13 @@ PATHS = {
                 'comment': KeyInfo(can_disable=True, remove_value=''),
                 'disabled': KeyInfo(default=False),
                 'interface': KeyInfo(required=True),
-                'mac-address': KeyInfo(default='00:00:00:00:00:00'),
+                'mac-address': KeyInfo(default='00:00:00:00:00:00', value_canonicalizer=_canonicalize_mac),
                 'published': KeyInfo(default=False),
             },
         ),
     ),
 
-    ('ip', 'cloud'): APIData(
+    ('ip', 'cloud'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -6658,7 +6329,7 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'cloud', 'advanced'): APIData(
+    ('ip', 'cloud', 'advanced'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -6669,7 +6340,7 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'cloud', 'back-to-home-file'): APIData(
+    ('ip', 'cloud', 'back-to-home-file'): lambda: APIData(
         versioned=[
             ('7.18', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -6686,7 +6357,7 @@ PATHS = {
         ],
     ),
 
-    ('ip', 'cloud', 'back-to-home-file', 'settings'): APIData(
+    ('ip', 'cloud', 'back-to-home-file', 'settings'): lambda: APIData(
         versioned=[
             ('7.18', '>=', VersionedAPIData(
                 fixed_entries=True,
@@ -6699,7 +6370,7 @@ PATHS = {
         ],
     ),
 
-    ('ip', 'cloud', 'back-to-home-user'): APIData(
+    ('ip', 'cloud', 'back-to-home-user'): lambda: APIData(
         versioned=[
             ('7.18', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -6720,7 +6391,7 @@ PATHS = {
         ],
     ),
 
-    ('ip', 'cloud', 'back-to-home-users'): APIData(
+    ('ip', 'cloud', 'back-to-home-users'): lambda: APIData(
         versioned=[
             ('7.18', '>=', 'Not supported anymore in version  >= 7.18'),
             ('7.15', '>=', VersionedAPIData(
@@ -6744,7 +6415,7 @@ PATHS = {
         ],
     ),
 
-    ('ip', 'dhcp-client'): APIData(
+    ('ip', 'dhcp-client'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('interface',),
@@ -6773,7 +6444,7 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'dhcp-client', 'option'): APIData(
+    ('ip', 'dhcp-client', 'option'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -6790,7 +6461,7 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'dhcp-relay'): APIData(
+    ('ip', 'dhcp-relay'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -6813,7 +6484,7 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'dhcp-server'): APIData(
+    ('ip', 'dhcp-server'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -6842,7 +6513,7 @@ PATHS = {
                 'insert-queue-before': KeyInfo(can_disable=True, remove_value='first'),
                 'interface': KeyInfo(required=True),
                 'lease-script': KeyInfo(default=''),
-                'lease-time': KeyInfo(default='10m'),
+                'lease-time': KeyInfo(default='10m', value_canonicalizer=_canonicalize_duration),
                 'name': KeyInfo(),
                 'parent-queue': KeyInfo(can_disable=True, remove_value='none'),
                 'relay': KeyInfo(can_disable=True, remove_value='0.0.0.0'),
@@ -6853,7 +6524,7 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'dhcp-server', 'alert'): APIData(
+    ('ip', 'dhcp-server', 'alert'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -6871,7 +6542,7 @@ PATHS = {
         ],
     ),
 
-    ('ip', 'dhcp-server', 'config'): APIData(
+    ('ip', 'dhcp-server', 'config'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -6887,7 +6558,7 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'dhcp-server', 'lease'): APIData(
+    ('ip', 'dhcp-server', 'lease'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('server', 'address'),
@@ -6898,7 +6569,7 @@ PATHS = {
                 ([('7.15', '>=')], 'block-access', KeyInfo()),
                 # ([('7.15', '>=')], 'copy-from', KeyInfo(write_only=True)),
                 ([('7.15', '>=')], 'dhcp-option-set', KeyInfo()),
-                ([('7.15', '>=')], 'lease-time', KeyInfo()),
+                ([('7.15', '>=')], 'lease-time', KeyInfo(value_canonicalizer=_canonicalize_duration)),
                 ([('7.15', '>=')], 'numbers', KeyInfo(read_only=True)),
                 ([('7.15', '>=')], 'parent-queue', KeyInfo(can_disable=True)),
                 ([('7.15', '>=')], 'queue-type', KeyInfo(can_disable=True)),
@@ -6915,13 +6586,13 @@ PATHS = {
                 'dhcp-option': KeyInfo(default=''),
                 'disabled': KeyInfo(default=False),
                 'insert-queue-before': KeyInfo(can_disable=True),
-                'mac-address': KeyInfo(can_disable=True, remove_value=''),
+                'mac-address': KeyInfo(can_disable=True, remove_value='', value_canonicalizer=_canonicalize_mac),
                 'server': KeyInfo(absent_value='all'),
             },
         ),
     ),
 
-    ('ip', 'dhcp-server', 'matcher'): APIData(
+    ('ip', 'dhcp-server', 'matcher'): lambda: APIData(
         versioned=[
             ('7.4', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -6945,7 +6616,7 @@ PATHS = {
         ],
     ),
 
-    ('ip', 'dhcp-server', 'network'): APIData(
+    ('ip', 'dhcp-server', 'network'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('address',),
@@ -6962,18 +6633,18 @@ PATHS = {
                 'dhcp-option': KeyInfo(default=''),
                 'dhcp-option-set': KeyInfo(default=''),
                 'dns-none': KeyInfo(default=False),
-                'dns-server': KeyInfo(default=''),
+                'dns-server': KeyInfo(default='', value_canonicalizer=_canonicalize_name_list),
                 'domain': KeyInfo(default=''),
                 'gateway': KeyInfo(default=''),
                 'netmask': KeyInfo(can_disable=True, remove_value=0),
                 'next-server': KeyInfo(can_disable=True),
-                'ntp-server': KeyInfo(default=''),
+                'ntp-server': KeyInfo(default='', value_canonicalizer=_canonicalize_name_list),
                 'wins-server': KeyInfo(default=''),
             },
         ),
     ),
 
-    ('ip', 'dhcp-server', 'option'): APIData(
+    ('ip', 'dhcp-server', 'option'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -6991,7 +6662,7 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'dhcp-server', 'option', 'sets'): APIData(
+    ('ip', 'dhcp-server', 'option', 'sets'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -7007,7 +6678,7 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'dns'): APIData(
+    ('ip', 'dns'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -7022,21 +6693,21 @@ PATHS = {
             ],
             fields={
                 'allow-remote-requests': KeyInfo(),
-                'cache-max-ttl': KeyInfo(default='1w'),
+                'cache-max-ttl': KeyInfo(default='1w', value_canonicalizer=_canonicalize_duration),
                 'cache-size': KeyInfo(default='2048KiB'),
                 'max-concurrent-queries': KeyInfo(default=100),
                 'max-concurrent-tcp-sessions': KeyInfo(default=20),
                 'max-udp-packet-size': KeyInfo(default=4096),
                 'query-server-timeout': KeyInfo(default='2s'),
                 'query-total-timeout': KeyInfo(default='10s'),
-                'servers': KeyInfo(default=''),
+                'servers': KeyInfo(default='', value_canonicalizer=_canonicalize_name_list),
                 'use-doh-server': KeyInfo(default=''),
                 'verify-doh-cert': KeyInfo(default=False),
             },
         ),
     ),
 
-    ('ip', 'dns', 'adlist'): APIData(
+    ('ip', 'dns', 'adlist'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -7055,7 +6726,7 @@ PATHS = {
         ],
     ),
 
-    ('ip', 'dns', 'forwarders'): APIData(
+    ('ip', 'dns', 'forwarders'): lambda: APIData(
         versioned=[
             ('7.17', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -7074,7 +6745,7 @@ PATHS = {
         ],
     ),
 
-    ('ip', 'dns', 'static'): APIData(
+    ('ip', 'dns', 'static'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             mutually_exclusive=[['name', 'regexp']],
@@ -7087,7 +6758,7 @@ PATHS = {
                 # ([('7.15', '>=')], 'place-before', KeyInfo(write_only=True)),
             ],
             fields={
-                'address': KeyInfo(),
+                'address': KeyInfo(value_canonicalizer=_canonicalize_ip),
                 'cname': KeyInfo(),
                 'comment': KeyInfo(can_disable=True, remove_value=''),
                 'disabled': KeyInfo(default=False),
@@ -7102,13 +6773,13 @@ PATHS = {
                 'srv-target': KeyInfo(),
                 'srv-weight': KeyInfo(),
                 'text': KeyInfo(),
-                'ttl': KeyInfo(default='1d'),
+                'ttl': KeyInfo(default='1d', value_canonicalizer=_canonicalize_duration),
                 'type': KeyInfo(),
             },
         ),
     ),
 
-    ('ip', 'firewall', 'address-list'): APIData(
+    ('ip', 'firewall', 'address-list'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('address', 'list'),
@@ -7116,7 +6787,7 @@ PATHS = {
                 # ([('7.15', '>=')], 'copy-from', KeyInfo(write_only=True)),
                 ([('7.15', '>=')], 'dynamic', KeyInfo()),
                 ([('7.15', '>=')], 'numbers', KeyInfo(read_only=True)),
-                ([('7.15', '>=')], 'timeout', KeyInfo()),
+                ([('7.15', '>=')], 'timeout', KeyInfo(value_canonicalizer=_canonicalize_duration)),
             ],
             fields={
                 'address': KeyInfo(),
@@ -7127,7 +6798,7 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'firewall', 'calea'): APIData(
+    ('ip', 'firewall', 'calea'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -7202,7 +6873,7 @@ PATHS = {
         ],
     ),
 
-    ('ip', 'firewall', 'connection', 'tracking'): APIData(
+    ('ip', 'firewall', 'connection', 'tracking'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -7231,10 +6902,11 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'firewall', 'filter'): APIData(
+    ('ip', 'firewall', 'filter'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             stratify_keys=('chain',),
+            supports_place_before=True,
             versioned_fields=[
                 # ([('7.15', '>=')], 'copy-from', KeyInfo(write_only=True)),
                 ([('7.15', '>=')], 'numbers', KeyInfo(read_only=True)),
@@ -7310,7 +6982,7 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'firewall', 'layer7-protocol'): APIData(
+    ('ip', 'firewall', 'layer7-protocol'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -7326,10 +6998,11 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'firewall', 'mangle'): APIData(
+    ('ip', 'firewall', 'mangle'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             stratify_keys=('chain',),
+            supports_place_before=True,
             versioned_fields=[
                 # ([('7.15', '>=')], 'copy-from', KeyInfo(write_only=True)),
                 ([('7.15', '>=')], 'numbers', KeyInfo(read_only=True)),
@@ -7416,10 +7089,11 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'firewall', 'nat'): APIData(
+    ('ip', 'firewall', 'nat'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             stratify_keys=('chain',),
+            supports_place_before=True,
             versioned_fields=[
                 # ([('7.15', '>=')], 'copy-from', KeyInfo(write_only=True)),
                 ([('7.15', '>=')], 'numbers', KeyInfo(read_only=True)),
@@ -7495,10 +7169,11 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'firewall', 'raw'): APIData(
+    ('ip', 'firewall', 'raw'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             stratify_keys=('chain',),
+            supports_place_before=True,
             versioned_fields=[
                 # ([('7.15', '>=')], 'copy-from', KeyInfo(write_only=True)),
                 ([('7.15', '>=')], 'numbers', KeyInfo(read_only=True)),
@@ -7560,7 +7235,7 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'firewall', 'service-port'): APIData(
+    ('ip', 'firewall', 'service-port'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -7578,7 +7253,7 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'hotspot'): APIData(
+    ('ip', 'hotspot'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name', 'interface'),
@@ -7600,7 +7275,7 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'hotspot', 'active'): APIData(
+    ('ip', 'hotspot', 'active'): lambda: APIData(
         versioned=[
             ('7.21', '>=', 'Not supported anymore in version 7.21'),
             ('7.15', '>=', VersionedAPIData(
@@ -7614,7 +7289,7 @@ PATHS = {
         ],
     ),
 
-    ('ip', 'hotspot', 'ip-binding'): APIData(
+    ('ip', 'hotspot', 'ip-binding'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -7634,7 +7309,7 @@ PATHS = {
         ],
     ),
 
-    ('ip', 'hotspot', 'profile'): APIData(
+    ('ip', 'hotspot', 'profile'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -7673,7 +7348,7 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'hotspot', 'service-port'): APIData(
+    ('ip', 'hotspot', 'service-port'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -7689,7 +7364,7 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'hotspot', 'user'): APIData(
+    ('ip', 'hotspot', 'user'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -7718,7 +7393,7 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'hotspot', 'user', 'profile'): APIData(
+    ('ip', 'hotspot', 'user', 'profile'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -7757,7 +7432,7 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'hotspot', 'walled-garden'): APIData(
+    ('ip', 'hotspot', 'walled-garden'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             versioned_fields=[
@@ -7779,7 +7454,7 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'hotspot', 'walled-garden', 'ip'): APIData(
+    ('ip', 'hotspot', 'walled-garden', 'ip'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             versioned_fields=[
@@ -7803,7 +7478,7 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'ipsec', 'active-peers'): APIData(
+    ('ip', 'ipsec', 'active-peers'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -7817,7 +7492,7 @@ PATHS = {
         ],
     ),
 
-    ('ip', 'ipsec', 'identity'): APIData(
+    ('ip', 'ipsec', 'identity'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             versioned_fields=[
@@ -7848,7 +7523,7 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'ipsec', 'key'): APIData(
+    ('ip', 'ipsec', 'key'): lambda: APIData(
         versioned=[
             ('7.20', '>=', 'Not supported anymore in version  >= 7.20'),
             ('7.15', '>=', VersionedAPIData(
@@ -7864,7 +7539,7 @@ PATHS = {
         ],
     ),
 
-    ('ip', 'ipsec', 'key', 'psk'): APIData(
+    ('ip', 'ipsec', 'key', 'psk'): lambda: APIData(
         versioned=[
             ('7.21', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -7878,7 +7553,7 @@ PATHS = {
         ],
     ),
 
-    ('ip', 'ipsec', 'key', 'qkd'): APIData(
+    ('ip', 'ipsec', 'key', 'qkd'): lambda: APIData(
         versioned=[
             ('7.21', '>=', VersionedAPIData(
                 fixed_entries=True,
@@ -7897,7 +7572,7 @@ PATHS = {
         ],
     ),
 
-    ('ip', 'ipsec', 'key', 'rsa'): APIData(
+    ('ip', 'ipsec', 'key', 'rsa'): lambda: APIData(
         versioned=[
             ('7.20', '>=', VersionedAPIData(
                 fixed_entries=True,
@@ -7911,7 +7586,7 @@ PATHS = {
         ],
     ),
 
-    ('ip', 'ipsec', 'mode-config'): APIData(
+    ('ip', 'ipsec', 'mode-config'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -7937,7 +7612,7 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'ipsec', 'peer'): APIData(
+    ('ip', 'ipsec', 'peer'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -7961,7 +7636,7 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'ipsec', 'policy'): APIData(
+    ('ip', 'ipsec', 'policy'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             versioned_fields=[
@@ -7991,7 +7666,7 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'ipsec', 'policy', 'group'): APIData(
+    ('ip', 'ipsec', 'policy', 'group'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             versioned_fields=[
@@ -8006,7 +7681,7 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'ipsec', 'profile'): APIData(
+    ('ip', 'ipsec', 'profile'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -8031,7 +7706,7 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'ipsec', 'proposal'): APIData(
+    ('ip', 'ipsec', 'proposal'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -8051,7 +7726,7 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'ipsec', 'settings'): APIData(
+    ('ip', 'ipsec', 'settings'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -8067,7 +7742,7 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'kid-control'): APIData(
+    ('ip', 'kid-control'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -8096,7 +7771,7 @@ PATHS = {
         ],
     ),
 
-    ('ip', 'kid-control', 'device'): APIData(
+    ('ip', 'kid-control', 'device'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -8112,7 +7787,7 @@ PATHS = {
         ],
     ),
 
-    ('ip', 'media'): APIData(
+    ('ip', 'media'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -8130,7 +7805,7 @@ PATHS = {
         ],
     ),
 
-    ('ip', 'media', 'settings'): APIData(
+    ('ip', 'media', 'settings'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fixed_entries=True,
@@ -8143,7 +7818,7 @@ PATHS = {
         ],
     ),
 
-    ('ip', 'nat-pmp'): APIData(
+    ('ip', 'nat-pmp'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fixed_entries=True,
@@ -8156,7 +7831,7 @@ PATHS = {
         ],
     ),
 
-    ('ip', 'nat-pmp', 'interfaces'): APIData(
+    ('ip', 'nat-pmp', 'interfaces'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -8172,7 +7847,7 @@ PATHS = {
         ],
     ),
 
-    ('ip', 'neighbor', 'discovery-settings'): APIData(
+    ('ip', 'neighbor', 'discovery-settings'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -8194,7 +7869,7 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'packing'): APIData(
+    ('ip', 'packing'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -8211,7 +7886,7 @@ PATHS = {
         ],
     ),
 
-    ('ip', 'pool'): APIData(
+    ('ip', 'pool'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -8228,7 +7903,7 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'pool', 'used'): APIData(
+    ('ip', 'pool', 'used'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 # fixed_entries=True,
@@ -8246,7 +7921,7 @@ PATHS = {
         ],
     ),
 
-    ('ip', 'proxy'): APIData(
+    ('ip', 'proxy'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -8273,7 +7948,7 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'proxy', 'access'): APIData(
+    ('ip', 'proxy', 'access'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -8297,7 +7972,7 @@ PATHS = {
         ],
     ),
 
-    ('ip', 'proxy', 'cache'): APIData(
+    ('ip', 'proxy', 'cache'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -8320,7 +7995,7 @@ PATHS = {
         ],
     ),
 
-    ('ip', 'proxy', 'cache-contents'): APIData(
+    ('ip', 'proxy', 'cache-contents'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -8332,7 +8007,7 @@ PATHS = {
         ],
     ),
 
-    ('ip', 'proxy', 'connections'): APIData(
+    ('ip', 'proxy', 'connections'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 # fixed_entries=True,
@@ -8348,7 +8023,7 @@ PATHS = {
         ],
     ),
 
-    ('ip', 'proxy', 'direct'): APIData(
+    ('ip', 'proxy', 'direct'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -8371,7 +8046,7 @@ PATHS = {
         ],
     ),
 
-    ('ip', 'reverse-proxy'): APIData(
+    ('ip', 'reverse-proxy'): lambda: APIData(
         versioned=[
             ('7.22', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -8389,7 +8064,7 @@ PATHS = {
         ],
     ),
 
-    ('ip', 'route'): APIData(
+    ('ip', 'route'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             versioned_fields=[
@@ -8417,7 +8092,7 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'route', 'rule'): APIData(
+    ('ip', 'route', 'rule'): lambda: APIData(
         versioned=[
             ('7', '>=', 'Not supported anymore in version  >= 7'),
             ('7', '<', VersionedAPIData(
@@ -8436,7 +8111,7 @@ PATHS = {
         ],
     ),
 
-    ('ip', 'route', 'vrf'): APIData(
+    ('ip', 'route', 'vrf'): lambda: APIData(
         versioned=[
             ('7', '>=', 'Not supported anymore in version  >= 7'),
             ('7', '<', VersionedAPIData(
@@ -8452,7 +8127,7 @@ PATHS = {
         ],
     ),
 
-    ('ip', 'service'): APIData(
+    ('ip', 'service'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -8473,7 +8148,7 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'service', 'webserver'): APIData(
+    ('ip', 'service', 'webserver'): lambda: APIData(
         versioned=[
             ('7.21', '>=', VersionedAPIData(
                 fixed_entries=True,
@@ -8496,7 +8171,7 @@ PATHS = {
         ],
     ),
 
-    ('ip', 'settings'): APIData(
+    ('ip', 'settings'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -8524,7 +8199,7 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'smb'): APIData(
+    ('ip', 'smb'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -8541,7 +8216,7 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'smb', 'shares'): APIData(
+    ('ip', 'smb', 'shares'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             versioned_fields=[
@@ -8563,7 +8238,7 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'smb', 'users'): APIData(
+    ('ip', 'smb', 'users'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             versioned_fields=[
@@ -8581,7 +8256,7 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'socks'): APIData(
+    ('ip', 'socks'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -8600,7 +8275,7 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'socks', 'access'): APIData(
+    ('ip', 'socks', 'access'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             versioned_fields=[
@@ -8620,7 +8295,7 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'socks', 'connections'): APIData(
+    ('ip', 'socks', 'connections'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 # fixed_entries=True,
@@ -8640,7 +8315,7 @@ PATHS = {
         ],
     ),
 
-    ('ip', 'socks', 'users'): APIData(
+    ('ip', 'socks', 'users'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -8657,7 +8332,7 @@ PATHS = {
         ],
     ),
 
-    ('ip', 'socksify'): APIData(
+    ('ip', 'socksify'): lambda: APIData(
         versioned=[
             ('7.20', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -8678,7 +8353,7 @@ PATHS = {
         ],
     ),
 
-    ('ip', 'ssh'): APIData(
+    ('ip', 'ssh'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -8699,7 +8374,7 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'tftp'): APIData(
+    ('ip', 'tftp'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -8722,7 +8397,7 @@ PATHS = {
         ],
     ),
 
-    ('ip', 'tftp', 'settings'): APIData(
+    ('ip', 'tftp', 'settings'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -8733,7 +8408,7 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'traffic-flow'): APIData(
+    ('ip', 'traffic-flow'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -8751,7 +8426,7 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'traffic-flow', 'ipfix'): APIData(
+    ('ip', 'traffic-flow', 'ipfix'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -8797,7 +8472,7 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'traffic-flow', 'target'): APIData(
+    ('ip', 'traffic-flow', 'target'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             versioned_fields=[
@@ -8817,7 +8492,7 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'upnp'): APIData(
+    ('ip', 'upnp'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -8830,7 +8505,7 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'upnp', 'interfaces'): APIData(
+    ('ip', 'upnp', 'interfaces'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('interface', 'type'),
@@ -8847,7 +8522,7 @@ PATHS = {
         ),
     ),
 
-    ('ip', 'vrf'): APIData(
+    ('ip', 'vrf'): lambda: APIData(
         versioned=[
             ('7', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -8867,7 +8542,7 @@ PATHS = {
         ],
     ),
 
-    ('ipv6', 'address'): APIData(
+    ('ipv6', 'address'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             versioned_fields=[
@@ -8877,7 +8552,7 @@ PATHS = {
                 ([('7.15', '>=')], 'numbers', KeyInfo(read_only=True)),
             ],
             fields={
-                'address': KeyInfo(),
+                'address': KeyInfo(value_canonicalizer=_canonicalize_ip),
                 'advertise': KeyInfo(default=True),
                 'comment': KeyInfo(can_disable=True, remove_value=''),
                 'disabled': KeyInfo(default=False),
@@ -8889,7 +8564,7 @@ PATHS = {
         ),
     ),
 
-    ('ipv6', 'dhcp-client'): APIData(
+    ('ipv6', 'dhcp-client'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('interface', 'request'),
@@ -8925,7 +8600,7 @@ PATHS = {
         ),
     ),
 
-    ('ipv6', 'dhcp-client', 'option'): APIData(
+    ('ipv6', 'dhcp-client', 'option'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -8943,7 +8618,7 @@ PATHS = {
         ],
     ),
 
-    ('ipv6', 'dhcp-relay'): APIData(
+    ('ipv6', 'dhcp-relay'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -8966,7 +8641,7 @@ PATHS = {
         ],
     ),
 
-    ('ipv6', 'dhcp-relay', 'option'): APIData(
+    ('ipv6', 'dhcp-relay', 'option'): lambda: APIData(
         versioned=[
             ('7.21', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -8983,7 +8658,7 @@ PATHS = {
         ],
     ),
 
-    ('ipv6', 'dhcp-server'): APIData(
+    ('ipv6', 'dhcp-server'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -9015,7 +8690,7 @@ PATHS = {
         ),
     ),
 
-    ('ipv6', 'dhcp-server', 'binding'): APIData(
+    ('ipv6', 'dhcp-server', 'binding'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -9045,7 +8720,7 @@ PATHS = {
         ],
     ),
 
-    ('ipv6', 'dhcp-server', 'option'): APIData(
+    ('ipv6', 'dhcp-server', 'option'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -9062,7 +8737,7 @@ PATHS = {
         ),
     ),
 
-    ('ipv6', 'dhcp-server', 'option', 'sets'): APIData(
+    ('ipv6', 'dhcp-server', 'option', 'sets'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -9076,7 +8751,7 @@ PATHS = {
         ],
     ),
 
-    ('ipv6', 'firewall', 'address-list'): APIData(
+    ('ipv6', 'firewall', 'address-list'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('address', 'list'),
@@ -9095,10 +8770,11 @@ PATHS = {
         ),
     ),
 
-    ('ipv6', 'firewall', 'filter'): APIData(
+    ('ipv6', 'firewall', 'filter'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             stratify_keys=('chain',),
+            supports_place_before=True,
             versioned_fields=[
                 ([('7.15', '>=')], 'connection-nat-state', KeyInfo()),
                 # ([('7.15', '>=')], 'copy-from', KeyInfo(write_only=True)),
@@ -9166,10 +8842,11 @@ PATHS = {
         ),
     ),
 
-    ('ipv6', 'firewall', 'mangle'): APIData(
+    ('ipv6', 'firewall', 'mangle'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             stratify_keys=('chain',),
+            supports_place_before=True,
             versioned_fields=[
                 ([('7.15', '>=')], 'connection-nat-state', KeyInfo()),
                 # ([('7.15', '>=')], 'copy-from', KeyInfo(write_only=True)),
@@ -9249,10 +8926,11 @@ PATHS = {
         ),
     ),
 
-    ('ipv6', 'firewall', 'nat'): APIData(
+    ('ipv6', 'firewall', 'nat'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             stratify_keys=('chain',),
+            supports_place_before=True,
             versioned_fields=[
                 # ([('7.15', '>=')], 'copy-from', KeyInfo(write_only=True)),
                 ([('7.15', '>=')], 'headers', KeyInfo()),
@@ -9322,10 +9000,11 @@ PATHS = {
         ),
     ),
 
-    ('ipv6', 'firewall', 'raw'): APIData(
+    ('ipv6', 'firewall', 'raw'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             stratify_keys=('chain',),
+            supports_place_before=True,
             versioned_fields=[
                 # ([('7.15', '>=')], 'copy-from', KeyInfo(write_only=True)),
                 ([('7.15', '>=')], 'numbers', KeyInfo(read_only=True)),
@@ -9384,7 +9063,7 @@ PATHS = {
         ),
     ),
 
-    ('ipv6', 'nd'): APIData(
+    ('ipv6', 'nd'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('interface',),
@@ -9414,7 +9093,7 @@ PATHS = {
         ),
     ),
 
-    ('ipv6', 'nd', 'prefix'): APIData(
+    ('ipv6', 'nd', 'prefix'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             versioned_fields=[
@@ -9436,7 +9115,7 @@ PATHS = {
         ),
     ),
 
-    ('ipv6', 'nd', 'prefix', 'default'): APIData(
+    ('ipv6', 'nd', 'prefix', 'default'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -9452,7 +9131,7 @@ PATHS = {
         ),
     ),
 
-    ('ipv6', 'nd', 'proxy'): APIData(
+    ('ipv6', 'nd', 'proxy'): lambda: APIData(
         versioned=[
             ('7.20', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -9468,7 +9147,7 @@ PATHS = {
         ],
     ),
 
-    ('ipv6', 'neighbor'): APIData(
+    ('ipv6', 'neighbor'): lambda: APIData(
         versioned=[
             ('7.18', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -9485,7 +9164,7 @@ PATHS = {
         ],
     ),
 
-    ('ipv6', 'pool'): APIData(
+    ('ipv6', 'pool'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -9504,7 +9183,7 @@ PATHS = {
         ],
     ),
 
-    ('ipv6', 'route'): APIData(
+    ('ipv6', 'route'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             versioned_fields=[
@@ -9538,7 +9217,7 @@ PATHS = {
         ),
     ),
 
-    ('ipv6', 'settings'): APIData(
+    ('ipv6', 'settings'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -9564,7 +9243,7 @@ PATHS = {
         ),
     ),
 
-    ('lcd',): APIData(
+    ('lcd',): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fixed_entries=True,
@@ -9584,7 +9263,7 @@ PATHS = {
         ],
     ),
 
-    ('lcd', 'interface'): APIData(
+    ('lcd', 'interface'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -9602,7 +9281,7 @@ PATHS = {
         ],
     ),
 
-    ('lcd', 'interface', 'pages'): APIData(
+    ('lcd', 'interface', 'pages'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -9618,7 +9297,7 @@ PATHS = {
         ],
     ),
 
-    ('lcd', 'pin'): APIData(
+    ('lcd', 'pin'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fixed_entries=True,
@@ -9632,7 +9311,7 @@ PATHS = {
         ],
     ),
 
-    ('lcd', 'screen'): APIData(
+    ('lcd', 'screen'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 # fixed_entries=True,
@@ -9648,7 +9327,7 @@ PATHS = {
         ],
     ),
 
-    ('lora',): APIData(
+    ('lora',): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 # fixed_entries=True,
@@ -9681,7 +9360,7 @@ PATHS = {
         ],
     ),
 
-    ('lora', 'channels'): APIData(
+    ('lora', 'channels'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 # fixed_entries=True,
@@ -9701,7 +9380,7 @@ PATHS = {
         ],
     ),
 
-    ('lora', 'joineui'): APIData(
+    ('lora', 'joineui'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -9719,7 +9398,7 @@ PATHS = {
         ],
     ),
 
-    ('lora', 'netid'): APIData(
+    ('lora', 'netid'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -9737,7 +9416,7 @@ PATHS = {
         ],
     ),
 
-    ('lora', 'radios'): APIData(
+    ('lora', 'radios'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 # fixed_entries=True,
@@ -9759,7 +9438,7 @@ PATHS = {
         ],
     ),
 
-    ('lora', 'servers'): APIData(
+    ('lora', 'servers'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -9783,7 +9462,7 @@ PATHS = {
         ],
     ),
 
-    ('lora', 'traffic', 'options'): APIData(
+    ('lora', 'traffic', 'options'): lambda: APIData(
         versioned=[
             ('7.17', '>=', VersionedAPIData(
                 fixed_entries=True,
@@ -9799,7 +9478,7 @@ PATHS = {
         ],
     ),
 
-    ('mpls',): APIData(
+    ('mpls',): lambda: APIData(
         versioned=[
             ('7.15', '>=', 'Not supported anymore in version  >= 7.15'),
             ('7.15', '<', VersionedAPIData(
@@ -9814,7 +9493,7 @@ PATHS = {
         ],
     ),
 
-    ('mpls', 'interface'): APIData(
+    ('mpls', 'interface'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             versioned_fields=[
@@ -9833,7 +9512,7 @@ PATHS = {
         ),
     ),
 
-    ('mpls', 'ldp'): APIData(
+    ('mpls', 'ldp'): lambda: APIData(
         versioned=[
             ('7.1', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -9874,7 +9553,7 @@ PATHS = {
         ],
     ),
 
-    ('mpls', 'ldp', 'accept-filter'): APIData(
+    ('mpls', 'ldp', 'accept-filter'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             versioned_fields=[
@@ -9893,7 +9572,7 @@ PATHS = {
         ),
     ),
 
-    ('mpls', 'ldp', 'advertise-filter'): APIData(
+    ('mpls', 'ldp', 'advertise-filter'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             versioned_fields=[
@@ -9912,7 +9591,7 @@ PATHS = {
         ),
     ),
 
-    ('mpls', 'ldp', 'interface'): APIData(
+    ('mpls', 'ldp', 'interface'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             versioned_fields=[
@@ -9932,7 +9611,7 @@ PATHS = {
         ),
     ),
 
-    ('mpls', 'ldp', 'local-mapping'): APIData(
+    ('mpls', 'ldp', 'local-mapping'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -9949,7 +9628,7 @@ PATHS = {
         ],
     ),
 
-    ('mpls', 'ldp', 'neighbor'): APIData(
+    ('mpls', 'ldp', 'neighbor'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -9965,7 +9644,7 @@ PATHS = {
         ],
     ),
 
-    ('mpls', 'ldp', 'remote-mapping'): APIData(
+    ('mpls', 'ldp', 'remote-mapping'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -9983,7 +9662,7 @@ PATHS = {
         ],
     ),
 
-    ('mpls', 'mangle'): APIData(
+    ('mpls', 'mangle'): lambda: APIData(
         versioned=[
             ('7.17', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -10001,7 +9680,7 @@ PATHS = {
         ],
     ),
 
-    ('mpls', 'settings'): APIData(
+    ('mpls', 'settings'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fixed_entries=True,
@@ -10016,7 +9695,7 @@ PATHS = {
         ],
     ),
 
-    ('mpls', 'traffic-eng', 'interface'): APIData(
+    ('mpls', 'traffic-eng', 'interface'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -10041,7 +9720,7 @@ PATHS = {
         ],
     ),
 
-    ('mpls', 'traffic-eng', 'path'): APIData(
+    ('mpls', 'traffic-eng', 'path'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -10065,7 +9744,7 @@ PATHS = {
         ],
     ),
 
-    ('mpls', 'traffic-eng', 'tunnel'): APIData(
+    ('mpls', 'traffic-eng', 'tunnel'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -10100,7 +9779,7 @@ PATHS = {
         ],
     ),
 
-    ('openflow',): APIData(
+    ('openflow',): lambda: APIData(
         versioned=[
             ('7.20', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -10122,7 +9801,7 @@ PATHS = {
         ],
     ),
 
-    ('openflow', 'port'): APIData(
+    ('openflow', 'port'): lambda: APIData(
         versioned=[
             ('7.20', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -10139,7 +9818,7 @@ PATHS = {
         ],
     ),
 
-    ('partitions',): APIData(
+    ('partitions',): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 # fixed_entries=True,
@@ -10156,7 +9835,7 @@ PATHS = {
         ],
     ),
 
-    ('port',): APIData(
+    ('port',): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 # fixed_entries=True,
@@ -10178,7 +9857,7 @@ PATHS = {
         ],
     ),
 
-    ('port', 'firmware'): APIData(
+    ('port', 'firmware'): lambda: APIData(
         versioned=[
             ('7.15', '>=', 'Not supported anymore in version  >= 7.15'),
             ('7.15', '<', VersionedAPIData(
@@ -10192,7 +9871,7 @@ PATHS = {
         ],
     ),
 
-    ('port', 'remote-access'): APIData(
+    ('port', 'remote-access'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             versioned_fields=[
@@ -10213,7 +9892,7 @@ PATHS = {
         ),
     ),
 
-    ('ppp', 'aaa'): APIData(
+    ('ppp', 'aaa'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -10230,7 +9909,7 @@ PATHS = {
         ),
     ),
 
-    ('ppp', 'l2tp-secret'): APIData(
+    ('ppp', 'l2tp-secret'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -10245,7 +9924,7 @@ PATHS = {
         ],
     ),
 
-    ('ppp', 'profile'): APIData(
+    ('ppp', 'profile'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -10295,7 +9974,7 @@ PATHS = {
         ),
     ),
 
-    ('ppp', 'secret'): APIData(
+    ('ppp', 'secret'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -10322,7 +10001,7 @@ PATHS = {
         ),
     ),
 
-    ('queue', 'interface'): APIData(
+    ('queue', 'interface'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -10337,7 +10016,7 @@ PATHS = {
         ),
     ),
 
-    ('queue', 'simple'): APIData(
+    ('queue', 'simple'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -10375,7 +10054,7 @@ PATHS = {
         ),
     ),
 
-    ('queue', 'tree'): APIData(
+    ('queue', 'tree'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -10401,7 +10080,7 @@ PATHS = {
         ),
     ),
 
-    ('queue', 'type'): APIData(
+    ('queue', 'type'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -10464,7 +10143,7 @@ PATHS = {
         ),
     ),
 
-    ('radius',): APIData(
+    ('radius',): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             versioned_fields=[
@@ -10494,7 +10173,7 @@ PATHS = {
         ),
     ),
 
-    ('radius', 'incoming'): APIData(
+    ('radius', 'incoming'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -10509,7 +10188,7 @@ PATHS = {
         ),
     ),
 
-    ('routing', 'bfd', 'configuration'): APIData(
+    ('routing', 'bfd', 'configuration'): lambda: APIData(
         versioned=[
             ('7.11', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -10537,7 +10216,7 @@ PATHS = {
         ],
     ),
 
-    ('routing', 'bfd', 'interface'): APIData(
+    ('routing', 'bfd', 'interface'): lambda: APIData(
         versioned=[
             ('7.15', '>=', 'Not supported anymore in version  >= 7.15'),
             ('7.15', '<', VersionedAPIData(
@@ -10554,7 +10233,7 @@ PATHS = {
         ],
     ),
 
-    ('routing', 'bgp', 'aggregate'): APIData(
+    ('routing', 'bgp', 'aggregate'): lambda: APIData(
         versioned=[
             ('7.15', '>=', 'Not supported anymore in version  >= 7.15'),
             ('7.15', '<', VersionedAPIData(
@@ -10575,7 +10254,7 @@ PATHS = {
         ],
     ),
 
-    ('routing', 'bgp', 'connection'): APIData(
+    ('routing', 'bgp', 'connection'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             versioned_fields=[
@@ -10651,7 +10330,7 @@ PATHS = {
         ),
     ),
 
-    ('routing', 'bgp', 'evpn'): APIData(
+    ('routing', 'bgp', 'evpn'): lambda: APIData(
         versioned=[
             ('7.20', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -10673,7 +10352,7 @@ PATHS = {
         ],
     ),
 
-    ('routing', 'bgp', 'instance'): APIData(
+    ('routing', 'bgp', 'instance'): lambda: APIData(
         versioned=[
             ('7.20', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -10719,7 +10398,7 @@ PATHS = {
         ],
     ),
 
-    ('routing', 'bgp', 'network'): APIData(
+    ('routing', 'bgp', 'network'): lambda: APIData(
         versioned=[
             ('7.15', '>=', 'Not supported anymore in version  >= 7.15'),
             ('7.15', '<', VersionedAPIData(
@@ -10735,7 +10414,7 @@ PATHS = {
         ],
     ),
 
-    ('routing', 'bgp', 'peer'): APIData(
+    ('routing', 'bgp', 'peer'): lambda: APIData(
         versioned=[
             ('7.15', '>=', 'Not supported anymore in version  >= 7.15'),
             ('7.15', '<', VersionedAPIData(
@@ -10774,7 +10453,7 @@ PATHS = {
         ],
     ),
 
-    ('routing', 'bgp', 'template'): APIData(
+    ('routing', 'bgp', 'template'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -10841,7 +10520,7 @@ PATHS = {
         ),
     ),
 
-    ('routing', 'bgp', 'vpls'): APIData(
+    ('routing', 'bgp', 'vpls'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -10872,7 +10551,7 @@ PATHS = {
         ],
     ),
 
-    ('routing', 'bgp', 'vpn'): APIData(
+    ('routing', 'bgp', 'vpn'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -10900,7 +10579,7 @@ PATHS = {
         ],
     ),
 
-    ('routing', 'fantasy'): APIData(
+    ('routing', 'fantasy'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -10928,7 +10607,7 @@ PATHS = {
         ],
     ),
 
-    ('routing', 'filter'): APIData(
+    ('routing', 'filter'): lambda: APIData(
         versioned=[
             ('7', '>=', 'Not supported anymore in version  >= 7'),
             ('7', '<', VersionedAPIData(
@@ -10997,7 +10676,7 @@ PATHS = {
         ],
     ),
 
-    ('routing', 'filter', 'community-ext-list'): APIData(
+    ('routing', 'filter', 'community-ext-list'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -11015,7 +10694,7 @@ PATHS = {
         ],
     ),
 
-    ('routing', 'filter', 'community-large-list'): APIData(
+    ('routing', 'filter', 'community-large-list'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -11033,7 +10712,7 @@ PATHS = {
         ],
     ),
 
-    ('routing', 'filter', 'community-list'): APIData(
+    ('routing', 'filter', 'community-list'): lambda: APIData(
         versioned=[
             ('7', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -11053,7 +10732,7 @@ PATHS = {
         ],
     ),
 
-    ('routing', 'filter', 'num-list'): APIData(
+    ('routing', 'filter', 'num-list'): lambda: APIData(
         versioned=[
             ('7', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -11072,7 +10751,7 @@ PATHS = {
         ],
     ),
 
-    ('routing', 'filter', 'rule'): APIData(
+    ('routing', 'filter', 'rule'): lambda: APIData(
         versioned=[
             ('7', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -11091,7 +10770,7 @@ PATHS = {
         ],
     ),
 
-    ('routing', 'filter', 'select-rule'): APIData(
+    ('routing', 'filter', 'select-rule'): lambda: APIData(
         versioned=[
             ('7', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -11116,7 +10795,7 @@ PATHS = {
         ],
     ),
 
-    ('routing', 'gmp'): APIData(
+    ('routing', 'gmp'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -11133,7 +10812,7 @@ PATHS = {
         ],
     ),
 
-    ('routing', 'id'): APIData(
+    ('routing', 'id'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             versioned_fields=[
@@ -11151,7 +10830,7 @@ PATHS = {
         ),
     ),
 
-    ('routing', 'igmp-proxy'): APIData(
+    ('routing', 'igmp-proxy'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -11164,7 +10843,7 @@ PATHS = {
         ),
     ),
 
-    ('routing', 'igmp-proxy', 'interface'): APIData(
+    ('routing', 'igmp-proxy', 'interface'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('interface',),
@@ -11183,7 +10862,7 @@ PATHS = {
         ),
     ),
 
-    ('routing', 'igmp-proxy', 'mfc'): APIData(
+    ('routing', 'igmp-proxy', 'mfc'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -11200,7 +10879,7 @@ PATHS = {
         ],
     ),
 
-    ('routing', 'isis', 'instance'): APIData(
+    ('routing', 'isis', 'instance'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -11236,7 +10915,7 @@ PATHS = {
         ],
     ),
 
-    ('routing', 'isis', 'interface'): APIData(
+    ('routing', 'isis', 'interface'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 # fixed_entries=True,
@@ -11272,7 +10951,7 @@ PATHS = {
         ],
     ),
 
-    ('routing', 'isis', 'interface-template'): APIData(
+    ('routing', 'isis', 'interface-template'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -11317,7 +10996,7 @@ PATHS = {
         ],
     ),
 
-    ('routing', 'isis', 'lsp'): APIData(
+    ('routing', 'isis', 'lsp'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 # fixed_entries=True,
@@ -11338,7 +11017,7 @@ PATHS = {
         ],
     ),
 
-    ('routing', 'isis', 'neighbor'): APIData(
+    ('routing', 'isis', 'neighbor'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 # fixed_entries=True,
@@ -11358,7 +11037,7 @@ PATHS = {
         ],
     ),
 
-    ('routing', 'mme'): APIData(
+    ('routing', 'mme'): lambda: APIData(
         versioned=[
             ('7.15', '>=', 'Not supported anymore in version  >= 7.15'),
             ('7.15', '<', VersionedAPIData(
@@ -11378,7 +11057,7 @@ PATHS = {
         ],
     ),
 
-    ('routing', 'ospf', 'area'): APIData(
+    ('routing', 'ospf', 'area'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -11400,7 +11079,7 @@ PATHS = {
         ),
     ),
 
-    ('routing', 'ospf', 'area', 'range'): APIData(
+    ('routing', 'ospf', 'area', 'range'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('area', 'prefix'),
@@ -11419,7 +11098,7 @@ PATHS = {
         ),
     ),
 
-    ('routing', 'ospf', 'instance'): APIData(
+    ('routing', 'ospf', 'instance'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -11449,7 +11128,7 @@ PATHS = {
         ),
     ),
 
-    ('routing', 'ospf', 'interface-template'): APIData(
+    ('routing', 'ospf', 'interface-template'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             versioned_fields=[
@@ -11483,7 +11162,7 @@ PATHS = {
         ),
     ),
 
-    ('routing', 'ospf', 'neighbor'): APIData(
+    ('routing', 'ospf', 'neighbor'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 # fixed_entries=True,
@@ -11499,7 +11178,7 @@ PATHS = {
         ],
     ),
 
-    ('routing', 'ospf', 'static-neighbor'): APIData(
+    ('routing', 'ospf', 'static-neighbor'): lambda: APIData(
         versioned=[
             ('7', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -11519,7 +11198,7 @@ PATHS = {
         ],
     ),
 
-    ('routing', 'ospf-v3', 'area'): APIData(
+    ('routing', 'ospf-v3', 'area'): lambda: APIData(
         versioned=[
             ('7.15', '>=', 'Not supported anymore in version  >= 7.15'),
             ('7.15', '<', VersionedAPIData(
@@ -11536,7 +11215,7 @@ PATHS = {
         ],
     ),
 
-    ('routing', 'ospf-v3', 'instance'): APIData(
+    ('routing', 'ospf-v3', 'instance'): lambda: APIData(
         versioned=[
             ('7.15', '>=', 'Not supported anymore in version  >= 7.15'),
             ('7.15', '<', VersionedAPIData(
@@ -11563,7 +11242,7 @@ PATHS = {
         ],
     ),
 
-    ('routing', 'pimsm', 'bsr', 'candidate'): APIData(
+    ('routing', 'pimsm', 'bsr', 'candidate'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -11582,7 +11261,7 @@ PATHS = {
         ],
     ),
 
-    ('routing', 'pimsm', 'bsr', 'rp-candidate'): APIData(
+    ('routing', 'pimsm', 'bsr', 'rp-candidate'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -11600,7 +11279,7 @@ PATHS = {
         ],
     ),
 
-    ('routing', 'pimsm', 'igmp-interface-template'): APIData(
+    ('routing', 'pimsm', 'igmp-interface-template'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 # fixed_entries=True,
@@ -11616,7 +11295,7 @@ PATHS = {
         ],
     ),
 
-    ('routing', 'pimsm', 'instance'): APIData(
+    ('routing', 'pimsm', 'instance'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -11641,7 +11320,7 @@ PATHS = {
         ),
     ),
 
-    ('routing', 'pimsm', 'interface-template'): APIData(
+    ('routing', 'pimsm', 'interface-template'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             versioned_fields=[
@@ -11665,7 +11344,7 @@ PATHS = {
         ),
     ),
 
-    ('routing', 'pimsm', 'static-rp'): APIData(
+    ('routing', 'pimsm', 'static-rp'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -11684,7 +11363,7 @@ PATHS = {
         ],
     ),
 
-    ('routing', 'rip'): APIData(
+    ('routing', 'rip'): lambda: APIData(
         versioned=[
             ('7.15', '>=', 'Not supported anymore in version  >= 7.15'),
             ('7.15', '<', VersionedAPIData(
@@ -11710,7 +11389,7 @@ PATHS = {
         ],
     ),
 
-    ('routing', 'rip', 'instance'): APIData(
+    ('routing', 'rip', 'instance'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -11735,7 +11414,7 @@ PATHS = {
         ],
     ),
 
-    ('routing', 'rip', 'interface-template'): APIData(
+    ('routing', 'rip', 'interface-template'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -11758,7 +11437,7 @@ PATHS = {
         ],
     ),
 
-    ('routing', 'rip', 'keys'): APIData(
+    ('routing', 'rip', 'keys'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -11776,7 +11455,7 @@ PATHS = {
         ],
     ),
 
-    ('routing', 'rip', 'static-neighbor'): APIData(
+    ('routing', 'rip', 'static-neighbor'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -11791,7 +11470,7 @@ PATHS = {
         ],
     ),
 
-    ('routing', 'ripng'): APIData(
+    ('routing', 'ripng'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             single_value=True,
@@ -11813,7 +11492,7 @@ PATHS = {
         ),
     ),
 
-    ('routing', 'route'): APIData(
+    ('routing', 'route'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 # fixed_entries=True,
@@ -11830,7 +11509,7 @@ PATHS = {
         ],
     ),
 
-    ('routing', 'route', 'rule'): APIData(
+    ('routing', 'route', 'rule'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 # fixed_entries=True,
@@ -11853,7 +11532,7 @@ PATHS = {
         ],
     ),
 
-    ('routing', 'rpki'): APIData(
+    ('routing', 'rpki'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -11875,7 +11554,7 @@ PATHS = {
         ],
     ),
 
-    ('routing', 'rule'): APIData(
+    ('routing', 'rule'): lambda: APIData(
         versioned=[
             ('7', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -11902,7 +11581,7 @@ PATHS = {
         ],
     ),
 
-    ('routing', 'settings'): APIData(
+    ('routing', 'settings'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fixed_entries=True,
@@ -11923,7 +11602,7 @@ PATHS = {
         ],
     ),
 
-    ('routing', 'table'): APIData(
+    ('routing', 'table'): lambda: APIData(
         versioned=[
             ('7', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -11941,7 +11620,7 @@ PATHS = {
         ],
     ),
 
-    ('rsync-daemon',): APIData(
+    ('rsync-daemon',): lambda: APIData(
         versioned=[
             ('7.16', '>=', 'Not supported anymore in version  >= 7.16'),
             ('7.15', '>=', VersionedAPIData(
@@ -11955,7 +11634,7 @@ PATHS = {
         ],
     ),
 
-    ('snmp',): APIData(
+    ('snmp',): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -11980,7 +11659,7 @@ PATHS = {
         ),
     ),
 
-    ('snmp', 'community'): APIData(
+    ('snmp', 'community'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -12005,7 +11684,7 @@ PATHS = {
         ),
     ),
 
-    ('special-login',): APIData(
+    ('special-login',): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -12021,7 +11700,7 @@ PATHS = {
         ],
     ),
 
-    ('system', 'clock'): APIData(
+    ('system', 'clock'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -12038,7 +11717,7 @@ PATHS = {
         ),
     ),
 
-    ('system', 'clock', 'manual'): APIData(
+    ('system', 'clock', 'manual'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -12052,7 +11731,7 @@ PATHS = {
         ),
     ),
 
-    ('system', 'console'): APIData(
+    ('system', 'console'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -12068,7 +11747,7 @@ PATHS = {
         ],
     ),
 
-    ('system', 'console', 'screen'): APIData(
+    ('system', 'console', 'screen'): lambda: APIData(
         versioned=[
             ('7.16.1', '>=', 'Not supported anymore in version  >= 7.16.1'),
             ('7.15.3', '>=', VersionedAPIData(
@@ -12083,7 +11762,7 @@ PATHS = {
         ],
     ),
 
-    ('system', 'gps'): APIData(
+    ('system', 'gps'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fixed_entries=True,
@@ -12102,7 +11781,7 @@ PATHS = {
         ],
     ),
 
-    ('system', 'hardware'): APIData(
+    ('system', 'hardware'): lambda: APIData(
         versioned=[
             ('7.16.1', '>=', 'Not supported anymore in version  >= 7.16.1'),
             ('7.15.3', '>=', VersionedAPIData(
@@ -12116,7 +11795,7 @@ PATHS = {
         ],
     ),
 
-    ('system', 'health'): APIData(
+    ('system', 'health'): lambda: APIData(
         versioned=[
             ('7.16.1', '>=', 'Not supported anymore in version  >= 7.16.1'),
             ('7.15.3', '>=', VersionedAPIData(
@@ -12130,7 +11809,7 @@ PATHS = {
         ],
     ),
 
-    ('system', 'health', 'settings'): APIData(
+    ('system', 'health', 'settings'): lambda: APIData(
         versioned=[
             ('7.14', '>=', VersionedAPIData(
                 fixed_entries=True,
@@ -12171,7 +11850,7 @@ PATHS = {
         ],
     ),
 
-    ('system', 'identity'): APIData(
+    ('system', 'identity'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -12182,7 +11861,7 @@ PATHS = {
         ),
     ),
 
-    ('system', 'leds'): APIData(
+    ('system', 'leds'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -12202,7 +11881,7 @@ PATHS = {
         ],
     ),
 
-    ('system', 'leds', 'settings'): APIData(
+    ('system', 'leds', 'settings'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -12213,7 +11892,7 @@ PATHS = {
         ),
     ),
 
-    ('system', 'logging'): APIData(
+    ('system', 'logging'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             versioned_fields=[
@@ -12231,7 +11910,7 @@ PATHS = {
         ),
     ),
 
-    ('system', 'logging', 'action'): APIData(
+    ('system', 'logging', 'action'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -12269,7 +11948,7 @@ PATHS = {
         ),
     ),
 
-    ('system', 'note'): APIData(
+    ('system', 'note'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -12284,7 +11963,7 @@ PATHS = {
         ),
     ),
 
-    ('system', 'ntp', 'client'): APIData(
+    ('system', 'ntp', 'client'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -12303,7 +11982,7 @@ PATHS = {
         ),
     ),
 
-    ('system', 'ntp', 'client', 'servers'): APIData(
+    ('system', 'ntp', 'client', 'servers'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('address',),
@@ -12323,7 +12002,7 @@ PATHS = {
         ),
     ),
 
-    ('system', 'ntp', 'key'): APIData(
+    ('system', 'ntp', 'key'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -12338,7 +12017,7 @@ PATHS = {
         ],
     ),
 
-    ('system', 'ntp', 'server'): APIData(
+    ('system', 'ntp', 'server'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -12357,7 +12036,7 @@ PATHS = {
         ),
     ),
 
-    ('system', 'package', 'local-update'): APIData(
+    ('system', 'package', 'local-update'): lambda: APIData(
         versioned=[
             ('7.22', '>=', 'Not supported anymore in version 7.22'),
             ('7.17', '>=', VersionedAPIData(
@@ -12373,7 +12052,7 @@ PATHS = {
         ],
     ),
 
-    ('system', 'package', 'local-update', 'mirror'): APIData(
+    ('system', 'package', 'local-update', 'mirror'): lambda: APIData(
         versioned=[
             ('7.17', '>=', VersionedAPIData(
                 fixed_entries=True,
@@ -12391,7 +12070,7 @@ PATHS = {
         ],
     ),
 
-    ('system', 'package', 'local-update', 'update-package-source'): APIData(
+    ('system', 'package', 'local-update', 'update-package-source'): lambda: APIData(
         versioned=[
             ('7.17', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -12408,7 +12087,7 @@ PATHS = {
         ],
     ),
 
-    ('system', 'package', 'update'): APIData(
+    ('system', 'package', 'update'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -12422,7 +12101,7 @@ PATHS = {
         ),
     ),
 
-    ('system', 'resource', 'hardware', 'usb-settings'): APIData(
+    ('system', 'resource', 'hardware', 'usb-settings'): lambda: APIData(
         versioned=[
             ('7.20', '>=', VersionedAPIData(
                 fixed_entries=True,
@@ -12435,7 +12114,7 @@ PATHS = {
         ],
     ),
 
-    ('system', 'resource', 'irq'): APIData(
+    ('system', 'resource', 'irq'): lambda: APIData(
         unversioned=VersionedAPIData(
             # fixed_entries=True,
             fully_understood=True,
@@ -12448,7 +12127,7 @@ PATHS = {
         ),
     ),
 
-    ('system', 'resource', 'irq', 'rps'): APIData(
+    ('system', 'resource', 'irq', 'rps'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -12463,7 +12142,7 @@ PATHS = {
         ),
     ),
 
-    ('system', 'resource', 'usb'): APIData(
+    ('system', 'resource', 'usb'): lambda: APIData(
         versioned=[
             ('7.20', '>=', 'Not supported anymore in version  >= 7.20'),
             ('7.15', '>=', VersionedAPIData(
@@ -12487,7 +12166,7 @@ PATHS = {
         ],
     ),
 
-    ('system', 'resource', 'usb', 'settings'): APIData(
+    ('system', 'resource', 'usb', 'settings'): lambda: APIData(
         versioned=[
             ('7.20', '>=', 'Not supported anymore in version  >= 7.20'),
             ('7.15', '>=', VersionedAPIData(
@@ -12501,7 +12180,7 @@ PATHS = {
         ],
     ),
 
-    ('system', 'routerboard', 'mode-button'): APIData(
+    ('system', 'routerboard', 'mode-button'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fixed_entries=True,
@@ -12516,7 +12195,7 @@ PATHS = {
         ],
     ),
 
-    ('system', 'routerboard', 'reset-button'): APIData(
+    ('system', 'routerboard', 'reset-button'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fixed_entries=True,
@@ -12531,7 +12210,7 @@ PATHS = {
         ],
     ),
 
-    ('system', 'routerboard', 'settings'): APIData(
+    ('system', 'routerboard', 'settings'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -12567,7 +12246,7 @@ PATHS = {
         ),
     ),
 
-    ('system', 'routerboard', 'usb'): APIData(
+    ('system', 'routerboard', 'usb'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fixed_entries=True,
@@ -12581,7 +12260,7 @@ PATHS = {
         ],
     ),
 
-    ('system', 'routerboard', 'wps-button'): APIData(
+    ('system', 'routerboard', 'wps-button'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fixed_entries=True,
@@ -12596,7 +12275,7 @@ PATHS = {
         ],
     ),
 
-    ('system', 'scheduler'): APIData(
+    ('system', 'scheduler'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -12617,7 +12296,7 @@ PATHS = {
         ),
     ),
 
-    ('system', 'script'): APIData(
+    ('system', 'script'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -12636,7 +12315,7 @@ PATHS = {
         ),
     ),
 
-    ('system', 'script', 'environment'): APIData(
+    ('system', 'script', 'environment'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 # fixed_entries=True,
@@ -12652,7 +12331,7 @@ PATHS = {
         ],
     ),
 
-    ('system', 'script', 'job'): APIData(
+    ('system', 'script', 'job'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 # fixed_entries=True,
@@ -12669,7 +12348,7 @@ PATHS = {
         ],
     ),
 
-    ('system', 'swos'): APIData(
+    ('system', 'swos'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fixed_entries=True,
@@ -12687,7 +12366,7 @@ PATHS = {
         ],
     ),
 
-    ('system', 'upgrade'): APIData(
+    ('system', 'upgrade'): lambda: APIData(
         versioned=[
             ('7.17', '>=', 'Not supported anymore in version  >= 7.17'),
             ('7.15', '>=', VersionedAPIData(
@@ -12703,7 +12382,7 @@ PATHS = {
         ],
     ),
 
-    ('system', 'upgrade', 'mirror'): APIData(
+    ('system', 'upgrade', 'mirror'): lambda: APIData(
         versioned=[
             ('7.17', '>=', 'Not supported anymore in version  >= 7.17'),
             ('7.17', '<', VersionedAPIData(
@@ -12724,7 +12403,7 @@ PATHS = {
         ],
     ),
 
-    ('system', 'upgrade', 'upgrade-package-source'): APIData(
+    ('system', 'upgrade', 'upgrade-package-source'): lambda: APIData(
         versioned=[
             ('7.17', '>=', 'Not supported anymore in version  >= 7.17'),
             ('7.15', '>=', VersionedAPIData(
@@ -12739,7 +12418,7 @@ PATHS = {
         ],
     ),
 
-    ('system', 'ups'): APIData(
+    ('system', 'ups'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -12760,7 +12439,7 @@ PATHS = {
         ),
     ),
 
-    ('system', 'watchdog'): APIData(
+    ('system', 'watchdog'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -12779,7 +12458,7 @@ PATHS = {
         ),
     ),
 
-    ('task',): APIData(
+    ('task',): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -12799,7 +12478,7 @@ PATHS = {
         ],
     ),
 
-    ('tool', 'bandwidth-server'): APIData(
+    ('tool', 'bandwidth-server'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -12817,7 +12496,7 @@ PATHS = {
         ),
     ),
 
-    ('tool', 'calea'): APIData(
+    ('tool', 'calea'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -12843,7 +12522,7 @@ PATHS = {
         ],
     ),
 
-    ('tool', 'e-mail'): APIData(
+    ('tool', 'e-mail'): lambda: APIData(
         versioned=[
             ('7.12', '>=', VersionedAPIData(
                 fixed_entries=True,
@@ -12882,7 +12561,7 @@ PATHS = {
         ],
     ),
 
-    ('tool', 'graphing'): APIData(
+    ('tool', 'graphing'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -12894,7 +12573,7 @@ PATHS = {
         ),
     ),
 
-    ('tool', 'graphing', 'interface'): APIData(
+    ('tool', 'graphing', 'interface'): lambda: APIData(
         versioned=[
             ('7', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -12913,7 +12592,7 @@ PATHS = {
         ],
     ),
 
-    ('tool', 'graphing', 'queue'): APIData(
+    ('tool', 'graphing', 'queue'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -12931,7 +12610,7 @@ PATHS = {
         ],
     ),
 
-    ('tool', 'graphing', 'resource'): APIData(
+    ('tool', 'graphing', 'resource'): lambda: APIData(
         versioned=[
             ('7', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -12949,7 +12628,7 @@ PATHS = {
         ],
     ),
 
-    ('tool', 'mac-server'): APIData(
+    ('tool', 'mac-server'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -12960,7 +12639,7 @@ PATHS = {
         ),
     ),
 
-    ('tool', 'mac-server', 'mac-winbox'): APIData(
+    ('tool', 'mac-server', 'mac-winbox'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -12971,7 +12650,7 @@ PATHS = {
         ),
     ),
 
-    ('tool', 'mac-server', 'ping'): APIData(
+    ('tool', 'mac-server', 'ping'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -12982,7 +12661,7 @@ PATHS = {
         ),
     ),
 
-    ('tool', 'mac-server', 'sessions'): APIData(
+    ('tool', 'mac-server', 'sessions'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 # fixed_entries=True,
@@ -12999,7 +12678,7 @@ PATHS = {
         ],
     ),
 
-    ('tool', 'netwatch'): APIData(
+    ('tool', 'netwatch'): lambda: APIData(
         versioned=[
             ('7', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -13049,7 +12728,7 @@ PATHS = {
         ],
     ),
 
-    ('tool', 'romon'): APIData(
+    ('tool', 'romon'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -13062,7 +12741,7 @@ PATHS = {
         ),
     ),
 
-    ('tool', 'romon', 'port'): APIData(
+    ('tool', 'romon', 'port'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             versioned_fields=[
@@ -13080,7 +12759,7 @@ PATHS = {
         ),
     ),
 
-    ('tool', 'sms'): APIData(
+    ('tool', 'sms'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -13102,7 +12781,7 @@ PATHS = {
         ),
     ),
 
-    ('tool', 'sniffer'): APIData(
+    ('tool', 'sniffer'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -13145,7 +12824,7 @@ PATHS = {
         ),
     ),
 
-    ('tool', 'traffic-generator'): APIData(
+    ('tool', 'traffic-generator'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -13159,7 +12838,7 @@ PATHS = {
         ),
     ),
 
-    ('tool', 'traffic-generator', 'packet-template'): APIData(
+    ('tool', 'traffic-generator', 'packet-template'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -13215,7 +12894,7 @@ PATHS = {
         ],
     ),
 
-    ('tool', 'traffic-generator', 'port'): APIData(
+    ('tool', 'traffic-generator', 'port'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -13230,7 +12909,7 @@ PATHS = {
         ],
     ),
 
-    ('tool', 'traffic-generator', 'raw-packet-template'): APIData(
+    ('tool', 'traffic-generator', 'raw-packet-template'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -13257,7 +12936,7 @@ PATHS = {
         ],
     ),
 
-    ('tool', 'traffic-generator', 'stream'): APIData(
+    ('tool', 'traffic-generator', 'stream'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -13279,7 +12958,7 @@ PATHS = {
         ],
     ),
 
-    ('tool', 'traffic-monitor'): APIData(
+    ('tool', 'traffic-monitor'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -13299,7 +12978,7 @@ PATHS = {
         ],
     ),
 
-    ('tr069-client',): APIData(
+    ('tr069-client',): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fixed_entries=True,
@@ -13323,7 +13002,7 @@ PATHS = {
         ],
     ),
 
-    ('user',): APIData(
+    ('user',): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -13346,7 +13025,7 @@ PATHS = {
         ),
     ),
 
-    ('user', 'aaa'): APIData(
+    ('user', 'aaa'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -13361,7 +13040,7 @@ PATHS = {
         ),
     ),
 
-    ('user', 'active'): APIData(
+    ('user', 'active'): lambda: APIData(
         versioned=[
             ('7.20', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -13373,7 +13052,7 @@ PATHS = {
         ],
     ),
 
-    ('user', 'group'): APIData(
+    ('user', 'group'): lambda: APIData(
         unversioned=VersionedAPIData(
             fully_understood=True,
             primary_keys=('name',),
@@ -13390,7 +13069,7 @@ PATHS = {
         ),
     ),
 
-    ('user', 'settings'): APIData(
+    ('user', 'settings'): lambda: APIData(
         unversioned=VersionedAPIData(
             fixed_entries=True,
             fully_understood=True,
@@ -13402,7 +13081,7 @@ PATHS = {
         ),
     ),
 
-    ('user', 'ssh-keys'): APIData(
+    ('user', 'ssh-keys'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -13416,7 +13095,7 @@ PATHS = {
         ],
     ),
 
-    ('user-manager',): APIData(
+    ('user-manager',): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fixed_entries=True,
@@ -13437,7 +13116,7 @@ PATHS = {
         ],
     ),
 
-    ('user-manager', 'advanced'): APIData(
+    ('user-manager', 'advanced'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fixed_entries=True,
@@ -13457,7 +13136,7 @@ PATHS = {
         ],
     ),
 
-    ('user-manager', 'attribute'): APIData(
+    ('user-manager', 'attribute'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -13474,7 +13153,7 @@ PATHS = {
         ],
     ),
 
-    ('user-manager', 'database'): APIData(
+    ('user-manager', 'database'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fixed_entries=True,
@@ -13487,7 +13166,7 @@ PATHS = {
         ],
     ),
 
-    ('user-manager', 'limitation'): APIData(
+    ('user-manager', 'limitation'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -13518,7 +13197,7 @@ PATHS = {
         ],
     ),
 
-    ('user-manager', 'payment'): APIData(
+    ('user-manager', 'payment'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -13539,7 +13218,7 @@ PATHS = {
         ],
     ),
 
-    ('user-manager', 'profile'): APIData(
+    ('user-manager', 'profile'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -13558,7 +13237,7 @@ PATHS = {
         ],
     ),
 
-    ('user-manager', 'profile-limitation'): APIData(
+    ('user-manager', 'profile-limitation'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -13576,7 +13255,7 @@ PATHS = {
         ],
     ),
 
-    ('user-manager', 'router'): APIData(
+    ('user-manager', 'router'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -13597,7 +13276,7 @@ PATHS = {
         ],
     ),
 
-    ('user-manager', 'session'): APIData(
+    ('user-manager', 'session'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -13609,7 +13288,7 @@ PATHS = {
         ],
     ),
 
-    ('user-manager', 'user'): APIData(
+    ('user-manager', 'user'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -13630,7 +13309,7 @@ PATHS = {
         ],
     ),
 
-    ('user-manager', 'user', 'group'): APIData(
+    ('user-manager', 'user', 'group'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -13647,7 +13326,7 @@ PATHS = {
         ],
     ),
 
-    ('user-manager', 'user-profile'): APIData(
+    ('user-manager', 'user-profile'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -13660,7 +13339,7 @@ PATHS = {
         ],
     ),
 
-    ('zerotier',): APIData(
+    ('zerotier',): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -13679,7 +13358,7 @@ PATHS = {
         ],
     ),
 
-    ('zerotier', 'controller'): APIData(
+    ('zerotier', 'controller'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -13705,7 +13384,7 @@ PATHS = {
         ],
     ),
 
-    ('zerotier', 'controller', 'member'): APIData(
+    ('zerotier', 'controller', 'member'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -13725,7 +13404,7 @@ PATHS = {
         ],
     ),
 
-    ('zerotier', 'interface'): APIData(
+    ('zerotier', 'interface'): lambda: APIData(
         versioned=[
             ('7.15', '>=', VersionedAPIData(
                 fully_understood=True,
@@ -13747,4 +13426,4 @@ PATHS = {
         ],
     ),
 
-}
+})
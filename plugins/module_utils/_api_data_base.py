@@ -0,0 +1,1108 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2022, Felix Fontein (@felixfontein) <felix@fontein.de>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# The data inside here is private to this collection. If you use this from outside the collection,
+# you are on your own. There can be random changes to its format even in bugfix releases!
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import bisect
+import json
+import re
+
+from ansible.module_utils.common.text.converters import to_native, to_text
+
+from ansible_collections.community.routeros.plugins.module_utils._api_helper import value_to_str
+from ansible_collections.community.routeros.plugins.module_utils.version import LooseVersion
+
+try:
+    import ipaddress
+    HAS_IPADDRESS = True
+except ImportError:
+    HAS_IPADDRESS = False
+
+
+# ---------------------------------------------------------------------------
+# Value sanitizers
+#
+# A value sanitizer is a callable (any) -> any that normalises a user-supplied
+# field value so it matches the form RouterOS stores and returns.  Sanitizers
+# are registered on individual KeyInfo instances via the ``value_sanitizer``
+# kwarg and are applied by ``polish_entry()`` in api_modify.py before any
+# comparison or API call is made.
+#
+# CONTRACT: a sanitizer must be idempotent – applying it twice must yield the
+# same result as applying it once.
+# CONTRACT: a sanitizer must pass through any value type it does not
+# explicitly handle, leaving it unchanged.
+# ---------------------------------------------------------------------------
+
+def _sanitize_ensure_leading_slash(value):
+    # type: (any) -> any
+    """Prepend ``/`` when absent, mirroring RouterOS's implicit normalisation.
+
+    RouterOS silently prepends ``/`` to certain path fields (e.g.
+    ``container/mounts`` ``src`` and ``dst``) when entries are created or
+    updated.  Without this sanitizer Ansible would always detect a diff
+    between the user-supplied value ``usb1/data`` and the RouterOS-stored
+    value ``/usb1/data``, making the module non-idempotent.
+
+    Edge cases:
+    * Non-string value → returned as-is (type checking is the caller's
+      responsibility; this sanitizer only operates on strings).
+    * Empty string → returned as-is (RouterOS maps a missing ``src`` to ``/``,
+      but that is represented separately via the field default).
+    * Already starts with ``/`` → returned unchanged.
+    """
+    if value and isinstance(value, str) and not value.startswith('/'):
+        return '/' + value
+    return value
+
+
+# Value sanitizers by name. The cached API data (see _api_data_cache.py) refers to
+# sanitizers by these names, so every sanitizer used in PATHS must be listed here.
+VALUE_SANITIZERS = {
+    'ensure_leading_slash': _sanitize_ensure_leading_slash,
+}
+
+
+# ---------------------------------------------------------------------------
+# Value canonicalizers
+#
+# A value canonicalizer is a callable (text) -> text that maps all the ways of
+# writing a field value that RouterOS treats as equal to one form.  They are
+# registered on individual KeyInfo instances via the ``value_canonicalizer``
+# kwarg and are applied by api_modify to the string forms of both the existing
+# and the desired values before comparing them.  Unlike a sanitizer, a
+# canonicalizer never changes the value that is sent to RouterOS.
+#
+# CONTRACT: a canonicalizer must be idempotent.
+# CONTRACT: a canonicalizer must return any value it cannot parse unchanged.
+# ---------------------------------------------------------------------------
+
+_DURATION_RE = re.compile(
+    r'^(?:(\d+)w)?(?:(\d+)d)?(?:(\d+)h)?(?:(\d+)m)?(?:(\d+)s)?(?:(\d+)ms)?'
+    r'(?:(\d+):(\d+):(\d+)(?:\.(\d+))?)?$'
+)
+
+# Milliseconds per unit of the groups of _DURATION_RE
+_DURATION_FACTORS = (604800000, 86400000, 3600000, 60000, 1000, 1, 3600000, 60000, 1000)
+
+
+def _canonicalize_duration(value):
+    """Convert a duration like ``5m``, ``00:05:00`` or ``300`` to milliseconds, for example ``300000ms``."""
+    if not value:
+        return value
+    if value.isdigit():
+        # A number without unit is a number of seconds
+        return '{0}ms'.format(int(value) * 1000)
+    match = _DURATION_RE.match(value)
+    if not match:
+        return value
+    groups = match.groups()
+    total = sum(int(group) * factor for group, factor in zip(groups, _DURATION_FACTORS) if group)
+    if groups[-1]:
+        total += int((groups[-1] + '00')[:3])
+    return '{0}ms'.format(total)
+
+
+def _canonicalize_bool(value):
+    """Map ``true`` and ``false``, which RouterOS also accepts, to ``yes`` and ``no``."""
+    return {'yes': 'yes', 'true': 'yes', 'no': 'no', 'false': 'no'}.get(value.lower(), value)
+
+
+_MAC_RE = re.compile(r'^[0-9A-Fa-f]{2}([:-])[0-9A-Fa-f]{2}(?:\1[0-9A-Fa-f]{2}){4}$')
+
+
+def _canonicalize_mac(value):
+    """Write a MAC address in upper case with colons, like RouterOS does."""
+    if not _MAC_RE.match(value):
+        return value
+    return value.upper().replace('-', ':')
+
+
+def _canonicalize_ip(value):
+    """Write an IPv4 or IPv6 address, optionally with prefix length or netmask, in its compressed form.
+
+    The host bits of an address with prefix are kept. Without the ``ipaddress`` library, values are
+    returned unchanged.
+    """
+    if not HAS_IPADDRESS:
+        return value
+    try:
+        if '/' in value:
+            return to_text(ipaddress.ip_interface(value))
+        return to_text(ipaddress.ip_address(value))
+    except ValueError:
+        return value
+
+
+def _canonicalize_name_list(value):
+    """Remove whitespace and empty elements from a comma-separated list. The order is kept, since it can matter."""
+    return ','.join(part.strip() for part in value.split(',') if part.strip())
+
+
+# Value canonicalizers by name. The cached API data (see _api_data_cache.py) refers to
+# canonicalizers by these names, so every canonicalizer used in PATHS must be listed here.
+VALUE_CANONICALIZERS = {
+    'bool': _canonicalize_bool,
+    'duration': _canonicalize_duration,
+    'ip': _canonicalize_ip,
+    'mac': _canonicalize_mac,
+    'name_list': _canonicalize_name_list,
+}
+
+
+# Registry of detection strategy names -> callables
+# Callables are NOT defined here (they need API access);
+# they're registered by the modules at runtime.
+# _api_data.py only stores the string keys.
+HARDWARE_DETECTOR_KEYS = {
+    'switch_chip_type',
+    # Future: 'wireless_chip_type', etc.
+}
+
+
+def _compare(a, b, comparator):
+    if comparator == '==':
+        return a == b
+    if comparator == '!=':
+        return a != b
+    if comparator == '<':
+        return a < b
+    if comparator == '<=':
+        return a <= b
+    if comparator == '>':
+        return a > b
+    if comparator == '>=':
+        return a >= b
+    raise ValueError('Unknown comparator "{comparator}"'.format(comparator=comparator))
+
+
+def _parse_version(version):
+    return tuple(LooseVersion(version).version)
+
+
+class _VersionRegions(object):
+    """Partition of all versions into regions by a set of boundary versions.
+
+    For the sorted boundaries ``b_0 < ... < b_(n-1)``, region ``2i + 1`` consists of ``b_i`` alone,
+    and region ``2i`` of all versions strictly between ``b_(i-1)`` and ``b_i``. Comparing a version
+    with a boundary gives the same result for all versions of a region, so all conditions can be
+    evaluated once per region.
+    """
+
+    __slots__ = ('_bounds', '_bound_regions', 'count')
+
+    def __init__(self, versions):
+        self._bounds = sorted(set(versions))
+        self._bound_regions = dict((bound, 2 * index + 1) for index, bound in enumerate(self._bounds))
+        self.count = 2 * len(self._bounds) + 1
+
+    def find(self, version):
+        index = bisect.bisect_left(self._bounds, version)
+        if index < len(self._bounds) and self._bounds[index] == version:
+            return 2 * index + 1
+        return 2 * index
+
+    def matches(self, region, bound, comparator):
+        return _compare(region, self._bound_regions[bound], comparator)
+
+
+class _SharedImmutable(object):
+    """Base class for immutable objects which are shared when created with equal values.
+
+    Subclasses must define ``__slots__``, an ``_instances`` dictionary, and a static ``_validate()``
+    method accepting the values for all slots. They create their objects in ``__new__()`` by passing
+    the values for all slots to ``_get_instance()``. Slots listed in ``_derived_slots`` must come last;
+    they are not passed to ``_get_instance()`` and ``_validate()``, but computed by ``_derive()``.
+
+    Values are validated only once: ``_instances`` remembers for every shared object whether its
+    values have been validated.
+    """
+
+    __slots__ = ()
+
+    _derived_slots = ()
+
+    @classmethod
+    def _get_instance(cls, values, validate=True):
+        # Include the types so that for example 1, 1.0 and True are not considered the same
+        key = tuple((type(value), value) for value in values)
+        try:
+            shared = cls._instances.get(key)
+        except TypeError:
+            # Some value is not hashable; do not share this object
+            key = None
+            shared = None
+        if shared is not None:
+            instance, validated = shared
+            if validate and not validated:
+                cls._validate(*values)
+                cls._instances[key] = (instance, True)
+            return instance
+        if validate:
+            cls._validate(*values)
+        instance = object.__new__(cls)
+        for name, value in zip(cls.__slots__, values):
+            object.__setattr__(instance, name, value)
+        instance._derive()
+        if key is not None:
+            cls._instances[key] = (instance, validate)
+        return instance
+
+    def _derive(self):
+        pass
+
+    def validate(self):
+        self._validate(*[getattr(self, name) for name in self.__slots__ if name not in self._derived_slots])
+
+    def __setattr__(self, name, value):
+        raise AttributeError('{type} objects are immutable'.format(type=type(self).__name__))
+
+    def __delattr__(self, name):
+        raise AttributeError('{type} objects are immutable'.format(type=type(self).__name__))
+
+
+class Depr(_SharedImmutable):
+    __slots__ = ('version', 'msg', 'context')
+
+    _instances = {}
+
+    def __new__(cls, version, msg, context="all", validate=True):
+        return cls._get_instance((version, msg, context), validate=validate)
+
+    @staticmethod
+    def _validate(version, msg, context):
+        if context not in ("all", "read", "write"):
+            raise ValueError('context must be all, read, or write, but not {context!r}'.format(context=context))
+
+    def applies(self, context):
+        return context == self.context or self.context == "all"
+
+    def emit(self, module):
+        module.deprecate(self.msg, version=self.version, collection_name="community.routeros")
+
+
+class APIData(object):
+    __slots__ = (
+        'unversioned',
+        'versioned',
+        'hardware_detect',
+        'hardware_variants',
+        'fully_understood',
+        'needs_version',
+        'has_identifier',
+        'modify_not_supported',
+        '_regions',
+        '_versioned_by_region',
+        '_current',
+    )
+
+    def __init__(self,
+                 unversioned=None,
+                 versioned=None,
+                 hardware_detect=None,
+                 hardware_variants=None,
+                 validate=True):
+        self.unversioned = unversioned
+        self.versioned = versioned
+        self.hardware_detect = hardware_detect
+        self.hardware_variants = hardware_variants
+        if validate:
+            self.validate()
+
+        # --- Derive fully_understood, needs_version, has_identifier, modify_not_supported ---
+        if self.hardware_variants is not None:
+            # fully_understood if ANY variant is fully_understood
+            self.fully_understood = any(
+                v.fully_understood for v in self.hardware_variants.values()
+            )
+            # needs_version if ANY variant needs_version
+            self.needs_version = any(
+                v.needs_version for v in self.hardware_variants.values()
+            )
+            # has_identifier / modify_not_supported: only True when ALL variants have it
+            self.has_identifier = all(
+                v.has_identifier for v in self.hardware_variants.values()
+            )
+            self.modify_not_supported = all(
+                v.modify_not_supported for v in self.hardware_variants.values()
+            )
+        elif self.unversioned is not None:
+            self.needs_version = self.unversioned.needs_version
+            self.fully_understood = self.unversioned.fully_understood
+            self.has_identifier = self.unversioned.has_identifier
+            self.modify_not_supported = self.unversioned.modify_not_supported
+        else:
+            self.needs_version = self.versioned is not None
+            # Mark as 'fully understood' if it is for at least one version
+            self.fully_understood = False
+            for dummy, dummy, unversioned in self.versioned:
+                if unversioned and not isinstance(unversioned, str) and unversioned.fully_understood:
+                    self.fully_understood = True
+                    break
+            # Mark as 'has_identifier' only if it is for all versions
+            self.has_identifier = True
+            for dummy, dummy, unversioned in self.versioned:
+                if unversioned and not isinstance(unversioned, str) and not unversioned.has_identifier:
+                    self.has_identifier = False
+                    break
+            # Mark as 'modify_not_supported' only if it is for all versions
+            self.modify_not_supported = True
+            for dummy, dummy, unversioned in self.versioned:
+                if unversioned and not isinstance(unversioned, str) and not unversioned.modify_not_supported:
+                    self.modify_not_supported = False
+                    break
+            # For every version region, determine the index of the first matching entry of versioned
+            bounds = [
+                None if other_version == '*' and comparator == '*' else _parse_version(other_version)
+                for other_version, comparator, dummy in self.versioned
+            ]
+            self._regions = _VersionRegions(bound for bound in bounds if bound is not None)
+            self._versioned_by_region = []
+            for region in range(self._regions.count):
+                selected = None
+                for index, (bound, (dummy, comparator, dummy)) in enumerate(zip(bounds, self.versioned)):
+                    if bound is None or self._regions.matches(region, bound, comparator):
+                        selected = index
+                        break
+                self._versioned_by_region.append(selected)
+        self._current = None if self.needs_version else self.unversioned
+
+    def validate(self):
+        if self.hardware_variants is not None:
+            if self.unversioned is not None or self.versioned is not None:
+                raise ValueError('Cannot combine hardware_variants with unversioned/versioned')
+            if self.hardware_detect is None:
+                raise ValueError('hardware_detect required when hardware_variants is set')
+            for key, variant in self.hardware_variants.items():
+                if not isinstance(variant, APIData):
+                    raise ValueError('hardware_variants[{key!r}] must be an APIData instance'.format(key=key))
+                if variant.hardware_variants is not None:
+                    raise ValueError('hardware_variants[{key!r}] must not itself have hardware_variants'.format(key=key))
+        elif self.hardware_detect is not None:
+            raise ValueError('hardware_detect requires hardware_variants')
+        else:
+            if (self.unversioned is None) == (self.versioned is None):
+                raise ValueError('either unversioned or versioned must be provided')
+
+    def _select(self, data, api_version):
+        if data is None:
+            self._current = None
+            return False, None
+        if isinstance(data, str):
+            self._current = None
+            return False, data
+        self._current = data.specialize_for_version(api_version)
+        return self._current.fully_understood, None
+
+    def provide_version(self, version):
+        if not self.needs_version:
+            return self.unversioned.fully_understood, None
+        api_version = LooseVersion(version)
+        if self.unversioned is not None:
+            self._current = self.unversioned.specialize_for_version(api_version)
+            return self._current.fully_understood, None
+        selected = self._versioned_by_region[self._regions.find(tuple(api_version.version))]
+        if selected is None:
+            self._current = None
+            return False, None
+        return self._select(self.versioned[selected][2], api_version)
+
+    def get_data(self):
+        if self._current is None:
+            raise ValueError('either provide_version() was not called or it returned False')
+        return self._current
+
+
+class FieldPlan(object):
+    """Facts on the fields of a path that api_modify needs for every entry.
+
+    Use VersionedAPIData.field_plan to obtain the plan of a path; it is computed once per object.
+    """
+
+    __slots__ = (
+        'read_only',
+        'write_only',
+        'sanitized',
+        'write_deprecations',
+        'required',
+        'required_one_of',
+        'mutually_exclusive',
+        'disabled_defaults',
+        'canonicalizers',
+    )
+
+    def __init__(self, fields, required_one_of, mutually_exclusive):
+        self.read_only = frozenset(k for k, key_info in fields.items() if key_info.read_only)
+        self.write_only = frozenset(k for k, key_info in fields.items() if key_info.write_only)
+        # The keys with a value sanitizer, together with their KeyInfo
+        self.sanitized = tuple((k, key_info) for k, key_info in fields.items() if key_info.value_sanitizer is not None)
+        self.write_deprecations = dict(
+            (k, key_info.depr) for k, key_info in fields.items() if key_info.depr and key_info.depr.applies('write')
+        )
+        self.required = tuple(k for k, key_info in fields.items() if key_info.required)
+        self.required_one_of = tuple(tuple(require_list) for require_list in required_one_of if require_list)
+        self.mutually_exclusive = tuple(tuple(exclusive_list) for exclusive_list in mutually_exclusive if len(exclusive_list) > 1)
+        # The keys that can be disabled and have a default, with their default
+        self.disabled_defaults = tuple(
+            (k, key_info.default) for k, key_info in fields.items() if key_info.can_disable and key_info.default is not None
+        )
+        # The value canonicalizers of the keys. Fields with a boolean default are compared as booleans,
+        # since RouterOS accepts both yes/no and true/false for them.
+        self.canonicalizers = {}
+        for k, key_info in fields.items():
+            if key_info.value_canonicalizer is not None:
+                self.canonicalizers[k] = key_info.value_canonicalizer
+            elif isinstance(key_info.default, bool):
+                self.canonicalizers[k] = _canonicalize_bool
+
+
+class VersionedAPIData(object):
+    __slots__ = (
+        'primary_keys',
+        'stratify_keys',
+        'required_one_of',
+        'mutually_exclusive',
+        'has_identifier',
+        'modify_not_supported',
+        'single_value',
+        'unknown_mechanism',
+        'fully_understood',
+        'fixed_entries',
+        'supports_place_before',
+        'fields',
+        'versioned_fields',
+        'needs_version',
+        '_regions',
+        '_versioned_fields_by_region',
+        '_specializations',
+        '_field_plan',
+    )
+
+    def __init__(self,
+                 primary_keys=None,
+                 stratify_keys=None,
+                 required_one_of=None,
+                 mutually_exclusive=None,
+                 has_identifier=False,
+                 modify_not_supported=False,
+                 single_value=False,
+                 unknown_mechanism=False,
+                 fully_understood=False,
+                 fixed_entries=False,
+                 supports_place_before=False,
+                 fields=None,
+                 versioned_fields=None,
+                 validate=True):
+        self.primary_keys = primary_keys
+        self.stratify_keys = stratify_keys
+        self.required_one_of = required_one_of or []
+        self.mutually_exclusive = mutually_exclusive or []
+        self.has_identifier = has_identifier
+        self.modify_not_supported = modify_not_supported
+        self.single_value = single_value
+        self.unknown_mechanism = unknown_mechanism
+        self.fully_understood = fully_understood
+        if single_value:
+            fixed_entries = False
+        self.fixed_entries = fixed_entries
+        # Whether new entries can be created at a position with the place-before argument of add
+        self.supports_place_before = supports_place_before
+        self.fields = fields
+        self.versioned_fields = versioned_fields or []
+        if validate:
+            self.validate()
+        self.needs_version = len(self.versioned_fields) > 0
+        # For every version region, determine the versioned fields whose conditions all match
+        conditions_list = [
+            [(_parse_version(other_version), comparator) for other_version, comparator in conditions]
+            for conditions, dummy, dummy in self.versioned_fields
+        ]
+        self._regions = _VersionRegions(bound for conditions in conditions_list for bound, dummy in conditions)
+        self._versioned_fields_by_region = []
+        for region in range(self._regions.count):
+            self._versioned_fields_by_region.append(tuple(
+                index
+                for index, conditions in enumerate(conditions_list)
+                if all(self._regions.matches(region, bound, comparator) for bound, comparator in conditions)
+            ))
+        # The result of specialize_for_version() only depends on the versioned fields that apply.
+        # It is computed on first use and then shared between callers.
+        self._specializations = {}
+        self._field_plan = None
+
+    @property
+    def field_plan(self):
+        if self._field_plan is None:
+            self._field_plan = FieldPlan(self.fields, self.required_one_of, self.mutually_exclusive)
+        return self._field_plan
+
+    def validate(self):
+        if sum([self.primary_keys is not None, self.stratify_keys is not None, self.has_identifier, self.single_value, self.unknown_mechanism]) > 1:
+            raise ValueError('primary_keys, stratify_keys, has_identifier, single_value, and unknown_mechanism are mutually exclusive')
+        if self.unknown_mechanism and self.fully_understood:
+            raise ValueError('unknown_mechanism and fully_understood cannot be combined')
+        if self.fixed_entries and self.primary_keys is None:
+            raise ValueError('fixed_entries can only be used with primary_keys')
+        if self.supports_place_before and (self.primary_keys is not None or self.single_value):
+            raise ValueError('supports_place_before cannot be combined with primary_keys or single_value')
+        if self.fields is None:
+            raise ValueError('fields must be provided')
+        if not isinstance(self.versioned_fields, list):
+            raise ValueError('unversioned_fields must be a list')
+        for conditions, name, field in self.versioned_fields:
+            if not isinstance(conditions, (tuple, list)):
+                raise ValueError('conditions must be a list or tuple')
+            if not isinstance(field, KeyInfo):
+                raise ValueError('field must be a KeyInfo object')
+            if name in self.fields:
+                raise ValueError('"{name}" appears both in fields and versioned_fields'.format(name=name))
+        if self.primary_keys:
+            for pk in self.primary_keys:
+                if pk not in self.fields:
+                    raise ValueError('Primary key {pk} must be in fields!'.format(pk=pk))
+        if self.stratify_keys:
+            for sk in self.stratify_keys:
+                if sk not in self.fields:
+                    raise ValueError('Stratify key {sk} must be in fields!'.format(sk=sk))
+        for index, require_list in enumerate(self.required_one_of):
+            if not isinstance(require_list, list):
+                raise ValueError('Require one of element at index #{index} must be a list!'.format(index=index + 1))
+            for rk in require_list:
+                if rk not in self.fields:
+                    raise ValueError('Require one of key {rk} must be in fields!'.format(rk=rk))
+        for index, exclusive_list in enumerate(self.mutually_exclusive):
+            if not isinstance(exclusive_list, list):
+                raise ValueError('Mutually exclusive element at index #{index} must be a list!'.format(index=index + 1))
+            for ek in exclusive_list:
+                if ek not in self.fields:
+                    raise ValueError('Mutually exclusive key {ek} must be in fields!'.format(ek=ek))
+
+    def specialize_for_version(self, api_version):
+        versioned_field_indices = self._versioned_fields_by_region[self._regions.find(tuple(api_version.version))]
+        result = self._specializations.get(versioned_field_indices)
+        if result is None:
+            result = self._specialize(versioned_field_indices, api_version)
+            self._specializations[versioned_field_indices] = result
+        return result
+
+    def _specialize(self, versioned_field_indices, api_version):
+        fields = self.fields.copy()
+        for index in versioned_field_indices:
+            dummy, name, field = self.versioned_fields[index]
+            if name in fields:
+                raise ValueError(
+                    'Internal error: field "{field}" already exists for {version}'.format(field=name, version=api_version)
+                )
+            fields[name] = field
+        return VersionedAPIData(
+            primary_keys=self.primary_keys,
+            stratify_keys=self.stratify_keys,
+            required_one_of=self.required_one_of,
+            mutually_exclusive=self.mutually_exclusive,
+            has_identifier=self.has_identifier,
+            single_value=self.single_value,
+            unknown_mechanism=self.unknown_mechanism,
+            fully_understood=self.fully_understood,
+            fixed_entries=self.fixed_entries,
+            supports_place_before=self.supports_place_before,
+            fields=fields,
+            modify_not_supported=self.modify_not_supported,
+            validate=False,
+        )
+
+
+class KeyInfo(_SharedImmutable):
+    """Information on a field.
+
+    KeyInfo objects are immutable, and equal KeyInfo objects are shared between all paths.
+    """
+
+    __slots__ = (
+        'can_disable',
+        'remove_value',
+        'absent_value',
+        'default',
+        'required',
+        'automatically_computed_from',
+        'read_only',
+        'write_only',
+        'value_sanitizer',
+        'value_canonicalizer',
+        'depr',
+        'default_str',
+        'remove_value_str',
+    )
+
+    # The values of default and remove_value as returned by value_to_str() and the value canonicalizer,
+    # to compare them with other values
+    _derived_slots = ('default_str', 'remove_value_str')
+
+    _instances = {}
+
+    def __new__(cls,
+                _dummy=None,
+                can_disable=False,
+                remove_value=None,
+                absent_value=None,
+                default=None,
+                required=False,
+                automatically_computed_from=None,
+                read_only=False,
+                write_only=False,
+                value_sanitizer=None,
+                value_canonicalizer=None,
+                depr=None,
+                validate=True):
+        if _dummy is not None:
+            raise ValueError('KeyInfo() does not have positional arguments')
+        return cls._get_instance((
+            can_disable,
+            remove_value,
+            absent_value,
+            default,
+            required,
+            automatically_computed_from,
+            read_only,
+            write_only,
+            value_sanitizer,
+            value_canonicalizer,
+            depr,
+        ), validate=validate)
+
+    def _derive(self):
+        for name, value in (('default_str', self.default), ('remove_value_str', self.remove_value)):
+            value = value_to_str(value)
+            if value is not None and self.value_canonicalizer is not None:
+                value = self.value_canonicalizer(value)
+            object.__setattr__(self, name, value)
+
+    @staticmethod
+    def _validate(can_disable,
+                  remove_value,
+                  absent_value,
+                  default,
+                  required,
+                  automatically_computed_from,
+                  read_only,
+                  write_only,
+                  value_sanitizer,
+                  value_canonicalizer,
+                  depr):
+        if sum([required, default is not None or can_disable, automatically_computed_from is not None]) > 1:
+            raise ValueError(
+                'required, default, automatically_computed_from, and can_disable are mutually exclusive '
+                'besides default and can_disable which can be set together')
+        if not can_disable and remove_value is not None:
+            raise ValueError('remove_value can only be specified if can_disable=True')
+        if absent_value is not None and any([default is not None, automatically_computed_from is not None, can_disable]):
+            raise ValueError('absent_value can not be combined with default, automatically_computed_from, can_disable=True, or absent_value')
+        if read_only and write_only:
+            raise ValueError('read_only and write_only cannot be used at the same time')
+        if read_only and any([can_disable, remove_value is not None, absent_value is not None, default is not None, required]):
+            raise ValueError('read_only can not be combined with can_disable, remove_value, absent_value, default, or required')
+
+        if value_sanitizer is not None and not callable(value_sanitizer):
+            raise ValueError('value_sanitizer must be a callable or None')
+        if value_sanitizer is not None and read_only:
+            raise ValueError(
+                'value_sanitizer cannot be combined with read_only: '
+                'read-only fields are never written so sanitisation has no effect'
+            )
+        if value_sanitizer is not None and write_only:
+            raise ValueError(
+                'value_sanitizer cannot be combined with write_only: '
+                'write-only fields cannot be read back from RouterOS so '
+                'the sanitised value cannot be verified'
+            )
+        if value_canonicalizer is not None and not callable(value_canonicalizer):
+            raise ValueError('value_canonicalizer must be a callable or None')
+        if depr is not None and not isinstance(depr, Depr):
+            raise ValueError('depr must be a Depr instance, but got {depr!r}'.format(depr=depr))
+
+
+def validate_api_data(api_data):
+    """Run all consistency checks on an APIData object and on all objects contained in it.
+
+    Objects created with ``validate=False``, like the ones loaded from _api_data_cache.py, are not
+    checked when they are created. The unit tests use this to check all PATHS instead.
+    """
+    api_data.validate()
+    for variant in (api_data.hardware_variants or {}).values():
+        validate_api_data(variant)
+    entries = [api_data.unversioned] + [entry for dummy, dummy, entry in api_data.versioned or []]
+    for entry in entries:
+        if entry is None or isinstance(entry, str):
+            continue
+        entry.validate()
+        fields = list(entry.fields.values()) + [field for dummy, dummy, field in entry.versioned_fields]
+        for field in fields:
+            field.validate()
+            if field.depr is not None:
+                field.depr.validate()
+        for versioned_field_indices in entry._versioned_fields_by_region:
+            names = [entry.versioned_fields[index][1] for index in versioned_field_indices]
+            for name in names:
+                if names.count(name) > 1:
+                    raise ValueError('Versioned field "{name}" applies more than once for some versions'.format(name=name))
+
+
+class LazyPathDict(object):
+    """Read-only mapping of paths to APIData objects.
+
+    Every value is provided as a factory and is only called the first time the path is looked up.
+    If ``loader`` is provided, the values are passed to ``loader`` instead of being called.
+    Iterating over the paths does not create any APIData object; iterating over ``values()`` or
+    ``items()`` creates all of them.
+    """
+
+    def __init__(self, factories, loader=None):
+        self._factories = factories
+        self._loader = loader
+        self._data = {}
+
+    def __getitem__(self, path):
+        data = self._data.get(path)
+        if data is None:
+            factory = self._factories[path]
+            data = factory() if self._loader is None else self._loader(factory)
+            self._data[path] = data
+        return data
+
+    def __contains__(self, path):
+        return path in self._factories
+
+    def __iter__(self):
+        return iter(self._factories)
+
+    def __len__(self):
+        return len(self._factories)
+
+    def get(self, path, default=None):
+        if path not in self._factories:
+            return default
+        return self[path]
+
+    def keys(self):
+        return self._factories.keys()
+
+    def values(self):
+        for path in self._factories:
+            yield self[path]
+
+    def items(self):
+        for path in self._factories:
+            yield path, self[path]
+
+
+class CachedPathDict(LazyPathDict):
+    """Read-only mapping of paths to APIData objects serialized with dump_api_data().
+
+    ``snapshots`` is a list of ``(start, end)`` version ranges (``end`` can be ``None``). For every
+    range, the texts contain which part of the API data is selected for its versions, so that
+    get_snapshot() can create the data for such a version without creating the APIData object.
+    """
+
+    def __init__(self, texts, snapshots=()):
+        super(CachedPathDict, self).__init__(texts, loader=load_api_data)
+        self._snapshots = snapshots
+        self._snapshot_ranges = None
+        self._decoded = {}
+
+    def _decode(self, path):
+        data = self._decoded.get(path)
+        if data is None:
+            data = json.loads(self._factories[path])
+            self._decoded[path] = data
+        return data
+
+    def _find_snapshot(self, version):
+        if self._snapshot_ranges is None:
+            self._snapshot_ranges = [
+                (_parse_version(start), None if end is None else _parse_version(end))
+                for start, end in self._snapshots
+            ]
+        version = tuple(LooseVersion(version).version)
+        for index, (start, end) in enumerate(self._snapshot_ranges):
+            if start <= version and (end is None or version < end):
+                return index
+        return None
+
+    def has_snapshots(self, path):
+        """Whether the API data for ``path`` depends on the version and has snapshots."""
+        if path not in self._factories:
+            return False
+        data = self._decode(path)
+        if 'hardware_variants' in data:
+            return any('snapshots' in variant for dummy, variant in data['hardware_variants'])
+        return 'snapshots' in data
+
+    def get_snapshot(self, path, version, detect_hardware):
+        """Return the VersionedAPIData object for ``path`` and the RouterOS version ``version``.
+
+        ``detect_hardware(hardware_detect)`` is called to find the hardware variant if the path has some.
+        Returns ``None`` if no snapshot covers the version, or if the path is not supported for it.
+        In that case, ``provide_version()`` of the APIData object must be used, which also reports
+        the reason why the path is not supported.
+        """
+        snapshot = self._find_snapshot(version)
+        if snapshot is None or not self.has_snapshots(path):
+            return None
+        data = self._decode(path)
+        if 'hardware_variants' in data:
+            data = dict(data['hardware_variants']).get(detect_hardware(data['hardware_detect']))
+            if data is None or 'snapshots' not in data:
+                return None
+        selection = data['snapshots'][snapshot]
+        if selection is None:
+            return None
+        entry_index = selection[0]
+        entry = data['unversioned'] if entry_index < 0 else data['versioned'][entry_index][2]
+        entry = dict(entry)
+        versioned_fields = entry.pop('versioned_fields', [])
+        entry['fields'] = entry['fields'] + [versioned_fields[index][1:] for index in selection[1:]]
+        return _load_versioned_api_data(entry)
+
+
+def get_backend_name(path_info):
+    """Return the name of the function of api_modify that synchronizes the entries of the VersionedAPIData object ``path_info``.
+
+    Returns ``None`` if the path cannot be modified with api_modify.
+    """
+    if not path_info.fully_understood:
+        return None
+    if path_info.primary_keys:
+        return 'sync_with_primary_keys'
+    if path_info.single_value:
+        return 'sync_single_value'
+    if not path_info.has_identifier and not path_info.modify_not_supported:
+        return 'sync_list'
+    return None
+
+
+def get_path_capabilities(api_data):
+    """Return whether the APIData object ``api_data`` can be read, and the backends that can modify it for some version."""
+    backends = set()
+    for variant in (api_data.hardware_variants or {None: api_data}).values():
+        entries = [variant.unversioned] if variant.unversioned is not None else [entry for dummy, dummy, entry in variant.versioned]
+        for entry in entries:
+            if entry is not None and not isinstance(entry, str):
+                backends.add(get_backend_name(entry))
+    backends.discard(None)
+    return api_data.fully_understood, sorted(backends)
+
+
+def load_path_capabilities(text):
+    """Read the list of ``(path, readable, backends)`` tuples for all paths created by dump_path_capabilities()."""
+    return [(to_native(path), readable, tuple(backends)) for path, readable, backends in json.loads(text)]
+
+
+def dump_path_capabilities(paths):
+    """Serialize the capabilities of all paths of a mapping of paths to APIData objects, sorted by path."""
+    capabilities = [[join_path(path)] + list(get_path_capabilities(api_data)) for path, api_data in paths.items()]
+    return json.dumps(sorted(capabilities), separators=(',', ':'))
+
+
+def unpack_path_texts(index, data):
+    """Split the concatenated texts of all paths in ``data`` according to ``index``, a JSON list of ``[path, length]`` pairs.
+
+    Compiling a dictionary literal with many keys takes much longer than compiling one long string,
+    so _api_data_cache.py stores the texts like this.
+    """
+    texts = {}
+    offset = 0
+    for path, length in json.loads(index):
+        texts[tuple(split_path(to_native(path)))] = data[offset:offset + length]
+        offset += length
+    return texts
+
+
+def pack_path_texts(texts):
+    """Return the ``(index, data)`` pair for unpack_path_texts() for a dictionary mapping paths to texts."""
+    index = json.dumps([[join_path(path), len(text)] for path, text in texts.items()], separators=(',', ':'))
+    return index, ''.join(texts.values())
+
+
+def _snapshot_selection(api_data, version):
+    # Describes the data selected for a version by the index of the versioned entry (-1 for unversioned)
+    # and the indices of the versioned fields that apply. Returns None if the path is not supported.
+    version = _parse_version(version)
+    if api_data.unversioned is not None:
+        entry_index, entry = -1, api_data.unversioned
+    else:
+        entry_index = api_data._versioned_by_region[api_data._regions.find(version)]
+        if entry_index is None:
+            return None
+        entry = api_data.versioned[entry_index][2]
+        if entry is None or isinstance(entry, str):
+            return None
+    if not entry.fully_understood:
+        return None
+    return [entry_index] + list(entry._versioned_fields_by_region[entry._regions.find(version)])
+
+
+# Serialization of APIData objects for the cache in _api_data_cache.py.
+# Only values that differ from the constructor defaults are stored.
+
+_KEY_INFO_DEFAULTS = (
+    ('can_disable', False),
+    ('remove_value', None),
+    ('absent_value', None),
+    ('default', None),
+    ('required', False),
+    ('automatically_computed_from', None),
+    ('read_only', False),
+    ('write_only', False),
+)
+
+_VERSIONED_API_DATA_FLAGS = (
+    'has_identifier',
+    'modify_not_supported',
+    'single_value',
+    'unknown_mechanism',
+    'fully_understood',
+    'fixed_entries',
+    'supports_place_before',
+)
+
+
+def _dump_key_info(key_info):
+    result = {}
+    for attr, default in _KEY_INFO_DEFAULTS:
+        value = getattr(key_info, attr)
+        if value != default:
+            result[attr] = value
+    if key_info.value_sanitizer is not None:
+        for name, sanitizer in VALUE_SANITIZERS.items():
+            if sanitizer is key_info.value_sanitizer:
+                result['value_sanitizer'] = name
+                break
+        else:
+            raise ValueError('Value sanitizer {sanitizer!r} is not registered in VALUE_SANITIZERS'.format(sanitizer=key_info.value_sanitizer))
+    if key_info.value_canonicalizer is not None:
+        for name, canonicalizer in VALUE_CANONICALIZERS.items():
+            if canonicalizer is key_info.value_canonicalizer:
+                result['value_canonicalizer'] = name
+                break
+        else:
+            raise ValueError('Value canonicalizer {canonicalizer!r} is not registered in VALUE_CANONICALIZERS'.format(
+                canonicalizer=key_info.value_canonicalizer))
+    if key_info.depr is not None:
+        result['depr'] = dict(version=key_info.depr.version, msg=key_info.depr.msg, context=key_info.depr.context)
+    return result
+
+
+def _load_key_info(data):
+    data = dict(data)
+    if 'value_sanitizer' in data:
+        data['value_sanitizer'] = VALUE_SANITIZERS[data['value_sanitizer']]
+    if 'value_canonicalizer' in data:
+        data['value_canonicalizer'] = VALUE_CANONICALIZERS[data['value_canonicalizer']]
+    if 'depr' in data:
+        data['depr'] = Depr(validate=False, **data['depr'])
+    if 'automatically_computed_from' in data:
+        data['automatically_computed_from'] = tuple(data['automatically_computed_from'])
+    return KeyInfo(validate=False, **data)
+
+
+def _dump_versioned_api_data(data):
+    result = {}
+    if data.primary_keys is not None:
+        result['primary_keys'] = data.primary_keys
+    if data.stratify_keys is not None:
+        result['stratify_keys'] = data.stratify_keys
+    if data.required_one_of:
+        result['required_one_of'] = data.required_one_of
+    if data.mutually_exclusive:
+        result['mutually_exclusive'] = data.mutually_exclusive
+    for flag in _VERSIONED_API_DATA_FLAGS:
+        if getattr(data, flag):
+            result[flag] = True
+    result['fields'] = [[name, _dump_key_info(field)] for name, field in data.fields.items()]
+    if data.versioned_fields:
+        result['versioned_fields'] = [
+            [conditions, name, _dump_key_info(field)] for conditions, name, field in data.versioned_fields
+        ]
+    return result
+
+
+def _load_versioned_api_data(data):
+    data = dict(data)
+    if 'primary_keys' in data:
+        data['primary_keys'] = tuple(data['primary_keys'])
+    if 'stratify_keys' in data:
+        data['stratify_keys'] = tuple(data['stratify_keys'])
+    data['fields'] = dict((name, _load_key_info(field)) for name, field in data['fields'])
+    if 'versioned_fields' in data:
+        data['versioned_fields'] = [
+            ([tuple(condition) for condition in conditions], name, _load_key_info(field))
+            for conditions, name, field in data['versioned_fields']
+        ]
+    return VersionedAPIData(validate=False, **data)
+
+
+def _dump_api_data(api_data, snapshots):
+    if api_data.hardware_variants is not None:
+        return dict(
+            hardware_detect=api_data.hardware_detect,
+            hardware_variants=[[key, _dump_api_data(variant, snapshots)] for key, variant in api_data.hardware_variants.items()],
+        )
+    if api_data.unversioned is not None:
+        result = dict(unversioned=_dump_versioned_api_data(api_data.unversioned))
+    else:
+        result = dict(versioned=[
+            [other_version, comparator, entry if entry is None or isinstance(entry, str) else _dump_versioned_api_data(entry)]
+            for other_version, comparator, entry in api_data.versioned
+        ])
+    if snapshots and api_data.needs_version:
+        result['snapshots'] = [_snapshot_selection(api_data, version) for version in snapshots]
+    return result
+
+
+def _load_api_data(data):
+    if 'hardware_variants' in data:
+        return APIData(
+            hardware_detect=data['hardware_detect'],
+            hardware_variants=dict((key, _load_api_data(variant)) for key, variant in data['hardware_variants']),
+            validate=False,
+        )
+    if 'unversioned' in data:
+        return APIData(unversioned=_load_versioned_api_data(data['unversioned']), validate=False)
+    versioned = []
+    for other_version, comparator, entry in data['versioned']:
+        if isinstance(entry, dict):
+            entry = _load_versioned_api_data(entry)
+        elif entry is not None:
+            entry = to_native(entry)
+        versioned.append((other_version, comparator, entry))
+    return APIData(versioned=versioned, validate=False)
+
+
+def dump_api_data(api_data, snapshots=None):
+    """Serialize an APIData object to a compact JSON string that can be read by load_api_data().
+
+    If ``snapshots`` is provided, the data selected for each of these versions is stored as well for
+    CachedPathDict.get_snapshot(). The selection must be the same for all versions of a snapshot's range.
+    """
+    return json.dumps(_dump_api_data(api_data, snapshots), separators=(',', ':'), sort_keys=True)
+
+
+def load_api_data(text):
+    """Create an APIData object from a string created by dump_api_data().
+
+    The objects are not validated; use validate_api_data() for that.
+    """
+    return _load_api_data(json.loads(text))
+
+
+def split_path(path):
+    return path.split()
+
+
+def join_path(path):
+    return ' '.join(path)
@@ -0,0 +1,2536 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026, Felix Fontein (@felixfontein) <felix@fontein.de>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# The data inside here is private to this collection. If you use this from outside the collection,
+# you are on your own. There can be random changes to its format even in bugfix releases!
+
+# This file is generated by tests/update-api-data-cache.py from the PATHS in _api_data.py.
+# DO NOT EDIT MANUALLY! Modify _api_data.py instead and run 'nox -Re update-docs'.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+from ansible_collections.community.routeros.plugins.module_utils._api_data_base import (
+    CachedPathDict,
+    load_path_capabilities,
+    unpack_path_texts,
+)
+
+
+PATHS = CachedPathDict(unpack_path_texts(
+    (
+        '[["app",1358],["app settings",342],["caps-man aaa",280],["caps-man access-list",835],["caps-man actual-interface-configuration",1879],["caps'
+        '-man channel",629],["caps-man configuration",2672],["caps-man datapath",658],["caps-man interface",3011],["caps-man manager",292],["caps-man'
+        ' manager interface",370],["caps-man provisioning",643],["caps-man rates",445],["caps-man security",616],["certificate",578],["certificate cr'
+        'l",150],["certificate scep-server",244],["certificate scep-server ra",342],["certificate settings",381],["console settings",259],["container'
+        '",1717],["container config",312],["container envs",411],["container mounts",697],["disk",2059],["disk btrfs filesystem",308],["disk btrfs su'
+        'bvolume",226],["disk btrfs transfer",263],["disk settings",373],["dude",165],["dude agent",166],["dude device",166],["dude device-type",166]'
+        ',["dude notification",166],["dude probe",166],["dude ros address",263],["dude ros arp",252],["dude ros health",496],["dude ros interface",34'
+        '8],["dude ros lease",438],["dude ros neighbor",281],["dude ros queue",597],["dude ros resource",281],["dude ros route",518],["dude ros route'
+        'rboard",281],["dude service",166],["file",195],["file rsync-daemon",146],["file sync",390],["interface",334],["interface 6to4",599],["interf'
+        'ace amt",408],["interface bonding",1088],["interface bridge",2774],["interface bridge calea",2143],["interface bridge filter",2163],["interf'
+        'ace bridge host",249],["interface bridge mdb",322],["interface bridge mlag",286],["interface bridge msti",238],["interface bridge nat",2247]'
+        ',["interface bridge port",1595],["interface bridge port mst-override",265],["interface bridge port-controller",282],["interface bridge port-'
+        'controller device",213],["interface bridge port-controller port",357],["interface bridge port-extender",286],["interface bridge settings",24'
+        '2],["interface bridge vlan",450],["interface detect-internet",358],["interface dot1x client",485],["interface dot1x server",753],["interface'
+        ' dot1x server active",333],["interface eoip",886],["interface eoipv6",559],["interface ethernet",1540],["interface ethernet poe",516],["inte'
+        'rface ethernet switch",1799],["interface ethernet switch acl",1310],["interface ethernet switch acl policer",476],["interface ethernet switc'
+        'h dscp-qos-map",184],["interface ethernet switch dscp-to-dscp",139],["interface ethernet switch egress-vlan-tag",189],["interface ethernet s'
+        'witch egress-vlan-translation",426],["interface ethernet switch host",345],["interface ethernet switch ingress-port-policer",331],["interfac'
+        'e ethernet switch ingress-vlan-translation",461],["interface ethernet switch l3hw-settings",251],["interface ethernet switch l3hw-settings a'
+        'dvanced",526],["interface ethernet switch mac-based-vlan",224],["interface ethernet switch multicast-fdb",251],["interface ethernet switch o'
+        'ne2one-vlan-switching",209],["interface ethernet switch policer-qos-map",248],["interface ethernet switch port",4026],["interface ethernet s'
+        'witch port-isolation",712],["interface ethernet switch port-leakage",344],["interface ethernet switch protocol-based-vlan",339],["interface '
+        'ethernet switch qos map",225],["interface ethernet switch qos map ip",208],["interface ethernet switch qos map vlan",223],["interface ethern'
+        'et switch qos port",604],["interface ethernet switch qos priority-flow-control",316],["interface ethernet switch qos profile",305],["interfa'
+        'ce ethernet switch qos settings",810],["interface ethernet switch qos tx-manager",302],["interface ethernet switch qos tx-manager queue",459'
+        '],["interface ethernet switch qos-group",224],["interface ethernet switch reserved-fdb",274],["interface ethernet switch rule",1072],["inter'
+        'face ethernet switch shaper",223],["interface ethernet switch stats",1749],["interface ethernet switch trunk",186],["interface ethernet swit'
+        'ch unicast-fdb",281],["interface ethernet switch vlan",367],["interface gre",636],["interface gre6",601],["interface ipip",386],["interface '
+        'ipipv6",406],["interface l2tp-client",1119],["interface l2tp-ether",601],["interface l2tp-server",194],["interface l2tp-server server",1010]'
+        ',["interface list",324],["interface list member",330],["interface lte",589],["interface lte apn",848],["interface lte settings",304],["inter'
+        'face macsec",247],["interface macsec profile",174],["interface macvlan",358],["interface mesh",565],["interface mesh port",255],["interface '
+        'ovpn-client",811],["interface ovpn-server",194],["interface ovpn-server server",1606],["interface ppp-client",1076],["interface ppp-server",'
+        '534],["interface pppoe-client",845],["interface pppoe-server",209],["interface pppoe-server server",867],["interface pptp-client",658],["int'
+        'erface pptp-server",224],["interface pptp-server server",331],["interface sstp-client",975],["interface sstp-server",224],["interface sstp-s'
+        'erver server",698],["interface veth",559],["interface vlan",728],["interface vpls",900],["interface vrrp",1173],["interface vxlan",1240],["i'
+        'nterface vxlan vteps",306],["interface wifi",10089],["interface wifi aaa",586],["interface wifi access-list",853],["interface wifi cap",684]'
+        ',["interface wifi capsman",431],["interface wifi channel",732],["interface wifi configuration",9025],["interface wifi datapath",643],["inter'
+        'face wifi interworking",1429],["interface wifi network",1684],["interface wifi network radio",732],["interface wifi provisioning",743],["int'
+        'erface wifi radio settings",208],["interface wifi security",1671],["interface wifi security multi-passphrase",305],["interface wifi steering'
+        '",729],["interface wifi steering neighbor-group",310],["interface wifiwave2",593],["interface wifiwave2 aaa",557],["interface wifiwave2 acce'
+        'ss-list",681],["interface wifiwave2 cap",495],["interface wifiwave2 capsman",428],["interface wifiwave2 channel",312],["interface wifiwave2 '
+        'configuration",550],["interface wifiwave2 datapath",352],["interface wifiwave2 interworking",832],["interface wifiwave2 provisioning",486],['
+        '"interface wifiwave2 security",1228],["interface wifiwave2 steering",324],["interface wireguard",397],["interface wireguard peers",1074],["i'
+        'nterface wireless",3714],["interface wireless access-list",812],["interface wireless align",396],["interface wireless cap",438],["interface '
+        'wireless channels",312],["interface wireless connect-list",1177],["interface wireless interworking-profiles",815],["interface wireless manua'
+        'l-tx-power-table",306],["interface wireless nstreme",387],["interface wireless nstreme-dual",660],["interface wireless security-profiles",14'
+        '89],["interface wireless sniffer",432],["interface wireless snooper",185],["interface wireless wds",359],["iot bluetooth",323],["iot bluetoo'
+        'th advertisers",477],["iot bluetooth advertisers ad-structures",175],["iot bluetooth peripheral-devices",345],["iot bluetooth scanners",449]'
+        ',["iot bluetooth whitelist",219],["iot lora",659],["iot lora channels",366],["iot lora joineui",261],["iot lora netid",259],["iot lora radio'
+        's",437],["iot lora servers",311],["iot lora traffic options",210],["iot modbus",413],["iot modbus security-rules",216],["iot mqtt brokers",5'
+        '07],["iot mqtt subscriptions",195],["ip accounting",296],["ip accounting web-access",269],["ip address",484],["ip arp",439],["ip cloud",448]'
+        ',["ip cloud advanced",112],["ip cloud back-to-home-file",221],["ip cloud back-to-home-file settings",156],["ip cloud back-to-home-user",297]'
+        ',["ip cloud back-to-home-users",409],["ip dhcp-client",918],["ip dhcp-client option",283],["ip dhcp-relay",634],["ip dhcp-server",1599],["ip'
+        ' dhcp-server alert",244],["ip dhcp-server config",302],["ip dhcp-server lease",1260],["ip dhcp-server matcher",529],["ip dhcp-server network'
+        '",776],["ip dhcp-server option",374],["ip dhcp-server option sets",324],["ip dns",987],["ip dns adlist",369],["ip dns forwarders",400],["ip '
+        'dns static",762],["ip firewall address-list",448],["ip firewall calea",2184],["ip firewall connection tracking",844],["ip firewall filter",2'
+        '631],["ip firewall layer7-protocol",284],["ip firewall mangle",3089],["ip firewall nat",2657],["ip firewall raw",2070],["ip firewall service'
+        '-port",311],["ip hotspot",514],["ip hotspot active",208],["ip hotspot ip-binding",248],["ip hotspot profile",1208],["ip hotspot service-port'
+        '",268],["ip hotspot user",610],["ip hotspot user profile",1107],["ip hotspot walled-garden",495],["ip hotspot walled-garden ip",606],["ip ip'
+        'sec active-peers",182],["ip ipsec identity",889],["ip ipsec key",340],["ip ipsec key psk",145],["ip ipsec key qkd",248],["ip ipsec key rsa",'
+        '309],["ip ipsec mode-config",889],["ip ipsec peer",672],["ip ipsec policy",790],["ip ipsec policy group",270],["ip ipsec profile",669],["ip '
+        'ipsec proposal",471],["ip ipsec settings",294],["ip kid-control",367],["ip kid-control device",198],["ip media",247],["ip media settings",14'
+        '6],["ip nat-pmp",143],["ip nat-pmp interfaces",201],["ip neighbor discovery-settings",690],["ip packing",227],["ip pool",265],["ip pool used'
+        '",319],["ip proxy",716],["ip proxy access",317],["ip proxy cache",298],["ip proxy cache-contents",137],["ip proxy connections",310],["ip pro'
+        'xy direct",298],["ip reverse-proxy",237],["ip route",729],["ip route rule",453],["ip route vrf",315],["ip service",417],["ip service webserv'
+        'er",343],["ip settings",825],["ip smb",324],["ip smb shares",547],["ip smb users",319],["ip socks",381],["ip socks access",468],["ip socks c'
+        'onnections",445],["ip socks users",277],["ip socksify",378],["ip ssh",623],["ip tftp",333],["ip tftp settings",108],["ip traffic-flow",364],'
+        '["ip traffic-flow ipfix",1270],["ip traffic-flow target",389],["ip upnp",194],["ip upnp interfaces",314],["ip vrf",323],["ipv6 address",566]'
+        ',["ipv6 dhcp-client",1260],["ipv6 dhcp-client option",236],["ipv6 dhcp-relay",378],["ipv6 dhcp-relay option",224],["ipv6 dhcp-server",1090],'
+        '["ipv6 dhcp-server binding",496],["ipv6 dhcp-server option",310],["ipv6 dhcp-server option sets",166],["ipv6 firewall address-list",416],["i'
+        'pv6 firewall filter",2336],["ipv6 firewall mangle",2519],["ipv6 firewall nat",2429],["ipv6 firewall raw",1894],["ipv6 nd",856],["ipv6 nd pre'
+        'fix",486],["ipv6 nd prefix default",294],["ipv6 nd proxy",206],["ipv6 neighbor",224],["ipv6 pool",255],["ipv6 route",1130],["ipv6 settings",'
+        '956],["lcd",292],["lcd interface",255],["lcd interface pages",208],["lcd pin",169],["lcd screen",298],["lora",659],["lora channels",366],["l'
+        'ora joineui",261],["lora netid",259],["lora radios",437],["lora servers",311],["lora traffic options",210],["mpls",313],["mpls interface",43'
+        '7],["mpls ldp",1025],["mpls ldp accept-filter",392],["mpls ldp advertise-filter",335],["mpls ldp interface",496],["mpls ldp local-mapping",2'
+        '49],["mpls ldp neighbor",226],["mpls ldp remote-mapping",246],["mpls mangle",300],["mpls settings",199],["mpls traffic-eng interface",579],['
+        '"mpls traffic-eng path",545],["mpls traffic-eng tunnel",1015],["openflow",378],["openflow port",220],["partitions",313],["port",386],["port '
+        'firmware",273],["port remote-access",491],["ppp aaa",355],["ppp l2tp-secret",183],["ppp profile",1686],["ppp secret",672],["queue interface"'
+        ',277],["queue simple",1207],["queue tree",611],["queue type",2182],["radius",764],["radius incoming",238],["routing bfd configuration",746],'
+        '["routing bfd interface",269],["routing bgp aggregate",468],["routing bgp connection",2214],["routing bgp evpn",290],["routing bgp instance"'
+        ',987],["routing bgp network",344],["routing bgp peer",1199],["routing bgp template",2329],["routing bgp vpls",481],["routing bgp vpn",522],['
+        '"routing fantasy",395],["routing filter",2445],["routing filter community-ext-list",215],["routing filter community-large-list",215],["routi'
+        'ng filter community-list",368],["routing filter num-list",330],["routing filter rule",330],["routing filter select-rule",556],["routing gmp"'
+        ',217],["routing id",335],["routing igmp-proxy",159],["routing igmp-proxy interface",398],["routing igmp-proxy mfc",237],["routing isis insta'
+        'nce",955],["routing isis interface",1042],["routing isis interface-template",1421],["routing isis lsp",383],["routing isis neighbor",374],["'
+        'routing mme",493],["routing ospf area",514],["routing ospf area range",385],["routing ospf instance",815],["routing ospf interface-template"'
+        ',960],["routing ospf neighbor",310],["routing ospf static-neighbor",391],["routing ospf-v3 area",259],["routing ospf-v3 instance",523],["rou'
+        'ting pimsm bsr candidate",253],["routing pimsm bsr rp-candidate",231],["routing pimsm igmp-interface-template",301],["routing pimsm instance'
+        '",547],["routing pimsm interface-template",586],["routing pimsm static-rp",259],["routing rip",702],["routing rip instance",503],["routing r'
+        'ip interface-template",436],["routing rip keys",229],["routing rip static-neighbor",186],["routing ripng",545],["routing route",326],["routi'
+        'ng route rule",508],["routing rpki",308],["routing rule",600],["routing settings",468],["routing table",325],["rsync-daemon",205],["snmp",67'
+        '5],["snmp community",650],["special-login",194],["system clock",281],["system clock manual",237],["system console",194],["system console scr'
+        'een",238],["system gps",257],["system hardware",215],["system health",224],["system health settings",855],["system identity",104],["system l'
+        'eds",278],["system leds settings",109],["system logging",366],["system logging action",1227],["system note",271],["system ntp client",416],['
+        '"system ntp client servers",422],["system ntp key",183],["system ntp server",371],["system package local-update",340],["system package local'
+        '-update mirror",242],["system package local-update update-package-source",222],["system package update",214],["system resource hardware usb-'
+        'settings",153],["system resource irq",222],["system resource irq rps",255],["system resource usb",468],["system resource usb settings",210],'
+        '["system routerboard mode-button",176],["system routerboard reset-button",176],["system routerboard settings",1182],["system routerboard usb'
+        '",156],["system routerboard wps-button",176],["system scheduler",485],["system script",446],["system script environment",295],["system scrip'
+        't job",309],["system swos",266],["system upgrade",345],["system upgrade mirror",422],["system upgrade upgrade-package-source",228],["system '
+        'ups",503],["system watchdog",415],["task",342],["tool bandwidth-server",383],["tool calea",456],["tool e-mail",777],["tool graphing",140],["'
+        'tool graphing interface",378],["tool graphing queue",252],["tool graphing resource",346],["tool mac-server",102],["tool mac-server mac-winbo'
+        'x",102],["tool mac-server ping",101],["tool mac-server sessions",317],["tool netwatch",1711],["tool romon",168],["tool romon port",302],["to'
+        'ol sms",513],["tool sniffer",1528],["tool traffic-generator",231],["tool traffic-generator packet-template",1607],["tool traffic-generator p'
+        'ort",184],["tool traffic-generator raw-packet-template",483],["tool traffic-generator stream",304],["tool traffic-monitor",262],["tr069-clie'
+        'nt",430],["user",530],["user aaa",244],["user active",141],["user group",315],["user settings",129],["user ssh-keys",146],["user-manager",32'
+        '9],["user-manager advanced",319],["user-manager attribute",221],["user-manager database",143],["user-manager limitation",625],["user-manager'
+        ' payment",285],["user-manager profile",265],["user-manager profile-limitation",237],["user-manager router",293],["user-manager session",137]'
+        ',["user-manager user",284],["user-manager user group",222],["user-manager user-profile",135],["zerotier",250],["zerotier controller",363],["'
+        'zerotier controller member",265],["zerotier interface",323]]'
+    ),
+    (
+        '{"snapshots":[null,null,null,null,[0],[0],[0]],"versioned":[["7.21",">=",{"fields":[["auto-update",{}],["disabled",{}],["environment",{}],["'
+        'extra-mounts",{}],["firewall-redirects",{}],["hw-device-access",{}],["network",{}],["numbers",{"depr":{"context":"write","msg":"The numbers '
+        'field will be read-only from community.routeros 4.0.0 on.","version":"4.0.0"}}],["required-mounts",{}]],"fully_understood":true,"has_identif'
+        'ier":true,"versioned_fields":[[[["7.22",">="]],"app-store-url",{"read_only":true}],[[["7.22",">="]],"category",{"read_only":true}],[[["7.22"'
+        ',">="]],"cmds",{"read_only":true}],[[["7.22",">="]],"containers",{"read_only":true}],[[["7.22",">="]],"custom",{"read_only":true}],[[["7.22"'
+        ',">="]],"default-credentials",{"read_only":true}],[[["7.22",">="]],"default-network",{"read_only":true}],[[["7.22",">="]],"description",{"re'
+        'ad_only":true}],[[["7.22",">="]],"from-app-store",{"read_only":true}],[[["7.22",">="]],"interface",{"read_only":true}],[[["7.22",">="]],"nam'
+        'e",{"read_only":true}],[[["7.22",">="]],"project-page",{"read_only":true}],[[["7.22",">="]],"pvid",{}],[[["7.22",">="]],"running",{"read_onl'
+        'y":true}],[[["7.22",">="]],"status",{"read_only":true}],[[["7.22",">="]],"ui-url",{"read_only":true}],[[["7.22",">="]],"use-https",{}],[[["7'
+        '.22",">="]],"variables-to-use-in-environment",{"read_only":true}],[[["7.22",">="]],"yaml",{}]]}]]}{"snapshots":[null,null,null,null,[0],[0],'
+        '[0]],"versioned":[["7.21",">=",{"fields":[["auto-update",{}],["disk",{}],["download-path",{}],["lan-bridge",{}],["media-path",{}],["registry'
+        '-mirrors",{}],["router-ip",{}],["show-in-webfig",{}]],"fully_understood":true,"single_value":true,"versioned_fields":[[[["7.22",">="]],"app-'
+        'store-urls",{}]]}]]}{"unversioned":{"fields":[["called-format",{"default":"mac:ssid"}],["interim-update",{"default":"disabled"}],["mac-cachi'
+        'ng",{"default":"disabled"}],["mac-format",{"default":"XX:XX:XX:XX:XX:XX"}],["mac-mode",{"default":"as-username"}]],"fully_understood":true,"'
+        'single_value":true}}{"snapshots":[[-1],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0]],"unversioned":{"fields":[["action",{"can_disable":true}],['
+        '"allow-signal-out-of-range",{"can_disable":true}],["ap-tx-limit",{"can_disable":true}],["client-to-client-forwarding",{"can_disable":true}],'
+        '["client-tx-limit",{"can_disable":true}],["comment",{"can_disable":true,"remove_value":""}],["disabled",{"default":false}],["interface",{"ca'
+        'n_disable":true}],["mac-address",{"can_disable":true}],["mac-address-mask",{"can_disable":true}],["private-passphrase",{"can_disable":true}]'
+        ',["radius-accounting",{"can_disable":true}],["signal-range",{"can_disable":true}],["ssid-regexp",{}],["time",{"can_disable":true}],["vlan-id'
+        '",{"can_disable":true}],["vlan-mode",{"can_disable":true}]],"fully_understood":true,"versioned_fields":[[[["7.15.2",">="]],"numbers",{"read_'
+        'only":true}]]}}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["arp",{}],["arp-timeout",{}],["channel.band"'
+        ',{}],["channel.control-channel-width",{}],["channel.extension-channel",{}],["channel.frequency",{}],["channel.reselect-interval",{}],["chann'
+        'el.save-selected",{}],["channel.secondary-frequency",{}],["channel.skip-dfs-channels",{}],["channel.tx-power",{}],["comment",{}],["configura'
+        'tion.country",{}],["configuration.disconnect-timeout",{}],["configuration.distance",{}],["configuration.frame-lifetime",{}],["configuration.'
+        'guard-interval",{}],["configuration.hide-ssid",{}],["configuration.hw-protection-mode",{}],["configuration.hw-retries",{}],["configuration.i'
+        'nstallation",{}],["configuration.keepalive-frames",{}],["configuration.load-balancing-group",{}],["configuration.max-sta-count",{}],["config'
+        'uration.mode",{}],["configuration.multicast-helper",{}],["configuration.rx-chains",{}],["configuration.ssid",{}],["configuration.tx-chains",'
+        '{}],["datapath.bridge",{}],["datapath.bridge-cost",{}],["datapath.bridge-horizon",{}],["datapath.client-to-client-forwarding",{}],["datapath'
+        '.interface-list",{}],["datapath.local-forwarding",{}],["datapath.openflow-switch",{}],["datapath.vlan-id",{}],["datapath.vlan-mode",{}],["di'
+        'sable-running-check",{}],["disabled",{}],["l2mtu",{}],["mac-address",{}],["master-interface",{}],["mtu",{}],["name",{}],["numbers",{"depr":{'
+        '"context":"write","msg":"The numbers field will be read-only from community.routeros 4.0.0 on.","version":"4.0.0"}}],["radio-mac",{}],["secu'
+        'rity.authentication-types",{}],["security.disable-pmkid",{}],["security.eap-methods",{}],["security.eap-radius-accounting",{}],["security.en'
+        'cryption",{}],["security.group-encryption",{}],["security.group-key-update",{}],["security.passphrase",{}],["security.tls-certificate",{}],['
+        '"security.tls-mode",{}]],"fully_understood":true,"has_identifier":true}]]}{"snapshots":[[-1],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0]],"unv'
+        'ersioned":{"fields":[["band",{"can_disable":true}],["comment",{"can_disable":true,"remove_value":""}],["control-channel-width",{"can_disable'
+        '":true}],["extension-channel",{"can_disable":true}],["frequency",{"can_disable":true}],["name",{}],["reselect-interval",{"can_disable":true}'
+        '],["save-selected",{"can_disable":true}],["secondary-frequency",{"can_disable":true}],["skip-dfs-channels",{"can_disable":true}],["tx-power"'
+        ',{"can_disable":true}]],"fully_understood":true,"primary_keys":["name"],"versioned_fields":[[[["7.15.2",">="]],"numbers",{"read_only":true}]'
+        ']}}{"snapshots":[[-1],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0]],"unversioned":{"fields":[["channel",{"can_disable":true}],["channel.band",{'
+        '"can_disable":true}],["channel.control-channel-width",{"can_disable":true}],["channel.extension-channel",{"can_disable":true}],["channel.fre'
+        'quency",{"can_disable":true}],["channel.reselect-interval",{"can_disable":true}],["channel.save-selected",{"can_disable":true}],["channel.se'
+        'condary-frequency",{"can_disable":true}],["channel.skip-dfs-channels",{"can_disable":true}],["channel.tx-power",{"can_disable":true}],["comm'
+        'ent",{"can_disable":true,"remove_value":""}],["country",{"can_disable":true}],["datapath",{"can_disable":true}],["datapath.arp",{}],["datapa'
+        'th.bridge",{"can_disable":true}],["datapath.bridge-cost",{"can_disable":true}],["datapath.bridge-horizon",{"can_disable":true}],["datapath.c'
+        'lient-to-client-forwarding",{"can_disable":true}],["datapath.interface-list",{"can_disable":true}],["datapath.l2mtu",{}],["datapath.local-fo'
+        'rwarding",{"can_disable":true}],["datapath.mtu",{}],["datapath.openflow-switch",{"can_disable":true}],["datapath.vlan-id",{"can_disable":tru'
+        'e}],["datapath.vlan-mode",{"can_disable":true}],["disconnect-timeout",{"can_disable":true}],["distance",{"can_disable":true}],["frame-lifeti'
+        'me",{"can_disable":true}],["guard-interval",{"can_disable":true}],["hide-ssid",{"can_disable":true}],["hw-protection-mode",{"can_disable":tr'
+        'ue}],["hw-retries",{"can_disable":true}],["installation",{"can_disable":true}],["keepalive-frames",{"can_disable":true}],["load-balancing-gr'
+        'oup",{"can_disable":true}],["max-sta-count",{"can_disable":true}],["mode",{"can_disable":true}],["multicast-helper",{"can_disable":true}],["'
+        'name",{}],["rates",{"can_disable":true}],["rates.basic",{"can_disable":true}],["rates.ht-basic-mcs",{"can_disable":true}],["rates.ht-support'
+        'ed-mcs",{"can_disable":true}],["rates.supported",{"can_disable":true}],["rates.vht-basic-mcs",{"can_disable":true}],["rates.vht-supported-mc'
+        's",{"can_disable":true}],["rx-chains",{"can_disable":true}],["security",{"can_disable":true}],["security.authentication-types",{"can_disable'
+        '":true}],["security.disable-pmkid",{"can_disable":true}],["security.eap-methods",{"can_disable":true}],["security.eap-radius-accounting",{"c'
+        'an_disable":true}],["security.encryption",{"can_disable":true}],["security.group-encryption",{"can_disable":true}],["security.group-key-upda'
+        'te",{}],["security.passphrase",{"can_disable":true}],["security.tls-certificate",{}],["security.tls-mode",{}],["ssid",{"can_disable":true}],'
+        '["tx-chains",{"can_disable":true}]],"fully_understood":true,"primary_keys":["name"],"versioned_fields":[[[["7.15.2",">="]],"numbers",{"read_'
+        'only":true}]]}}{"snapshots":[[-1],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0]],"unversioned":{"fields":[["arp",{}],["bridge",{"can_disable":tr'
+        'ue}],["bridge-cost",{"can_disable":true}],["bridge-horizon",{"can_disable":true}],["client-to-client-forwarding",{"can_disable":true}],["com'
+        'ment",{"can_disable":true,"remove_value":""}],["interface-list",{"can_disable":true}],["l2mtu",{}],["local-forwarding",{"can_disable":true}]'
+        ',["mtu",{}],["name",{}],["openflow-switch",{"can_disable":true}],["vlan-id",{"can_disable":true}],["vlan-mode",{"can_disable":true}]],"fully'
+        '_understood":true,"primary_keys":["name"],"versioned_fields":[[[["7.15.2",">="]],"numbers",{"read_only":true}]]}}{"snapshots":[[0],[0,0],[0,'
+        '0],[0,0],[0,0],[0,0],[0,0]],"versioned":[["7.15",">=",{"fields":[["arp",{}],["arp-timeout",{}],["channel",{"can_disable":true}],["channel.ba'
+        'nd",{"can_disable":true}],["channel.control-channel-width",{"can_disable":true}],["channel.extension-channel",{"can_disable":true}],["channe'
+        'l.frequency",{"can_disable":true}],["channel.reselect-interval",{"can_disable":true}],["channel.save-selected",{"can_disable":true}],["chann'
+        'el.secondary-frequency",{"can_disable":true}],["channel.skip-dfs-channels",{"can_disable":true}],["channel.tx-power",{"can_disable":true}],['
+        '"comment",{}],["configuration",{"can_disable":true}],["configuration.country",{"can_disable":true}],["configuration.disconnect-timeout",{"ca'
+        'n_disable":true}],["configuration.distance",{"can_disable":true}],["configuration.frame-lifetime",{"can_disable":true}],["configuration.guar'
+        'd-interval",{"can_disable":true}],["configuration.hide-ssid",{"can_disable":true}],["configuration.hw-protection-mode",{"can_disable":true}]'
+        ',["configuration.hw-retries",{"can_disable":true}],["configuration.installation",{"can_disable":true}],["configuration.keepalive-frames",{"c'
+        'an_disable":true}],["configuration.load-balancing-group",{"can_disable":true}],["configuration.max-sta-count",{"can_disable":true}],["config'
+        'uration.mode",{"can_disable":true}],["configuration.multicast-helper",{"can_disable":true}],["configuration.rx-chains",{"can_disable":true}]'
+        ',["configuration.ssid",{"can_disable":true}],["configuration.tx-chains",{"can_disable":true}],["datapath",{"can_disable":true}],["datapath.b'
+        'ridge",{"can_disable":true}],["datapath.bridge-cost",{"can_disable":true}],["datapath.bridge-horizon",{"can_disable":true}],["datapath.clien'
+        't-to-client-forwarding",{"can_disable":true}],["datapath.interface-list",{"can_disable":true}],["datapath.local-forwarding",{"can_disable":t'
+        'rue}],["datapath.openflow-switch",{"can_disable":true}],["datapath.vlan-id",{"can_disable":true}],["datapath.vlan-mode",{"can_disable":true}'
+        '],["disable-running-check",{}],["disabled",{}],["l2mtu",{}],["mac-address",{}],["master-interface",{}],["mtu",{}],["name",{}],["radio-mac",{'
+        '}],["radio-name",{}],["rates",{"can_disable":true}],["rates.basic",{"can_disable":true}],["rates.ht-basic-mcs",{"can_disable":true}],["rates'
+        '.ht-supported-mcs",{"can_disable":true}],["rates.supported",{"can_disable":true}],["rates.vht-basic-mcs",{"can_disable":true}],["rates.vht-s'
+        'upported-mcs",{"can_disable":true}],["security",{"can_disable":true}],["security.authentication-types",{"can_disable":true}],["security.disa'
+        'ble-pmkid",{"can_disable":true}],["security.eap-methods",{"can_disable":true}],["security.eap-radius-accounting",{"can_disable":true}],["sec'
+        'urity.encryption",{"can_disable":true}],["security.group-encryption",{"can_disable":true}],["security.group-key-update",{}],["security.passp'
+        'hrase",{"can_disable":true}],["security.tls-certificate",{}],["security.tls-mode",{}]],"fully_understood":true,"versioned_fields":[[[["7.15.'
+        '2",">="]],"numbers",{"read_only":true}]]}]]}{"unversioned":{"fields":[["ca-certificate",{"default":"none"}],["certificate",{"default":"none"'
+        '}],["enabled",{"default":false}],["package-path",{"default":""}],["require-peer-certificate",{"default":false}],["upgrade-policy",{"default"'
+        ':"none"}]],"fully_understood":true,"single_value":true}}{"snapshots":[[-1],[-1,1],[-1,1],[-1,1],[-1,1],[-1,1],[-1,1]],"unversioned":{"fields'
+        '":[["comment",{"can_disable":true,"remove_value":""}],["disabled",{"default":false}],["forbid",{"default":false}],["interface",{}]],"fully_u'
+        'nderstood":true,"primary_keys":["interface"],"versioned_fields":[[[["7.15","<"]],"default",{}],[[["7.15.2",">="]],"numbers",{"read_only":tru'
+        'e}]]}}{"snapshots":[[-1],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0]],"unversioned":{"fields":[["action",{"default":"none"}],["comment",{"can_'
+        'disable":true,"remove_value":""}],["common-name-regexp",{"default":""}],["disabled",{"default":false}],["hw-supported-modes",{"default":""}]'
+        ',["identity-regexp",{"default":""}],["ip-address-ranges",{"default":""}],["master-configuration",{"default":"*FFFFFFFF"}],["name-format",{"d'
+        'efault":"cap"}],["name-prefix",{"default":""}],["radio-mac",{"default":"00:00:00:00:00:00"}],["slave-configurations",{"default":""}]],"fully'
+        '_understood":true,"versioned_fields":[[[["7.15.2",">="]],"numbers",{"read_only":true}]]}}{"snapshots":[[0],[0,0],[0,0],[0,0],[0,0],[0,0],[0,'
+        '0]],"versioned":[["7.15",">=",{"fields":[["basic",{"can_disable":true}],["comment",{}],["ht-basic-mcs",{"can_disable":true}],["ht-supported-'
+        'mcs",{"can_disable":true}],["name",{}],["supported",{"can_disable":true}],["vht-basic-mcs",{"can_disable":true}],["vht-supported-mcs",{"can_'
+        'disable":true}]],"fully_understood":true,"versioned_fields":[[[["7.15.2",">="]],"numbers",{"read_only":true}]]}]]}{"snapshots":[[-1],[-1,0],'
+        '[-1,0],[-1,0],[-1,0],[-1,0],[-1,0]],"unversioned":{"fields":[["authentication-types",{"can_disable":true}],["comment",{"can_disable":true,"r'
+        'emove_value":""}],["disable-pmkid",{"can_disable":true}],["eap-methods",{"can_disable":true}],["eap-radius-accounting",{"can_disable":true}]'
+        ',["encryption",{"can_disable":true}],["group-encryption",{"can_disable":true}],["group-key-update",{}],["name",{}],["passphrase",{"can_disab'
+        'le":true}],["tls-certificate",{}],["tls-mode",{}]],"fully_understood":true,"primary_keys":["name"],"versioned_fields":[[[["7.15.2",">="]],"n'
+        'umbers",{"read_only":true}]]}}{"snapshots":[[0],[0],[0],[0],[0,0],[0,0],[0,0]],"versioned":[["7.15",">=",{"fields":[["common-name",{}],["cou'
+        'ntry",{}],["days-valid",{"default":365}],["digest-algorithm",{"default":"sha256"}],["key-size",{"default":"2048"}],["key-usage",{"default":"'
+        'digital-signature,key-encipherment,data-encipherment,key-cert-sign,crl-sign,tls-server,tls-client"}],["locality",{}],["name",{}],["numbers",'
+        '{"read_only":true}],["organization",{}],["state",{}],["subject-alt-name",{}],["trusted",{}],["unit",{}]],"fully_understood":true,"versioned_'
+        'fields":[[[["7.21",">="]],"trust-store",{}]]}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["numbers",{'
+        '"read_only":true}],["url",{}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["'
+        'ca-cert",{}],["days-valid",{}],["disabled",{}],["next-ca-cert",{}],["numbers",{"read_only":true}],["path",{}],["request-lifetime",{}]],"full'
+        'y_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["ca-identity",{}],["challenge-passwor'
+        'd",{}],["disabled",{}],["fingerprint-algorithm",{}],["name",{}],["numbers",{"read_only":true}],["on-smart-card",{}],["ra-path",{}],["ra-tran'
+        'saction-lifetime",{}],["server-url",{}],["template",{}]],"fully_understood":true}]]}{"snapshots":[[-1],[-1],[-1],[-1],[-1,0,1],[-1,0,1],[-1,'
+        '0,1]],"unversioned":{"fields":[["crl-download",{"default":false}],["crl-store",{"default":"ram"}],["crl-use",{"default":false}]],"fully_unde'
+        'rstood":true,"single_value":true,"versioned_fields":[[[["7.19",">="]],"builtin-trust-anchors",{}],[[["7.21",">="]],"builtin-trust-store",{}]'
+        ',[[["7.22.1",">="]],"current-defaults",{}]]}}{"snapshots":[[0],[0],[0],[0,0],[0,0,1],[0,0,1],[0,0,1]],"versioned":[["7.15",">=",{"fields":[['
+        '"sanitize-names",{}]],"fully_understood":true,"single_value":true,"versioned_fields":[[[["7.18",">="]],"log-script-errors",{}],[[["7.20",">='
+        '"]],"tab-width",{}]]}]]}{"snapshots":[[1],[1],[1],[1],[0,0,1,2,3,4,6,14,15,16,17,18,21],[0,0,1,2,3,4,6,14,15,16,17,18,20,21,22],[0,0,1,2,3,4'
+        ',6,14,15,16,17,18,20,21,22]],"versioned":[["7.19",">=",{"fields":[["cmd",{}],["comment",{}],["dns",{}],["domain-name",{}],["entrypoint",{}],'
+        '["file",{}],["hostname",{}],["interface",{}],["logging",{}],["name",{}],["numbers",{"read_only":true}],["remote-image",{}],["root-dir",{}],['
+        '"start-on-boot",{}],["stop-signal",{}],["user",{}],["workdir",{}]],"fully_understood":true,"primary_keys":["name"],"versioned_fields":[[[["7'
+        '.20",">="]],"auto-restart-interval",{}],[[["7.20",">="]],"check-certificate",{}],[[["7.21",">="]],"cpu-list",{}],[[["7.20",">="]],"devices",'
+        '{}],[[["7.21",">="]],"env",{}],[[["7.20","<"]],"envlist",{}],[[["7.20",">="]],"envlists",{}],[[["7.22",">="]],"healthcheck-cmd",{}],[[["7.22'
+        '",">="]],"healthcheck-interval",{}],[[["7.22",">="]],"healthcheck-retries",{}],[[["7.22",">="]],"healthcheck-start-interval",{}],[[["7.22","'
+        '>="]],"healthcheck-start-period",{}],[[["7.22",">="]],"healthcheck-status",{}],[[["7.22",">="]],"healthcheck-timeout",{}],[[["7.21",">="]],"'
+        'hosts",{}],[[["7.21",">="]],"layer-dir",{}],[[["7.20",">="]],"memory-high",{}],[[["7.21",">="]],"mount",{}],[[["7.21",">="]],"mountlists",{}'
+        '],[[["7.21","<"]],"mounts",{}],[[["7.21.2",">="]],"shm-size",{}],[[["7.21",">="]],"stop-time",{}],[[["7.21.2",">="]],"tmpfs",{}]]}],["7.15",'
+        '">=",{"fields":[["cmd",{}],["comment",{}],["dns",{}],["domain-name",{}],["entrypoint",{}],["envlist",{}],["file",{}],["hostname",{}],["inter'
+        'face",{}],["logging",{}],["mounts",{}],["numbers",{"read_only":true}],["remote-image",{}],["root-dir",{}],["start-on-boot",{}],["stop-signal'
+        '",{}],["user",{}],["workdir",{}]],"fully_understood":true}]]}{"snapshots":[[0,1],[0,1],[0,1],[0,1],[0,0],[0,0],[0,0]],"versioned":[["7.15","'
+        '>=",{"fields":[["layer-dir",{}],["password",{}],["registry-url",{}],["tmpdir",{}],["username",{}]],"fully_understood":true,"single_value":tr'
+        'ue,"versioned_fields":[[[["7.20",">="]],"memory-high",{}],[[["7.20","<"]],"ram-high",{}]]}]]}{"snapshots":[[1],[1],[1],[1],[0,0],[0,0],[0,0]'
+        '],"versioned":[["7.20",">=",{"fields":[["comment",{}],["key",{}],["list",{}],["numbers",{"read_only":true}],["value",{}]],"fully_understood"'
+        ':true,"primary_keys":["list","key"],"versioned_fields":[[[["7.21",">="]],"disabled",{}]]}],["7.20","<",{"fields":[["comment",{}],["key",{}],'
+        '["name",{}],["numbers",{"read_only":true}],["value",{}]],"fully_understood":true}]]}{"snapshots":[[1,2],[1,2],[1,2],[1,2],[1,0,1,3],[1,0,1,3'
+        '],[1,0,1,3]],"versioned":[["7.22",">=",{"fields":[["comment",{"can_disable":true,"remove_value":""}],["disabled",{"default":false}],["dst",{'
+        '"value_sanitizer":"ensure_leading_slash"}],["list",{}],["numbers",{"read_only":true}],["read-only",{"default":false}],["src",{"default":"/",'
+        '"value_sanitizer":"ensure_leading_slash"}]],"fully_understood":true,"primary_keys":["dst","list"]}],["7.15",">=",{"fields":[["comment",{}],['
+        '"dst",{}],["numbers",{"read_only":true}],["src",{}]],"fully_understood":true,"versioned_fields":[[[["7.21",">="]],"disabled",{}],[[["7.21","'
+        '>="]],"list",{}],[[["7.21","<"]],"name",{}],[[["7.20",">="]],"read-only",{}]]}]]}{"snapshots":[[0,9],[0,9],[0,9],[0,0,1,2,3,6,7,8,9,15,16,17'
+        ',18,19,20],[0,0,1,2,3,4,5,6,7,8,10,11,12,13,14,15,16,17,18,19,20],[0,0,1,2,3,4,5,6,7,8,10,11,12,13,14,15,16,17,18,19,20],[0,0,1,2,3,4,5,6,7,'
+        '8,10,11,12,13,14,15,16,17,18,19,20]],"versioned":[["7.15",">=",{"fields":[["comment",{}],["crypted-backend",{}],["disabled",{}],["encryption'
+        '-key",{}],["iscsi-address",{}],["iscsi-export",{}],["iscsi-iqn",{}],["iscsi-port",{}],["media-interface",{}],["media-sharing",{}],["nfs-addr'
+        'ess",{}],["nfs-share",{}],["nfs-sharing",{}],["numbers",{"read_only":true}],["nvme-tcp-address",{}],["nvme-tcp-export",{}],["nvme-tcp-host-n'
+        'ame",{}],["nvme-tcp-password",{}],["nvme-tcp-port",{}],["nvme-tcp-server-allow-host-name",{}],["nvme-tcp-server-password",{}],["nvme-tcp-ser'
+        'ver-port",{}],["parent",{}],["partition-number",{}],["partition-offset",{}],["partition-size",{}],["raid-chunk-size",{}],["raid-device-count'
+        '",{}],["raid-master",{}],["raid-max-component-size",{}],["raid-member-failed",{}],["raid-role",{}],["raid-type",{}],["ramdisk-size",{}],["se'
+        'lf-encryption-password",{}],["slot",{}],["smb-address",{}],["smb-encryption",{}],["smb-password",{}],["smb-share",{}],["smb-sharing",{}],["s'
+        'mb-user",{}],["tmpfs-max-size",{}],["type",{}]],"fully_understood":true,"versioned_fields":[[[["7.18",">="]],"compress",{}],[[["7.17",">="]]'
+        ',"file-offset",{}],[[["7.17",">="]],"file-path",{}],[[["7.17",">="]],"file-size",{}],[[["7.21",">="]],"iscsi-server-iqn",{}],[[["7.21",">="]'
+        '],"iscsi-server-port",{}],[[["7.17",">="]],"mount-filesystem",{}],[[["7.17",">="]],"mount-point-template",{}],[[["7.17",">="]],"mount-read-o'
+        'nly",{}],[[["7.21","<"]],"nvme-tcp-name",{}],[[["7.21",">="]],"nvme-tcp-nqn",{}],[[["7.21",">="]],"nvme-tcp-server-nqn",{}],[[["7.21",">="]]'
+        ',"smb-server-encryption",{}],[[["7.21",">="]],"smb-server-password",{}],[[["7.21",">="]],"smb-server-user",{}],[[["7.17",">="]],"sshfs-addre'
+        'ss",{}],[[["7.17",">="]],"sshfs-password",{}],[[["7.17",">="]],"sshfs-path",{}],[[["7.17",">="]],"sshfs-port",{}],[[["7.17",">="]],"sshfs-us'
+        'er",{}],[[["7.17",">="]],"swap",{}]]}]]}{"snapshots":[null,null,null,[0],[0],[0],[0]],"versioned":[["7.18",">=",{"fields":[["default-subvolu'
+        'me",{}],["label",{}],["numbers",{"depr":{"context":"write","msg":"The numbers field will be read-only from community.routeros 4.0.0 on.","ve'
+        'rsion":"4.0.0"}}]],"fully_understood":true,"has_identifier":true}]]}{"snapshots":[null,null,null,[0],[0],[0],[0]],"versioned":[["7.18",">=",'
+        '{"fields":[["fs",{}],["mount",{}],["mountpoint",{}],["name",{}],["numbers",{"read_only":true}],["parent",{}],["read-only",{}]],"fully_unders'
+        'tood":true}]]}{"snapshots":[null,null,null,[0],[0],[0],[0]],"versioned":[["7.18",">=",{"fields":[["file",{}],["fs",{}],["send-parent",{}],["'
+        'send-subvolumes",{}],["ssh-address",{}],["ssh-port",{}],["ssh-receive-mount",{}],["ssh-user",{}],["type",{}]],"fully_understood":true}]]}{"s'
+        'napshots":[[-1],[-1],[-1],[-1],[-1],[-1],[-1]],"unversioned":{"fields":[["auto-media-interface",{"default":"bridge"}],["auto-media-sharing",'
+        '{"default":true}],["auto-smb-sharing",{"default":true}],["auto-smb-user",{"default":"guest"}]],"fully_understood":true,"single_value":true,"'
+        'versioned_fields":[[[["7.15","<"]],"default-mount-point-template",{"default":"[slot]"}]]}}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versio'
+        'ned":[["7.15",">=",{"fields":[["data-directory",{}],["enabled",{}]],"fully_understood":true,"single_value":true}]]}{"snapshots":[[0],[0],[0]'
+        ',[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["comment",{}],["name",{}],["numbers",{"read_only":true}]],"fully_understood":true}]]'
+        '}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["comment",{}],["name",{}],["numbers",{"read_only":true}]],'
+        '"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["comment",{}],["name",{}],["numb'
+        'ers",{"read_only":true}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["comme'
+        'nt",{}],["name",{}],["numbers",{"read_only":true}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.1'
+        '5",">=",{"fields":[["comment",{}],["name",{}],["numbers",{"read_only":true}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],['
+        '0],[0]],"versioned":[["7.15",">=",{"fields":[["address",{}],["broadcast",{}],["comment",{}],["device",{}],["disabled",{}],["interface",{}],['
+        '"netmask",{}],["network",{}],["numbers",{"read_only":true}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versione'
+        'd":[["7.15",">=",{"fields":[["address",{}],["comment",{}],["device",{}],["disabled",{}],["interface",{}],["mac-address",{}],["numbers",{"rea'
+        'd_only":true}],["published",{}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":['
+        '["cpu-overtemp-check",{}],["cpu-overtemp-startup-delay",{}],["cpu-overtemp-threshold",{}],["device",{}],["fan-mode",{}],["fan-on-threshold",'
+        '{}],["fan-switch",{}],["numbers",{"depr":{"context":"write","msg":"The numbers field will be read-only from community.routeros 4.0.0 on.","v'
+        'ersion":"4.0.0"}}],["psu1-state",{}],["psu2-state",{}],["use-fan",{}],["use-fan2",{}]],"fully_understood":true,"has_identifier":true}]]}{"sn'
+        'apshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["comment",{}],["device",{}],["disabled",{}],["l2mtu",{}],["mtu"'
+        ',{}],["name",{}],["numbers",{"depr":{"context":"write","msg":"The numbers field will be read-only from community.routeros 4.0.0 on.","versio'
+        'n":"4.0.0"}}]],"fully_understood":true,"has_identifier":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"field'
+        's":[["address",{}],["address-lists",{}],["always-broadcast",{}],["block-access",{}],["client-id",{}],["comment",{}],["device",{}],["dhcp-opt'
+        'ion",{}],["dhcp-option-set",{}],["disabled",{}],["insert-queue-before",{}],["lease-time",{}],["mac-address",{}],["numbers",{"read_only":true'
+        '}],["rate-limit",{}],["server",{}],["use-src-mac",{}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["'
+        '7.15",">=",{"fields":[["device",{}],["numbers",{"depr":{"context":"write","msg":"The numbers field will be read-only from community.routeros'
+        ' 4.0.0 on.","version":"4.0.0"}}]],"fully_understood":true,"has_identifier":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[['
+        '"7.15",">=",{"fields":[["bucket-size",{}],["burst-limit",{}],["burst-threshold",{}],["burst-time",{}],["comment",{}],["device",{}],["disable'
+        'd",{}],["dst",{}],["limit-at",{}],["max-limit",{}],["name",{}],["numbers",{"read_only":true}],["packet-marks",{}],["parent",{}],["priority",'
+        '{}],["queue",{}],["target",{}],["time",{}],["total-bucket-size",{}],["total-burst-limit",{}],["total-burst-threshold",{}],["total-burst-time'
+        '",{}],["total-limit-at",{}],["total-max-limit",{}],["total-priority",{}],["total-queue",{}]],"fully_understood":true}]]}{"snapshots":[[0],[0'
+        '],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["device",{}],["numbers",{"depr":{"context":"write","msg":"The numbers field wil'
+        'l be read-only from community.routeros 4.0.0 on.","version":"4.0.0"}}]],"fully_understood":true,"has_identifier":true}]]}{"snapshots":[[0],['
+        '0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["bgp-as-path",{}],["bgp-atomic-aggregate",{}],["bgp-communities",{}],["bgp-loc'
+        'al-pref",{}],["bgp-med",{}],["bgp-origin",{}],["bgp-prepend",{}],["check-gateway",{}],["comment",{}],["device",{}],["disabled",{}],["distanc'
+        'e",{}],["dst-address",{}],["gateway",{}],["numbers",{"read_only":true}],["pref-src",{}],["route-tag",{}],["routing-mark",{}],["scope",{}],["'
+        'target-scope",{}],["type",{}],["vrf-interface",{}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.1'
+        '5",">=",{"fields":[["device",{}],["numbers",{"depr":{"context":"write","msg":"The numbers field will be read-only from community.routeros 4.'
+        '0.0 on.","version":"4.0.0"}}]],"fully_understood":true,"has_identifier":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.'
+        '15",">=",{"fields":[["comment",{}],["name",{}],["numbers",{"read_only":true}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],'
+        '[0],[0]],"versioned":[["7.15",">=",{"fields":[["contents",{}],["name",{}],["numbers",{"read_only":true}],["type",{"default":"file"}]],"fully'
+        '_understood":true}]]}{"snapshots":[null,null,null,[0],[0],[0],[0]],"versioned":[["7.16",">=",{"fields":[["enabled",{}]],"fully_understood":t'
+        'rue,"single_value":true}]]}{"snapshots":[[0,1,2],[0,1,2],[0,1,2],[0,0],[0,0],[0,0],[0,0]],"versioned":[["7.15",">=",{"fields":[["comment",{}'
+        '],["disabled",{}],["local-path",{}],["mode",{}],["numbers",{"read_only":true}],["password",{}],["remote-path",{}],["user",{}]],"fully_unders'
+        'tood":true,"versioned_fields":[[[["7.16",">="]],"remote-address",{}],[[["7.16","<"]],"remote-addrs",{}],[[["7.16","<"]],"status",{}]]}]]}{"s'
+        'napshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["comment",{}],["disabled",{}],["l2mtu",{}],["mtu",{}],["name",'
+        '{}],["numbers",{"depr":{"context":"write","msg":"The numbers field will be read-only from community.routeros 4.0.0 on.","version":"4.0.0"}}]'
+        '],"fully_understood":true,"has_identifier":true}]]}{"snapshots":[[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0]],"unversioned":{"fields":['
+        '["clamp-tcp-mss",{"default":true}],["comment",{"can_disable":true,"remove_value":""}],["disabled",{"default":false}],["dont-fragment",{"defa'
+        'ult":false}],["dscp",{"default":"inherit"}],["ipsec-secret",{"can_disable":true}],["keepalive",{"can_disable":true,"default":"10s,10"}],["lo'
+        'cal-address",{"default":"0.0.0.0"}],["mtu",{"default":"auto"}],["name",{}],["remote-address",{"required":true}]],"fully_understood":true,"pr'
+        'imary_keys":["name"],"versioned_fields":[[[["7.15",">="]],"numbers",{"read_only":true}]]}}{"snapshots":[null,null,null,[1],null,null,null],"'
+        'versioned":[["7.19",">=","Not supported anymore in version  >= 7.19"],["7.18",">=",{"fields":[["comment",{}],["disabled",{}],["discovery-ip"'
+        ',{}],["dont-fragment",{}],["gateway-port",{}],["interface",{}],["local-ip",{}],["mac-address",{}],["max-tunnels",{}],["mode",{}],["name",{}]'
+        ',["numbers",{"read_only":true}],["relay-port",{}]],"fully_understood":true}]]}{"snapshots":[[-1,3],[-1,3],[-1,3],[-1,3],[-1,0,1,2,3],[-1,0,1'
+        ',2,3],[-1,0,1,2,3]],"unversioned":{"fields":[["arp",{"default":"enabled"}],["arp-interval",{"default":"100ms"}],["arp-ip-targets",{"default"'
+        ':""}],["arp-timeout",{"default":"auto"}],["comment",{"can_disable":true,"remove_value":""}],["disabled",{"default":false}],["down-delay",{"d'
+        'efault":"0ms"}],["forced-mac-address",{"can_disable":true}],["lacp-rate",{"default":"30secs"}],["lacp-user-key",{"can_disable":true,"remove_'
+        'value":0}],["link-monitoring",{"default":"mii"}],["mii-interval",{"default":"100ms"}],["min-links",{"default":0}],["mlag-id",{"can_disable":'
+        'true,"remove_value":0}],["mode",{"default":"balance-rr"}],["mtu",{"default":1500}],["name",{}],["primary",{"default":"none"}],["slaves",{"re'
+        'quired":true}],["transmit-hash-policy",{"default":"layer-2"}],["up-delay",{"default":"0ms"}]],"fully_understood":true,"primary_keys":["name"'
+        '],"versioned_fields":[[[["7.19",">="]],"lacp-mode",{}],[[["7.21",">="]],"lacp-system-id",{}],[[["7.21",">="]],"lacp-system-priority",{}],[[['
+        '"7.15",">="]],"numbers",{"read_only":true}]]}}{"snapshots":[[-1,9,20,21],[-1,9,20,21],[-1,9,20,21],[-1,6,9,13,20,21],[-1,0,6,7,9,10,11,12,13'
+        ',14,18,19,20,21,22,23,24,26,27,28,29],[-1,0,6,7,9,10,11,12,13,14,18,19,20,21,22,23,24,26,27,28,29],[-1,0,6,7,9,10,11,12,13,14,18,19,20,21,22'
+        ',23,24,26,27,28,29]],"unversioned":{"fields":[["admin-mac",{"default":"","value_canonicalizer":"mac"}],["ageing-time",{"default":"5m"}],["ar'
+        'p",{"default":"enabled"}],["arp-timeout",{"default":"auto"}],["auto-mac",{"default":true}],["comment",{"can_disable":true,"remove_value":""}'
+        '],["dhcp-snooping",{"default":false}],["disabled",{"default":false}],["ether-type",{"default":"0x8100"}],["fast-forward",{"default":true}],['
+        '"forward-delay",{"default":"15s"}],["frame-types",{"default":"admit-all"}],["igmp-snooping",{"default":false}],["max-message-age",{"default"'
+        ':"20s"}],["mld-version",{"default":1}],["mtu",{"default":"auto"}],["multicast-querier",{"default":false}],["name",{}],["priority",{"default"'
+        ':"0x8000"}],["protocol-mode",{"default":"rstp"}],["pvid",{"default":1}],["transmit-hold-count",{"default":6}],["vlan-filtering",{"default":f'
+        'alse}]],"fully_understood":true,"primary_keys":["name"],"versioned_fields":[[[["7.20",">="],["7.23","<"]],"add-dhcp-option82",{"default":fal'
+        'se}],[[["7.23",">="]],"dhcp-agent-circuit-id",{"can_disable":true}],[[["7.23",">="]],"dhcp-agent-remote-id",{"can_disable":true}],[[["7.23",'
+        '">="]],"dhcpv6-agent-circuit-id",{"can_disable":true}],[[["7.23",">="]],"dhcpv6-agent-remote-id",{"can_disable":true}],[[["7.23",">="]],"dhc'
+        'pv6-snooping",{"default":false}],[[["7.16",">="]],"forward-reserved-addresses",{"default":false}],[[["7.20",">="]],"igmp-version",{"default"'
+        ':2}],[[["7.0","<"]],"ingress-filtering",{"default":false}],[[["7.0",">="]],"ingress-filtering",{"default":true}],[[["7.20",">="]],"last-memb'
+        'er-interval",{"default":"1s"}],[[["7.20",">="]],"last-member-query-count",{"default":2}],[[["7.20",">="]],"max-hops",{"default":20}],[[["7.1'
+        '6",">="]],"max-learned-entries",{"default":"auto"}],[[["7.20",">="]],"membership-interval",{"default":"4m20s"}],[[["7.22",">="]],"mlag-heart'
+        'beat",{}],[[["7.22",">="]],"mlag-peer-port",{}],[[["7.22",">="]],"mlag-priority",{}],[[["7.20",">="]],"multicast-router",{"default":"tempora'
+        'ry-query"}],[[["7.20",">="]],"mvrp",{"default":false}],[[["7.15",">="]],"numbers",{"read_only":true}],[[["7.13",">="]],"port-cost-mode",{"de'
+        'fault":"long"}],[[["7.20",">="]],"querier-interval",{"default":"4m15s"}],[[["7.20",">="]],"query-interval",{"default":"2m5s"}],[[["7.20",">='
+        '"]],"query-response-interval",{"default":"10s"}],[[["7.22",">="]],"ra-guard",{}],[[["7.20",">="]],"region-name",{"default":""}],[[["7.20",">'
+        '="]],"region-revision",{"default":0}],[[["7.20",">="]],"startup-query-count",{"default":2}],[[["7.20",">="]],"startup-query-interval",{"defa'
+        'ult":"31s250ms"}]]}}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["802.3-sap",{"can_disable":true}],["802'
+        '.3-type",{"can_disable":true}],["action",{}],["arp-dst-address",{"can_disable":true}],["arp-dst-mac-address",{"can_disable":true}],["arp-gra'
+        'tuitous",{"can_disable":true}],["arp-hardware-type",{"can_disable":true}],["arp-opcode",{"can_disable":true}],["arp-packet-type",{"can_disab'
+        'le":true}],["arp-src-address",{"can_disable":true}],["arp-src-mac-address",{"can_disable":true}],["chain",{}],["comment",{}],["disabled",{}]'
+        ',["dst-address",{"can_disable":true}],["dst-address6",{"can_disable":true}],["dst-mac-address",{"can_disable":true}],["dst-port",{"can_disab'
+        'le":true}],["in-bridge",{"can_disable":true}],["in-bridge-list",{"can_disable":true}],["in-interface",{"can_disable":true}],["in-interface-l'
+        'ist",{"can_disable":true}],["ingress-priority",{"can_disable":true}],["ip-protocol",{"can_disable":true}],["limit",{"can_disable":true}],["l'
+        'og",{}],["log-prefix",{}],["mac-protocol",{"can_disable":true}],["numbers",{"read_only":true}],["out-bridge",{"can_disable":true}],["out-bri'
+        'dge-list",{"can_disable":true}],["out-interface",{"can_disable":true}],["out-interface-list",{"can_disable":true}],["packet-mark",{"can_disa'
+        'ble":true}],["packet-type",{"can_disable":true}],["sniff-id",{}],["sniff-target",{}],["sniff-target-port",{}],["src-address",{"can_disable":'
+        'true}],["src-address6",{"can_disable":true}],["src-mac-address",{"can_disable":true}],["src-port",{"can_disable":true}],["stp-flags",{"can_d'
+        'isable":true}],["stp-forward-delay",{"can_disable":true}],["stp-hello-time",{"can_disable":true}],["stp-max-age",{"can_disable":true}],["stp'
+        '-msg-age",{"can_disable":true}],["stp-port",{"can_disable":true}],["stp-root-address",{"can_disable":true}],["stp-root-cost",{"can_disable":'
+        'true}],["stp-root-priority",{"can_disable":true}],["stp-sender-address",{"can_disable":true}],["stp-sender-priority",{"can_disable":true}],['
+        '"stp-type",{"can_disable":true}],["tls-host",{"can_disable":true}],["vlan-encap",{"can_disable":true}],["vlan-id",{"can_disable":true}],["vl'
+        'an-priority",{"can_disable":true}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields'
+        '":[["802.3-sap",{"can_disable":true}],["802.3-type",{"can_disable":true}],["action",{}],["arp-dst-address",{"can_disable":true}],["arp-dst-m'
+        'ac-address",{"can_disable":true}],["arp-gratuitous",{"can_disable":true}],["arp-hardware-type",{"can_disable":true}],["arp-opcode",{"can_dis'
+        'able":true}],["arp-packet-type",{"can_disable":true}],["arp-src-address",{"can_disable":true}],["arp-src-mac-address",{"can_disable":true}],'
+        '["chain",{}],["comment",{}],["disabled",{}],["dst-address",{"can_disable":true}],["dst-address6",{"can_disable":true}],["dst-mac-address",{"'
+        'can_disable":true}],["dst-port",{"can_disable":true}],["in-bridge",{"can_disable":true}],["in-bridge-list",{"can_disable":true}],["in-interf'
+        'ace",{"can_disable":true}],["in-interface-list",{"can_disable":true}],["ingress-priority",{"can_disable":true}],["ip-protocol",{"can_disable'
+        '":true}],["jump-target",{}],["limit",{"can_disable":true}],["log",{}],["log-prefix",{}],["mac-protocol",{"can_disable":true}],["new-packet-m'
+        'ark",{}],["new-priority",{}],["numbers",{"read_only":true}],["out-bridge",{"can_disable":true}],["out-bridge-list",{"can_disable":true}],["o'
+        'ut-interface",{"can_disable":true}],["out-interface-list",{"can_disable":true}],["packet-mark",{"can_disable":true}],["packet-type",{"can_di'
+        'sable":true}],["passthrough",{}],["src-address",{"can_disable":true}],["src-address6",{"can_disable":true}],["src-mac-address",{"can_disable'
+        '":true}],["src-port",{"can_disable":true}],["stp-flags",{"can_disable":true}],["stp-forward-delay",{"can_disable":true}],["stp-hello-time",{'
+        '"can_disable":true}],["stp-max-age",{"can_disable":true}],["stp-msg-age",{"can_disable":true}],["stp-port",{"can_disable":true}],["stp-root-'
+        'address",{"can_disable":true}],["stp-root-cost",{"can_disable":true}],["stp-root-priority",{"can_disable":true}],["stp-sender-address",{"can'
+        '_disable":true}],["stp-sender-priority",{"can_disable":true}],["stp-type",{"can_disable":true}],["tls-host",{"can_disable":true}],["vlan-enc'
+        'ap",{"can_disable":true}],["vlan-id",{"can_disable":true}],["vlan-priority",{"can_disable":true}]],"fully_understood":true}]]}{"snapshots":['
+        '[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["bridge",{}],["comment",{}],["disabled",{}],["interface",{}],["mac-addres'
+        's",{}],["numbers",{"read_only":true}],["vid",{"can_disable":true}]],"fully_understood":true}]]}{"snapshots":[[0,1],[0,1],[0,1],[0,1],[0,0],['
+        '0,0],[0,0]],"versioned":[["7.15",">=",{"fields":[["bridge",{}],["comment",{}],["disabled",{}],["group",{}],["numbers",{"read_only":true}],["'
+        'vid",{"can_disable":true}]],"fully_understood":true,"versioned_fields":[[[["7.19",">="]],"interface",{}],[[["7.19","<"]],"ports",{}]]}]]}{"s'
+        'napshots":[[-1],[-1],[-1],[-1,0,1],[-1,0,1],[-1,0,1],[-1,0,1]],"unversioned":{"fields":[["bridge",{"default":"none"}],["peer-port",{"default'
+        '":"none"}]],"fully_understood":true,"single_value":true,"versioned_fields":[[[["7.18",">="]],"heartbeat",{}],[[["7.17",">="]],"priority",{}]'
+        ']}}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["bridge",{}],["comment",{}],["disabled",{}],["identifier'
+        '",{}],["numbers",{"read_only":true}],["priority",{}],["vlan-mapping",{}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],['
+        '0]],"versioned":[["7.15",">=",{"fields":[["802.3-sap",{"can_disable":true}],["802.3-type",{"can_disable":true}],["action",{}],["arp-dst-addr'
+        'ess",{"can_disable":true}],["arp-dst-mac-address",{"can_disable":true}],["arp-gratuitous",{"can_disable":true}],["arp-hardware-type",{"can_d'
+        'isable":true}],["arp-opcode",{"can_disable":true}],["arp-packet-type",{"can_disable":true}],["arp-src-address",{"can_disable":true}],["arp-s'
+        'rc-mac-address",{"can_disable":true}],["chain",{}],["comment",{}],["disabled",{}],["dst-address",{"can_disable":true}],["dst-address6",{"can'
+        '_disable":true}],["dst-mac-address",{"can_disable":true}],["dst-port",{"can_disable":true}],["in-bridge",{"can_disable":true}],["in-bridge-l'
+        'ist",{"can_disable":true}],["in-interface",{"can_disable":true}],["in-interface-list",{"can_disable":true}],["ingress-priority",{"can_disabl'
+        'e":true}],["ip-protocol",{"can_disable":true}],["jump-target",{}],["limit",{"can_disable":true}],["log",{}],["log-prefix",{}],["mac-protocol'
+        '",{"can_disable":true}],["new-packet-mark",{}],["new-priority",{}],["numbers",{"read_only":true}],["out-bridge",{"can_disable":true}],["out-'
+        'bridge-list",{"can_disable":true}],["out-interface",{"can_disable":true}],["out-interface-list",{"can_disable":true}],["packet-mark",{"can_d'
+        'isable":true}],["packet-type",{"can_disable":true}],["passthrough",{}],["src-address",{"can_disable":true}],["src-address6",{"can_disable":t'
+        'rue}],["src-mac-address",{"can_disable":true}],["src-port",{"can_disable":true}],["stp-flags",{"can_disable":true}],["stp-forward-delay",{"c'
+        'an_disable":true}],["stp-hello-time",{"can_disable":true}],["stp-max-age",{"can_disable":true}],["stp-msg-age",{"can_disable":true}],["stp-p'
+        'ort",{"can_disable":true}],["stp-root-address",{"can_disable":true}],["stp-root-cost",{"can_disable":true}],["stp-root-priority",{"can_disab'
+        'le":true}],["stp-sender-address",{"can_disable":true}],["stp-sender-priority",{"can_disable":true}],["stp-type",{"can_disable":true}],["tls-'
+        'host",{"can_disable":true}],["to-arp-reply-mac-address",{}],["to-dst-mac-address",{}],["to-src-mac-address",{}],["vlan-encap",{"can_disable"'
+        ':true}],["vlan-id",{"can_disable":true}],["vlan-priority",{"can_disable":true}]],"fully_understood":true}]]}{"snapshots":[[-1,1,3,6,8],[-1,1'
+        ',3,6,8],[-1,1,3,6,8],[-1,1,3,6,8],[-1,1,3,4,5,6,8],[-1,1,3,4,5,6,8],[-1,1,3,4,5,6,8]],"unversioned":{"fields":[["auto-isolate",{"default":fa'
+        'lse}],["bpdu-guard",{"default":false}],["bridge",{"required":true}],["broadcast-flood",{"default":true}],["comment",{"can_disable":true,"rem'
+        'ove_value":""}],["disabled",{"default":false}],["edge",{"default":"auto"}],["fast-leave",{"default":false}],["frame-types",{"default":"admit'
+        '-all"}],["horizon",{"default":"none"}],["hw",{"default":true}],["interface",{}],["learn",{"default":"auto"}],["multicast-router",{"default":'
+        '"temporary-query"}],["point-to-point",{"default":"auto"}],["priority",{"default":"0x80"}],["pvid",{"default":1}],["restricted-role",{"defaul'
+        't":false}],["restricted-tcn",{"default":false}],["tag-stacking",{"default":false}],["trusted",{"default":false}],["unknown-multicast-flood",'
+        '{"default":true}],["unknown-unicast-flood",{"default":true}]],"fully_understood":true,"primary_keys":["interface"],"versioned_fields":[[[["7'
+        '.0","<"]],"ingress-filtering",{"default":false}],[[["7.0",">="]],"ingress-filtering",{"default":true}],[[["7.13","<"]],"internal-path-cost",'
+        '{"default":10}],[[["7.13",">="]],"internal-path-cost",{"can_disable":true}],[[["7.20",">="]],"mvrp-applicant-state",{"default":"normal-parti'
+        'cipant"}],[[["7.20",">="]],"mvrp-registrar-state",{"default":"normal"}],[[["7.15",">="]],"numbers",{"read_only":true}],[[["7.13","<"]],"path'
+        '-cost",{"default":10}],[[["7.13",">="]],"path-cost",{"can_disable":true}],[[["7.23",">="]],"trusted-dhcpv6",{"default":false}],[[["7.22",">='
+        '"]],"trusted-ra",{}]]}}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["comment",{}],["disabled",{}],["iden'
+        'tifier",{}],["interface",{}],["internal-path-cost",{"can_disable":true}],["numbers",{"read_only":true}],["priority",{}]],"fully_understood":'
+        'true}]]}{"snapshots":[[1],[1],[1],null,null,null,null],"versioned":[["7.18",">=","Not supported anymore in version  >= 7.18"],["7.18","<",{"'
+        'fields":[["bridge",{"default":"none"}],["cascade-ports",{"default":""}],["switch",{"default":"none"}]],"fully_understood":true,"single_value'
+        '":true}]]}{"snapshots":[[1],[1],[1],null,null,null,null],"versioned":[["7.18",">=","Not supported anymore in version  >= 7.18"],["7.15",">="'
+        ',{"fields":[["name",{}],["numbers",{"read_only":true}]],"fully_understood":true}]]}{"snapshots":[[1],[1],[1],null,null,null,null],"versioned'
+        '":[["7.18",">=","Not supported anymore in version  >= 7.18"],["7.15",">=",{"fields":[["disabled",{}],["name",{}],["numbers",{"depr":{"contex'
+        't":"write","msg":"The numbers field will be read-only from community.routeros 4.0.0 on.","version":"4.0.0"}}]],"fully_understood":true,"has_'
+        'identifier":true}]]}{"snapshots":[[1],[1],[1],null,null,null,null],"versioned":[["7.18",">=","Not supported anymore in version  >= 7.18"],["'
+        '7.18","<",{"fields":[["control-ports",{"default":""}],["excluded-ports",{"default":""}],["switch",{"default":"none"}]],"fully_understood":tr'
+        'ue,"single_value":true}]]}{"unversioned":{"fields":[["allow-fast-path",{"default":true}],["use-ip-firewall",{"default":false}],["use-ip-fire'
+        'wall-for-pppoe",{"default":false}],["use-ip-firewall-for-vlan",{"default":false}]],"fully_understood":true,"single_value":true}}{"snapshots"'
+        ':[[-1,0,1],[-1,0,1],[-1,0,1],[-1,0,1],[-1,0,1],[-1,0,1],[-1,0,1]],"unversioned":{"fields":[["bridge",{}],["comment",{"can_disable":true,"rem'
+        'ove_value":""}],["disabled",{"default":false}],["tagged",{"default":""}],["untagged",{"default":""}],["vlan-ids",{}]],"fully_understood":tru'
+        'e,"primary_keys":["bridge","vlan-ids"],"versioned_fields":[[[["7.15",">="]],"mvrp-forbidden",{"default":""}],[[["7.15",">="]],"numbers",{"re'
+        'ad_only":true}]]}}{"snapshots":[[-1],[-1],[-1],[-1],[-1],[-1],[-1]],"unversioned":{"fields":[["detect-interface-list",{"default":"none"}],["'
+        'internet-interface-list",{"default":"none"}],["lan-interface-list",{"default":"none"}],["wan-interface-list",{"default":"none"}]],"fully_und'
+        'erstood":true,"single_value":true,"versioned_fields":[[[["7.22",">="]],"request-interval",{}]]}}{"snapshots":[[-1,0,1],[-1,0,1],[-1,0,1],[-1'
+        ',0,1],[-1,0,1],[-1,0,1],[-1,0,1]],"unversioned":{"fields":[["anon-identity",{"default":""}],["certificate",{"default":"none"}],["comment",{"'
+        'can_disable":true,"remove_value":""}],["disabled",{"default":false}],["eap-methods",{}],["identity",{}],["interface",{}]],"fully_understood"'
+        ':true,"primary_keys":["eap-methods","identity","interface"],"versioned_fields":[[[["7.15",">="]],"numbers",{"read_only":true}],[[["7.15",">='
+        '"]],"password",{}]]}}{"snapshots":[[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0]],"unversioned":{"fields":[["accounting",{"default":true}'
+        '],["auth-timeout",{"default":"1m"}],["auth-types",{"default":"dot1x"}],["comment",{"can_disable":true,"remove_value":""}],["disabled",{"defa'
+        'ult":false}],["guest-vlan-id",{"can_disable":true}],["interface",{}],["interim-update",{"default":"0s"}],["mac-auth-mode",{"default":"mac-as'
+        '-username"}],["radius-mac-format",{"default":"XX:XX:XX:XX:XX:XX"}],["reauth-timeout",{"can_disable":true}],["reject-vlan-id",{"can_disable":'
+        'true}],["retrans-timeout",{"default":"30s"}],["server-fail-vlan-id",{"can_disable":true}]],"fully_understood":true,"stratify_keys":["interfa'
+        'ce"],"versioned_fields":[[[["7.15",">="]],"numbers",{"read_only":true}]]}}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">'
+        '=",{"fields":[["auth-info",{"read_only":true}],["client-mac",{"read_only":true}],["interface",{"read_only":true}],["session-id",{"read_only"'
+        ':true}],["username",{"read_only":true}],["vlan-id",{"read_only":true}]],"fully_understood":true,"modify_not_supported":true}]]}{"snapshots":'
+        '[[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0]],"unversioned":{"fields":[["allow-fast-path",{"default":true}],["arp",{"default":"enabled"'
+        '}],["arp-timeout",{"default":"auto"}],["clamp-tcp-mss",{"default":true}],["comment",{"can_disable":true,"remove_value":""}],["disabled",{"de'
+        'fault":false}],["dont-fragment",{"default":false}],["dscp",{"default":"inherit"}],["ipsec-secret",{"can_disable":true}],["keepalive",{"can_d'
+        'isable":true,"default":"10s,10"}],["local-address",{"default":"0.0.0.0"}],["loop-protect",{"default":"default"}],["loop-protect-disable-time'
+        '",{"default":"5m"}],["loop-protect-send-interval",{"default":"5s"}],["mac-address",{}],["mtu",{"default":"auto"}],["name",{}],["remote-addre'
+        'ss",{"required":true}],["tunnel-id",{"required":true}]],"fully_understood":true,"primary_keys":["name"],"versioned_fields":[[[["7.15",">="]]'
+        ',"numbers",{"read_only":true}]]}}{"snapshots":[[0],[0],[0],[0],[0,0],[0,0],[0,0]],"versioned":[["7.15",">=",{"fields":[["arp",{}],["arp-time'
+        'out",{}],["clamp-tcp-mss",{}],["comment",{}],["disabled",{}],["dscp",{}],["ipsec-secret",{"can_disable":true}],["keepalive",{"can_disable":t'
+        'rue}],["local-address",{}],["loop-protect",{}],["loop-protect-disable-time",{}],["loop-protect-send-interval",{}],["mac-address",{}],["mtu",'
+        '{}],["name",{}],["numbers",{"read_only":true}],["remote-address",{}],["tunnel-id",{}]],"fully_understood":true,"versioned_fields":[[[["7.21"'
+        ',">="]],"dont-fragment",{}]]}]]}{"snapshots":[[-1,3,4],[-1,3,4],[-1,0,1,3,4],[-1,0,1,3,4],[-1,0,1,3,4],[-1,0,1,3,4],[-1,0,1,3,4]],"unversion'
+        'ed":{"fields":[["advertise",{}],["arp",{"default":"enabled"}],["arp-timeout",{"default":"auto"}],["auto-negotiation",{"default":true}],["ban'
+        'dwidth",{"default":"unlimited/unlimited"}],["combo-mode",{"can_disable":true}],["comment",{"can_disable":true,"remove_value":""}],["default-'
+        'name",{}],["disabled",{"default":false}],["fec-mode",{"can_disable":true,"remove_value":"auto"}],["l2mtu",{}],["loop-protect",{"default":"de'
+        'fault"}],["loop-protect-disable-time",{"default":"5m"}],["loop-protect-send-interval",{"default":"5s"}],["mac-address",{}],["mdix-enable",{}'
+        '],["mtu",{"default":1500}],["name",{}],["orig-mac-address",{}],["poe-out",{"can_disable":true,"remove_value":"auto-on"}],["poe-priority",{"c'
+        'an_disable":true,"remove_value":10}],["poe-voltage",{"can_disable":true}],["power-cycle-interval",{}],["power-cycle-ping-address",{"can_disa'
+        'ble":true}],["power-cycle-ping-enabled",{}],["power-cycle-ping-timeout",{"can_disable":true}],["rx-flow-control",{"default":"off"}],["sfp-ra'
+        'te-select",{"default":"high"}],["sfp-shutdown-temperature",{"can_disable":true,"default":95}],["speed",{}],["tx-flow-control",{"default":"of'
+        'f"}]],"fixed_entries":true,"fully_understood":true,"primary_keys":["default-name"],"versioned_fields":[[[["7.15.3",">="]],"cable-settings",{'
+        '}],[[["7.15.3",">="]],"disable-running-check",{}],[[["7.15","<"]],"full-duplex",{"default":true}],[[["7.15",">="]],"numbers",{}],[[["7.15","'
+        '>="]],"sfp-ignore-rx-los",{}]]}}{"snapshots":[[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0]],"unversioned":{"fields":[["name",{}],["poe-o'
+        'ut",{"default":"auto-on"}],["poe-priority",{"default":10}],["poe-voltage",{"default":"auto"}],["power-cycle-interval",{"default":"none"}],["'
+        'power-cycle-ping-address",{"can_disable":true}],["power-cycle-ping-enabled",{"default":false}],["power-cycle-ping-timeout",{"can_disable":tr'
+        'ue}]],"fixed_entries":true,"fully_understood":true,"primary_keys":["name"],"versioned_fields":[[[["7.15",">="]],"numbers",{}]]}}{"hardware_d'
+        'etect":"switch_chip_type","hardware_variants":[["single_entry_switch",{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{'
+        '"fields":[["bridge-type",{}],["bypass-ingress-port-policing-for",{}],["bypass-l2-security-check-filter-for",{}],["bypass-vlan-ingress-filter'
+        '-for",{}],["drop-if-invalid-or-src-port-not-member-of-vlan-on-ports",{}],["drop-if-no-vlan-assignment-on-ports",{}],["egress-mirror-ratio",{'
+        '}],["egress-mirror0",{}],["egress-mirror1",{}],["fdb-uses",{}],["forward-unknown-vlan",{}],["ingress-mirror-ratio",{}],["ingress-mirror0",{}'
+        '],["ingress-mirror1",{}],["mac-level-isolation",{}],["mirror-egress-if-ingress-mirrored",{}],["mirror-tx-on-mirror-port",{}],["mirrored-pack'
+        'et-drop-precedence",{}],["mirrored-packet-qos-priority",{}],["multicast-lookup-mode",{}],["name",{}],["override-existing-when-ufdb-full",{}]'
+        ',["unicast-fdb-timeout",{}],["unknown-vlan-lookup-mode",{}],["use-cvid-in-one2one-vlan-lookup",{}],["use-svid-in-one2one-vlan-lookup",{}],["'
+        'vlan-uses",{}]],"fully_understood":true,"single_value":true}]]}],["multi_entry_switch",{"snapshots":[[-1,0,1,2,3,4,5,6,7],[-1,0,1,2,3,4,5,6,'
+        '7],[-1,0,1,2,3,4,5,6,7],[-1,0,1,2,3,4,5,6,7],[-1,0,1,2,3,4,5,6,7],[-1,0,1,2,3,4,5,6,7],[-1,0,1,2,3,4,5,6,7]],"unversioned":{"fields":[["cpu-'
+        'flow-control",{"default":true}],["mirror-source",{"default":"none"}],["mirror-target",{"default":"none"}],["name",{}]],"fixed_entries":true,'
+        '"fully_understood":true,"primary_keys":["name"],"versioned_fields":[[[["7.15",">="]],"l3-hw-offloading",{}],[[["7.15",">="]],"mirror-egress-'
+        'target",{}],[[["7.15",">="]],"numbers",{}],[[["7.15",">="]],"qos-hw-offloading",{}],[[["7.15",">="]],"rspan",{}],[[["7.15",">="]],"rspan-egr'
+        'ess-vlan-id",{}],[[["7.15",">="]],"rspan-ingress-vlan-id",{}],[[["7.15",">="]],"switch-all-ports",{}]]}}]]}{"snapshots":[[0],[0],[0],[0],[0]'
+        ',[0],[0]],"versioned":[["7.15",">=",{"fields":[["action",{}],["attack-filter-bypass",{}],["comment",{}],["custom-fields",{}],["customer-dei"'
+        ',{}],["customer-pcp",{}],["customer-tag",{}],["customer-vid",{}],["disabled",{}],["drop-precedence",{}],["dscp",{}],["dst-addr-registered",{'
+        '}],["dst-l3-port",{}],["dst-ports",{}],["ecn",{}],["egress-vlan-filter-bypass",{}],["egress-vlan-translate-bypass",{}],["first-fragment",{}]'
+        ',["flow-id",{}],["fragmented",{}],["ingress-vlan-filter-bypass",{}],["invert-match",{}],["ip-dst",{}],["ip-protocol",{}],["ip-src",{}],["ipv'
+        '6-dst",{}],["ipv6-src",{}],["isolation-filter-bypass",{}],["lookup-vid",{}],["mac-dst-address",{}],["mac-isolation-profile",{}],["mac-protoc'
+        'ol",{}],["mac-src-address",{}],["mirror-to",{}],["new-customer-dei",{}],["new-customer-pcp",{}],["new-customer-vid",{}],["new-drop-precedenc'
+        'e",{}],["new-dscp",{}],["new-dst-ports",{}],["new-flow-id",{}],["new-priority",{}],["new-registered-state",{}],["new-service-dei",{}],["new-'
+        'service-pcp",{}],["new-service-vid",{}],["numbers",{}],["policer",{}],["priority",{}],["service-dei",{}],["service-pcp",{}],["service-tag",{'
+        '}],["service-vid",{}],["src-l3-port",{}],["src-mac-addr-state",{}],["src-mac-learn",{}],["src-ports",{}],["table",{}],["ttl",{}]],"fully_und'
+        'erstood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["bucket-coupling",{}],["color-awareness",{'
+        '}],["meter-len",{}],["meter-unit",{}],["name",{}],["new-dei-for-red",{}],["new-dei-for-yellow",{}],["new-dscp-for-red",{}],["new-dscp-for-ye'
+        'llow",{}],["new-pcp-for-red",{}],["new-pcp-for-yellow",{}],["numbers",{}],["red-action",{}],["red-burst",{}],["red-rate",{}],["yellow-action'
+        '",{}],["yellow-burst",{}],["yellow-rate",{}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">='
+        '",{"fields":[["dei",{}],["drop-precedence",{}],["numbers",{}],["pcp",{}],["priority",{}]],"fully_understood":true}]]}{"snapshots":[[0],[0],['
+        '0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["new-dscp",{}],["numbers",{}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0'
+        '],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["comment",{}],["disabled",{}],["numbers",{}],["tagged-ports",{}],["vlan-id",{}]],"f'
+        'ully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["comment",{}],["customer-dei",{}],'
+        '["customer-pcp",{}],["customer-vid",{}],["customer-vlan-format",{}],["disabled",{}],["new-customer-vid",{}],["new-service-vid",{}],["numbers'
+        '",{}],["pcp-propagation",{}],["ports",{}],["service-dei",{}],["service-pcp",{}],["service-vid",{}],["service-vlan-format",{}],["swap-vids",{'
+        '}]],"fully_understood":true}]]}{"snapshots":[[0],[0,0],[0,0],[0,0],[0,0],[0,0],[0,0]],"versioned":[["7.15",">=",{"fields":[["copy-to-cpu",{}'
+        '],["drop",{}],["mac-address",{}],["mirror",{}],["ports",{}],["redirect-to-cpu",{}],["share-vlan-learned",{}],["switch",{}],["vlan-id",{}]],"'
+        'fully_understood":true,"versioned_fields":[[[["7.15.2",">="]],"numbers",{"read_only":true}]]}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"'
+        'versioned":[["7.15",">=",{"fields":[["burst",{}],["disabled",{}],["meter-len",{}],["meter-unit",{}],["new-dei-for-yellow",{}],["new-dscp-for'
+        '-yellow",{}],["new-pcp-for-yellow",{}],["numbers",{}],["packet-types",{}],["port",{}],["rate",{}],["yellow-action",{}]],"fully_understood":t'
+        'rue}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["comment",{}],["customer-dei",{}],["customer-pcp",{}'
+        '],["customer-vid",{}],["customer-vlan-format",{}],["disabled",{}],["new-customer-vid",{}],["new-service-vid",{}],["numbers",{}],["pcp-propag'
+        'ation",{}],["ports",{}],["protocol",{}],["sa-learning",{}],["service-dei",{}],["service-pcp",{}],["service-vid",{}],["service-vlan-format",{'
+        '}],["swap-vids",{}]],"fully_understood":true}]]}{"snapshots":[[0,0],[0,0],[0,0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["auto'
+        'restart",{}],["icmp-reply-on-error",{}],["ipv6-hw",{}]],"fully_understood":true,"single_value":true,"versioned_fields":[[[["7.16","<"]],"fas'
+        'ttrack-hw",{}]]}]]}{"snapshots":[[0,1],[0,1],[0,1],[0,0],[0,0],[0,0],[0,0]],"versioned":[["7.15",">=",{"fields":[["neigh-discovery-burst-del'
+        'ay",{}],["neigh-discovery-burst-limit",{}],["neigh-discovery-interval",{}],["neigh-keepalive-interval",{}],["route-index-delay-max",{}],["ro'
+        'ute-index-delay-min",{}],["route-queue-limit-high",{}],["route-queue-limit-low",{}],["shwp-reset-counter",{}]],"fully_understood":true,"sing'
+        'le_value":true,"versioned_fields":[[[["7.18",">="]],"neigh-dump-retries",{}],[[["7.18","<"]],"partial-offload-chunk",{}]]}]]}{"snapshots":[['
+        '0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["comment",{}],["disabled",{}],["new-customer-vid",{}],["new-service-vid",{'
+        '}],["numbers",{}],["src-mac-address",{}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"'
+        'fields":[["address",{}],["bypass-vlan-filter",{}],["comment",{}],["disabled",{}],["numbers",{}],["ports",{}],["qos-group",{}],["svl",{}],["v'
+        'lan-id",{}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["comment",{}],["cus'
+        'tomer-vid",{}],["disabled",{}],["dst-port",{}],["numbers",{}],["service-vid",{}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],['
+        '0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["dei-for-red",{}],["dei-for-yellow",{}],["dscp-for-red",{}],["dscp-for-yellow",{}],["numbe'
+        'rs",{}],["pcp-for-red",{}],["pcp-for-yellow",{}]],"fully_understood":true}]]}{"snapshots":[[-1,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,1'
+        '8,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54],[-1,0,1,2,3,4,5,6,7,8,9,10,11'
+        ',12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54],[-1,0,1,2'
+        ',3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51'
+        ',52,53,54],[-1,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,'
+        '45,46,47,48,49,50,51,52,53,54],[-1,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,3'
+        '8,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54],[-1,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31'
+        ',32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54],[-1,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,'
+        '25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54]],"unversioned":{"fields":[["default-vlan-id",{}],'
+        '["name",{}],["vlan-header",{"default":"leave-as-is"}],["vlan-mode",{"default":"disabled"}]],"fixed_entries":true,"fully_understood":true,"pr'
+        'imary_keys":["name"],"versioned_fields":[[[["7.15",">="]],"action-on-static-station-move",{}],[[["7.15",">="]],"allow-fdb-based-vlan-transla'
+        'te",{}],[[["7.15",">="]],"allow-mac-based-customer-vlan-assignment-for",{}],[[["7.15",">="]],"allow-mac-based-service-vlan-assignment-for",{'
+        '}],[[["7.15",">="]],"allow-multicast-loopback",{}],[[["7.15",">="]],"allow-unicast-loopback",{}],[[["7.15",">="]],"custom-drop-counter-inclu'
+        'des",{}],[[["7.15",">="]],"default-customer-pcp",{}],[[["7.15",">="]],"default-service-pcp",{}],[[["7.15",">="]],"drop-dynamic-mac-move",{}]'
+        ',[[["7.15",">="]],"drop-secure-static-mac-move",{}],[[["7.15",">="]],"drop-when-ufdb-entry-src-drop",{}],[[["7.15",">="]],"dscp-based-qos-ds'
+        'cp-to-dscp-mapping",{}],[[["7.15",">="]],"egress-customer-tpid-override",{}],[[["7.15",">="]],"egress-mirror-to",{}],[[["7.15",">="]],"egres'
+        's-pcp-propagation",{}],[[["7.15",">="]],"egress-rate",{}],[[["7.15",">="]],"egress-service-tpid-override",{}],[[["7.15",">="]],"egress-vlan-'
+        'mode",{}],[[["7.15",">="]],"egress-vlan-tag-table-lookup-key",{}],[[["7.15",">="]],"filter-priority-tagged-frame",{}],[[["7.15",">="]],"filt'
+        'er-tagged-frame",{}],[[["7.15",">="]],"filter-untagged-frame",{}],[[["7.15",">="]],"ingress-customer-tpid-override",{}],[[["7.15",">="]],"in'
+        'gress-mirror-to",{}],[[["7.15",">="]],"ingress-mirroring-according-to-vlan",{}],[[["7.15",">="]],"ingress-rate",{}],[[["7.15",">="]],"ingres'
+        's-service-tpid-override",{}],[[["7.15",">="]],"isolation-leakage-profile-override",{}],[[["7.15",">="]],"l3-hw-offloading",{}],[[["7.15",">='
+        '"]],"learn-limit",{}],[[["7.15",">="]],"limit-broadcasts",{}],[[["7.15",">="]],"limit-unknown-multicasts",{}],[[["7.15",">="]],"limit-unknow'
+        'n-unicasts",{}],[[["7.15",">="]],"mirror-egress",{}],[[["7.15",">="]],"mirror-ingress",{}],[[["7.15",">="]],"mirror-ingress-target",{}],[[["'
+        '7.15",">="]],"numbers",{}],[[["7.15",">="]],"pcp-based-qos-dei-mapping",{}],[[["7.15",">="]],"pcp-based-qos-drop-precedence-mapping",{}],[[['
+        '"7.15",">="]],"pcp-based-qos-dscp-mapping",{}],[[["7.15",">="]],"pcp-based-qos-pcp-mapping",{}],[[["7.15",">="]],"pcp-based-qos-priority-map'
+        'ping",{}],[[["7.15",">="]],"pcp-or-dscp-based-qos-change-dei",{}],[[["7.15",">="]],"pcp-or-dscp-based-qos-change-dscp",{}],[[["7.15",">="]],'
+        '"pcp-or-dscp-based-qos-change-pcp",{}],[[["7.15",">="]],"pcp-propagation-for-initial-pcp",{}],[[["7.15",">="]],"per-queue-scheduling",{}],[['
+        '["7.15",">="]],"policy-drop-counter-includes",{}],[[["7.15",">="]],"priority-to-queue",{}],[[["7.15",">="]],"qos-scheme-precedence",{}],[[["'
+        '7.15",">="]],"queue-custom-drop-counter0-includes",{}],[[["7.15",">="]],"queue-custom-drop-counter1-includes",{}],[[["7.15",">="]],"storm-ra'
+        'te",{}],[[["7.15",">="]],"vlan-type",{}]]}}{"hardware_detect":"switch_chip_type","hardware_variants":[["single_entry_switch",{"snapshots":[['
+        '0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["comment",{}],["disabled",{}],["flow-id",{}],["forwarding-type",{}],["mac-'
+        'profile",{}],["port-profile",{}],["ports",{}],["protocol-type",{}],["registration-status",{}],["traffic-type",{}],["type",{}],["vlan-profile'
+        '",{}]],"fully_understood":true}]]}],["multi_entry_switch",{"snapshots":[[0,0],[0,0],[0,0],[0,0],[0,0],[0,0],[0,0]],"versioned":[["6.43",">="'
+        ',{"fields":[["forwarding-override",{}],["name",{}]],"fixed_entries":true,"fully_understood":true,"primary_keys":["name"],"versioned_fields":'
+        '[[[["7.15",">="]],"numbers",{"read_only":true}]]}]]}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["com'
+        'ment",{}],["disabled",{}],["flow-id",{}],["forwarding-type",{}],["mac-profile",{}],["numbers",{}],["port-profile",{}],["ports",{}],["protoco'
+        'l-type",{}],["registration-status",{}],["traffic-type",{}],["type",{}],["vlan-profile",{}]],"fully_understood":true}]]}{"snapshots":[[0],[0]'
+        ',[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["comment",{}],["disabled",{}],["frame-type",{}],["new-customer-vid",{}],["new-se'
+        'rvice-vid",{}],["numbers",{}],["ports",{}],["protocol",{}],["qos-group",{}],["set-customer-vid-for",{}],["set-qos-for",{}],["set-service-vid'
+        '-for",{}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0,0],[0,0],[0,0]],"versioned":[["7.15",">=",{"fields":[["comment",{}],['
+        '"name",{}],["numbers",{"read_only":true}]],"fully_understood":true,"versioned_fields":[[[["7.21",">="]],"disabled",{}]]}]]}{"snapshots":[[0]'
+        ',[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["comment",{}],["disabled",{}],["dscp",{}],["map",{}],["numbers",{"read_only"'
+        ':true}],["profile",{}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["comment'
+        '",{}],["dei-only",{}],["disabled",{}],["map",{}],["numbers",{"read_only":true}],["pcp",{}],["profile",{}]],"fully_understood":true}]]}{"snap'
+        'shots":[[0,0],[0,0],[0,0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["egress-rate-queue0",{}],["egress-rate-queue1",{}],["egress'
+        '-rate-queue2",{}],["egress-rate-queue3",{}],["egress-rate-queue4",{}],["egress-rate-queue5",{}],["egress-rate-queue6",{}],["egress-rate-queu'
+        'e7",{}],["map",{}],["numbers",{"depr":{"context":"write","msg":"The numbers field will be read-only from community.routeros 4.0.0 on.","vers'
+        'ion":"4.0.0"}}],["profile",{}],["trust-l2",{}],["trust-l3",{}],["tx-manager",{}]],"fully_understood":true,"has_identifier":true,"versioned_f'
+        'ields":[[[["7.16","<"]],"pfc",{}]]}]]}{"snapshots":[[1],[1],[1],null,null,null,null],"versioned":[["7.16",">=","Not supported anymore in ver'
+        'sion  >= 7.16"],["7.15",">=",{"fields":[["comment",{}],["name",{}],["numbers",{"read_only":true}],["pause-threshold",{}],["resume-threshold"'
+        ',{}],["rx",{}],["traffic-class",{}],["tx",{}]],"fully_understood":true}]]}{"snapshots":[[0,0],[0,0],[0,0],[0,1],[0,1],[0,1],[0,1]],"versione'
+        'd":[["7.15",">=",{"fields":[["comment",{}],["dscp",{}],["name",{}],["numbers",{"read_only":true}],["pcp",{}],["traffic-class",{}]],"fully_un'
+        'derstood":true,"versioned_fields":[[[["7.16","<"]],"color",{}],[[["7.17",">="]],"disabled",{}]]}]]}{"snapshots":[[0,2,3,4,5,6,7,8,9,10,11,12'
+        ',13],[0,2,3,4,5,6,7,8,9,10,11,12,13],[0,2,3,4,5,6,7,8,9,10,11,12,13],[0],[0,0,1],[0,0,1],[0,0,1]],"versioned":[["7.15",">=",{"fields":[["mul'
+        'ticast-buffers",{}],["shared-buffers",{}]],"fully_understood":true,"single_value":true,"versioned_fields":[[[["7.20",">="]],"mirror-buffers"'
+        ',{}],[[["7.21",">="]],"mirror-profile",{}],[[["7.16","<"]],"shared-buffers-color",{}],[[["7.16","<"]],"shared-pool0",{}],[[["7.16","<"]],"sh'
+        'ared-pool1",{}],[[["7.16","<"]],"shared-pool2",{}],[[["7.16","<"]],"shared-pool3",{}],[[["7.16","<"]],"shared-pool4",{}],[[["7.16","<"]],"sh'
+        'ared-pool5",{}],[[["7.16","<"]],"shared-pool6",{}],[[["7.16","<"]],"shared-pool7",{}],[[["7.16","<"]],"treat-yellow-as",{}],[[["7.16","<"]],'
+        '"wred-shared-threshold",{}],[[["7.16","<"]],"wred-threshold",{}]]}]]}{"snapshots":[[0,1],[0,1],[0,1],[0,2],[0,0,2],[0,0,2],[0,0,2]],"version'
+        'ed":[["7.15",">=",{"fields":[["comment",{}],["name",{}],["numbers",{"read_only":true}]],"fully_understood":true,"versioned_fields":[[[["7.21'
+        '",">="]],"disabled",{}],[[["7.16","<"]],"ecn",{}],[[["7.16",">="]],"queue-buffers",{}]]}]]}{"snapshots":[[0,0,1],[0,0,1],[0,0,1],[0],[0],[0]'
+        ',[0]],"versioned":[["7.15",">=",{"fields":[["comment",{}],["numbers",{"depr":{"context":"write","msg":"The numbers field will be read-only f'
+        'rom community.routeros 4.0.0 on.","version":"4.0.0"}}],["queue-buffers",{}],["schedule",{}],["use-shared-buffers",{}],["weight",{}]],"fully_'
+        'understood":true,"has_identifier":true,"versioned_fields":[[[["7.16","<"]],"shared-pool-index",{}],[[["7.16","<"]],"wred",{}]]}]]}{"snapshot'
+        's":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["dei",{}],["disabled",{}],["drop-precedence",{}],["dscp",{}],["name",'
+        '{}],["numbers",{}],["pcp",{}],["priority",{}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">'
+        '=",{"fields":[["action",{}],["bypass-ingress-port-policing",{}],["bypass-ingress-vlan-filter",{}],["comment",{}],["disabled",{}],["mac-addre'
+        'ss",{}],["numbers",{}],["qos-group",{}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"f'
+        'ields":[["comment",{}],["copy-to-cpu",{}],["disabled",{}],["dscp",{"can_disable":true}],["dst-address",{"can_disable":true}],["dst-address6"'
+        ',{"can_disable":true}],["dst-mac-address",{"can_disable":true}],["dst-port",{"can_disable":true}],["flow-label",{"can_disable":true}],["keep'
+        '-qos-fields",{}],["mac-protocol",{"can_disable":true}],["mirror",{}],["mirror-ports",{}],["new-dst-ports",{"can_disable":true}],["new-qos-pr'
+        'ofile",{}],["new-vlan-id",{"can_disable":true}],["new-vlan-priority",{"can_disable":true}],["numbers",{"read_only":true}],["ports",{"can_dis'
+        'able":true}],["protocol",{"can_disable":true}],["rate",{"can_disable":true}],["redirect-to-cpu",{}],["src-address",{"can_disable":true}],["s'
+        'rc-address6",{"can_disable":true}],["src-mac-address",{"can_disable":true}],["src-port",{"can_disable":true}],["switch",{}],["traffic-class"'
+        ',{"can_disable":true}],["vlan-header",{"can_disable":true}],["vlan-id",{"can_disable":true}],["vlan-priority",{"can_disable":true}]],"fully_'
+        'understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["burst",{}],["comment",{}],["disabled",'
+        '{}],["meter-unit",{}],["numbers",{}],["port",{}],["rate",{}],["target",{}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0]'
+        ',[0]],"versioned":[["7.15",">=",{"fields":[["driver-rx-byte",{"read_only":true}],["driver-rx-packet",{"read_only":true}],["driver-tx-byte",{'
+        '"read_only":true}],["driver-tx-packet",{"read_only":true}],["rx-1024-1518",{"read_only":true}],["rx-128-255",{"read_only":true}],["rx-1519-m'
+        'ax",{"read_only":true}],["rx-256-511",{"read_only":true}],["rx-512-1023",{"read_only":true}],["rx-64",{"read_only":true}],["rx-65-127",{"rea'
+        'd_only":true}],["rx-align-error",{"read_only":true}],["rx-broadcast",{"read_only":true}],["rx-bytes",{"read_only":true}],["rx-control",{"rea'
+        'd_only":true}],["rx-fcs-error",{"read_only":true}],["rx-fragment",{"read_only":true}],["rx-length-error",{"read_only":true}],["rx-multicast"'
+        ',{"read_only":true}],["rx-overflow",{"read_only":true}],["rx-packet",{"read_only":true}],["rx-pause",{"read_only":true}],["rx-too-long",{"re'
+        'ad_only":true}],["rx-too-short",{"read_only":true}],["tx-1024-1518",{"read_only":true}],["tx-128-255",{"read_only":true}],["tx-1519-max",{"r'
+        'ead_only":true}],["tx-256-511",{"read_only":true}],["tx-512-1023",{"read_only":true}],["tx-64",{"read_only":true}],["tx-65-127",{"read_only"'
+        ':true}],["tx-broadcast",{"read_only":true}],["tx-bytes",{"read_only":true}],["tx-control",{"read_only":true}],["tx-deferred",{"read_only":tr'
+        'ue}],["tx-excessive-collision",{"read_only":true}],["tx-excessive-deferred",{"read_only":true}],["tx-late-collision",{"read_only":true}],["t'
+        'x-multicast",{"read_only":true}],["tx-multiple-collision",{"read_only":true}],["tx-packet",{"read_only":true}],["tx-pause",{"read_only":true'
+        '}],["tx-single-collision",{"read_only":true}],["tx-too-long",{"read_only":true}],["tx-underrun",{"read_only":true}]],"fully_understood":true'
+        ',"modify_not_supported":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["comment",{}],["disabled",{'
+        '}],["member-ports",{}],["name",{}],["numbers",{}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15'
+        '",">=",{"fields":[["action",{}],["comment",{}],["disabled",{}],["isolation-profile",{}],["mac-address",{}],["mirror",{}],["numbers",{}],["po'
+        'rt",{}],["qos-group",{}],["svl",{}],["vlan-id",{}]],"fully_understood":true}]]}{"snapshots":[[0],[0,0],[0,0],[0,0],[0,0],[0,0],[0,0]],"versi'
+        'oned":[["7.15",">=",{"fields":[["comment",{}],["disabled",{}],["flood",{}],["independent-learning",{}],["ingress-mirror",{}],["learn",{}],["'
+        'ports",{}],["qos-group",{}],["svl",{}],["switch",{}],["vlan-id",{}]],"fully_understood":true,"versioned_fields":[[[["7.15.2",">="]],"numbers'
+        '",{"read_only":true}]]}]]}{"snapshots":[[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0]],"unversioned":{"fields":[["allow-fast-path",{"defa'
+        'ult":true}],["clamp-tcp-mss",{"default":true}],["comment",{"can_disable":true,"remove_value":""}],["disabled",{"default":false}],["dont-frag'
+        'ment",{"default":false}],["dscp",{"default":"inherit"}],["ipsec-secret",{"can_disable":true}],["keepalive",{"can_disable":true,"default":"10'
+        's,10"}],["local-address",{"default":"0.0.0.0"}],["mtu",{"default":"auto"}],["name",{}],["remote-address",{"required":true}]],"fully_understo'
+        'od":true,"primary_keys":["name"],"versioned_fields":[[[["7.15",">="]],"numbers",{"read_only":true}]]}}{"snapshots":[[-1,1],[-1,1],[-1,1],[-1'
+        ',1],[-1,0,1],[-1,0,1],[-1,0,1]],"unversioned":{"fields":[["clamp-tcp-mss",{"default":true}],["comment",{"can_disable":true,"remove_value":""'
+        '}],["disabled",{"default":false}],["dscp",{"default":"inherit"}],["ipsec-secret",{"can_disable":true}],["keepalive",{"can_disable":true,"def'
+        'ault":"10s,10"}],["local-address",{"default":"::"}],["mtu",{"default":"auto"}],["name",{}],["remote-address",{"required":true}]],"fully_unde'
+        'rstood":true,"primary_keys":["name"],"versioned_fields":[[[["7.21",">="]],"dont-fragment",{}],[[["7.15",">="]],"numbers",{"read_only":true}]'
+        ']}}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["allow-fast-path",{}],["clamp-tcp-mss",{}],["comment",{}'
+        '],["disabled",{}],["dont-fragment",{}],["dscp",{}],["ipsec-secret",{"can_disable":true}],["keepalive",{"can_disable":true}],["local-address"'
+        ',{}],["mtu",{}],["name",{}],["numbers",{"read_only":true}],["remote-address",{}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],['
+        '0,0],[0,0],[0,0]],"versioned":[["7.15",">=",{"fields":[["clamp-tcp-mss",{}],["comment",{}],["disabled",{}],["dscp",{}],["ipsec-secret",{"can'
+        '_disable":true}],["keepalive",{"can_disable":true}],["local-address",{}],["mtu",{}],["name",{}],["numbers",{"read_only":true}],["remote-addr'
+        'ess",{}]],"fully_understood":true,"versioned_fields":[[[["7.21",">="]],"dont-fragment",{}]]}]]}{"snapshots":[[-1,0,1],[-1,0,1],[-1,0,1],[-1,'
+        '0,1,2],[-1,0,1,2],[-1,0,1,2],[-1,0,1,2]],"unversioned":{"fields":[["add-default-route",{"default":false}],["allow",{"default":"pap,chap,msch'
+        'ap1,mschap2"}],["allow-fast-path",{"default":false}],["comment",{"can_disable":true,"remove_value":""}],["connect-to",{"required":true}],["d'
+        'efault-route-distance",{"default":false}],["dial-on-demand",{"default":false}],["disabled",{"default":true}],["ipsec-secret",{"default":""}]'
+        ',["keepalive-timeout",{"default":60}],["l2tp-proto-version",{"default":"l2tpv2"}],["l2tpv3-cookie-length",{"default":0}],["l2tpv3-digest-has'
+        'h",{"default":"md5"}],["max-mru",{"default":1450}],["max-mtu",{"default":1450}],["mrru",{"default":"disabled"}],["name",{"required":true}],['
+        '"password",{}],["profile",{"default":"default-encryption"}],["src-address",{}],["use-ipsec",{"default":false}],["use-peer-dns",{"default":fa'
+        'lse}],["user",{"required":true}]],"fully_understood":true,"primary_keys":["name"],"versioned_fields":[[[["7.15",">="]],"l2tpv3-circuit-id",{'
+        '}],[[["7.15",">="]],"numbers",{"read_only":true}],[[["7.18",">="]],"random-source-port",{}]]}}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"ve'
+        'rsioned":[["7.15",">=",{"fields":[["allow-fast-path",{}],["circuit-id",{}],["comment",{}],["connect-to",{}],["cookie-length",{}],["digest-ha'
+        'sh",{}],["disabled",{}],["ipsec-secret",{}],["l2tp-proto-version",{}],["local-address",{}],["local-session-id",{}],["local-tunnel-id",{}],["'
+        'mac-address",{"can_disable":true}],["mtu",{}],["name",{}],["numbers",{"read_only":true}],["peer-cookie",{}],["remote-session-id",{}],["remot'
+        'e-tunnel-id",{}],["send-cookie",{}],["unmanaged-mode",{}],["use-ipsec",{}],["use-l2-specific-sublayer",{}]],"fully_understood":true}]]}{"sna'
+        'pshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["comment",{}],["disabled",{}],["name",{}],["numbers",{"read_only'
+        '":true}],["user",{}]],"fully_understood":true}]]}{"snapshots":[[-1,0,1,2,3,4,5],[-1,0,1,2,3,4,5],[-1,0,1,2,3,4,5],[-1,0,1,2,3,4,5],[-1,0,1,2'
+        ',3,4,5],[-1,0,1,2,3,4,5],[-1,0,1,2,3,4,5]],"unversioned":{"fields":[["allow-fast-path",{"default":false}],["authentication",{"default":"pap,'
+        'chap,mschap1,mschap2"}],["caller-id-type",{"default":"ip-address"}],["default-profile",{"default":"default-encryption"}],["enabled",{"defaul'
+        't":false}],["ipsec-secret",{"default":""}],["keepalive-timeout",{"default":30}],["max-mru",{"default":1450}],["max-mtu",{"default":1450}],["'
+        'max-sessions",{"default":"unlimited"}],["mrru",{"default":"disabled"}],["one-session-per-host",{"default":false}],["use-ipsec",{"default":fa'
+        'lse}]],"fully_understood":true,"single_value":true,"versioned_fields":[[[["7.15",">="]],"accept-proto-version",{}],[[["7.15",">="]],"accept-'
+        'pseudowire-type",{}],[[["7.15",">="]],"l2tpv3-circuit-id",{}],[[["7.15",">="]],"l2tpv3-cookie-length",{}],[[["7.15",">="]],"l2tpv3-digest-ha'
+        'sh",{}],[[["7.15",">="]],"l2tpv3-ether-interface-list",{"can_disable":true}]]}}{"snapshots":[[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0'
+        ']],"unversioned":{"fields":[["comment",{"can_disable":true,"remove_value":""}],["exclude",{"default":""}],["include",{"default":""}],["name"'
+        ',{}]],"fully_understood":true,"primary_keys":["name"],"versioned_fields":[[[["7.15",">="]],"numbers",{"read_only":true}]]}}{"snapshots":[[-1'
+        ',0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0]],"unversioned":{"fields":[["comment",{"can_disable":true,"remove_value":""}],["disabled",{"def'
+        'ault":false}],["interface",{}],["list",{}]],"fully_understood":true,"primary_keys":["list","interface"],"versioned_fields":[[[["7.15",">="]]'
+        ',"numbers",{"read_only":true}]]}}{"snapshots":[[0],[0],[0],[0,0],[0,0],[0,0],[0,0]],"versioned":[["7.15",">=",{"fields":[["allow-roaming",{"'
+        'can_disable":true}],["apn-profiles",{}],["band",{}],["comment",{}],["disabled",{}],["modem-init",{"can_disable":true}],["mtu",{}],["name",{}'
+        '],["network-mode",{"can_disable":true}],["nr-band",{}],["numbers",{"depr":{"context":"write","msg":"The numbers field will be read-only from'
+        ' community.routeros 4.0.0 on.","version":"4.0.0"}}],["operator",{}],["pin",{}],["sms-read",{}]],"fully_understood":true,"has_identifier":tru'
+        'e,"versioned_fields":[[[["7.16",">="]],"sms-protocol",{}]]}]]}{"snapshots":[[-1,0,1,3,4,5,6,7,8,9,10,11],[-1,0,1,3,4,5,6,7,8,9,10,11],[-1,0,'
+        '1,3,4,5,6,7,8,9,10,11],[-1,0,1,3,4,5,6,7,8,9,10,11],[-1,0,1,3,4,5,6,7,8,9,10,11],[-1,0,1,3,4,5,6,7,8,9,10,11],[-1,0,1,3,4,5,6,7,8,9,10,11]],'
+        '"unversioned":{"fields":[["add-default-route",{}],["apn",{"required":true}],["default-route-distance",{}],["name",{}],["use-peer-dns",{}]],"'
+        'fully_understood":true,"versioned_fields":[[[["7.15",">="]],"authentication",{}],[[["7.15",">="]],"comment",{}],[[["7.15","<"]],"default",{}'
+        '],[[["7.15",">="]],"ip-type",{}],[[["7.15",">="]],"ipv6-interface",{}],[[["7.15",">="]],"numbers",{"read_only":true}],[[["7.15",">="]],"pass'
+        'through-interface",{}],[[["7.15",">="]],"passthrough-mac",{}],[[["7.15",">="]],"passthrough-subnet-size",{}],[[["7.15",">="]],"password",{}]'
+        ',[[["7.15",">="]],"use-network-apn",{}],[[["7.15",">="]],"user",{}]]}}{"snapshots":[[0],[0],[0],[0,0],[0,0,1],[0,0,1],[0,0,1]],"versioned":['
+        '["7.15",">=",{"fields":[["firmware-path",{}],["info-polling-interval",{}],["mode",{}]],"fully_understood":true,"single_value":true,"versione'
+        'd_fields":[[[["7.17",">="]],"esim-channel",{}],[[["7.19",">="]],"link-recovery-timer",{}]]}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"ve'
+        'rsioned":[["7.15",">=",{"fields":[["cak",{}],["ckn",{}],["comment",{}],["disabled",{}],["interface",{}],["mtu",{}],["name",{}],["numbers",{"'
+        'read_only":true}],["profile",{}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":'
+        '[["name",{}],["numbers",{"read_only":true}],["server-priority",{}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"v'
+        'ersioned":[["7.15",">=",{"fields":[["arp",{}],["arp-timeout",{}],["comment",{}],["disabled",{}],["interface",{}],["loop-protect",{}],["loop-'
+        'protect-disable-time",{}],["loop-protect-send-interval",{}],["mac-address",{}],["mode",{}],["mtu",{}],["name",{}],["numbers",{"read_only":tr'
+        'ue}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["admin-mac",{}],["arp",{}]'
+        ',["arp-timeout",{}],["auto-mac",{}],["comment",{}],["disabled",{}],["hwmp-default-hoplimit",{}],["hwmp-prep-lifetime",{}],["hwmp-preq-destin'
+        'ation-only",{}],["hwmp-preq-reply-and-forward",{}],["hwmp-preq-retries",{}],["hwmp-preq-waiting-time",{}],["hwmp-rann-interval",{}],["hwmp-r'
+        'ann-lifetime",{}],["hwmp-rann-propagation-delay",{}],["mesh-portal",{}],["mtu",{}],["name",{}],["numbers",{"read_only":true}],["reoptimize-p'
+        'aths",{}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["comment",{}],["disab'
+        'led",{}],["hello-interval",{}],["interface",{}],["mesh",{}],["numbers",{"read_only":true}],["path-cost",{}],["port-type",{}]],"fully_underst'
+        'ood":true}]]}{"snapshots":[[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0]],"unversioned":{"fields":[["add-default-route",{"default":false}'
+        '],["auth",{"default":"sha1"}],["certificate",{}],["cipher",{"default":"blowfish128"}],["comment",{"can_disable":true,"remove_value":""}],["c'
+        'onnect-to",{}],["disabled",{"default":true}],["disconnect-notify",{}],["mac-address",{}],["max-mtu",{"default":1500}],["mode",{"default":"ip'
+        '"}],["name",{}],["password",{}],["port",{"default":1194}],["profile",{"default":"default"}],["protocol",{"default":"tcp"}],["route-nopull",{'
+        '"default":false}],["tls-version",{"default":"any"}],["use-peer-dns",{"default":true}],["user",{}],["verify-server-certificate",{"default":fa'
+        'lse}]],"fully_understood":true,"primary_keys":["name"],"versioned_fields":[[[["7.15",">="]],"numbers",{"read_only":true}]]}}{"snapshots":[[0'
+        '],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["comment",{}],["disabled",{}],["name",{}],["numbers",{"read_only":true}],["'
+        'user",{}]],"fully_understood":true}]]}{"snapshots":[[1,0,1,2,4,5,6,7,8],[1,0,1,2,4,5,6,7,8],[1,0,1,2,4,5,6,7,8],[0],[0,0],[0,0],[0,0]],"vers'
+        'ioned":[["7.17",">=",{"fields":[["auth",{}],["certificate",{}],["cipher",{}],["comment",{}],["default-profile",{"default":"default"}],["disa'
+        'bled",{}],["enable-tun-ipv6",{}],["ipv6-prefix-len",{}],["keepalive-timeout",{"default":60}],["mac-address",{}],["max-mtu",{"default":1500}]'
+        ',["mode",{"default":"ip"}],["name",{"default":""}],["netmask",{"default":24}],["numbers",{"read_only":true}],["port",{"default":1194}],["pro'
+        'tocol",{"default":"tcp"}],["push-routes",{}],["redirect-gateway",{}],["reneg-sec",{}],["require-client-certificate",{"default":false}],["tls'
+        '-version",{}],["tun-server-ipv6",{}],["user-auth-method",{}],["vrf",{"default":"main"}]],"fully_understood":true,"versioned_fields":[[[["7.2'
+        '1",">="]],"push-routes-ipv6",{}]]}],["7.17","<",{"fields":[["auth",{}],["cipher",{}],["default-profile",{"default":"default"}],["enabled",{"'
+        'default":false}],["keepalive-timeout",{"default":60}],["mac-address",{}],["max-mtu",{"default":1500}],["mode",{"default":"ip"}],["netmask",{'
+        '"default":24}],["port",{"default":1194}],["protocol",{"default":"tcp"}],["require-client-certificate",{"default":false}]],"fully_understood"'
+        ':true,"single_value":true,"versioned_fields":[[[["7.15",">="]],"certificate",{}],[[["7.15",">="]],"enable-tun-ipv6",{}],[[["7.15",">="]],"ip'
+        'v6-prefix-len",{}],[[["7.15","<"]],"name",{"default":""}],[[["7.15",">="]],"push-routes",{}],[[["7.15",">="]],"redirect-gateway",{}],[[["7.1'
+        '5",">="]],"reneg-sec",{}],[[["7.15",">="]],"tls-version",{}],[[["7.15",">="]],"tun-server-ipv6",{}]]}]]}{"snapshots":[[-1,1,2],[-1,1,2],[-1,'
+        '1,2],[-1,1,2],[-1,0,1,2],[-1,0,1,2],[-1,0,1,2]],"unversioned":{"fields":[["add-default-route",{"default":true}],["allow",{"default":"pap,cha'
+        'p,mschap1,mschap2"}],["apn",{"default":"internet"}],["comment",{"can_disable":true,"remove_value":""}],["data-channel",{"default":0}],["defa'
+        'ult-route-distance",{"default":1}],["dial-command",{"default":"ATDT"}],["dial-on-demand",{"default":true}],["disabled",{"default":true}],["i'
+        'nfo-channel",{"default":0}],["keepalive-timeout",{"default":30}],["max-mru",{"default":1500}],["max-mtu",{"default":1500}],["modem-init",{"d'
+        'efault":""}],["mrru",{"default":"disabled"}],["name",{}],["null-modem",{"default":false}],["password",{"default":""}],["phone",{"default":""'
+        '}],["pin",{"default":""}],["port",{}],["profile",{"default":"default"}],["use-peer-dns",{"default":true}],["user",{"default":""}]],"fully_un'
+        'derstood":true,"primary_keys":["name"],"versioned_fields":[[[["7.20",">="]],"network-mode",{"can_disable":true}],[[["7.15",">="]],"numbers",'
+        '{"read_only":true}],[[["7.15",">="]],"remote-address",{}]]}}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":['
+        '["authentication",{"default":"pap,chap,mschap1,mschap2"}],["comment",{}],["data-channel",{"default":0}],["disabled",{"default":true}],["max-'
+        'mru",{"default":1500}],["max-mtu",{"default":1500}],["modem-init",{"default":""}],["mrru",{"default":"disabled"}],["name",{}],["null-modem",'
+        '{"default":false}],["numbers",{"read_only":true}],["port",{"default":"*FFFFFFFF"}],["profile",{"default":"default"}],["ring-count",{"default'
+        '":1}]],"fully_understood":true}]]}{"snapshots":[[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0]],"unversioned":{"fields":[["ac-name",{"defa'
+        'ult":""}],["add-default-route",{"default":false}],["allow",{"default":"pap,chap,mschap1,mschap2"}],["comment",{"can_disable":true,"remove_va'
+        'lue":""}],["default-route-distance",{"default":1}],["dial-on-demand",{"default":false}],["disabled",{"default":true}],["host-uniq",{"can_dis'
+        'able":true}],["interface",{"required":true}],["keepalive-timeout",{"default":10}],["max-mru",{"default":"auto"}],["max-mtu",{"default":"auto'
+        '"}],["mrru",{"default":"disabled"}],["name",{}],["password",{"default":""}],["profile",{"default":"default"}],["service-name",{"default":""}'
+        '],["use-peer-dns",{"default":false}],["user",{"default":""}]],"fully_understood":true,"primary_keys":["name"],"versioned_fields":[[[["7.15",'
+        '">="]],"numbers",{"read_only":true}]]}}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["comment",{}],["disa'
+        'bled",{}],["name",{}],["numbers",{"read_only":true}],["service",{}],["user",{}]],"fully_understood":true}]]}{"snapshots":[[-1,1],[-1,1],[-1,'
+        '1],[-1,1,2],[-1,0,1,2],[-1,0,1,2],[-1,0,1,2]],"unversioned":{"fields":[["accept-empty-service",{"default":true}],["authentication",{"default'
+        '":"pap,chap,mschap1,mschap2"}],["comment",{"can_disable":true,"remove_value":""}],["default-profile",{"default":"default"}],["disabled",{"de'
+        'fault":true}],["interface",{"required":true}],["keepalive-timeout",{"default":10}],["max-mru",{"default":"auto"}],["max-mtu",{"default":"aut'
+        'o"}],["max-sessions",{"default":"unlimited"}],["mrru",{"default":"disabled"}],["one-session-per-host",{"default":false}],["pado-delay",{"def'
+        'ault":0}],["service-name",{"default":""}]],"fully_understood":true,"primary_keys":["interface"],"versioned_fields":[[[["7.20",">="]],"accept'
+        '-untagged",{"default":true}],[[["7.15",">="]],"numbers",{"read_only":true}],[[["7.17",">="]],"pppoe-over-vlan-range",{"default":""}]]}}{"sna'
+        'pshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["add-default-route",{"default":false}],["allow",{"default":"pap,'
+        'chap,mschap1,mschap2"}],["comment",{}],["connect-to",{"required":true}],["default-route-distance",{"default":1}],["dial-on-demand",{"default'
+        '":false}],["disabled",{"default":true}],["keepalive-timeout",{"default":60}],["max-mru",{"default":1450}],["max-mtu",{"default":1450}],["mrr'
+        'u",{"default":"disabled"}],["name",{}],["numbers",{"read_only":true}],["password",{"default":""}],["profile",{"default":"default-encryption"'
+        '}],["use-peer-dns",{"default":false}],["user",{"required":true}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"ver'
+        'sioned":[["7.15",">=",{"fields":[["comment",{}],["disabled",{"default":false}],["name",{}],["numbers",{"read_only":true}],["user",{"required'
+        '":true}]],"fully_understood":true}]]}{"unversioned":{"fields":[["authentication",{"default":"mschap1,mschap2"}],["default-profile",{"default'
+        '":"default-encryption"}],["enabled",{"default":false}],["keepalive-timeout",{"default":30}],["max-mru",{"default":1450}],["max-mtu",{"defaul'
+        't":1450}],["mrru",{"default":"disabled"}]],"fully_understood":true,"single_value":true}}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versione'
+        'd":[["7.15",">=",{"fields":[["add-default-route",{"default":false}],["add-sni",{"default":false}],["authentication",{"default":"pap,chap,msc'
+        'hap1,mschap2"}],["certificate",{"default":"none"}],["ciphers",{"default":"aes256-sha"}],["comment",{}],["connect-to",{"required":true}],["de'
+        'fault-route-distance",{"default":1}],["dial-on-demand",{"default":false}],["disabled",{"default":true}],["http-proxy",{"default":"::"}],["ke'
+        'epalive-timeout",{"default":60}],["max-mru",{"default":1460}],["max-mtu",{"default":1460}],["mrru",{"default":false}],["name",{}],["numbers"'
+        ',{"read_only":true}],["password",{"default":""}],["pfs",{"default":false}],["port",{"default":443}],["profile",{"default":"default"}],["prox'
+        'y-port",{"default":443}],["tls-version",{"default":"any"}],["user",{"required":true}],["verify-server-address-from-certificate",{"default":f'
+        'alse}],["verify-server-certificate",{"default":false}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[['
+        '"7.15",">=",{"fields":[["comment",{}],["disabled",{"default":false}],["name",{}],["numbers",{"read_only":true}],["user",{"required":true}]],'
+        '"fully_understood":true}]]}{"snapshots":[[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0]],"unversioned":{"fields":[["authentication",{"defa'
+        'ult":"pap,chap,mschap1,mschap2"}],["certificate",{"default":"none"}],["default-profile",{"default":"default"}],["enabled",{"default":false}]'
+        ',["keepalive-timeout",{"default":60}],["max-mru",{"default":1500}],["max-mtu",{"default":1500}],["mrru",{"default":"disabled"}],["pfs",{"def'
+        'ault":false}],["port",{"default":443}],["tls-version",{"default":"any"}],["verify-client-certificate",{"default":"no"}]],"fully_understood":'
+        'true,"single_value":true,"versioned_fields":[[[["7.15",">="]],"ciphers",{"default":"aes256-sha,aes256-gcm-sha384"}],[[["7.15","<"]],"force-a'
+        'es",{"default":false}]]}}{"snapshots":[[0],[0],[0],[0],[0,0,1,2],[0,0,1,2],[0,0,1,2]],"versioned":[["7.15",">=",{"fields":[["address",{"defa'
+        'ult":""}],["comment",{"can_disable":true,"remove_value":""}],["disabled",{"default":false}],["gateway",{"default":""}],["gateway6",{"default'
+        '":""}],["name",{}],["numbers",{"read_only":true}]],"fully_understood":true,"primary_keys":["name"],"versioned_fields":[[[["7.21",">="]],"con'
+        'tainer-mac-address",{"default":"00:00:00:00:00:00"}],[[["7.20",">="]],"dhcp",{"default":false}],[[["7.20",">="]],"mac-address",{"default":"0'
+        '0:00:00:00:00:00"}]]}]]}{"snapshots":[[-1,1,2],[-1,1,2],[-1,1,2],[-1,1,2],[-1,0,1,2],[-1,0,1,2],[-1,0,1,2]],"unversioned":{"fields":[["arp",'
+        '{"default":"enabled"}],["arp-timeout",{"default":"auto"}],["comment",{"can_disable":true,"remove_value":""}],["disabled",{"default":false}],'
+        '["interface",{"required":true}],["loop-protect",{"default":"default"}],["loop-protect-disable-time",{"default":"5m"}],["loop-protect-send-in'
+        'terval",{"default":"5s"}],["mtu",{"default":1500}],["name",{}],["use-service-tag",{"default":false}],["vlan-id",{"required":true}]],"fully_u'
+        'nderstood":true,"primary_keys":["name"],"versioned_fields":[[[["7.21",">="]],"l3-hw-offloading",{}],[[["7.15",">="]],"mvrp",{"default":false'
+        '}],[[["7.15",">="]],"numbers",{"read_only":true}]]}}{"snapshots":[[0],[0],[0],[0,0],[0,0],[0,0],[0,0]],"versioned":[["7.15",">=",{"fields":['
+        '["arp",{"default":"enabled"}],["arp-timeout",{"default":"auto"}],["bridge",{"can_disable":true}],["bridge-cost",{"can_disable":true,"default'
+        '":1}],["bridge-horizon",{"can_disable":true,"default":"none"}],["cisco-static-id",{"can_disable":true}],["comment",{}],["disable-running-che'
+        'ck",{"default":false}],["disabled",{"default":true}],["mac-address",{}],["mtu",{"default":1500}],["name",{}],["numbers",{"read_only":true}],'
+        '["peer",{"required":true}],["pw-control-word",{"can_disable":true,"default":"default"}],["pw-l2mtu",{"can_disable":true,"default":1500}],["p'
+        'w-type",{"can_disable":true,"default":"raw-ethernet"}],["vpls-id",{"can_disable":true}]],"fully_understood":true,"required_one_of":[["cisco-'
+        'static-id","vpls-id"]],"versioned_fields":[[[["7.17",">="]],"bridge-pvid",{"can_disable":true,"default":1}]]}]]}{"snapshots":[[-1,2,4,5,6],['
+        '-1,2,4,5,6],[-1,2,4,5,6],[-1,2,4,5,6],[-1,0,1,2,4,6],[-1,0,1,2,4,6],[-1,0,1,2,4,6]],"unversioned":{"fields":[["arp",{"default":"enabled"}],['
+        '"arp-timeout",{"default":"auto"}],["authentication",{"default":"none"}],["comment",{"can_disable":true,"remove_value":""}],["disabled",{"def'
+        'ault":false}],["interface",{"required":true}],["interval",{"default":"1s"}],["name",{}],["on-backup",{"default":""}],["on-fail",{"default":"'
+        '"}],["on-master",{"default":""}],["password",{"default":""}],["preemption-mode",{"default":true}],["priority",{"default":100}],["remote-addr'
+        'ess",{}],["sync-connection-tracking",{"default":false}],["v3-protocol",{"default":"ipv4"}],["version",{"default":3}],["vrid",{"default":1}]]'
+        ',"fully_understood":true,"primary_keys":["name"],"versioned_fields":[[[["7.20",">="]],"connection-tracking-mode",{"default":"passive-active"'
+        '}],[[["7.20",">="]],"connection-tracking-port",{"default":8275}],[[["7.11",">="]],"group-authority",{"default":""}],[[["7.11","<"]],"group-m'
+        'aster",{"default":""}],[[["7.11",">="]],"group-master",{"write_only":true}],[[["7.20","<"]],"mtu",{"default":1500}],[[["7.15",">="]],"number'
+        's",{"read_only":true}]]}}{"snapshots":[[0,7],[0,7],[0,7],[0,0,1,3,6,7],[0,0,1,2,3,4,5,6,8],[0,0,1,2,3,4,5,6,8],[0,0,1,2,3,4,5,6,8]],"version'
+        'ed":[["7.15",">=",{"fields":[["allow-fast-path",{"default":true}],["arp",{"default":"enabled"}],["arp-timeout",{"default":"auto"}],["comment'
+        '",{}],["disabled",{"default":false}],["dont-fragment",{"default":"auto"}],["group",{"can_disable":true}],["interface",{"can_disable":true}],'
+        '["local-address",{"can_disable":true}],["loop-protect",{"default":"default"}],["loop-protect-disable-time",{"default":"5m"}],["loop-protect-'
+        'send-interval",{"default":"5s"}],["mac-address",{}],["max-fdb-size",{"default":4096}],["mtu",{"default":1500}],["name",{"default":"vxlan1"}]'
+        ',["numbers",{"read_only":true}],["port",{"default":4789}],["vni",{"required":true}],["vteps-ip-version",{"default":"ipv4"}]],"fully_understo'
+        'od":true,"versioned_fields":[[[["7.18",">="]],"bridge",{"can_disable":true}],[[["7.18",">="]],"bridge-pvid",{"default":1}],[[["7.20",">="]],'
+        '"checksum",{"default":false}],[[["7.18",">="]],"hw",{"default":true}],[[["7.20",">="]],"learning",{"default":true}],[[["7.20",">="]],"rem-cs'
+        'um",{"default":"none"}],[[["7.18",">="]],"ttl",{"default":"auto"}],[[["7.20","<"]],"vrf",{}],[[["7.20",">="]],"vtep-vrf",{"default":"main"}]'
+        ']}]]}{"snapshots":[[0,2],[0,2],[0,2],[0,0,1],[0,0,1],[0,0,1],[0,0,1]],"versioned":[["7.15",">=",{"fields":[["interface",{}],["numbers",{"rea'
+        'd_only":true}],["remote-ip",{}]],"fully_understood":true,"versioned_fields":[[[["7.16",">="]],"comment",{}],[[["7.18",">="]],"disabled",{}],'
+        '[[["7.18","<"]],"port",{}]]}]]}{"snapshots":[[0],[0],[0],[0,4,5,6,14,15],[0,0,2,3,4,5,6,7,8,9,10,13,14,15,16,17,18,19,20],[0,0,2,3,4,5,6,7,8'
+        ',9,10,13,14,15,16,17,18,19,20],[0,0,2,3,4,5,6,7,8,9,10,13,14,15,16,17,18,19,20]],"versioned":[["7.15",">=",{"fields":[["aaa",{}],["aaa.calle'
+        'd-format",{}],["aaa.calling-format",{}],["aaa.interim-update",{}],["aaa.mac-caching",{}],["aaa.nas-identifier",{}],["aaa.password-format",{}'
+        '],["aaa.username-format",{}],["arp",{}],["arp-timeout",{}],["channel",{}],["channel.band",{}],["channel.frequency",{}],["channel.reselect-in'
+        'terval",{}],["channel.secondary-frequency",{}],["channel.skip-dfs-channels",{}],["channel.width",{}],["comment",{}],["configuration",{}],["c'
+        'onfiguration.antenna-gain",{}],["configuration.beacon-interval",{}],["configuration.chains",{}],["configuration.country",{}],["configuration'
+        '.distance",{}],["configuration.dtim-period",{}],["configuration.hide-ssid",{}],["configuration.manager",{}],["configuration.mode",{}],["conf'
+        'iguration.multicast-enhance",{}],["configuration.qos-classifier",{}],["configuration.ssid",{}],["configuration.tx-chains",{}],["configuratio'
+        'n.tx-power",{}],["datapath",{}],["datapath.bridge",{}],["datapath.bridge-cost",{}],["datapath.bridge-horizon",{}],["datapath.client-isolatio'
+        'n",{}],["datapath.interface-list",{}],["datapath.vlan-id",{}],["disable-running-check",{}],["disabled",{}],["interworking",{}],["interworkin'
+        'g.3gpp-info",{}],["interworking.authentication-types",{}],["interworking.connection-capabilities",{}],["interworking.domain-names",{}],["int'
+        'erworking.esr",{}],["interworking.hessid",{}],["interworking.hotspot20",{}],["interworking.hotspot20-dgaf",{}],["interworking.internet",{}],'
+        '["interworking.ipv4-availability",{}],["interworking.ipv6-availability",{}],["interworking.network-type",{}],["interworking.operational-clas'
+        'ses",{}],["interworking.operator-names",{}],["interworking.realms",{}],["interworking.roaming-ois",{}],["interworking.uesa",{}],["interworki'
+        'ng.venue",{}],["interworking.venue-names",{}],["interworking.wan-at-capacity",{}],["interworking.wan-downlink",{}],["interworking.wan-downli'
+        'nk-load",{}],["interworking.wan-measurement-duration",{}],["interworking.wan-status",{}],["interworking.wan-symmetric",{}],["interworking.wa'
+        'n-uplink",{}],["interworking.wan-uplink-load",{}],["l2mtu",{}],["mac-address",{}],["master-interface",{}],["mtu",{}],["name",{}],["numbers",'
+        '{"read_only":true}],["radio-mac",{}],["security",{}],["security.authentication-types",{}],["security.connect-group",{}],["security.connect-p'
+        'riority",{}],["security.dh-groups",{}],["security.disable-pmkid",{}],["security.eap-accounting",{}],["security.eap-anonymous-identity",{}],['
+        '"security.eap-certificate-mode",{}],["security.eap-methods",{}],["security.eap-password",{}],["security.eap-tls-certificate",{}],["security.'
+        'eap-username",{}],["security.encryption",{}],["security.ft",{}],["security.ft-mobility-domain",{}],["security.ft-nas-identifier",{}],["secur'
+        'ity.ft-over-ds",{}],["security.ft-preserve-vlanid",{}],["security.ft-r0-key-lifetime",{}],["security.ft-reassociation-deadline",{}],["securi'
+        'ty.group-encryption",{}],["security.group-key-update",{}],["security.management-encryption",{}],["security.management-protection",{}],["secu'
+        'rity.owe-transition-interface",{}],["security.passphrase",{}],["security.sae-anti-clogging-threshold",{}],["security.sae-max-failure-rate",{'
+        '}],["security.sae-pwe",{}],["security.wps",{}],["steering",{}],["steering.neighbor-group",{}],["steering.rrm",{}],["steering.wnm",{}]],"full'
+        'y_understood":true,"primary_keys":["name"],"required_one_of":[["radio-mac","master-interface"]],"versioned_fields":[[[["7.20",">="]],"channe'
+        'l.deprioritize-unii-3-4",{"can_disable":true}],[[["7.22",">="]],"channel.preamble-puncturing",{}],[[["7.19",">="]],"channel.reselect-time",{'
+        '"can_disable":true}],[[["7.21",">="]],"configuration.hw-protection-mode",{}],[[["7.17",">="]],"configuration.installation",{"can_disable":tr'
+        'ue}],[[["7.18",">="]],"configuration.max-clients",{"can_disable":true}],[[["7.17",">="]],"configuration.station-roaming",{"can_disable":true'
+        '}],[[["7.20",">="]],"datapath.openflow-switch",{}],[[["7.19",">="]],"datapath.traffic-processing",{"can_disable":true}],[[["7.21",">="]],"in'
+        'terworking.3gpp-info-raw",{}],[[["7.21",">="]],"interworking.realms-raw",{}],[[["7.22",">="]],"mld-interface",{}],[[["7.22",">="]],"mld-name'
+        '",{}],[[["7.21",">="]],"security.beacon-protection",{}],[[["7.17",">="]],"security.multi-passphrase-group",{"can_disable":true}],[[["7.18","'
+        '>="]],"steering.2g-probe-delay",{"can_disable":true}],[[["7.21",">="]],"steering.transition-request-count",{}],[[["7.21",">="]],"steering.tr'
+        'ansition-request-period",{}],[[["7.21",">="]],"steering.transition-threshold",{}],[[["7.21",">="]],"steering.transition-threshold-time",{}],'
+        '[[["7.21",">="]],"steering.transition-time",{}]]}],["7.13",">=",{"fields":[["aaa",{"can_disable":true}],["aaa.called-format",{"can_disable":'
+        'true}],["aaa.calling-format",{"can_disable":true}],["aaa.interim-update",{"can_disable":true}],["aaa.mac-caching",{"can_disable":true}],["aa'
+        'a.nas-identifier",{"can_disable":true}],["aaa.password-format",{"can_disable":true}],["aaa.username-format",{"can_disable":true}],["arp",{"c'
+        'an_disable":true}],["arp-timeout",{"default":"auto"}],["channel",{"can_disable":true}],["channel.band",{"can_disable":true}],["channel.frequ'
+        'ency",{"can_disable":true}],["channel.secondary-frequency",{"can_disable":true}],["channel.skip-dfs-channels",{"can_disable":true}],["channe'
+        'l.width",{"can_disable":true}],["comment",{"can_disable":true,"remove_value":""}],["configuration",{"can_disable":true}],["configuration.ant'
+        'enna-gain",{"can_disable":true}],["configuration.beacon-interval",{"can_disable":true}],["configuration.chains",{"can_disable":true}],["conf'
+        'iguration.country",{"can_disable":true}],["configuration.dtim-period",{"can_disable":true}],["configuration.hide-ssid",{"can_disable":true}]'
+        ',["configuration.manager",{"can_disable":true}],["configuration.mode",{"can_disable":true}],["configuration.multicast-enhance",{"can_disable'
+        '":true}],["configuration.qos-classifier",{"can_disable":true}],["configuration.ssid",{"can_disable":true}],["configuration.tx-power",{"can_d'
+        'isable":true}],["datapath",{"can_disable":true}],["datapath.bridge",{"can_disable":true}],["datapath.bridge-cost",{"can_disable":true}],["da'
+        'tapath.bridge-horizon",{"can_disable":true}],["datapath.client-isolation",{"can_disable":true}],["datapath.interface-list",{"can_disable":tr'
+        'ue}],["datapath.vlan-id",{"can_disable":true}],["default-name",{}],["disable-running-check",{"can_disable":true}],["disabled",{"default":tru'
+        'e}],["interworking",{"can_disable":true}],["interworking.3gpp-info",{"can_disable":true}],["interworking.authentication-types",{"can_disable'
+        '":true}],["interworking.connection-capabilities",{"can_disable":true}],["interworking.domain-names",{"can_disable":true}],["interworking.esr'
+        '",{"can_disable":true}],["interworking.hessid",{"can_disable":true}],["interworking.hotspot20",{"can_disable":true}],["interworking.hotspot2'
+        '0-dgaf",{"can_disable":true}],["interworking.internet",{"can_disable":true}],["interworking.ipv4-availability",{"can_disable":true}],["inter'
+        'working.ipv6-availability",{"can_disable":true}],["interworking.network-type",{"can_disable":true}],["interworking.operational-classes",{"ca'
+        'n_disable":true}],["interworking.operator-names",{"can_disable":true}],["interworking.realms",{"can_disable":true}],["interworking.roaming-o'
+        'is",{"can_disable":true}],["interworking.uesa",{"can_disable":true}],["interworking.venue",{"can_disable":true}],["interworking.venue-names"'
+        ',{"can_disable":true}],["interworking.wan-at-capacity",{"can_disable":true}],["interworking.wan-downlink",{"can_disable":true}],["interworki'
+        'ng.wan-downlink-load",{"can_disable":true}],["interworking.wan-measurement-duration",{"can_disable":true}],["interworking.wan-status",{"can_'
+        'disable":true}],["interworking.wan-symmetric",{"can_disable":true}],["interworking.wan-uplink",{"can_disable":true}],["interworking.wan-upli'
+        'nk-load",{"can_disable":true}],["l2mtu",{"can_disable":true,"default":1560}],["mac-address",{}],["master-interface",{"can_disable":true}],["'
+        'mtu",{"can_disable":true,"default":1500}],["name",{}],["radio-mac",{"can_disable":true}],["security",{"can_disable":true}],["security.authen'
+        'tication-types",{"can_disable":true}],["security.connect-group",{"can_disable":true}],["security.connect-priority",{"can_disable":true}],["s'
+        'ecurity.dh-groups",{"can_disable":true}],["security.disable-pmkid",{"can_disable":true}],["security.eap-accounting",{"can_disable":true}],["'
+        'security.eap-anonymous-identity",{"can_disable":true}],["security.eap-certificate-mode",{"can_disable":true}],["security.eap-methods",{"can_'
+        'disable":true}],["security.eap-password",{"can_disable":true}],["security.eap-tls-certificate",{"can_disable":true}],["security.eap-username'
+        '",{"can_disable":true}],["security.encryption",{"can_disable":true}],["security.ft",{"can_disable":true}],["security.ft-mobility-domain",{"c'
+        'an_disable":true}],["security.ft-nas-identifier",{"can_disable":true}],["security.ft-over-ds",{"can_disable":true}],["security.ft-preserve-v'
+        'lanid",{"can_disable":true}],["security.ft-r0-key-lifetime",{"can_disable":true}],["security.ft-reassociation-deadline",{"can_disable":true}'
+        '],["security.group-encryption",{"can_disable":true}],["security.group-key-update",{"can_disable":true}],["security.management-encryption",{"'
+        'can_disable":true}],["security.management-protection",{"can_disable":true}],["security.owe-transition-interface",{"can_disable":true}],["sec'
+        'urity.passphrase",{"can_disable":true}],["security.sae-anti-clogging-threshold",{"can_disable":true}],["security.sae-max-failure-rate",{"can'
+        '_disable":true}],["security.sae-pwe",{"can_disable":true}],["security.wps",{"can_disable":true}],["steering",{"can_disable":true}],["steerin'
+        'g.neighbor-group",{"can_disable":true}],["steering.rrm",{"can_disable":true}],["steering.wnm",{"can_disable":true}]],"fully_understood":true'
+        ',"primary_keys":["name"],"required_one_of":[["default-name","radio-mac","master-interface"]],"versioned_fields":[[[["7.15","<"]],"configurat'
+        'ion.tx-chain",{"can_disable":true}]]}]]}{"snapshots":[[0,0],[0,0],[0,0],[0,0],[0,0],[0,0],[0,0]],"versioned":[["7.13",">=",{"fields":[["call'
+        'ed-format",{"can_disable":true}],["calling-format",{"can_disable":true}],["comment",{"can_disable":true,"remove_value":""}],["disabled",{"de'
+        'fault":false}],["interim-update",{"can_disable":true}],["mac-caching",{"can_disable":true}],["name",{}],["nas-identifier",{"can_disable":tru'
+        'e}],["password-format",{"can_disable":true}],["username-format",{"can_disable":true}]],"fully_understood":true,"primary_keys":["name"],"vers'
+        'ioned_fields":[[[["7.15",">="]],"numbers",{"read_only":true}]]}]]}{"snapshots":[[0,2],[0,2],[0,2],[0,1,2],[0,0,1,2],[0,0,1,2],[0,0,1,2]],"ve'
+        'rsioned":[["7.13",">=",{"fields":[["action",{"can_disable":true,"default":"accept"}],["allow-signal-out-of-range",{"can_disable":true}],["cl'
+        'ient-isolation",{"can_disable":true}],["comment",{"can_disable":true,"remove_value":""}],["disabled",{"default":false}],["interface",{"can_d'
+        'isable":true}],["mac-address",{"can_disable":true}],["mac-address-mask",{"can_disable":true}],["passphrase",{"can_disable":true}],["radius-a'
+        'ccounting",{"can_disable":true}],["signal-range",{"can_disable":true}],["ssid-regexp",{"can_disable":true}],["time",{"can_disable":true}],["'
+        'vlan-id",{"can_disable":true}]],"fully_understood":true,"versioned_fields":[[[["7.21",">="]],"days",{}],[[["7.17",">="]],"multi-passphrase-g'
+        'roup",{"can_disable":true}],[[["7.15",">="]],"numbers",{"read_only":true}]]}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.1'
+        '3",">=",{"fields":[["caps-man-addresses",{"can_disable":true,"default":""}],["caps-man-certificate-common-names",{"can_disable":true,"defaul'
+        't":""}],["caps-man-names",{"can_disable":true,"default":""}],["certificate",{"can_disable":true,"default":"none"}],["discovery-interfaces",{'
+        '"can_disable":true,"default":""}],["enabled",{"default":false}],["lock-to-caps-man",{"can_disable":true,"default":false}],["slaves-datapath"'
+        ',{"can_disable":true}],["slaves-static",{"can_disable":true}]],"fully_understood":true,"single_value":true,"versioned_fields":[[[["7.22.1","'
+        '>="]],"mld-datapath",{}],[[["7.22",">="]],"mld-static",{}]]}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.13",">=",{"fields'
+        '":[["ca-certificate",{"can_disable":true,"default":""}],["certificate",{"can_disable":true,"default":"none"}],["enabled",{"default":false}],'
+        '["interfaces",{"can_disable":true,"default":""}],["package-path",{"default":""}],["require-peer-certificate",{"default":false}],["upgrade-po'
+        'licy",{"default":"none"}]],"fully_understood":true,"single_value":true}]]}{"snapshots":[[0,1],[0,1],[0,1],[0,1,3],[0,0,1,3,4],[0,0,1,3,4],[0'
+        ',0,1,3,4]],"versioned":[["7.13",">=",{"fields":[["band",{"can_disable":true}],["comment",{"can_disable":true,"remove_value":""}],["disabled"'
+        ',{"default":false}],["frequency",{"can_disable":true}],["name",{}],["secondary-frequency",{"can_disable":true}],["skip-dfs-channels",{"can_d'
+        'isable":true}],["width",{"can_disable":true}]],"fully_understood":true,"primary_keys":["name"],"versioned_fields":[[[["7.20",">="]],"deprior'
+        'itize-unii-3-4",{"can_disable":true}],[[["7.15",">="]],"numbers",{"read_only":true}],[[["7.22",">="]],"preamble-puncturing",{}],[[["7.18",">'
+        '="]],"reselect-interval",{"can_disable":true}],[[["7.19",">="]],"reselect-time",{"can_disable":true}]]}]]}{"snapshots":[[0,0,1,2,3,4,5,6,7,9'
+        ',13,14,15,16,17,18,19,20,23,24,27,29,30,31,32,33,34,35,36,37,38,39,40,41,42,44,45,46,47,48,49,50,51,52,53,54,55,57,58,60,61,62,63,64,65,66,6'
+        '7,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,84,85,86,87,88,89,92,93,99],[0,0,1,2,3,4,5,6,7,9,13,14,15,16,17,18,19,20,23,24,27,29,30,31,32'
+        ',33,34,35,36,37,38,39,40,41,42,44,45,46,47,48,49,50,51,52,53,54,55,57,58,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,8'
+        '2,84,85,86,87,88,89,92,93,99],[0,0,1,2,3,4,5,6,7,9,13,14,15,16,17,18,19,20,23,24,27,29,30,31,32,33,34,35,36,37,38,39,40,41,42,44,45,46,47,48'
+        ',49,50,51,52,53,54,55,57,58,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,84,85,86,87,88,89,92,93,99],[0,0,1,2,3,4,5,'
+        '6,7,9,11,13,14,15,16,17,18,19,20,23,24,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,42,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,60,61,62'
+        ',63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,99],[0,0,1,2,3,4,5,6,7,8,9,11,12,13,14,15,16,1'
+        '7,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,'
+        '64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99],[0,0,1,2,3,4,5,6,7,8,9,11,12,13'
+        ',14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,6'
+        '0,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99],[0,0,1,2,3,4,5,6,7,8'
+        ',9,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56'
+        ',57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99]],"version'
+        'ed":[["7.13",">=",{"fields":[["aaa",{"can_disable":true}],["antenna-gain",{"can_disable":true}],["beacon-interval",{"can_disable":true}],["c'
+        'hains",{"can_disable":true}],["channel",{"can_disable":true}],["comment",{"can_disable":true,"remove_value":""}],["country",{"can_disable":t'
+        'rue}],["datapath",{"can_disable":true}],["disabled",{"default":false}],["dtim-period",{"can_disable":true}],["hide-ssid",{"default":false}],'
+        '["interworking",{"can_disable":true}],["manager",{"can_disable":true}],["mode",{"can_disable":true}],["multicast-enhance",{"can_disable":tru'
+        'e}],["name",{}],["qos-classifier",{"can_disable":true}],["security",{"can_disable":true}],["ssid",{"can_disable":true}],["steering",{"can_di'
+        'sable":true}],["tx-chains",{"can_disable":true}],["tx-power",{"can_disable":true}]],"fully_understood":true,"primary_keys":["name"],"version'
+        'ed_fields":[[[["7.13",">="]],"aaa.called-format",{"can_disable":true}],[[["7.13",">="]],"aaa.calling-format",{"can_disable":true}],[[["7.13"'
+        ',">="]],"aaa.interim-update",{"can_disable":true}],[[["7.13",">="]],"aaa.mac-caching",{"can_disable":true}],[[["7.13",">="]],"aaa.nas-identi'
+        'fier",{"can_disable":true}],[[["7.13",">="]],"aaa.password-format",{"can_disable":true}],[[["7.13",">="]],"aaa.username-format",{"can_disabl'
+        'e":true}],[[["7.13",">="]],"channel.band",{"can_disable":true}],[[["7.20",">="]],"channel.deprioritize-unii-3-4",{"can_disable":true}],[[["7'
+        '.13",">="]],"channel.frequency",{"can_disable":true}],[[["7.22",">="]],"channel.preamble-puncturing",{}],[[["7.18",">="]],"channel.reselect-'
+        'interval",{"can_disable":true}],[[["7.19",">="]],"channel.reselect-time",{"can_disable":true}],[[["7.13",">="]],"channel.secondary-frequency'
+        '",{"can_disable":true}],[[["7.13",">="]],"channel.skip-dfs-channels",{"can_disable":true}],[[["7.13",">="]],"channel.width",{"can_disable":t'
+        'rue}],[[["7.13",">="]],"datapath.bridge",{"can_disable":true}],[[["7.13",">="]],"datapath.bridge-cost",{"can_disable":true}],[[["7.13",">="]'
+        '],"datapath.bridge-horizon",{"can_disable":true}],[[["7.13",">="]],"datapath.client-isolation",{"can_disable":true}],[[["7.13",">="]],"datap'
+        'ath.interface-list",{"can_disable":true}],[[["7.20",">="]],"datapath.openflow-switch",{}],[[["7.19",">="]],"datapath.traffic-processing",{"c'
+        'an_disable":true}],[[["7.13",">="]],"datapath.vlan-id",{"can_disable":true}],[[["7.15",">="]],"distance",{"can_disable":true}],[[["7.21",">='
+        '"]],"hw-protection-mode",{}],[[["7.17",">="]],"installation",{"can_disable":true}],[[["7.13",">="]],"interworking.3gpp-info",{"can_disable":'
+        'true}],[[["7.21",">="]],"interworking.3gpp-info-raw",{}],[[["7.13",">="]],"interworking.authentication-types",{"can_disable":true}],[[["7.13'
+        '",">="]],"interworking.connection-capabilities",{"can_disable":true}],[[["7.13",">="]],"interworking.domain-names",{"can_disable":true}],[[['
+        '"7.13",">="]],"interworking.esr",{"can_disable":true}],[[["7.13",">="]],"interworking.hessid",{"can_disable":true}],[[["7.13",">="]],"interw'
+        'orking.hotspot20",{"can_disable":true}],[[["7.13",">="]],"interworking.hotspot20-dgaf",{"can_disable":true}],[[["7.13",">="]],"interworking.'
+        'internet",{"can_disable":true}],[[["7.13",">="]],"interworking.ipv4-availability",{"can_disable":true}],[[["7.13",">="]],"interworking.ipv6-'
+        'availability",{"can_disable":true}],[[["7.13",">="]],"interworking.network-type",{"can_disable":true}],[[["7.13",">="]],"interworking.operat'
+        'ional-classes",{"can_disable":true}],[[["7.13",">="]],"interworking.operator-names",{"can_disable":true}],[[["7.13",">="]],"interworking.rea'
+        'lms",{"can_disable":true}],[[["7.21",">="]],"interworking.realms-raw",{}],[[["7.13",">="]],"interworking.roaming-ois",{"can_disable":true}],'
+        '[[["7.13",">="]],"interworking.uesa",{"can_disable":true}],[[["7.13",">="]],"interworking.venue",{"can_disable":true}],[[["7.13",">="]],"int'
+        'erworking.venue-names",{"can_disable":true}],[[["7.13",">="]],"interworking.wan-at-capacity",{"can_disable":true}],[[["7.13",">="]],"interwo'
+        'rking.wan-downlink",{"can_disable":true}],[[["7.13",">="]],"interworking.wan-downlink-load",{"can_disable":true}],[[["7.13",">="]],"interwor'
+        'king.wan-measurement-duration",{"can_disable":true}],[[["7.13",">="]],"interworking.wan-status",{"can_disable":true}],[[["7.15",">="]],"inte'
+        'rworking.wan-symmetric",{"can_disable":true}],[[["7.13",">="]],"interworking.wan-uplink",{"can_disable":true}],[[["7.13",">="]],"interworkin'
+        'g.wan-uplink-load",{"can_disable":true}],[[["7.18",">="]],"max-clients",{"can_disable":true}],[[["7.15",">="]],"numbers",{"read_only":true}]'
+        ',[[["7.13",">="]],"security.authentication-types",{"can_disable":true}],[[["7.21",">="]],"security.beacon-protection",{}],[[["7.13",">="]],"'
+        'security.connect-group",{"can_disable":true}],[[["7.13",">="]],"security.connect-priority",{"can_disable":true}],[[["7.13",">="]],"security.'
+        'dh-groups",{"can_disable":true}],[[["7.13",">="]],"security.disable-pmkid",{"can_disable":true}],[[["7.13",">="]],"security.eap-accounting",'
+        '{"can_disable":true}],[[["7.13",">="]],"security.eap-anonymous-identity",{"can_disable":true}],[[["7.13",">="]],"security.eap-certificate-mo'
+        'de",{"can_disable":true}],[[["7.13",">="]],"security.eap-methods",{"can_disable":true}],[[["7.13",">="]],"security.eap-password",{"can_disab'
+        'le":true}],[[["7.13",">="]],"security.eap-tls-certificate",{"can_disable":true}],[[["7.13",">="]],"security.eap-username",{"can_disable":tru'
+        'e}],[[["7.13",">="]],"security.encryption",{"can_disable":true}],[[["7.13",">="]],"security.ft",{"can_disable":true}],[[["7.13",">="]],"secu'
+        'rity.ft-mobility-domain",{"can_disable":true}],[[["7.13",">="]],"security.ft-nas-identifier",{"can_disable":true}],[[["7.13",">="]],"securit'
+        'y.ft-over-ds",{"can_disable":true}],[[["7.13",">="]],"security.ft-preserve-vlanid",{"can_disable":true}],[[["7.13",">="]],"security.ft-r0-ke'
+        'y-lifetime",{"can_disable":true}],[[["7.13",">="]],"security.ft-reassociation-deadline",{"can_disable":true}],[[["7.13",">="]],"security.gro'
+        'up-encryption",{"can_disable":true}],[[["7.13",">="]],"security.group-key-update",{"can_disable":true}],[[["7.13",">="]],"security.managemen'
+        't-encryption",{"can_disable":true}],[[["7.13",">="]],"security.management-protection",{"can_disable":true}],[[["7.17",">="]],"security.multi'
+        '-passphrase-group",{"can_disable":true}],[[["7.13",">="]],"security.owe-transition-interface",{"can_disable":true}],[[["7.13",">="]],"securi'
+        'ty.passphrase",{"can_disable":true}],[[["7.13",">="]],"security.sae-anti-clogging-threshold",{"can_disable":true}],[[["7.13",">="]],"securit'
+        'y.sae-max-failure-rate",{"can_disable":true}],[[["7.13",">="]],"security.sae-pwe",{"can_disable":true}],[[["7.13",">="]],"security.wps",{"ca'
+        'n_disable":true}],[[["7.17",">="]],"station-roaming",{"can_disable":true}],[[["7.18",">="]],"steering.2g-probe-delay",{"can_disable":true}],'
+        '[[["7.13",">="]],"steering.neighbor-group",{"can_disable":true}],[[["7.13",">="]],"steering.rrm",{"can_disable":true}],[[["7.21",">="]],"ste'
+        'ering.transition-request-count",{}],[[["7.21",">="]],"steering.transition-request-period",{}],[[["7.21",">="]],"steering.transition-threshol'
+        'd",{}],[[["7.21",">="]],"steering.transition-threshold-time",{}],[[["7.21",">="]],"steering.transition-time",{}],[[["7.13",">="]],"steering.'
+        'wnm",{"can_disable":true}]]}]]}{"snapshots":[[0,0],[0,0],[0,0],[0,0],[0,0,1,2],[0,0,1,2],[0,0,1,2]],"versioned":[["7.13",">=",{"fields":[["b'
+        'ridge",{"can_disable":true}],["bridge-cost",{"can_disable":true}],["bridge-horizon",{"can_disable":true}],["client-isolation",{"can_disable"'
+        ':true}],["comment",{"can_disable":true,"remove_value":""}],["disabled",{"default":false}],["interface-list",{"can_disable":true}],["name",{}'
+        '],["vlan-id",{"can_disable":true}]],"fully_understood":true,"primary_keys":["name"],"versioned_fields":[[[["7.15",">="]],"numbers",{"read_on'
+        'ly":true}],[[["7.20",">="]],"openflow-switch",{}],[[["7.19",">="]],"traffic-processing",{"can_disable":true}]]}]]}{"snapshots":[[0,1],[0,1],'
+        '[0,1],[0,1],[0,0,1,2],[0,0,1,2],[0,0,1,2]],"versioned":[["7.13",">=",{"fields":[["3gpp-info",{"can_disable":true}],["authentication-types",{'
+        '"can_disable":true}],["comment",{"can_disable":true,"remove_value":""}],["connection-capabilities",{"can_disable":true}],["disabled",{"defau'
+        'lt":false}],["domain-names",{"can_disable":true}],["esr",{"can_disable":true}],["hessid",{"can_disable":true}],["hotspot20",{"can_disable":t'
+        'rue}],["hotspot20-dgaf",{"can_disable":true}],["internet",{"can_disable":true}],["ipv4-availability",{"can_disable":true}],["ipv6-availabili'
+        'ty",{"can_disable":true}],["name",{}],["network-type",{"can_disable":true}],["operational-classes",{"can_disable":true}],["operator-names",{'
+        '"can_disable":true}],["realms",{"can_disable":true}],["roaming-ois",{"can_disable":true}],["uesa",{"can_disable":true}],["venue",{"can_disab'
+        'le":true}],["venue-names",{"can_disable":true}],["wan-at-capacity",{"can_disable":true}],["wan-downlink",{"can_disable":true}],["wan-downlin'
+        'k-load",{"can_disable":true}],["wan-measurement-duration",{"can_disable":true}],["wan-status",{"can_disable":true}],["wan-symmetric",{"can_d'
+        'isable":true}],["wan-uplink",{"can_disable":true}],["wan-uplink-load",{"can_disable":true}]],"fully_understood":true,"primary_keys":["name"]'
+        ',"versioned_fields":[[[["7.21",">="]],"3gpp-info-raw",{}],[[["7.15",">="]],"numbers",{"read_only":true}],[[["7.21",">="]],"realms-raw",{}]]}'
+        ']]}{"snapshots":[null,null,null,null,null,null,null],"versioned":[["7.22",">=",{"fields":[["beacon-interval",{}],["comment",{}],["datapath.b'
+        'ridge",{}],["datapath.bridge-cost",{}],["datapath.bridge-horizon",{}],["datapath.client-isolation",{}],["datapath.interface-list",{}],["data'
+        'path.openflow-switch",{}],["datapath.traffic-processing",{}],["datapath.vlan-id",{}],["disabled",{}],["dtim-period",{}],["hide-ssid",{}],["h'
+        'w-protection-mode",{}],["labels",{}],["max-clients",{}],["mlo",{}],["mode",{}],["multicast-enhance",{}],["numbers",{"read_only":true}],["qos'
+        '-classifier",{}],["security.authentication-types",{}],["security.beacon-protection",{}],["security.connect-group",{}],["security.connect-pri'
+        'ority",{}],["security.dh-groups",{}],["security.disable-pmkid",{}],["security.eap-accounting",{}],["security.eap-anonymous-identity",{}],["s'
+        'ecurity.eap-certificate-mode",{}],["security.eap-methods",{}],["security.eap-password",{}],["security.eap-tls-certificate",{}],["security.ea'
+        'p-username",{}],["security.encryption",{}],["security.ft",{}],["security.ft-mobility-domain",{}],["security.ft-nas-identifier",{}],["securit'
+        'y.ft-over-ds",{}],["security.ft-preserve-vlanid",{}],["security.ft-r0-key-lifetime",{}],["security.ft-reassociation-deadline",{}],["security'
+        '.group-encryption",{}],["security.group-key-update",{}],["security.management-encryption",{}],["security.management-protection",{}],["securi'
+        'ty.multi-passphrase-group",{}],["security.owe-transition-interface",{}],["security.passphrase",{}],["security.sae-anti-clogging-threshold",{'
+        '}],["security.sae-max-failure-rate",{}],["security.sae-pwe",{}],["security.wps",{}],["ssid",{}],["station-roaming",{}]],"fully_understood":t'
+        'rue}]]}{"snapshots":[null,null,null,null,null,null,null],"versioned":[["7.22",">=",{"fields":[["channel.band",{}],["channel.deprioritize-uni'
+        'i-3-4",{}],["channel.frequency",{}],["channel.preamble-puncturing",{}],["channel.reselect-interval",{}],["channel.reselect-time",{}],["chann'
+        'el.secondary-frequency",{}],["channel.skip-dfs-channels",{}],["channel.width",{}],["comment",{}],["configuration.antenna-gain",{}],["configu'
+        'ration.chains",{}],["configuration.country",{}],["configuration.distance",{}],["configuration.installation",{}],["configuration.tx-chains",{'
+        '}],["configuration.tx-power",{}],["disabled",{}],["extra-labels",{}],["labels",{}],["numbers",{"read_only":true}],["security.authentication-'
+        'types",{}]],"fully_understood":true}]]}{"snapshots":[[0,1],[0,1],[0,1],[0,1,2],[0,1,2],[0,1,2],[0,1,2]],"versioned":[["7.13",">=",{"fields":'
+        '[["action",{"default":"none"}],["address-ranges",{"can_disable":true}],["comment",{"can_disable":true,"remove_value":""}],["common-name-rege'
+        'xp",{"can_disable":true}],["disabled",{"default":false}],["identity-regexp",{"can_disable":true}],["master-configuration",{"can_disable":tru'
+        'e}],["name-format",{}],["radio-mac",{"can_disable":true}],["slave-configurations",{"can_disable":true}],["supported-bands",{"can_disable":tr'
+        'ue}]],"fully_understood":true,"versioned_fields":[[[["7.22",">="]],"multi-link-mode",{}],[[["7.15",">="]],"numbers",{"read_only":true}],[[["'
+        '7.16",">="]],"slave-name-format",{}],[[["7.22",">="]],"supported-hw-caps",{}]]}]]}{"snapshots":[null,null,null,[0],[0],[0],[0]],"versioned":'
+        '[["7.17",">=",{"fields":[["external-antenna",{"can_disable":true}],["wifi-band",{"can_disable":true}]],"fully_understood":true,"single_value'
+        '":true}]]}{"snapshots":[[0,2],[0,2],[0,2],[0,1,2],[0,0,1,2],[0,0,1,2],[0,0,1,2]],"versioned":[["7.13",">=",{"fields":[["authentication-types'
+        '",{"can_disable":true}],["comment",{"can_disable":true,"remove_value":""}],["connect-group",{"can_disable":true}],["connect-priority",{"can_'
+        'disable":true}],["dh-groups",{"can_disable":true}],["disable-pmkid",{"can_disable":true}],["disabled",{"default":false}],["eap-accounting",{'
+        '"can_disable":true}],["eap-anonymous-identity",{"can_disable":true}],["eap-certificate-mode",{"can_disable":true}],["eap-methods",{"can_disa'
+        'ble":true}],["eap-password",{"can_disable":true}],["eap-tls-certificate",{"can_disable":true}],["eap-username",{"can_disable":true}],["encry'
+        'ption",{"can_disable":true}],["ft",{"can_disable":true}],["ft-mobility-domain",{"can_disable":true}],["ft-nas-identifier",{"can_disable":tru'
+        'e}],["ft-over-ds",{"can_disable":true}],["ft-preserve-vlanid",{"can_disable":true}],["ft-r0-key-lifetime",{"can_disable":true}],["ft-reassoc'
+        'iation-deadline",{"can_disable":true}],["group-encryption",{"can_disable":true}],["group-key-update",{"can_disable":true}],["management-encr'
+        'yption",{"can_disable":true}],["management-protection",{"can_disable":true}],["name",{}],["owe-transition-interface",{"can_disable":true}],['
+        '"passphrase",{"can_disable":true}],["sae-anti-clogging-threshold",{"can_disable":true}],["sae-max-failure-rate",{"can_disable":true}],["sae-'
+        'pwe",{"can_disable":true}],["wps",{"can_disable":true}]],"fully_understood":true,"primary_keys":["name"],"versioned_fields":[[[["7.21",">="]'
+        '],"beacon-protection",{}],[[["7.17",">="]],"multi-passphrase-group",{"can_disable":true}],[[["7.15",">="]],"numbers",{"read_only":true}]]}]]'
+        '}{"snapshots":[null,null,null,[0],[0],[0],[0]],"versioned":[["7.17",">=",{"fields":[["comment",{}],["disabled",{}],["expires",{"can_disable"'
+        ':true}],["group",{}],["isolation",{"can_disable":true}],["numbers",{"read_only":true}],["passphrase",{}],["vlan-id",{"can_disable":true}]],"'
+        'fully_understood":true}]]}{"snapshots":[[0,1],[0,1],[0,1],[0,0,1],[0,0,1,2,3,4,5,6],[0,0,1,2,3,4,5,6],[0,0,1,2,3,4,5,6]],"versioned":[["7.13'
+        '",">=",{"fields":[["comment",{"can_disable":true,"remove_value":""}],["disabled",{"default":false}],["name",{}],["neighbor-group",{"can_disa'
+        'ble":true}],["rrm",{"can_disable":true}],["wnm",{"can_disable":true}]],"fully_understood":true,"primary_keys":["name"],"versioned_fields":[['
+        '[["7.18",">="]],"2g-probe-delay",{"can_disable":true}],[[["7.15",">="]],"numbers",{"read_only":true}],[[["7.21",">="]],"transition-request-c'
+        'ount",{}],[[["7.21",">="]],"transition-request-period",{}],[[["7.21",">="]],"transition-threshold",{}],[[["7.21",">="]],"transition-threshol'
+        'd-time",{}],[[["7.21",">="]],"transition-time",{}]]}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["com'
+        'ment",{}],["numbers",{"depr":{"context":"write","msg":"The numbers field will be read-only from community.routeros 4.0.0 on.","version":"4.0'
+        '.0"}}]],"fully_understood":true,"has_identifier":true,"modify_not_supported":true}]]}{"snapshots":[null,null,null,null,null,null,null],"vers'
+        'ioned":[["7.13",">=","RouterOS 7.13 uses WiFi package"],["7.8",">=",{"fields":[["aaa",{}],["arp",{"default":"enabled"}],["arp-timeout",{"def'
+        'ault":"auto"}],["channel",{}],["configuration",{}],["datapath",{}],["default-name",{}],["disable-running-check",{"default":false}],["interwo'
+        'rking",{}],["l2mtu",{"default":1600}],["mac-address",{}],["master-interface",{}],["mtu",{"default":1500}],["name",{}],["security",{}],["stee'
+        'ring",{}]],"fully_understood":true,"primary_keys":["name"],"required_one_of":[["default-name","master-interface"]]}]]}{"snapshots":[null,nul'
+        'l,null,null,null,null,null],"versioned":[["7.13",">=","RouterOS 7.13 uses WiFi package"],["7.8",">=",{"fields":[["called-format",{"can_disab'
+        'le":true}],["calling-format",{"can_disable":true}],["comment",{"can_disable":true,"remove_value":""}],["disabled",{"default":true}],["interi'
+        'm-update",{"can_disable":true}],["mac-caching",{"can_disable":true}],["name",{}],["nas-identifier",{"can_disable":true}],["password-format",'
+        '{"can_disable":true}],["username-format",{"can_disable":true}]],"fully_understood":true,"primary_keys":["name"]}]]}{"snapshots":[null,null,n'
+        'ull,null,null,null,null],"versioned":[["7.13",">=","RouterOS 7.13 uses WiFi package"],["7.8",">=",{"fields":[["action",{"can_disable":true}]'
+        ',["allow-signal-out-of-range",{"can_disable":true}],["client-isolation",{"can_disable":true}],["comment",{"can_disable":true,"remove_value":'
+        '""}],["disabled",{"default":true}],["interface",{"can_disable":true}],["mac-address",{"can_disable":true}],["mac-address-mask",{"can_disable'
+        '":true}],["passphrase",{"can_disable":true}],["radius-accounting",{"can_disable":true}],["signal-range",{"can_disable":true}],["ssid-regexp"'
+        ',{}],["time",{"can_disable":true}],["vlan-id",{"can_disable":true}]],"fully_understood":true}]]}{"snapshots":[null,null,null,null,null,null,'
+        'null],"versioned":[["7.13",">=","RouterOS 7.13 uses WiFi package"],["7.8",">=",{"fields":[["caps-man-addresses",{"default":""}],["caps-man-c'
+        'ertificate-common-names",{"default":""}],["caps-man-names",{"default":""}],["certificate",{"default":"none"}],["discovery-interfaces",{"defa'
+        'ult":""}],["enabled",{"default":false}],["lock-to-caps-man",{"default":false}],["slaves-datapath",{}],["slaves-static",{}]],"fully_understoo'
+        'd":true,"single_value":true}]]}{"snapshots":[null,null,null,null,null,null,null],"versioned":[["7.13",">=","RouterOS 7.13 uses WiFi package"'
+        '],["7.8",">=",{"fields":[["ca-certificate",{"default":""}],["certificate",{"default":"none"}],["enabled",{"default":false}],["interfaces",{"'
+        'default":""}],["package-path",{"default":""}],["require-peer-certificate",{"default":false}],["upgrade-policy",{"default":"none"}]],"fully_u'
+        'nderstood":true,"single_value":true}]]}{"snapshots":[null,null,null,null,null,null,null],"versioned":[["7.13",">=","RouterOS 7.13 uses WiFi '
+        'package"],["7.8",">=",{"fields":[["band",{}],["frequency",{}],["name",{}],["secondary-frequency",{}],["skip-dfs-channels",{"default":"disabl'
+        'ed"}],["width",{}]],"fully_understood":true,"primary_keys":["name"]}]]}{"snapshots":[null,null,null,null,null,null,null],"versioned":[["7.13'
+        '",">=","RouterOS 7.13 uses WiFi package"],["7.8",">=",{"fields":[["aaa",{}],["antenna-gain",{}],["beacon-interval",{"default":100}],["chains'
+        '",{}],["channel",{}],["country",{"default":"United States"}],["datapath",{}],["dtim-period",{"default":1}],["hide-ssid",{"default":false}],['
+        '"interworking",{}],["manager",{}],["mode",{"default":"ap"}],["name",{}],["security",{}],["ssid",{}],["steering",{}],["tx-chains",{}],["tx-po'
+        'wer",{}]],"fully_understood":true,"primary_keys":["name"]}]]}{"snapshots":[null,null,null,null,null,null,null],"versioned":[["7.13",">=","Ro'
+        'uterOS 7.13 uses WiFi package"],["7.8",">=",{"fields":[["bridge",{}],["bridge-cost",{}],["bridge-horizon",{}],["client-isolation",{"default"'
+        ':false}],["interface-list",{}],["name",{}],["openflow-switch",{}],["vlan-id",{}]],"fully_understood":true,"primary_keys":["name"]}]]}{"snaps'
+        'hots":[null,null,null,null,null,null,null],"versioned":[["7.13",">=","RouterOS 7.13 uses WiFi package"],["7.8",">=",{"fields":[["3gpp-info",'
+        '{}],["authentication-types",{}],["comment",{"can_disable":true,"remove_value":""}],["connection-capabilities",{}],["disabled",{"default":fal'
+        'se}],["domain-names",{}],["esr",{}],["hessid",{}],["hotspot20",{}],["hotspot20-dgaf",{}],["internet",{}],["ipv4-availability",{}],["ipv6-ava'
+        'ilability",{}],["name",{}],["network-type",{}],["operational-classes",{}],["operator-names",{}],["realms",{}],["roaming-ois",{}],["uesa",{}]'
+        ',["venue",{}],["venue-names",{}],["wan-at-capacity",{}],["wan-downlink",{}],["wan-downlink-load",{}],["wan-measurement-duration",{}],["wan-s'
+        'tatus",{}],["wan-symmetric",{}],["wan-uplink",{}],["wan-uplink-load",{}]],"fully_understood":true,"primary_keys":["name"]}]]}{"snapshots":[n'
+        'ull,null,null,null,null,null,null],"versioned":[["7.13",">=","RouterOS 7.13 uses WiFi package"],["7.8",">=",{"fields":[["action",{"default":'
+        '"none"}],["address-ranges",{}],["comment",{"can_disable":true,"remove_value":""}],["common-name-regexp",{}],["disabled",{"default":false}],['
+        '"identity-regexp",{}],["master-configuration",{}],["name-format",{}],["radio-mac",{}],["slave-configurations",{}],["supported-bands",{}]],"f'
+        'ully_understood":true,"primary_keys":["action"]}]]}{"snapshots":[null,null,null,null,null,null,null],"versioned":[["7.13",">=","RouterOS 7.1'
+        '3 uses WiFi package"],["7.8",">=",{"fields":[["authentication-types",{}],["connect-group",{"can_disable":true}],["connect-priority",{}],["dh'
+        '-groups",{}],["disable-pmkid",{"default":false}],["eap-accounting",{"default":false}],["eap-anonymous-identity",{}],["eap-certificate-mode",'
+        '{"default":"dont-verify-certificate"}],["eap-methods",{}],["eap-password",{}],["eap-tls-certificate",{}],["eap-username",{}],["encryption",{'
+        '"default":"ccmp"}],["ft",{"default":false}],["ft-mobility-domain",{"default":44484}],["ft-nas-identifier",{}],["ft-over-ds",{"default":false'
+        '}],["ft-preserve-vlanid",{"default":true}],["ft-r0-key-lifetime",{"default":"600000s"}],["ft-reassociation-deadline",{"default":"20s"}],["gr'
+        'oup-encryption",{"default":"ccmp"}],["group-key-update",{"default":"24h"}],["management-encryption",{"default":"cmac"}],["management-protect'
+        'ion",{}],["name",{}],["owe-transition-interface",{}],["passphrase",{"default":""}],["sae-anti-clogging-threshold",{"can_disable":true}],["sa'
+        'e-max-failure-rate",{"can_disable":true}],["sae-pwe",{"default":"both"}],["wps",{"default":"push-button"}]],"fully_understood":true,"primary'
+        '_keys":["name"]}]]}{"snapshots":[null,null,null,null,null,null,null],"versioned":[["7.13",">=","RouterOS 7.13 uses WiFi package"],["7.8",">='
+        '",{"fields":[["comment",{"can_disable":true,"remove_value":""}],["disabled",{"default":false}],["name",{}],["neighbor-group",{}],["rrm",{}],'
+        '["wnm",{}]],"fully_understood":true,"primary_keys":["name"]}]]}{"snapshots":[[-1,0],[-1,0],[-1,0],[-1,0],[-1,0,1],[-1,0,1],[-1,0,1]],"unvers'
+        'ioned":{"fields":[["comment",{"can_disable":true,"remove_value":""}],["disabled",{"default":false}],["listen-port",{}],["mtu",{"default":142'
+        '0}],["name",{}],["private-key",{}]],"fully_understood":true,"primary_keys":["name"],"versioned_fields":[[[["7.15",">="]],"numbers",{"read_on'
+        'ly":true}],[[["7.21",">="]],"vrf",{}]]}}{"snapshots":[[-1,0,2,3,4,5,6,7,8,9],[-1,0,2,3,4,5,6,7,8,9],[-1,0,2,3,4,5,6,7,8,9],[-1,0,2,3,4,5,7,8'
+        ',9,10],[-1,0,1,2,3,4,5,7,8,9,10],[-1,0,1,2,3,4,5,7,8,9,10],[-1,0,1,2,3,4,5,7,8,9,10]],"unversioned":{"fields":[["allowed-address",{"required'
+        '":true}],["comment",{"can_disable":true,"remove_value":""}],["disabled",{"default":false}],["endpoint-address",{"default":""}],["endpoint-po'
+        'rt",{"default":0}],["interface",{}],["persistent-keepalive",{"can_disable":true,"remove_value":0}],["preshared-key",{"can_disable":true,"rem'
+        'ove_value":""}],["public-key",{}]],"fully_understood":true,"primary_keys":["public-key","interface"],"versioned_fields":[[[["7.15",">="]],"c'
+        'lient-address",{}],[[["7.21",">="]],"client-allowed-address",{}],[[["7.15",">="]],"client-dns",{}],[[["7.15",">="]],"client-endpoint",{}],[['
+        '["7.15",">="]],"client-keepalive",{}],[[["7.15",">="]],"client-listen-port",{}],[[["7.17","<"],["7.15",">="]],"is-responder",{}],[[["7.15","'
+        '>="]],"name",{}],[[["7.15",">="]],"numbers",{"read_only":true}],[[["7.15",">="]],"private-key",{}],[[["7.17",">="]],"responder",{}]]}}{"snap'
+        'shots":[[-1,0,2,3,4],[-1,0,1,2,3,4],[-1,0,1,2,3,4],[-1,0,1,2,3,4],[-1,0,1,2,3,4],[-1,0,1,2,3,4],[-1,0,1,2,3,4]],"unversioned":{"fields":[["a'
+        'daptive-noise-immunity",{"default":"none"}],["allow-sharedkey",{"default":false}],["ampdu-priorities",{"default":0}],["amsdu-limit",{"defaul'
+        't":8192}],["amsdu-threshold",{"default":8192}],["antenna-gain",{"default":0}],["antenna-mode",{}],["area",{"default":""}],["arp",{"default":'
+        '"enabled"}],["arp-timeout",{"default":"auto"}],["band",{}],["basic-rates-a/g",{"default":"6Mbps"}],["basic-rates-b",{"default":"1Mbps"}],["b'
+        'ridge-mode",{"default":"enabled"}],["channel-width",{"default":"20mhz"}],["comment",{"can_disable":true,"remove_value":""}],["compression",{'
+        '"default":false}],["country",{"default":"etsi"}],["default-ap-tx-limit",{"default":0}],["default-authentication",{"default":true}],["default'
+        '-client-tx-limit",{"default":0}],["default-forwarding",{"default":true}],["default-name",{}],["disable-running-check",{"default":false}],["d'
+        'isabled",{"default":true}],["disconnect-timeout",{"default":"3s"}],["distance",{"default":"dynamic"}],["frame-lifetime",{"default":0}],["fre'
+        'quency",{}],["frequency-mode",{"default":"regulatory-domain"}],["frequency-offset",{"default":0}],["guard-interval",{"default":"any"}],["hid'
+        'e-ssid",{"default":false}],["ht-basic-mcs",{}],["ht-supported-mcs",{}],["hw-fragmentation-threshold",{"default":"disabled"}],["hw-protection'
+        '-mode",{"default":"none"}],["hw-protection-threshold",{"default":0}],["hw-retries",{"default":7}],["installation",{"default":"any"}],["inter'
+        'working-profile",{"default":"disabled"}],["keepalive-frames",{"default":"enabled"}],["l2mtu",{"default":1600}],["mac-address",{}],["master-i'
+        'nterface",{}],["max-station-count",{"default":2007}],["mode",{"default":"ap-bridge"}],["mtu",{"default":1500}],["multicast-buffering",{"defa'
+        'ult":"enabled"}],["multicast-helper",{"default":"default"}],["name",{}],["noise-floor-threshold",{"default":"default"}],["nv2-cell-radius",{'
+        '"default":30}],["nv2-downlink-ratio",{"default":50}],["nv2-mode",{"default":"dynamic-downlink"}],["nv2-noise-floor-offset",{"default":"defau'
+        'lt"}],["nv2-preshared-key",{"default":""}],["nv2-qos",{"default":"default"}],["nv2-queue-count",{"default":2}],["nv2-security",{"default":"d'
+        'isabled"}],["nv2-sync-secret",{"default":""}],["on-fail-retry-time",{"default":"100ms"}],["preamble-mode",{"default":"both"}],["radio-name",'
+        '{}],["rate-selection",{"default":"advanced"}],["rate-set",{"default":"default"}],["running",{"read_only":true}],["rx-chains",{"default":"0,1'
+        '"}],["scan-list",{"default":"default"}],["secondary-frequency",{"default":""}],["security-profile",{"default":"default"}],["skip-dfs-channel'
+        's",{"default":"disabled"}],["ssid",{"required":true}],["station-bridge-clone-mac",{}],["station-roaming",{"default":"disabled"}],["supported'
+        '-rates-a/g",{}],["supported-rates-b",{}],["tdma-period-size",{"default":2}],["tx-chains",{}],["tx-power",{"default":""}],["tx-power-mode",{"'
+        'default":"default"}],["update-stats-interval",{"default":"disabled"}],["vlan-id",{"default":1}],["vlan-mode",{"default":"no-tag"}],["wds-cos'
+        't-range",{"default":"50-150"}],["wds-default-bridge",{"default":"none"}],["wds-default-cost",{"default":100}],["wds-ignore-ssid",{"default":'
+        'false}],["wds-mode",{"default":"disabled"}],["wireless-protocol",{"default":"any"}],["wmm-support",{"default":"disabled"}],["wps-mode",{"def'
+        'ault":"push-button"}]],"fully_understood":true,"primary_keys":["name"],"required_one_of":[["default-name","master-interface"]],"versioned_fi'
+        'elds":[[[["7.15",">="]],"burst-time",{}],[[["7.15.2",">="]],"numbers",{"read_only":true}],[[["7.15",">="]],"prism-cardtype",{}],[[["7.15",">'
+        '="]],"vht-basic-mcs",{}],[[["7.15",">="]],"vht-supported-mcs",{}]]}}{"snapshots":[[-1],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0]],"unversion'
+        'ed":{"fields":[["allow-signal-out-of-range",{"default":"10s"}],["ap-tx-limit",{"default":0}],["authentication",{"default":true}],["client-tx'
+        '-limit",{"default":0}],["comment",{"can_disable":true,"remove_value":""}],["disabled",{"default":false}],["forwarding",{"default":true}],["i'
+        'nterface",{"default":"any"}],["mac-address",{"default":"00:00:00:00:00:00"}],["management-protection-key",{"default":""}],["private-algo",{"'
+        'default":"none"}],["private-key",{"default":""}],["private-pre-shared-key",{"default":""}],["signal-range",{"default":"-120..120"}],["time",'
+        '{"can_disable":true}],["vlan-id",{"default":1}],["vlan-mode",{"default":"default"}]],"fully_understood":true,"versioned_fields":[[[["7.15.2"'
+        ',">="]],"numbers",{"read_only":true}]]}}{"unversioned":{"fields":[["active-mode",{"default":true}],["audio-max",{"default":-20}],["audio-min'
+        '",{"default":-100}],["audio-monitor",{"default":"00:00:00:00:00:00"}],["filter-mac",{"default":"00:00:00:00:00:00"}],["frame-size",{"default'
+        '":300}],["frames-per-second",{"default":25}],["receive-all",{"default":false}],["ssid-all",{"default":false}]],"fully_understood":true,"sing'
+        'le_value":true}}{"unversioned":{"fields":[["bridge",{"default":"none"}],["caps-man-addresses",{"default":""}],["caps-man-certificate-common-'
+        'names",{"default":""}],["caps-man-names",{"default":""}],["certificate",{"default":"none"}],["discovery-interfaces",{"default":""}],["enable'
+        'd",{"default":false}],["interfaces",{"default":""}],["lock-to-caps-man",{"default":false}],["static-virtual",{"default":false}]],"fully_unde'
+        'rstood":true,"single_value":true}}{"snapshots":[[0],[0,0],[0,0],[0,0],[0,0],[0,0],[0,0]],"versioned":[["7.15",">=",{"fields":[["band",{}],["'
+        'comment",{}],["disabled",{}],["extension-channel",{}],["frequency",{}],["list",{}],["name",{}],["width",{}]],"fully_understood":true,"versio'
+        'ned_fields":[[[["7.15.2",">="]],"numbers",{"read_only":true}]]}]]}{"snapshots":[[-1],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0]],"unversioned'
+        '":{"fields":[["3gpp",{"default":""}],["allow-signal-out-of-range",{"default":"10s"}],["area-prefix",{"default":""}],["comment",{"can_disable'
+        '":true,"remove_value":""}],["connect",{"default":true}],["disabled",{"default":false}],["interface",{"required":true}],["interworking",{"def'
+        'ault":"any"}],["iw-asra",{"default":"any"}],["iw-authentication-types",{}],["iw-connection-capabilities",{}],["iw-esr",{"default":"any"}],["'
+        'iw-hessid",{"default":"00:00:00:00:00:00"}],["iw-hotspot20",{"default":"any"}],["iw-hotspot20-dgaf",{"default":"any"}],["iw-internet",{"defa'
+        'ult":"any"}],["iw-ipv4-availability",{"default":"any"}],["iw-ipv6-availability",{"default":"any"}],["iw-network-type",{"default":"wildcard"}'
+        '],["iw-realms",{}],["iw-roaming-ois",{"default":""}],["iw-uesa",{"default":"any"}],["iw-venue",{"default":"any"}],["mac-address",{"default":'
+        '"00:00:00:00:00:00"}],["security-profile",{"default":"none"}],["signal-range",{"default":"-120..120"}],["ssid",{"default":""}],["wireless-pr'
+        'otocol",{"default":"any"}]],"fully_understood":true,"versioned_fields":[[[["7.15.2",">="]],"numbers",{"read_only":true}]]}}{"snapshots":[[0]'
+        ',[0,0],[0,0],[0,0],[0,0],[0,0],[0,0]],"versioned":[["7.15",">=",{"fields":[["3gpp-info",{}],["3gpp-raw",{}],["asra",{}],["authentication-typ'
+        'es",{}],["comment",{}],["connection-capabilities",{}],["domain-names",{}],["esr",{}],["hessid",{}],["hotspot20",{}],["hotspot20-dgaf",{}],["'
+        'internet",{}],["ipv4-availability",{}],["ipv6-availability",{}],["name",{}],["network-type",{}],["operational-classes",{}],["operator-names"'
+        ',{}],["realms",{}],["realms-raw",{}],["roaming-ois",{}],["uesa",{}],["venue",{}],["venue-names",{}],["wan-at-capacity",{}],["wan-downlink",{'
+        '}],["wan-downlink-load",{}],["wan-measurement-duration",{}],["wan-status",{}],["wan-symmetric",{}],["wan-uplink",{}],["wan-uplink-load",{}]]'
+        ',"fully_understood":true,"versioned_fields":[[[["7.15.2",">="]],"numbers",{"read_only":true}]]}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]]'
+        ',"versioned":[["7.15",">=",{"fields":[["comment",{}],["manual-tx-powers",{}],["numbers",{"depr":{"context":"write","msg":"The numbers field '
+        'will be read-only from community.routeros 4.0.0 on.","version":"4.0.0"}}]],"fully_understood":true,"has_identifier":true}]]}{"snapshots":[[0'
+        '],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["comment",{}],["disable-csma",{}],["enable-nstreme",{}],["enable-polling",{'
+        '}],["framer-limit",{}],["framer-policy",{}],["numbers",{"depr":{"context":"write","msg":"The numbers field will be read-only from community.'
+        'routeros 4.0.0 on.","version":"4.0.0"}}]],"fully_understood":true,"has_identifier":true}]]}{"snapshots":[[0],[0,0],[0,0],[0,0],[0,0],[0,0],['
+        '0,0]],"versioned":[["7.15",">=",{"fields":[["arp",{}],["arp-timeout",{}],["comment",{}],["disable-csma",{}],["disable-running-check",{}],["d'
+        'isabled",{}],["framer-limit",{}],["framer-policy",{}],["ht-channel-width",{}],["ht-guard-interval",{}],["ht-rates",{}],["ht-streams",{}],["l'
+        '2mtu",{}],["mtu",{}],["name",{}],["rates-a/g",{}],["rates-b",{}],["remote-mac",{}],["rx-band",{}],["rx-channel-width",{}],["rx-frequency",{}'
+        '],["rx-radio",{}],["tx-band",{}],["tx-channel-width",{}],["tx-frequency",{}],["tx-radio",{}]],"fully_understood":true,"versioned_fields":[[['
+        '["7.15.2",">="]],"numbers",{"read_only":true}]]}]]}{"snapshots":[[-1,0],[-1,0,2],[-1,0,2],[-1,0,2],[-1,0,2],[-1,0,2],[-1,0,2]],"unversioned"'
+        ':{"fields":[["authentication-types",{}],["disable-pmkid",{"default":false}],["eap-methods",{}],["group-ciphers",{}],["group-key-update",{"de'
+        'fault":"5m"}],["interim-update",{}],["management-protection",{"default":"disabled"}],["management-protection-key",{"default":""}],["mode",{"'
+        'default":"none"}],["mschapv2-password",{"default":""}],["mschapv2-username",{"default":""}],["name",{}],["radius-called-format",{}],["radius'
+        '-eap-accounting",{"default":false}],["radius-mac-accounting",{"default":false}],["radius-mac-authentication",{"default":false}],["radius-mac'
+        '-caching",{"default":"disabled"}],["radius-mac-format",{"default":"XX:XX:XX:XX:XX:XX"}],["radius-mac-mode",{"default":"as-username"}],["stat'
+        'ic-algo-0",{"default":"none"}],["static-algo-1",{"default":"none"}],["static-algo-2",{"default":"none"}],["static-algo-3",{"default":"none"}'
+        '],["static-key-0",{}],["static-key-1",{}],["static-key-2",{}],["static-key-3",{}],["static-sta-private-algo",{"default":"none"}],["static-st'
+        'a-private-key",{}],["static-transmit-key",{}],["supplicant-identity",{"default":"MikroTik"}],["tls-certificate",{"default":"none"}],["tls-mo'
+        'de",{}],["unicast-ciphers",{}],["wpa-pre-shared-key",{}],["wpa2-pre-shared-key",{}]],"fully_understood":true,"primary_keys":["name"],"versio'
+        'ned_fields":[[[["7.15",">="]],"comment",{}],[[["7.15","<"]],"disabled",{"default":true}],[[["7.15.2",">="]],"numbers",{"read_only":true}]]}}'
+        '{"unversioned":{"fields":[["channel-time",{"default":"200ms"}],["file-limit",{"default":10}],["file-name",{"default":""}],["memory-limit",{"'
+        'default":10}],["multiple-channels",{"default":false}],["only-headers",{"default":false}],["receive-errors",{"default":false}],["streaming-en'
+        'abled",{"default":false}],["streaming-max-rate",{"default":0}],["streaming-server",{"default":"0.0.0.0"}]],"fully_understood":true,"single_v'
+        'alue":true}}{"unversioned":{"fields":[["channel-time",{"default":"200ms"}],["multiple-channels",{"default":true}],["receive-errors",{"defaul'
+        't":false}]],"fully_understood":true,"single_value":true}}{"snapshots":[[0],[0,0],[0,0],[0,0],[0,0],[0,0],[0,0]],"versioned":[["7.15",">=",{"'
+        'fields":[["arp",{}],["arp-timeout",{}],["comment",{}],["disable-running-check",{}],["disabled",{}],["l2mtu",{}],["master-interface",{}],["mt'
+        'u",{}],["name",{}],["wds-address",{}]],"fully_understood":true,"versioned_fields":[[[["7.15.2",">="]],"numbers",{"read_only":true}]]}]]}{"sn'
+        'apshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["antenna",{}],["name",{}],["numbers",{"depr":{"context":"write"'
+        ',"msg":"The numbers field will be read-only from community.routeros 4.0.0 on.","version":"4.0.0"}}],["random-static-address",{}]],"fully_und'
+        'erstood":true,"has_identifier":true}]]}{"snapshots":[[0],[0],[0],[0],[0,0,1],[0,0,1],[0,0,1]],"versioned":[["7.15",">=",{"fields":[["ad-stru'
+        'ctures",{}],["channel-map",{}],["disabled",{}],["max-interval",{}],["min-interval",{}],["numbers",{"depr":{"context":"write","msg":"The numb'
+        'ers field will be read-only from community.routeros 4.0.0 on.","version":"4.0.0"}}],["own-address-type",{}]],"fully_understood":true,"has_id'
+        'entifier":true,"versioned_fields":[[[["7.21",">="]],"legacy",{}],[[["7.21",">="]],"phy",{}]]}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"'
+        'versioned":[["7.15",">=",{"fields":[["data",{}],["name",{}],["numbers",{"read_only":true}],["type",{}]],"fully_understood":true}]]}{"snapsho'
+        'ts":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["address",{}],["address-type",{}],["mtik-key",{}],["name",{}],["numb'
+        'ers",{"depr":{"context":"write","msg":"The numbers field will be read-only from community.routeros 4.0.0 on.","version":"4.0.0"}}],["persist'
+        '",{}]],"fully_understood":true,"has_identifier":true}]]}{"snapshots":[[0],[0],[0],[0],[0,0],[0,0],[0,0]],"versioned":[["7.15",">=",{"fields"'
+        ':[["disabled",{}],["filter-duplicates",{}],["filter-policy",{}],["interval",{}],["numbers",{"depr":{"context":"write","msg":"The numbers fie'
+        'ld will be read-only from community.routeros 4.0.0 on.","version":"4.0.0"}}],["own-address-type",{}],["type",{}],["window",{}]],"fully_under'
+        'stood":true,"has_identifier":true,"versioned_fields":[[[["7.21",">="]],"phy",{}]]}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":'
+        '[["7.15",">=",{"fields":[["address",{}],["address-type",{}],["comment",{}],["device",{}],["disabled",{}],["numbers",{"read_only":true}]],"fu'
+        'lly_understood":true}]]}{"snapshots":[[0,3],[0,3],[0,3],[0,0,1,2,3],[0,0,1,2],[0,0,1,2],[0,0,1,2]],"versioned":[["7.15",">=",{"fields":[["an'
+        'tenna",{}],["antenna-gain",{}],["channel-plan",{}],["disabled",{}],["forward",{}],["gateway-id",{}],["lbt-enabled",{}],["listen-time",{}],["'
+        'name",{}],["network",{}],["numbers",{"depr":{"context":"write","msg":"The numbers field will be read-only from community.routeros 4.0.0 on."'
+        ',"version":"4.0.0"}}],["rssi-threshold",{}],["servers",{}],["spoof-gps",{}]],"fully_understood":true,"has_identifier":true,"versioned_fields'
+        '":[[[["7.16",">="]],"alt",{}],[[["7.16",">="]],"lat",{}],[[["7.16",">="]],"long",{}],[[["7.19","<"]],"src-address",{}]]}]]}{"snapshots":[[0]'
+        ',[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["bandwidth",{}],["datarate",{}],["disabled",{}],["freq-off",{}],["numbers",{'
+        '"depr":{"context":"write","msg":"The numbers field will be read-only from community.routeros 4.0.0 on.","version":"4.0.0"}}],["radio",{}],["'
+        'spread-factor",{}]],"fully_understood":true,"has_identifier":true}]]}{"snapshots":[[0],[0],[0],[0,0],[0,0,1],[0,0,1],[0,0,1]],"versioned":[['
+        '"7.15",">=",{"fields":[["joineuis",{}],["name",{}],["numbers",{"read_only":true}]],"fully_understood":true,"versioned_fields":[[[["7.16",">='
+        '"]],"logging",{}],[[["7.19",">="]],"type",{}]]}]]}{"snapshots":[[0],[0],[0],[0,0],[0,0,1],[0,0,1],[0,0,1]],"versioned":[["7.15",">=",{"field'
+        's":[["name",{}],["netids",{}],["numbers",{"read_only":true}]],"fully_understood":true,"versioned_fields":[[[["7.16",">="]],"logging",{}],[[['
+        '"7.19",">="]],"type",{}]]}]]}{"snapshots":[[0,0,1],[0,0,1],[0,0,1],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["center-freq",{}],'
+        '["disabled",{}],["numbers",{"depr":{"context":"write","msg":"The numbers field will be read-only from community.routeros 4.0.0 on.","version'
+        '":"4.0.0"}}],["tx-freq-max",{}],["tx-freq-min",{}]],"fully_understood":true,"has_identifier":true,"versioned_fields":[[[["7.17","<"]],"rssi-'
+        'off",{}],[[["7.17","<"]],"tx-enabled",{}]]}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["address",{}]'
+        ',["certificate",{}],["down-port",{}],["interval",{}],["joineui",{}],["key",{}],["name",{}],["netid",{}],["numbers",{"read_only":true}],["por'
+        't",{}],["protocol",{}],["ssl",{}],["up-port",{}]],"fully_understood":true}]]}{"snapshots":[null,null,null,[0],[0,0],[0,0],[0,0]],"versioned"'
+        ':[["7.17",">=",{"fields":[["crc-errors",{}]],"fully_understood":true,"single_value":true,"versioned_fields":[[[["7.19",">="]],"pckt-limit",{'
+        '}]]}]]}{"snapshots":[[-1,0],[-1,0],[-1,0],[-1,0],[-1,0,2],[-1,0,2],[-1,0,2]],"unversioned":{"fields":[["disabled",{"default":true}],["hardwa'
+        're-port",{"default":"modbus"}],["tcp-port",{"default":502}],["timeout",{"default":1000}]],"fully_understood":true,"single_value":true,"versi'
+        'oned_fields":[[[["7.15",">="]],"disable-security-rules",{}],[[["7.22",">="]],"interframe-gap",{}],[[["7.21",">="]],"rx-switch-offset",{}]]}}'
+        '{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["allowed-function-codes",{}],["comment",{}],["disabled",{}]'
+        ',["ip-range",{}],["numbers",{"read_only":true}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0,0,1,2,3],[0,0,1,2,3],[0,0,1,2,3'
+        ']],"versioned":[["7.15",">=",{"fields":[["address",{}],["auto-connect",{}],["certificate",{}],["client-id",{}],["keep-alive",{}],["name",{}]'
+        ',["numbers",{"read_only":true}],["parallel-scripts-limit",{}],["password",{}],["port",{}],["ssl",{}],["username",{}]],"fully_understood":tru'
+        'e,"versioned_fields":[[[["7.20",">="]],"will-message",{}],[[["7.20",">="]],"will-qos",{}],[[["7.20",">="]],"will-retain",{}],[[["7.20",">="]'
+        '],"will-topic",{}]]}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["broker",{}],["numbers",{"read_only"'
+        ':true}],["on-message",{}],["qos",{}],["topic",{}]],"fully_understood":true}]]}{"snapshots":[null,null,null,null,null,null,null],"versioned":'
+        '[["7.15",">=","Not supported anymore in version  >= 7.15"],["7.15","<",{"fields":[["account-local-traffic",{"default":false}],["enabled",{"d'
+        'efault":false}],["threshold",{"default":256}]],"fully_understood":true,"single_value":true}]]}{"snapshots":[null,null,null,null,null,null,nu'
+        'll],"versioned":[["7.15",">=","Not supported anymore in version  >= 7.15"],["7.15","<",{"fields":[["accessible-via-web",{"default":false}],['
+        '"address",{"default":"0.0.0.0/0"}]],"fully_understood":true,"single_value":true}]]}{"snapshots":[[-1,0,1,2],[-1,0,1,2],[-1,0,1,2],[-1,0,1,2]'
+        ',[-1,0,1,2],[-1,0,1,2],[-1,0,1,2]],"unversioned":{"fields":[["address",{}],["comment",{"can_disable":true,"remove_value":""}],["disabled",{"'
+        'default":false}],["interface",{}],["network",{"automatically_computed_from":["address"]}]],"fully_understood":true,"primary_keys":["address"'
+        ',"interface"],"versioned_fields":[[[["7.15",">="]],"broadcast",{}],[[["7.15",">="]],"netmask",{}],[[["7.15",">="]],"numbers",{"read_only":tr'
+        'ue}]]}}{"snapshots":[[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0]],"unversioned":{"fields":[["address",{"default":"0.0.0.0"}],["comment"'
+        ',{"can_disable":true,"remove_value":""}],["disabled",{"default":false}],["interface",{"required":true}],["mac-address",{"default":"00:00:00:'
+        '00:00:00","value_canonicalizer":"mac"}],["published",{"default":false}]],"fully_understood":true,"versioned_fields":[[[["7.15",">="]],"numbe'
+        'rs",{"read_only":true}]]}}{"snapshots":[[-1,0,1,3],[-1,0,1,3],[-1,0,1,3],[-1,0,2,3],[-1,0,2,3],[-1,0,2,3],[-1,0,2,3]],"unversioned":{"fields'
+        '":[["ddns-update-interval",{"default":"none"}],["update-time",{"default":true}]],"fully_understood":true,"single_value":true,"versioned_fiel'
+        'ds":[[[["7.15",">="]],"back-to-home-vpn",{}],[[["7.17","<"]],"ddns-enabled",{"default":false}],[[["7.17",">="]],"ddns-enabled",{"default":"a'
+        'uto"}],[[["7.15",">="]],"vpn-prefer-relay-code",{}]]}}{"unversioned":{"fields":[["use-local-address",{"default":false}]],"fully_understood":'
+        'true,"single_value":true}}{"snapshots":[null,null,null,[0],[0],[0],[0]],"versioned":[["7.18",">=",{"fields":[["allow-uploads",{}],["comment"'
+        ',{}],["disabled",{}],["expires",{}],["numbers",{"read_only":true}],["path",{}]],"fully_understood":true}]]}{"snapshots":[null,null,null,[0],'
+        '[0],[0],[0]],"versioned":[["7.18",">=",{"fields":[["prefer-relay-code",{}]],"fully_understood":true,"single_value":true}]]}{"snapshots":[nul'
+        'l,null,null,[0],[0],[0],[0]],"versioned":[["7.18",">=",{"fields":[["allow-lan",{}],["comment",{}],["disabled",{}],["expires",{}],["file-acce'
+        'ss",{}],["file-access-path",{}],["name",{}],["numbers",{"read_only":true}],["private-key",{}],["public-key",{}]],"fully_understood":true}]]}'
+        '{"snapshots":[[1],[1],[1],null,null,null,null],"versioned":[["7.18",">=","Not supported anymore in version  >= 7.18"],["7.15",">=",{"fields"'
+        ':[["allow-lan",{}],["comment",{}],["disabled",{}],["expires",{}],["name",{}],["numbers",{"read_only":true}],["private-key",{}],["public-key"'
+        ',{}]],"fully_understood":true,"versioned_fields":[[[["7.17",">="]],"file-access",{}],[[["7.17",">="]],"file-access-path",{}]]}]]}{"snapshots'
+        '":[[-1,5],[-1,5],[-1,5],[-1,2,5],[-1,0,1,2,3,5,6,7],[-1,0,1,2,3,5,6,7],[-1,0,1,2,3,5,6,7]],"unversioned":{"fields":[["add-default-route",{"d'
+        'efault":true}],["comment",{"can_disable":true,"remove_value":""}],["default-route-distance",{"default":1}],["dhcp-options",{"can_disable":tr'
+        'ue,"default":"hostname,clientid","remove_value":""}],["disabled",{"default":false}],["interface",{}],["script",{}],["use-peer-dns",{"default'
+        '":true}],["use-peer-ntp",{"default":true}]],"fully_understood":true,"primary_keys":["interface"],"versioned_fields":[[[["7.19",">="]],"allow'
+        '-reconfigure",{"default":false}],[[["7.19",">="]],"check-gateway",{"default":"none"}],[[["7.18",">="]],"default-route-tables",{}],[[["7.20",'
+        '">="]],"dscp",{"default":0}],[[["7.22",">="]],"name",{}],[[["7.15",">="]],"numbers",{"read_only":true}],[[["7.20",">="]],"use-broadcast",{"d'
+        'efault":"both"}],[[["7.20",">="]],"vlan-priority",{"default":0}]]}}{"snapshots":[[-1,1],[-1,1],[-1,1],[-1,0,1],[-1,0,1],[-1,0,1],[-1,0,1]],"'
+        'unversioned":{"fields":[["code",{}],["name",{}],["value",{}]],"fully_understood":true,"primary_keys":["name"],"versioned_fields":[[[["7.16",'
+        '">="]],"comment",{}],[[["7.15",">="]],"numbers",{"read_only":true}]]}}{"snapshots":[[-1,0,2],[-1,0,2],[-1,0,2],[-1,0,1,2],[-1,0,1,2],[-1,0,1'
+        ',2],[-1,0,1,2]],"unversioned":{"fields":[["add-relay-info",{"default":false}],["delay-threshold",{"can_disable":true,"remove_value":"none"}]'
+        ',["dhcp-server",{"required":true}],["disabled",{"default":false}],["interface",{"required":true}],["local-address",{"can_disable":true,"remo'
+        've_value":"0.0.0.0"}],["name",{}],["relay-info-remote-id",{"can_disable":true}]],"fully_understood":true,"primary_keys":["name"],"versioned_'
+        'fields":[[[["7.15",">="]],"dhcp-server-vrf",{}],[[["7.17",">="]],"local-address-as-src-ip",{}],[[["7.15",">="]],"numbers",{"read_only":true}'
+        ']]}}{"snapshots":[[-1,0,3],[-1,0,3],[-1,0,3],[-1,0,1,3],[-1,0,1,2,3,4,5],[-1,0,1,2,3,4,5],[-1,0,1,2,3,4,5]],"unversioned":{"fields":[["addre'
+        'ss-pool",{"default":"static-only"}],["allow-dual-stack-queue",{"can_disable":true,"remove_value":true}],["always-broadcast",{"can_disable":t'
+        'rue,"remove_value":false}],["authoritative",{"default":true}],["bootp-lease-time",{"default":"forever"}],["bootp-support",{"can_disable":tru'
+        'e,"remove_value":"static"}],["client-mac-limit",{"can_disable":true,"remove_value":"unlimited"}],["comment",{"can_disable":true,"remove_valu'
+        'e":""}],["conflict-detection",{"can_disable":true,"remove_value":true}],["delay-threshold",{"can_disable":true,"remove_value":"none"}],["dhc'
+        'p-option-set",{"can_disable":true,"remove_value":"none"}],["disabled",{"default":false}],["insert-queue-before",{"can_disable":true,"remove_'
+        'value":"first"}],["interface",{"required":true}],["lease-script",{"default":""}],["lease-time",{"default":"10m","value_canonicalizer":"durat'
+        'ion"}],["name",{}],["parent-queue",{"can_disable":true,"remove_value":"none"}],["relay",{"can_disable":true,"remove_value":"0.0.0.0"}],["ser'
+        'ver-address",{"can_disable":true,"remove_value":"0.0.0.0"}],["use-framed-as-classless",{"can_disable":true,"remove_value":true}],["use-radiu'
+        's",{"default":false}]],"fully_understood":true,"primary_keys":["name"],"versioned_fields":[[[["7.15",">="]],"add-arp",{}],[[["7.17",">="]],"'
+        'address-lists",{}],[[["7.21",">="]],"dynamic-lease-identifiers",{}],[[["7.15",">="]],"numbers",{"read_only":true}],[[["7.21",">="]],"support'
+        '-broadband-tr101",{}],[[["7.19",">="]],"use-reconfigure",{}]]}}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields'
+        '":[["alert-timeout",{}],["comment",{}],["disabled",{}],["interface",{}],["numbers",{"read_only":true}],["on-alert",{}],["valid-server",{}]],'
+        '"fully_understood":true}]]}{"snapshots":[[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0]],"unversioned":{"fields":[["accounting",{"default"'
+        ':true}],["interim-update",{"default":"0s"}],["store-leases-disk",{"default":"5m"}]],"fully_understood":true,"single_value":true,"versioned_f'
+        'ields":[[[["7.15",">="]],"radius-password",{}]]}}{"snapshots":[[-1,2,3,4,5,6,7,8,9,10,11],[-1,2,3,4,5,6,7,8,9,10,11],[-1,2,3,4,5,6,7,8,9,10,'
+        '11],[-1,2,3,4,5,6,7,8,9,10,11],[-1,0,1,2,3,4,5,6,7,8,9,10,11],[-1,0,1,2,3,4,5,6,7,8,9,10,11],[-1,0,1,2,3,4,5,6,7,8,9,10,11]],"unversioned":{'
+        '"fields":[["address",{}],["address-lists",{"default":""}],["always-broadcast",{}],["client-id",{"can_disable":true,"remove_value":""}],["com'
+        'ment",{"can_disable":true,"remove_value":""}],["dhcp-option",{"default":""}],["disabled",{"default":false}],["insert-queue-before",{"can_dis'
+        'able":true}],["mac-address",{"can_disable":true,"remove_value":"","value_canonicalizer":"mac"}],["server",{"absent_value":"all"}]],"fully_un'
+        'derstood":true,"primary_keys":["server","address"],"versioned_fields":[[[["7.21",">="]],"agent-circuit-id",{}],[[["7.21",">="]],"agent-remot'
+        'e-id",{}],[[["7.15",">="]],"allow-dual-stack-queue",{"can_disable":true}],[[["7.15",">="]],"block-access",{}],[[["7.15",">="]],"dhcp-option-'
+        'set",{}],[[["7.15",">="]],"lease-time",{"value_canonicalizer":"duration"}],[[["7.15",">="]],"numbers",{"read_only":true}],[[["7.15",">="]],"'
+        'parent-queue",{"can_disable":true}],[[["7.15",">="]],"queue-type",{"can_disable":true}],[[["7.15",">="]],"rate-limit",{}],[[["7.15",">="]],"'
+        'routes",{}],[[["7.15",">="]],"use-src-mac",{}]]}}{"snapshots":[[0,2],[0,2],[0,2],[0,0,1,2],[0,0,1,2],[0,0,1,2],[0,0,1,2]],"versioned":[["7.4'
+        '",">=",{"fields":[["address-pool",{"default":"none"}],["code",{"required":true}],["disabled",{"default":false}],["name",{"required":true}],['
+        '"option-set",{}],["server",{"default":"all"}],["value",{"required":true}]],"fully_understood":true,"primary_keys":["name"],"versioned_fields'
+        '":[[[["7.16",">="]],"comment",{"can_disable":true,"remove_value":""}],[[["7.16",">="]],"matching-type",{}],[[["7.15",">="]],"numbers",{"read'
+        '_only":true}]]}]]}{"snapshots":[[-1,1],[-1,1],[-1,1],[-1,1],[-1,0,1],[-1,0,1],[-1,0,1]],"unversioned":{"fields":[["address",{}],["boot-file-'
+        'name",{"default":""}],["caps-manager",{"default":""}],["comment",{"can_disable":true,"remove_value":""}],["dhcp-option",{"default":""}],["dh'
+        'cp-option-set",{"default":""}],["dns-none",{"default":false}],["dns-server",{"default":"","value_canonicalizer":"name_list"}],["domain",{"de'
+        'fault":""}],["gateway",{"default":""}],["netmask",{"can_disable":true,"remove_value":0}],["next-server",{"can_disable":true}],["ntp-server",'
+        '{"default":"","value_canonicalizer":"name_list"}],["wins-server",{"default":""}]],"fully_understood":true,"primary_keys":["address"],"versio'
+        'ned_fields":[[[["7.20",">="]],"ntp-none",{}],[[["7.15",">="]],"numbers",{"read_only":true}]]}}{"snapshots":[[-1,1],[-1,1],[-1,1],[-1,0,1],[-'
+        '1,0,1],[-1,0,1],[-1,0,1]],"unversioned":{"fields":[["code",{"required":true}],["force",{"default":false}],["name",{}],["value",{"default":""'
+        '}]],"fully_understood":true,"primary_keys":["name"],"versioned_fields":[[[["7.16",">="]],"comment",{"can_disable":true,"remove_value":""}],['
+        '[["7.15",">="]],"numbers",{"read_only":true}]]}}{"snapshots":[[-1,1],[-1,1],[-1,1],[-1,0,1],[-1,0,1],[-1,0,1],[-1,0,1]],"unversioned":{"fiel'
+        'ds":[["name",{"required":true}],["options",{}]],"fully_understood":true,"primary_keys":["name"],"versioned_fields":[[[["7.16",">="]],"commen'
+        't",{"can_disable":true,"remove_value":""}],[[["7.15",">="]],"numbers",{"read_only":true}]]}}{"snapshots":[[-1,0,1,2,3,5],[-1,0,1,2,3,5],[-1,'
+        '0,1,2,3,5],[-1,0,1,2,3,4,5],[-1,0,1,2,3,4,5],[-1,0,1,2,3,4,5],[-1,0,1,2,3,4,5]],"unversioned":{"fields":[["allow-remote-requests",{}],["cach'
+        'e-max-ttl",{"default":"1w","value_canonicalizer":"duration"}],["cache-size",{"default":"2048KiB"}],["max-concurrent-queries",{"default":100}'
+        '],["max-concurrent-tcp-sessions",{"default":20}],["max-udp-packet-size",{"default":4096}],["query-server-timeout",{"default":"2s"}],["query-'
+        'total-timeout",{"default":"10s"}],["servers",{"default":"","value_canonicalizer":"name_list"}],["use-doh-server",{"default":""}],["verify-do'
+        'h-cert",{"default":false}]],"fully_understood":true,"single_value":true,"versioned_fields":[[[["7.15",">="]],"address-list-extra-time",{}],['
+        '[["7.8",">="]],"doh-max-concurrent-queries",{"default":50}],[[["7.8",">="]],"doh-max-server-connections",{"default":5}],[[["7.8",">="]],"doh'
+        '-timeout",{"default":"5s"}],[[["7.16",">="]],"mdns-repeat-ifaces",{}],[[["7.15",">="]],"vrf",{}]]}}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]'
+        '],"versioned":[["7.15",">=",{"fields":[["comment",{"can_disable":true,"remove_value":""}],["disabled",{"default":false}],["file",{"default":'
+        '""}],["match-count",{"read_only":true}],["name-count",{"read_only":true}],["numbers",{"read_only":true}],["ssl-verify",{"default":true}],["u'
+        'rl",{"default":""}]],"fully_understood":true}]]}{"snapshots":[null,null,null,[0],[0],[0],[0]],"versioned":[["7.17",">=",{"fields":[["comment'
+        '",{"can_disable":true,"remove_value":""}],["disabled",{"default":false}],["dns-servers",{"default":""}],["doh-servers",{"default":""}],["nam'
+        'e",{"required":true}],["numbers",{"read_only":true}],["verify-doh-cert",{"default":true}]],"fully_understood":true,"required_one_of":[["dns-'
+        'servers","doh-servers"]]}]]}{"snapshots":[[-1,0,1,2],[-1,0,1,2],[-1,0,1,2],[-1,0,1,2],[-1,0,1,2],[-1,0,1,2],[-1,0,1,2]],"unversioned":{"fiel'
+        'ds":[["address",{"value_canonicalizer":"ip"}],["cname",{}],["comment",{"can_disable":true,"remove_value":""}],["disabled",{"default":false}]'
+        ',["forward-to",{}],["mx-exchange",{}],["mx-preference",{}],["name",{}],["ns",{}],["regexp",{}],["srv-port",{}],["srv-priority",{}],["srv-tar'
+        'get",{}],["srv-weight",{}],["text",{}],["ttl",{"default":"1d","value_canonicalizer":"duration"}],["type",{}]],"fully_understood":true,"mutua'
+        'lly_exclusive":[["name","regexp"]],"required_one_of":[["name","regexp"]],"versioned_fields":[[[["7.5",">="]],"address-list",{}],[[["7.5",">='
+        '"]],"match-subdomain",{"default":false}],[[["7.15",">="]],"numbers",{"read_only":true}]]}}{"snapshots":[[-1,0,1,2],[-1,0,1,2],[-1,0,1,2],[-1'
+        ',0,1,2],[-1,0,1,2],[-1,0,1,2],[-1,0,1,2]],"unversioned":{"fields":[["address",{}],["comment",{"can_disable":true,"remove_value":""}],["disab'
+        'led",{"default":false}],["list",{}]],"fully_understood":true,"primary_keys":["address","list"],"versioned_fields":[[[["7.15",">="]],"dynamic'
+        '",{}],[[["7.15",">="]],"numbers",{"read_only":true}],[[["7.15",">="]],"timeout",{"value_canonicalizer":"duration"}]]}}{"snapshots":[[0],[0],'
+        '[0],[0],[0,0],[0,0],[0,0]],"versioned":[["7.15",">=",{"fields":[["action",{}],["address-list",{}],["address-list-timeout",{}],["chain",{}],['
+        '"comment",{}],["connection-bytes",{"can_disable":true}],["connection-limit",{"can_disable":true}],["connection-mark",{"can_disable":true}],['
+        '"connection-rate",{"can_disable":true}],["connection-type",{"can_disable":true}],["content",{"can_disable":true}],["disabled",{}],["dscp",{"'
+        'can_disable":true}],["dst-address",{"can_disable":true}],["dst-address-list",{"can_disable":true}],["dst-address-type",{"can_disable":true}]'
+        ',["dst-limit",{"can_disable":true}],["dst-port",{"can_disable":true}],["fragment",{"can_disable":true}],["hotspot",{"can_disable":true}],["i'
+        'cmp-options",{"can_disable":true}],["in-bridge-port",{"can_disable":true}],["in-bridge-port-list",{"can_disable":true}],["in-interface",{"ca'
+        'n_disable":true}],["in-interface-list",{"can_disable":true}],["ingress-priority",{"can_disable":true}],["ipsec-policy",{"can_disable":true}]'
+        ',["ipv4-options",{"can_disable":true}],["layer7-protocol",{"can_disable":true}],["limit",{"can_disable":true}],["log",{}],["log-prefix",{}],'
+        '["nth",{"can_disable":true}],["numbers",{"read_only":true}],["out-bridge-port",{"can_disable":true}],["out-bridge-port-list",{"can_disable":'
+        'true}],["out-interface",{"can_disable":true}],["out-interface-list",{"can_disable":true}],["packet-mark",{"can_disable":true}],["packet-size'
+        '",{"can_disable":true}],["per-connection-classifier",{"can_disable":true}],["port",{"can_disable":true}],["priority",{"can_disable":true}],['
+        '"protocol",{"can_disable":true}],["psd",{"can_disable":true}],["random",{"can_disable":true}],["realm",{"can_disable":true}],["routing-mark"'
+        ',{"can_disable":true}],["sniff-id",{}],["sniff-target",{}],["sniff-target-port",{}],["src-address",{"can_disable":true}],["src-address-list"'
+        ',{"can_disable":true}],["src-address-type",{"can_disable":true}],["src-mac-address",{"can_disable":true}],["src-port",{"can_disable":true}],'
+        '["tcp-mss",{"can_disable":true}],["time",{"can_disable":true}],["tls-host",{"can_disable":true}],["ttl",{"can_disable":true}]],"fully_unders'
+        'tood":true,"versioned_fields":[[[["7.21",">="]],"tos",{}]]}]]}{"snapshots":[[-1],[-1],[-1],[-1],[-1,0],[-1,0],[-1,0]],"unversioned":{"fields'
+        '":[["enabled",{"default":"auto"}],["generic-timeout",{"default":"10m"}],["icmp-timeout",{"default":"10s"}],["loose-tcp-tracking",{"default":'
+        'true}],["tcp-close-timeout",{"default":"10s"}],["tcp-close-wait-timeout",{"default":"10s"}],["tcp-established-timeout",{"default":"1d"}],["t'
+        'cp-fin-wait-timeout",{"default":"10s"}],["tcp-last-ack-timeout",{"default":"10s"}],["tcp-max-retrans-timeout",{"default":"5m"}],["tcp-syn-re'
+        'ceived-timeout",{"default":"5s"}],["tcp-syn-sent-timeout",{"default":"5s"}],["tcp-time-wait-timeout",{"default":"10s"}],["tcp-unacked-timeou'
+        't",{"default":"5m"}],["udp-stream-timeout",{"default":"3m"}],["udp-timeout",{"default":"10s"}]],"fully_understood":true,"single_value":true,'
+        '"versioned_fields":[[[["7.20",">="]],"liberal-tcp-tracking",{}]]}}{"snapshots":[[-1,0],[-1,0],[-1,0],[-1,0],[-1,0,2],[-1,0,2],[-1,0,2]],"unv'
+        'ersioned":{"fields":[["action",{}],["address-list",{"can_disable":true}],["address-list-timeout",{"can_disable":true}],["chain",{}],["commen'
+        't",{"can_disable":true,"remove_value":""}],["connection-bytes",{"can_disable":true}],["connection-limit",{"can_disable":true}],["connection-'
+        'mark",{"can_disable":true}],["connection-nat-state",{"can_disable":true}],["connection-rate",{"can_disable":true}],["connection-state",{"can'
+        '_disable":true}],["connection-type",{"can_disable":true}],["content",{"can_disable":true}],["disabled",{"default":false}],["dscp",{"can_disa'
+        'ble":true}],["dst-address",{"can_disable":true}],["dst-address-list",{"can_disable":true}],["dst-address-type",{"can_disable":true}],["dst-l'
+        'imit",{"can_disable":true}],["dst-port",{"can_disable":true}],["fragment",{"can_disable":true}],["hotspot",{"can_disable":true}],["hw-offloa'
+        'd",{"can_disable":true}],["icmp-options",{"can_disable":true}],["in-bridge-port",{"can_disable":true}],["in-bridge-port-list",{"can_disable"'
+        ':true}],["in-interface",{"can_disable":true}],["in-interface-list",{"can_disable":true}],["ingress-priority",{"can_disable":true}],["ipsec-p'
+        'olicy",{"can_disable":true}],["ipv4-options",{"can_disable":true}],["jump-target",{"can_disable":true}],["layer7-protocol",{"can_disable":tr'
+        'ue}],["limit",{"can_disable":true}],["log",{"default":false}],["log-prefix",{"default":""}],["nth",{"can_disable":true}],["out-bridge-port",'
+        '{"can_disable":true}],["out-bridge-port-list",{"can_disable":true}],["out-interface",{"can_disable":true}],["out-interface-list",{"can_disab'
+        'le":true}],["p2p",{"can_disable":true}],["packet-mark",{"can_disable":true}],["packet-size",{"can_disable":true}],["per-connection-classifie'
+        'r",{"can_disable":true}],["port",{"can_disable":true}],["priority",{"can_disable":true}],["protocol",{"can_disable":true}],["psd",{"can_disa'
+        'ble":true}],["random",{"can_disable":true}],["realm",{"can_disable":true}],["reject-with",{"can_disable":true}],["routing-mark",{"can_disabl'
+        'e":true}],["src-address",{"can_disable":true}],["src-address-list",{"can_disable":true}],["src-address-type",{"can_disable":true}],["src-mac'
+        '-address",{"can_disable":true}],["src-port",{"can_disable":true}],["tcp-flags",{"can_disable":true}],["tcp-mss",{"can_disable":true}],["time'
+        '",{"can_disable":true}],["tls-host",{"can_disable":true}],["ttl",{"can_disable":true}]],"fully_understood":true,"stratify_keys":["chain"],"s'
+        'upports_place_before":true,"versioned_fields":[[[["7.15",">="]],"numbers",{"read_only":true}],[[["7.15","<"]],"routing-table",{"can_disable"'
+        ':true}],[[["7.21",">="]],"tos",{}]]}}{"snapshots":[[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0]],"unversioned":{"fields":[["comment",{"c'
+        'an_disable":true,"remove_value":""}],["name",{}],["regexp",{}]],"fully_understood":true,"primary_keys":["name"],"versioned_fields":[[[["7.15'
+        '",">="]],"numbers",{"read_only":true}]]}}{"snapshots":[[-1,0,1],[-1,0,1],[-1,0,1],[-1,0,1],[-1,0,2,4],[-1,0,2,4],[-1,0,2,4]],"unversioned":{'
+        '"fields":[["action",{}],["address-list",{"can_disable":true}],["address-list-timeout",{"can_disable":true}],["chain",{}],["comment",{"can_di'
+        'sable":true,"remove_value":""}],["connection-bytes",{"can_disable":true}],["connection-limit",{"can_disable":true}],["connection-mark",{"can'
+        '_disable":true}],["connection-nat-state",{"can_disable":true}],["connection-rate",{"can_disable":true}],["connection-state",{"can_disable":t'
+        'rue}],["connection-type",{"can_disable":true}],["content",{"can_disable":true}],["disabled",{"default":false}],["dscp",{"can_disable":true}]'
+        ',["dst-address",{"can_disable":true}],["dst-address-list",{"can_disable":true}],["dst-address-type",{"can_disable":true}],["dst-limit",{"can'
+        '_disable":true}],["dst-port",{"can_disable":true}],["fragment",{"can_disable":true}],["hotspot",{"can_disable":true}],["icmp-options",{"can_'
+        'disable":true}],["in-bridge-port",{"can_disable":true}],["in-bridge-port-list",{"can_disable":true}],["in-interface",{"can_disable":true}],['
+        '"in-interface-list",{"can_disable":true}],["ingress-priority",{"can_disable":true}],["ipsec-policy",{"can_disable":true}],["ipv4-options",{"'
+        'can_disable":true}],["jump-target",{"can_disable":true}],["layer7-protocol",{"can_disable":true}],["limit",{"can_disable":true}],["log",{"de'
+        'fault":false}],["log-prefix",{"default":""}],["new-connection-mark",{"can_disable":true}],["new-dscp",{"can_disable":true}],["new-mss",{"can'
+        '_disable":true}],["new-packet-mark",{"can_disable":true}],["new-priority",{"can_disable":true}],["new-routing-mark",{"can_disable":true}],["'
+        'new-ttl",{"can_disable":true}],["nth",{"can_disable":true}],["out-bridge-port",{"can_disable":true}],["out-bridge-port-list",{"can_disable":'
+        'true}],["out-interface",{"can_disable":true}],["out-interface-list",{"can_disable":true}],["p2p",{"can_disable":true}],["packet-mark",{"can_'
+        'disable":true}],["packet-size",{"can_disable":true}],["per-connection-classifier",{"can_disable":true}],["port",{"can_disable":true}],["prio'
+        'rity",{"can_disable":true}],["protocol",{"can_disable":true}],["psd",{"can_disable":true}],["random",{"can_disable":true}],["realm",{"can_di'
+        'sable":true}],["route-dst",{"can_disable":true}],["routing-mark",{"can_disable":true}],["sniff-id",{"can_disable":true}],["sniff-target",{"c'
+        'an_disable":true}],["sniff-target-port",{"can_disable":true}],["src-address",{"can_disable":true}],["src-address-list",{"can_disable":true}]'
+        ',["src-address-type",{"can_disable":true}],["src-mac-address",{"can_disable":true}],["src-port",{"can_disable":true}],["tcp-flags",{"can_dis'
+        'able":true}],["tcp-mss",{"can_disable":true}],["time",{"can_disable":true}],["tls-host",{"can_disable":true}],["ttl",{"can_disable":true}]],'
+        '"fully_understood":true,"stratify_keys":["chain"],"supports_place_before":true,"versioned_fields":[[[["7.15",">="]],"numbers",{"read_only":t'
+        'rue}],[[["7.19","<"]],"passthrough",{"can_disable":true}],[[["7.19",">="]],"passthrough",{"default":true}],[[["7.15","<"]],"routing-table",{'
+        '"can_disable":true}],[[["7.21",">="]],"tos",{}]]}}{"snapshots":[[-1,0,4],[-1,0,4],[-1,0,4],[-1,0],[-1,0,1,2,3,5],[-1,0,1,2,3,5],[-1,0,1,2,3,'
+        '5]],"unversioned":{"fields":[["action",{}],["address-list",{"can_disable":true}],["address-list-timeout",{"can_disable":true}],["chain",{}],'
+        '["comment",{"can_disable":true,"remove_value":""}],["connection-bytes",{"can_disable":true}],["connection-limit",{"can_disable":true}],["con'
+        'nection-mark",{"can_disable":true}],["connection-rate",{"can_disable":true}],["connection-type",{"can_disable":true}],["content",{"can_disab'
+        'le":true}],["disabled",{"default":false}],["dscp",{"can_disable":true}],["dst-address",{"can_disable":true}],["dst-address-list",{"can_disab'
+        'le":true}],["dst-address-type",{"can_disable":true}],["dst-limit",{"can_disable":true}],["dst-port",{"can_disable":true}],["fragment",{"can_'
+        'disable":true}],["hotspot",{"can_disable":true}],["icmp-options",{"can_disable":true}],["in-bridge-port",{"can_disable":true}],["in-bridge-p'
+        'ort-list",{"can_disable":true}],["in-interface",{"can_disable":true}],["in-interface-list",{"can_disable":true}],["ingress-priority",{"can_d'
+        'isable":true}],["ipsec-policy",{"can_disable":true}],["ipv4-options",{"can_disable":true}],["jump-target",{"can_disable":true}],["layer7-pro'
+        'tocol",{"can_disable":true}],["limit",{"can_disable":true}],["log",{"default":false}],["log-prefix",{"default":""}],["nth",{"can_disable":tr'
+        'ue}],["out-bridge-port",{"can_disable":true}],["out-bridge-port-list",{"can_disable":true}],["out-interface",{"can_disable":true}],["out-int'
+        'erface-list",{"can_disable":true}],["packet-mark",{"can_disable":true}],["packet-size",{"can_disable":true}],["per-connection-classifier",{"'
+        'can_disable":true}],["port",{"can_disable":true}],["priority",{"can_disable":true}],["protocol",{"can_disable":true}],["psd",{"can_disable":'
+        'true}],["random",{"can_disable":true}],["randomise-ports",{"can_disable":true}],["realm",{"can_disable":true}],["routing-mark",{"can_disable'
+        '":true}],["same-not-by-dst",{"can_disable":true}],["src-address",{"can_disable":true}],["src-address-list",{"can_disable":true}],["src-addre'
+        'ss-type",{"can_disable":true}],["src-mac-address",{"can_disable":true}],["src-port",{"can_disable":true}],["tcp-mss",{"can_disable":true}],['
+        '"time",{"can_disable":true}],["to-addresses",{"can_disable":true}],["to-ports",{"can_disable":true}],["ttl",{"can_disable":true}]],"fully_un'
+        'derstood":true,"stratify_keys":["chain"],"supports_place_before":true,"versioned_fields":[[[["7.15",">="]],"numbers",{"read_only":true}],[[['
+        '"7.20",">="]],"socks5-port",{}],[[["7.20",">="]],"socks5-server",{}],[[["7.20",">="]],"socksify-service",{}],[[["7.16","<"]],"tls-host",{"ca'
+        'n_disable":true}],[[["7.21",">="]],"tos",{}]]}}{"snapshots":[[-1,0],[-1,0],[-1,0],[-1,0],[-1,0,1],[-1,0,1],[-1,0,1]],"unversioned":{"fields"'
+        ':[["action",{}],["address-list",{"can_disable":true}],["address-list-timeout",{"can_disable":true}],["chain",{}],["comment",{"can_disable":t'
+        'rue,"remove_value":""}],["content",{"can_disable":true}],["disabled",{"default":false}],["dscp",{"can_disable":true}],["dst-address",{"can_d'
+        'isable":true}],["dst-address-list",{"can_disable":true}],["dst-address-type",{"can_disable":true}],["dst-limit",{"can_disable":true}],["dst-'
+        'port",{"can_disable":true}],["fragment",{"can_disable":true}],["hotspot",{"can_disable":true}],["icmp-options",{"can_disable":true}],["in-br'
+        'idge-port",{"can_disable":true}],["in-bridge-port-list",{"can_disable":true}],["in-interface",{"can_disable":true}],["in-interface-list",{"c'
+        'an_disable":true}],["ingress-priority",{"can_disable":true}],["ipsec-policy",{"can_disable":true}],["ipv4-options",{"can_disable":true}],["j'
+        'ump-target",{"can_disable":true}],["limit",{"can_disable":true}],["log",{"default":false}],["log-prefix",{"default":""}],["nth",{"can_disabl'
+        'e":true}],["out-bridge-port",{"can_disable":true}],["out-bridge-port-list",{"can_disable":true}],["out-interface",{"can_disable":true}],["ou'
+        't-interface-list",{"can_disable":true}],["packet-mark",{"can_disable":true}],["packet-size",{"can_disable":true}],["per-connection-classifie'
+        'r",{"can_disable":true}],["port",{"can_disable":true}],["priority",{"can_disable":true}],["protocol",{"can_disable":true}],["psd",{"can_disa'
+        'ble":true}],["random",{"can_disable":true}],["src-address",{"can_disable":true}],["src-address-list",{"can_disable":true}],["src-address-typ'
+        'e",{"can_disable":true}],["src-mac-address",{"can_disable":true}],["src-port",{"can_disable":true}],["tcp-flags",{"can_disable":true}],["tcp'
+        '-mss",{"can_disable":true}],["time",{"can_disable":true}],["tls-host",{"can_disable":true}],["ttl",{"can_disable":true}]],"fully_understood"'
+        ':true,"stratify_keys":["chain"],"supports_place_before":true,"versioned_fields":[[[["7.15",">="]],"numbers",{"read_only":true}],[[["7.21",">'
+        '="]],"tos",{}]]}}{"snapshots":[[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0]],"unversioned":{"fields":[["disabled",{"default":false}],["n'
+        'ame",{}],["ports",{}],["sip-direct-media",{}],["sip-timeout",{}]],"fixed_entries":true,"fully_understood":true,"primary_keys":["name"],"vers'
+        'ioned_fields":[[[["7.15",">="]],"numbers",{}]]}}{"snapshots":[[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0]],"unversioned":{"fields":[["a'
+        'ddress-pool",{"default":"none"}],["addresses-per-mac",{"default":"2"}],["disabled",{"default":false}],["idle-timeout",{"default":"5m"}],["in'
+        'terface",{"required":true}],["keepalive-timeout",{"default":"none"}],["login-timeout",{"default":"none"}],["name",{}],["profile",{"default":'
+        '"default"}]],"fully_understood":true,"primary_keys":["name","interface"],"versioned_fields":[[[["7.15",">="]],"numbers",{"read_only":true}]]'
+        '}}{"snapshots":[[1],[1],[1],[1],null,null,null],"versioned":[["7.21",">=","Not supported anymore in version 7.21"],["7.15",">=",{"fields":[['
+        '"comment",{}]],"fully_understood":true,"modify_not_supported":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{'
+        '"fields":[["address",{}],["comment",{}],["disabled",{}],["mac-address",{}],["numbers",{"read_only":true}],["server",{}],["to-address",{}],["'
+        'type",{}]],"fully_understood":true}]]}{"snapshots":[[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0]],"unversioned":{"fields":[["dns-name",{'
+        '"default":""}],["hotspot-address",{"default":"0.0.0.0"}],["html-directory",{"default":"flash/hotspot"}],["html-directory-override",{"default'
+        '":""}],["http-cookie-lifetime",{"default":"3d"}],["http-proxy",{"default":"0.0.0.0:0"}],["install-hotspot-queue",{"default":false}],["login-'
+        'by",{"default":"cookie,http-chap"}],["mac-auth-mode",{"default":"mac-as-username"}],["mac-auth-password",{}],["name",{}],["nas-port-type",{"'
+        'default":"wireless-802.11"}],["radius-accounting",{"default":true}],["radius-default-domain",{"default":""}],["radius-interim-update",{"defa'
+        'ult":"received"}],["radius-location-id",{"default":""}],["radius-location-name",{"default":""}],["radius-mac-format",{"default":"XX:XX:XX:XX'
+        ':XX:XX"}],["rate-limit",{}],["smtp-server",{"default":"0.0.0.0"}],["split-user-domain",{"default":false}],["ssl-certificate",{}],["trial-upt'
+        'ime-limit",{"default":"30m"}],["trial-uptime-reset",{"default":"1d"}],["trial-user-profile",{"default":"default"}],["use-radius",{"default":'
+        'false}]],"fully_understood":true,"primary_keys":["name"],"versioned_fields":[[[["7.15",">="]],"numbers",{"read_only":true}]]}}{"snapshots":['
+        '[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0]],"unversioned":{"fields":[["disabled",{"default":false}],["name",{}],["ports",{}]],"fixed_e'
+        'ntries":true,"fully_understood":true,"primary_keys":["name"],"versioned_fields":[[[["7.15",">="]],"numbers",{}]]}}{"snapshots":[[-1,0],[-1,0'
+        '],[-1,0],[-1,0],[-1,0,2],[-1,0,2],[-1,0,1,2]],"unversioned":{"fields":[["address",{}],["comment",{"can_disable":true,"remove_value":""}],["d'
+        'isabled",{"default":false}],["email",{}],["limit-bytes-in",{}],["limit-bytes-out",{}],["limit-bytes-total",{}],["limit-uptime",{}],["mac-add'
+        'ress",{}],["name",{}],["password",{}],["profile",{"default":"default"}],["routes",{}],["server",{"default":"all"}]],"fully_understood":true,'
+        '"primary_keys":["name"],"versioned_fields":[[[["7.15",">="]],"numbers",{"read_only":true}],[[["7.21.3",">="]],"otp-secret",{}],[[["7.21",">='
+        '"]],"totp-secret",{}]]}}{"snapshots":[[-1,0,1,2],[-1,0,1,2],[-1,0,1,2],[-1,0,1,2],[-1,0,1,2],[-1,0,1,2],[-1,0,1,2]],"unversioned":{"fields":'
+        '[["add-mac-cookie",{"default":true}],["address-list",{"default":""}],["address-pool",{"default":"none"}],["advertise",{"default":false}],["a'
+        'dvertise-interval",{}],["advertise-timeout",{}],["advertise-url",{}],["idle-timeout",{"can_disable":true,"default":"none"}],["incoming-filte'
+        'r",{}],["incoming-packet-mark",{}],["insert-queue-before",{"can_disable":true}],["keepalive-timeout",{"can_disable":true,"default":"2m"}],["'
+        'mac-cookie-timeout",{"can_disable":true,"default":"3d"}],["name",{}],["open-status-page",{"default":"always"}],["outgoing-filter",{}],["outg'
+        'oing-packet-mark",{}],["parent-queue",{"can_disable":true}],["queue-type",{"can_disable":true}],["rate-limit",{}],["session-timeout",{}],["s'
+        'hared-users",{"default":1}],["status-autorefresh",{"default":"1m"}],["transparent-proxy",{"default":false}]],"fully_understood":true,"primar'
+        'y_keys":["name"],"versioned_fields":[[[["7.15",">="]],"numbers",{"read_only":true}],[[["7.15",">="]],"on-login",{}],[[["7.15",">="]],"on-log'
+        'out",{}]]}}{"snapshots":[[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0]],"unversioned":{"fields":[["action",{"default":"allow"}],["comment'
+        '",{"can_disable":true,"remove_value":""}],["disabled",{"default":false}],["dst-host",{"can_disable":true}],["dst-port",{"can_disable":true}]'
+        ',["method",{"can_disable":true}],["path",{"can_disable":true}],["server",{"can_disable":true}],["src-address",{"can_disable":true}]],"fully_'
+        'understood":true,"versioned_fields":[[[["7.15",">="]],"numbers",{"read_only":true}]]}}{"snapshots":[[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0'
+        '],[-1,0]],"unversioned":{"fields":[["action",{"default":"accept"}],["comment",{"can_disable":true,"remove_value":""}],["disabled",{"default"'
+        ':"no"}],["dst-address",{"can_disable":true,"remove_value":""}],["dst-address-list",{"can_disable":true,"remove_value":""}],["dst-host",{}],['
+        '"dst-port",{"can_disable":true}],["protocol",{"can_disable":true}],["server",{"can_disable":true}],["src-address",{"can_disable":true}],["sr'
+        'c-address-list",{"can_disable":true}]],"fully_understood":true,"versioned_fields":[[[["7.15",">="]],"numbers",{"read_only":true}]]}}{"snapsh'
+        'ots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["comment",{}],["numbers",{"read_only":true}]],"fully_understood":tr'
+        'ue,"modify_not_supported":true}]]}{"snapshots":[[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0]],"unversioned":{"fields":[["auth-method",{"'
+        'default":"pre-shared-key"}],["certificate",{}],["comment",{"can_disable":true,"remove_value":""}],["disabled",{"default":false}],["eap-metho'
+        'ds",{"default":"eap-tls"}],["generate-policy",{"default":false}],["key",{}],["match-by",{"can_disable":true,"remove_value":"remote-id"}],["m'
+        'ode-config",{"can_disable":true,"remove_value":"none"}],["my-id",{"can_disable":true,"remove_value":"auto"}],["notrack-chain",{"can_disable"'
+        ':true,"remove_value":""}],["password",{}],["peer",{}],["policy-template-group",{"can_disable":true,"remove_value":"default"}],["remote-certi'
+        'ficate",{}],["remote-id",{"can_disable":true,"remove_value":"auto"}],["remote-key",{}],["secret",{"default":""}],["username",{}]],"fully_und'
+        'erstood":true,"versioned_fields":[[[["7.15",">="]],"numbers",{"read_only":true}]]}}{"snapshots":[[1],[1],[1],[1],null,null,null],"versioned"'
+        ':[["7.20",">=","Not supported anymore in version  >= 7.20"],["7.15",">=",{"fields":[["name",{}],["numbers",{"depr":{"context":"write","msg":'
+        '"The numbers field will be read-only from community.routeros 4.0.0 on.","version":"4.0.0"}}]],"fully_understood":true,"has_identifier":true}'
+        ']]}{"snapshots":[null,null,null,null,[0],[0],[0]],"versioned":[["7.21",">=",{"fields":[["id",{}],["key",{}],["peer",{}]],"fully_understood":'
+        'true}]]}{"snapshots":[null,null,null,null,[0],[0],[0]],"versioned":[["7.21",">=",{"fields":[["address",{}],["cache-size",{}],["certificate",'
+        '{}],["enabled",{}],["key-size",{}],["kme-id",{}],["peer-sae-id",{}]],"fully_understood":true,"single_value":true}]]}{"snapshots":[null,null,'
+        'null,null,[0],[0],[0]],"versioned":[["7.20",">=",{"fields":[["name",{}],["numbers",{"depr":{"context":"write","msg":"The numbers field will '
+        'be read-only from community.routeros 4.0.0 on.","version":"4.0.0"}}]],"fixed_entries":true,"fully_understood":true,"primary_keys":["numbers"'
+        ']}]]}{"snapshots":[[-1,0,2,3,4,5],[-1,0,2,3,4,5],[-1,0,2,3,4,5],[-1,0,2,3,4,5],[-1,0,2,3,4,5],[-1,0,2,3,4,5],[-1,0,2,3,4,5]],"unversioned":{'
+        '"fields":[["address-pool",{"can_disable":true,"remove_value":"none"}],["address-prefix-length",{}],["name",{}],["split-dns",{"can_disable":t'
+        'rue,"remove_value":""}],["split-include",{"can_disable":true,"remove_value":""}],["src-address-list",{"can_disable":true,"remove_value":""}]'
+        ',["static-dns",{"can_disable":true,"remove_value":""}],["system-dns",{"default":false}]],"fully_understood":true,"primary_keys":["name"],"ve'
+        'rsioned_fields":[[[["6.44",">="]],"address",{"can_disable":true,"remove_value":"0.0.0.0"}],[[["7.15","<"]],"comment",{"can_disable":true,"re'
+        'move_value":""}],[[["7.15",">="]],"connection-mark",{}],[[["7.15",">="]],"numbers",{"read_only":true}],[[["6.43",">="]],"responder",{"defaul'
+        't":false}],[[["7.15",">="]],"use-responder-dns",{}]]}}{"snapshots":[[-1,0],[-1,0],[-1,0],[-1,0],[-1,0,1],[-1,0,1],[-1,0,1]],"unversioned":{"'
+        'fields":[["address",{"can_disable":true,"remove_value":""}],["comment",{"can_disable":true,"remove_value":""}],["disabled",{"default":false}'
+        '],["exchange-mode",{"default":"main"}],["local-address",{"can_disable":true,"remove_value":"0.0.0.0"}],["name",{}],["passive",{"can_disable"'
+        ':true,"remove_value":false}],["port",{"can_disable":true,"remove_value":500}],["profile",{"default":"default"}],["send-initial-contact",{"de'
+        'fault":true}]],"fully_understood":true,"primary_keys":["name"],"versioned_fields":[[[["7.15",">="]],"numbers",{"read_only":true}],[[["7.21",'
+        '">="]],"ppk-secret",{}]]}}{"snapshots":[[-1,0,1,2],[-1,0,1,2],[-1,0,1,2],[-1,0,1,2],[-1,0,1,2],[-1,0,1,2],[-1,0,1,2]],"unversioned":{"fields'
+        '":[["action",{"default":"encrypt"}],["comment",{"can_disable":true,"remove_value":""}],["disabled",{"default":false}],["dst-address",{}],["d'
+        'st-port",{"default":"any"}],["group",{"can_disable":true,"remove_value":"default"}],["ipsec-protocols",{"default":"esp"}],["level",{"default'
+        '":"require"}],["peer",{}],["proposal",{"default":"default"}],["protocol",{"default":"all"}],["src-address",{}],["src-port",{"default":"any"}'
+        '],["template",{"can_disable":true,"remove_value":false}],["tunnel",{"default":false}]],"fully_understood":true,"versioned_fields":[[[["7.15"'
+        ',">="]],"numbers",{"read_only":true}],[[["7.15",">="]],"sa-dst-address",{}],[[["7.15",">="]],"sa-src-address",{}]]}}{"snapshots":[[-1,0,2],['
+        '-1,0,2],[-1,0,2],[-1,0,2],[-1,0,2],[-1,0,2],[-1,0,2]],"unversioned":{"fields":[["name",{}]],"fully_understood":true,"versioned_fields":[[[["'
+        '7.15",">="]],"comment",{}],[[["7.15","<"]],"default",{}],[[["7.15",">="]],"numbers",{"read_only":true}]]}}{"snapshots":[[-1,0],[-1,0],[-1,0]'
+        ',[-1,0],[-1,0,1],[-1,0,1],[-1,0,1]],"unversioned":{"fields":[["dh-group",{"default":"modp2048,modp1024"}],["dpd-interval",{"default":"2m"}],'
+        '["dpd-maximum-failures",{"default":5}],["enc-algorithm",{"default":"aes-128,3des"}],["hash-algorithm",{"default":"sha1"}],["lifebytes",{"can'
+        '_disable":true,"remove_value":0}],["lifetime",{"default":"1d"}],["name",{}],["nat-traversal",{"default":true}],["prf-algorithm",{"can_disabl'
+        'e":true,"remove_value":"auto"}],["proposal-check",{"default":"obey"}]],"fully_understood":true,"primary_keys":["name"],"versioned_fields":[['
+        '[["7.15",">="]],"numbers",{"read_only":true}],[[["7.21",">="]],"ppk",{}]]}}{"snapshots":[[-1,0,1],[-1,0,1],[-1,0,1],[-1,0,1],[-1,0,1],[-1,0,'
+        '1],[-1,0,1]],"unversioned":{"fields":[["auth-algorithms",{"default":"sha1"}],["disabled",{"default":false}],["enc-algorithms",{"default":"ae'
+        's-256-cbc,aes-192-cbc,aes-128-cbc"}],["lifetime",{"default":"30m"}],["name",{}],["pfs-group",{"default":"modp1024"}]],"fully_understood":tru'
+        'e,"primary_keys":["name"],"versioned_fields":[[[["7.15",">="]],"comment",{}],[[["7.15",">="]],"numbers",{"read_only":true}]]}}{"snapshots":['
+        '[-1],[-1],[-1],[-1],[-1],[-1],[-1]],"unversioned":{"fields":[["accounting",{"default":true}],["interim-update",{"default":"0s"}],["xauth-use'
+        '-radius",{"default":false}]],"fully_understood":true,"single_value":true,"versioned_fields":[[[["7.22",">="]],"ddos-cookie-threshold",{}]]}}'
+        '{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["disabled",{}],["fri",{}],["mon",{}],["name",{}],["numbers"'
+        ',{"read_only":true}],["rate-limit",{}],["sat",{}],["sun",{}],["thu",{}],["tue",{}],["tur-fri",{}],["tur-mon",{}],["tur-sat",{}],["tur-sun",{'
+        '}],["tur-thu",{}],["tur-tue",{}],["tur-wed",{}],["wed",{}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned'
+        '":[["7.15",">=",{"fields":[["disabled",{}],["mac-address",{}],["name",{}],["numbers",{"read_only":true}],["user",{}]],"fully_understood":tru'
+        'e}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["allowed-hostname",{}],["allowed-ip",{}],["disabled",{'
+        '}],["friendly-name",{}],["interface",{}],["numbers",{"read_only":true}],["path",{}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0'
+        '],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["thumbnails",{}]],"fully_understood":true,"single_value":true}]]}{"snapshots":[[0],[0],'
+        '[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["enabled",{}]],"fully_understood":true,"single_value":true}]]}{"snapshots":[[0],['
+        '0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["disabled",{}],["forced-ip",{}],["interface",{}],["numbers",{"read_only":true}'
+        '],["type",{}]],"fully_understood":true}]]}{"snapshots":[[-1,2,3,4,6],[-1,2,3,4,6],[-1,2,3,4,6],[-1,0,1,2,3,4,5,6],[-1,0,1,2,3,4,5,6],[-1,0,1'
+        ',2,3,4,5,6],[-1,0,1,2,3,4,5,6]],"unversioned":{"fields":[["discover-interface-list",{}],["lldp-med-net-policy-vlan",{"default":"disabled"}],'
+        '["protocol",{"default":"cdp,lldp,mndp"}]],"fully_understood":true,"single_value":true,"versioned_fields":[[[["7.16",">="]],"discover-interva'
+        'l",{"default":"30s"}],[[["7.17",">="]],"lldp-dcbx",{"default":false}],[[["7.15",">="]],"lldp-mac-phy-config",{"default":false}],[[["7.15",">'
+        '="]],"lldp-max-frame-size",{}],[[["7.15",">="]],"lldp-poe-power",{}],[[["7.16",">="]],"lldp-vlan-info",{"default":false}],[[["7.7",">="]],"m'
+        'ode",{"default":"tx-and-rx"}]]}}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["aggregated-size",{}],["dis'
+        'abled",{}],["interface",{}],["numbers",{"read_only":true}],["packing",{}],["unpacking",{}]],"fully_understood":true}]]}{"snapshots":[[-1,0],'
+        '[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0]],"unversioned":{"fields":[["comment",{}],["name",{}],["next-pool",{}],["ranges",{}]],"fully_unders'
+        'tood":true,"primary_keys":["name"],"versioned_fields":[[[["7.15",">="]],"numbers",{"read_only":true}]]}}{"snapshots":[[0],[0],[0],[0],[0],[0'
+        '],[0]],"versioned":[["7.15",">=",{"fields":[["address",{}],["info",{}],["numbers",{"depr":{"context":"write","msg":"The numbers field will b'
+        'e read-only from community.routeros 4.0.0 on.","version":"4.0.0"}}],["owner",{}],["pool",{}]],"fully_understood":true,"has_identifier":true}'
+        ']]}{"unversioned":{"fields":[["always-from-cache",{"default":false}],["anonymous",{"default":false}],["cache-administrator",{"default":"webm'
+        'aster"}],["cache-hit-dscp",{"default":4}],["cache-on-disk",{"default":false}],["cache-path",{"default":"web-proxy"}],["enabled",{"default":f'
+        'alse}],["max-cache-object-size",{"default":"2048KiB"}],["max-cache-size",{"default":"unlimited"}],["max-client-connections",{"default":600}]'
+        ',["max-fresh-time",{"default":"3d"}],["max-server-connections",{"default":600}],["parent-proxy",{"default":"::"}],["parent-proxy-port",{"def'
+        'ault":0}],["port",{"default":8080}],["serialize-connections",{"default":false}],["src-address",{"default":"::"}]],"fully_understood":true,"s'
+        'ingle_value":true}}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["action",{}],["action-data",{}],["commen'
+        't",{}],["disabled",{}],["dst-address",{}],["dst-host",{}],["dst-port",{}],["local-port",{}],["method",{}],["numbers",{"read_only":true}],["p'
+        'ath",{}],["src-address",{}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["ac'
+        'tion",{}],["comment",{}],["disabled",{}],["dst-address",{}],["dst-host",{}],["dst-port",{}],["local-port",{}],["method",{}],["numbers",{"rea'
+        'd_only":true}],["path",{}],["src-address",{}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">'
+        '=",{"fields":[],"fully_understood":true,"modify_not_supported":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",'
+        '{"fields":[["comment",{}],["numbers",{"depr":{"context":"write","msg":"The numbers field will be read-only from community.routeros 4.0.0 on.'
+        '","version":"4.0.0"}}]],"fully_understood":true,"has_identifier":true,"modify_not_supported":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],['
+        '0]],"versioned":[["7.15",">=",{"fields":[["action",{}],["comment",{}],["disabled",{}],["dst-address",{}],["dst-host",{}],["dst-port",{}],["l'
+        'ocal-port",{}],["method",{}],["numbers",{"read_only":true}],["path",{}],["src-address",{}]],"fully_understood":true}]]}{"snapshots":[null,nu'
+        'll,null,null,null,null,null],"versioned":[["7.22",">=",{"fields":[["certificate",{}],["comment",{}],["disabled",{}],["ip-address",{}],["numb'
+        'ers",{"read_only":true}],["port",{}],["sni",{}]],"fully_understood":true}]]}{"snapshots":[[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0]],'
+        '"unversioned":{"fields":[["blackhole",{"can_disable":true}],["check-gateway",{"can_disable":true}],["comment",{"can_disable":true,"remove_va'
+        'lue":""}],["disabled",{"default":false}],["distance",{}],["dst-address",{}],["gateway",{}],["pref-src",{}],["routing-table",{"default":"main'
+        '"}],["scope",{}],["suppress-hw-offload",{"default":false}],["target-scope",{}],["vrf-interface",{"can_disable":true}]],"fully_understood":tr'
+        'ue,"versioned_fields":[[[["7.15",">="]],"numbers",{"read_only":true}],[[["7.15","<"]],"route-tag",{"can_disable":true}],[[["7.15","<"]],"rou'
+        'ting-mark",{"can_disable":true}],[[["7.15","<"]],"type",{"can_disable":true,"remove_value":"unicast"}]]}}{"snapshots":[null,null,null,null,n'
+        'ull,null,null],"versioned":[["7",">=","Not supported anymore in version  >= 7"],["7","<",{"fields":[["action",{"default":"lookup"}],["commen'
+        't",{"can_disable":true,"remove_value":""}],["disabled",{"default":false}],["dst-address",{"can_disable":true}],["interface",{"can_disable":t'
+        'rue}],["routing-mark",{"can_disable":true}],["src-address",{"can_disable":true}],["table",{"default":"main"}]],"fully_understood":true}]]}{"'
+        'snapshots":[null,null,null,null,null,null,null],"versioned":[["7",">=","Not supported anymore in version  >= 7"],["7","<",{"fields":[["comme'
+        'nt",{"can_disable":true,"remove_value":""}],["disabled",{"default":false}],["interfaces",{}],["routing-mark",{}]],"fully_understood":true,"p'
+        'rimary_keys":["routing-mark"]}]]}{"snapshots":[[-1,1,2],[-1,1,2],[-1,1,2],[-1,0,1,2],[-1,0,1,2],[-1,0,1,2],[-1,0,1,2]],"unversioned":{"field'
+        's":[["address",{}],["certificate",{}],["disabled",{"default":false}],["name",{}],["port",{}],["tls-version",{}]],"fixed_entries":true,"fully'
+        '_understood":true,"primary_keys":["name"],"versioned_fields":[[[["7.16",">="]],"max-sessions",{"default":20}],[[["7.15",">="]],"numbers",{}]'
+        ',[[["7.15",">="]],"vrf",{}]]}}{"snapshots":[null,null,null,null,[0],[0],[0]],"versioned":[["7.21",">=",{"fields":[["acme-plain",{}],["crl-pl'
+        'ain",{}],["graphs-plain",{}],["graphs-secure",{}],["index-plain",{}],["index-secure",{}],["rest-plain",{}],["rest-secure",{}],["scep-plain",'
+        '{}],["webfig-plain",{}],["webfig-secure",{}]],"fully_understood":true,"single_value":true}]]}{"snapshots":[[-1],[-1],[-1],[-1,0,1,3],[-1,0,1'
+        ',3],[-1,0,1,3],[-1,0,1,3]],"unversioned":{"fields":[["accept-redirects",{"default":false}],["accept-source-route",{"default":false}],["allow'
+        '-fast-path",{"default":true}],["arp-timeout",{"default":"30s"}],["icmp-rate-limit",{"default":10}],["icmp-rate-mask",{"default":"0x1818"}],['
+        '"ip-forward",{"default":true}],["max-neighbor-entries",{"default":8192}],["rp-filter",{"default":false}],["secure-redirects",{"default":true'
+        '}],["send-redirects",{"default":true}],["tcp-syncookies",{"default":false}]],"fully_understood":true,"single_value":true,"versioned_fields":'
+        '[[[["7.17",">="]],"icmp-errors-use-inbound-interface-address",{}],[[["7.16",">="]],"ipv4-multipath-hash-policy",{"default":"l3"}],[[["7.15",'
+        '"<"]],"route-cache",{"default":true}],[[["7.17",">="]],"tcp-timestamps",{}]]}}{"snapshots":[[-1],[-1],[-1],[-1],[-1],[-1],[-1]],"unversioned'
+        '":{"fields":[["comment",{"default":"MikrotikSMB"}],["domain",{"default":"MSHOME"}],["enabled",{"default":false}],["interfaces",{"default":"a'
+        'll"}]],"fully_understood":true,"single_value":true,"versioned_fields":[[[["7.15","<"]],"allow-guests",{"default":true}]]}}{"snapshots":[[-1,'
+        '1,3,4,5,6],[-1,1,3,4,5,6],[-1,1,3,4,5,6],[-1,1,3,4,5,6],[-1,1,3,4,5,6],[-1,1,3,4,5,6],[-1,1,3,4,5,6]],"unversioned":{"fields":[["comment",{"'
+        'can_disable":true,"remove_value":""}],["directory",{}],["disabled",{}],["name",{}]],"fully_understood":true,"versioned_fields":[[[["7.15","<'
+        '"]],"default",{}],[[["7.15",">="]],"invalid-users",{}],[[["7.15","<"]],"max-sessions",{}],[[["7.15",">="]],"numbers",{"read_only":true}],[[['
+        '"7.15",">="]],"read-only",{}],[[["7.15",">="]],"require-encryption",{}],[[["7.15",">="]],"valid-users",{}]]}}{"snapshots":[[-1,0,2],[-1,0,2]'
+        ',[-1,0,2],[-1,0,2],[-1,0,2],[-1,0,2],[-1,0,2]],"unversioned":{"fields":[["disabled",{}],["name",{}],["password",{}],["read-only",{}]],"fully'
+        '_understood":true,"versioned_fields":[[[["7.15",">="]],"comment",{}],[[["7.15","<"]],"default",{}],[[["7.15",">="]],"numbers",{"read_only":t'
+        'rue}]]}}{"snapshots":[[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0]],"unversioned":{"fields":[["auth-method",{"default":"none"}],["connec'
+        'tion-idle-timeout",{"default":"2m"}],["enabled",{"default":false}],["max-connections",{"default":200}],["port",{"default":1080}],["version",'
+        '{"default":4}]],"fully_understood":true,"single_value":true,"versioned_fields":[[[["7.15",">="]],"vrf",{}]]}}{"snapshots":[[-1,0,1],[-1,0,1]'
+        ',[-1,0,1],[-1,0,1],[-1,0,1],[-1,0,1],[-1,0,1]],"unversioned":{"fields":[["action",{"default":"allow"}],["comment",{"can_disable":true,"remov'
+        'e_value":""}],["disabled",{"default":false}],["dst-address",{"can_disable":true}],["dst-port",{"can_disable":true}],["src-address",{"can_dis'
+        'able":true}]],"fully_understood":true,"versioned_fields":[[[["7.15",">="]],"numbers",{"read_only":true}],[[["7.15",">="]],"src-port",{"can_d'
+        'isable":true}]]}}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["dst-address",{"read_only":true}],["number'
+        's",{"depr":{"context":"write","msg":"The numbers field will be read-only from community.routeros 4.0.0 on.","version":"4.0.0"}}],["rx",{"rea'
+        'd_only":true}],["src-address",{"read_only":true}],["tx",{"read_only":true}],["type",{"read_only":true}]],"fully_understood":true,"has_identi'
+        'fier":true,"modify_not_supported":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["disabled",{"defa'
+        'ult":false}],["name",{"required":true}],["numbers",{"read_only":true}],["only-one",{"default":false}],["password",{"required":true}],["rate-'
+        'limit",{}]],"fully_understood":true}]]}{"snapshots":[null,null,null,null,[0],[0],[0]],"versioned":[["7.20",">=",{"fields":[["comment",{}],["'
+        'connection-timeout",{"default":60}],["disabled",{"default":true}],["name",{}],["numbers",{"read_only":true}],["port",{"default":952}],["sock'
+        's5-password",{}],["socks5-port",{"default":1080}],["socks5-server",{"default":"0.0.0.0"}],["socks5-user",{}]],"fully_understood":true}]]}{"s'
+        'napshots":[[-1,0,1,3],[-1,0,1,3],[-1,0,1,3],[-1,1,2,3],[-1,2,3,4,5],[-1,2,3,4,5],[-1,2,3,4,5]],"unversioned":{"fields":[["forwarding-enabled'
+        '",{"default":false}],["host-key-size",{"default":2048}],["strong-crypto",{"default":false}]],"fully_understood":true,"single_value":true,"ve'
+        'rsioned_fields":[[[["7.17","<"]],"allow-none-crypto",{"default":false}],[[["7.21","<"]],"always-allow-password-login",{"default":false}],[[['
+        '"7.17",">="]],"ciphers",{"default":"auto"}],[[["7.9",">="]],"host-key-type",{"default":"rsa"}],[[["7.21",">="]],"password-authentication",{}'
+        '],[[["7.21",">="]],"publickey-authentication-options",{}]]}}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":['
+        '["allow",{}],["allow-overwrite",{}],["allow-rollover",{}],["comment",{}],["disabled",{}],["ip-addresses",{}],["numbers",{"read_only":true}],'
+        '["read-only",{}],["reading-window-size",{}],["real-filename",{}],["req-filename",{}]],"fully_understood":true}]]}{"unversioned":{"fields":[['
+        '"max-block-size",{"default":4096}]],"fully_understood":true,"single_value":true}}{"unversioned":{"fields":[["active-flow-timeout",{"default"'
+        ':"30m"}],["cache-entries",{"default":"32k"}],["enabled",{"default":false}],["inactive-flow-timeout",{"default":"15s"}],["interfaces",{"defau'
+        'lt":"all"}],["packet-sampling",{"default":false}],["sampling-interval",{"default":0}],["sampling-space",{"default":0}]],"fully_understood":t'
+        'rue,"single_value":true}}{"unversioned":{"fields":[["bytes",{"default":true}],["dst-address",{"default":true}],["dst-address-mask",{"default'
+        '":true}],["dst-mac-address",{"default":true}],["dst-port",{"default":true}],["first-forwarded",{"default":true}],["gateway",{"default":true}'
+        '],["icmp-code",{"default":true}],["icmp-type",{"default":true}],["igmp-type",{"default":true}],["in-interface",{"default":true}],["ip-header'
+        '-length",{"default":true}],["ip-total-length",{"default":true}],["ipv6-flow-label",{"default":true}],["is-multicast",{"default":true}],["las'
+        't-forwarded",{"default":true}],["nat-dst-address",{"default":true}],["nat-dst-port",{"default":true}],["nat-events",{"default":false}],["nat'
+        '-src-address",{"default":true}],["nat-src-port",{"default":true}],["out-interface",{"default":true}],["packets",{"default":true}],["protocol'
+        '",{"default":true}],["src-address",{"default":true}],["src-address-mask",{"default":true}],["src-mac-address",{"default":true}],["src-port",'
+        '{"default":true}],["sys-init-time",{"default":true}],["tcp-ack-num",{"default":true}],["tcp-flags",{"default":true}],["tcp-seq-num",{"defaul'
+        't":true}],["tcp-window-size",{"default":true}],["tos",{"default":true}],["ttl",{"default":true}],["udp-length",{"default":true}]],"fully_und'
+        'erstood":true,"single_value":true}}{"snapshots":[[-1,1],[-1,1],[-1,1],[-1,1],[-1,1],[-1,1],[-1,1]],"unversioned":{"fields":[["disabled",{"de'
+        'fault":false}],["dst-address",{}],["port",{"default":2055}],["src-address",{}],["v9-template-refresh",{"default":20}],["v9-template-timeout"'
+        ',{}],["version",{}]],"fully_understood":true,"versioned_fields":[[[["7.15","<"]],"address",{}],[[["7.15",">="]],"numbers",{"read_only":true}'
+        ']]}}{"unversioned":{"fields":[["allow-disable-external-interface",{"default":false}],["enabled",{"default":false}],["show-dummy-rule",{"defa'
+        'ult":true}]],"fully_understood":true,"single_value":true}}{"snapshots":[[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0]],"unversioned":{"fi'
+        'elds":[["disabled",{"default":false}],["forced-ip",{"can_disable":true}],["interface",{}],["type",{}]],"fully_understood":true,"primary_keys'
+        '":["interface","type"],"versioned_fields":[[[["7.15",">="]],"numbers",{"read_only":true}]]}}{"snapshots":[[0,0],[0,0],[0,0],[0,0],[0,0],[0,0'
+        '],[0,0]],"versioned":[["7",">=",{"fields":[["comment",{"can_disable":true,"remove_value":""}],["disabled",{"default":false}],["interfaces",{'
+        '}],["name",{}]],"fully_understood":true,"primary_keys":["name"],"versioned_fields":[[[["7.15",">="]],"numbers",{"read_only":true}]]}]]}{"sna'
+        'pshots":[[-1,2],[-1,2],[-1,2],[-1,0,2],[-1,0,2],[-1,0,2],[-1,0,2]],"unversioned":{"fields":[["address",{"value_canonicalizer":"ip"}],["adver'
+        'tise",{"default":true}],["comment",{"can_disable":true,"remove_value":""}],["disabled",{"default":false}],["eui-64",{"default":false}],["fro'
+        'm-pool",{"default":""}],["interface",{"required":true}],["no-dad",{"default":false}]],"fully_understood":true,"versioned_fields":[[[["7.18",'
+        '">="]],"auto-link-local",{}],[[["7.23",">="]],"from-pool-policy",{"default":"recommended"}],[[["7.15",">="]],"numbers",{"read_only":true}]]}'
+        '}{"snapshots":[[-1,3,7,9,10,11,12],[-1,3,7,9,10,11,12],[-1,3,7,9,10,11,12],[-1,1,3,7,8,9,10,11,12],[-1,0,1,2,3,4,5,6,7,8,9,10,11,12],[-1,0,1'
+        ',2,3,4,5,6,7,8,9,10,11,12],[-1,0,1,2,3,4,5,6,7,8,9,10,11,12]],"unversioned":{"fields":[["add-default-route",{"default":false}],["comment",{"'
+        'can_disable":true,"remove_value":""}],["default-route-distance",{"default":1}],["dhcp-options",{"default":""}],["disabled",{"default":false}'
+        '],["interface",{}],["pool-name",{"required":true}],["pool-prefix-length",{"default":64}],["prefix-hint",{"default":"::/0"}],["request",{}],['
+        '"use-peer-dns",{"default":true}]],"fully_understood":true,"primary_keys":["interface","request"],"versioned_fields":[[[["7.20",">="]],"accep'
+        't-prefix-without-address",{}],[[["7.17",">="]],"allow-reconfigure",{}],[[["7.19",">="]],"check-gateway",{}],[[["7.15",">="]],"custom-duid",{'
+        '"default":""}],[[["7.20",">="]],"custom-iana-id",{}],[[["7.20",">="]],"custom-iapd-id",{}],[[["7.19",">="]],"default-route-tables",{}],[[["7'
+        '.15",">="]],"numbers",{"read_only":true}],[[["7.17",">="]],"prefix-address-lists",{}],[[["7.15",">="]],"rapid-commit",{}],[[["7.15",">="]],"'
+        'script",{"default":""}],[[["7.15",">="]],"use-interface-duid",{"default":false}],[[["7.15",">="]],"validate-server-duid",{"default":true}]]}'
+        '}{"snapshots":[[0],[0],[0],[0,0],[0,0],[0,0],[0,0]],"versioned":[["7.15",">=",{"fields":[["code",{}],["name",{}],["numbers",{"read_only":tru'
+        'e}],["value",{}]],"fully_understood":true,"versioned_fields":[[[["7.16",">="]],"comment",{}]]}]]}{"snapshots":[[0],[0],[0],[0,1],[0,0,1],[0,'
+        '0,1],[0,0,1]],"versioned":[["7.15",">=",{"fields":[["comment",{}],["delay-threshold",{}],["dhcp-server",{}],["disabled",{}],["interface",{}]'
+        ',["link-address",{}],["name",{}],["numbers",{"read_only":true}]],"fully_understood":true,"versioned_fields":[[[["7.21",">="]],"dhcp-options"'
+        ',{}],[[["7.18",">="]],"store-relayed-bindings",{}]]}]]}{"snapshots":[null,null,null,null,[0],[0],[0]],"versioned":[["7.21",">=",{"fields":[['
+        '"code",{}],["comment",{}],["name",{}],["numbers",{"read_only":true}],["only-if-mac-available",{}],["value",{}]],"fully_understood":true}]]}{'
+        '"snapshots":[[-1,2],[-1,2],[-1,2],[-1,0,2,3,4],[-1,0,1,2,3,4],[-1,0,1,2,3,4],[-1,0,1,2,3,4]],"unversioned":{"fields":[["address-pool",{"defa'
+        'ult":"static-only"}],["allow-dual-stack-queue",{"can_disable":true,"remove_value":true}],["binding-script",{"can_disable":true,"remove_value'
+        '":""}],["comment",{"can_disable":true,"remove_value":""}],["dhcp-option",{"default":""}],["disabled",{"default":false}],["insert-queue-befor'
+        'e",{"can_disable":true,"remove_value":"first"}],["interface",{"required":true}],["lease-time",{"default":"3d"}],["name",{"required":true}],['
+        '"parent-queue",{"can_disable":true,"remove_value":"none"}],["preference",{"default":255}],["rapid-commit",{"default":true}],["route-distance'
+        '",{"default":1}],["use-radius",{"default":false}]],"fully_understood":true,"primary_keys":["name"],"versioned_fields":[[[["7.17",">="]],"add'
+        'ress-lists",{"default":""}],[[["7.20",">="]],"ignore-ia-na-bindings",{"default":false}],[[["7.15",">="]],"numbers",{"read_only":true}],[[["7'
+        '.17",">="]],"prefix-pool",{"default":"static-only"}],[[["7.17",">="]],"use-reconfigure",{"default":false}]]}}{"snapshots":[[0],[0],[0],[0,0,'
+        '1],[0,0,1],[0,0,1],[0,0,1]],"versioned":[["7.15",">=",{"fields":[["address",{}],["address-lists",{}],["allow-dual-stack-queue",{}],["comment'
+        '",{}],["dhcp-option",{}],["disabled",{}],["duid",{}],["iaid",{}],["insert-queue-before",{}],["life-time",{}],["numbers",{"read_only":true}],'
+        '["prefix-pool",{}],["queue-type",{}],["rate-limit",{}],["server",{}]],"fully_understood":true,"versioned_fields":[[[["7.17",">="]],"ia-type"'
+        ',{}],[[["7.16",">="]],"parent-queue",{}]]}]]}{"snapshots":[[-1,1],[-1,1],[-1,1],[-1,0,1],[-1,0,1],[-1,0,1],[-1,0,1]],"unversioned":{"fields"'
+        ':[["code",{"required":true}],["name",{}],["value",{"default":""}]],"fully_understood":true,"primary_keys":["name"],"versioned_fields":[[[["7'
+        '.16",">="]],"comment",{}],[[["7.15",">="]],"numbers",{"read_only":true}]]}}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15","'
+        '>=",{"fields":[["name",{}],["numbers",{"read_only":true}],["options",{}]],"fully_understood":true}]]}{"snapshots":[[-1,0,1,2],[-1,0,1,2],[-1'
+        ',0,1,2],[-1,0,1,2],[-1,0,1,2],[-1,0,1,2],[-1,0,1,2]],"unversioned":{"fields":[["address",{}],["comment",{"can_disable":true,"remove_value":"'
+        '"}],["disabled",{"default":false}],["list",{}]],"fully_understood":true,"primary_keys":["address","list"],"versioned_fields":[[[["7.15",">="'
+        ']],"dynamic",{}],[[["7.15",">="]],"numbers",{"read_only":true}],[[["7.15",">="]],"timeout",{}]]}}{"snapshots":[[-1,0,1,2,3],[-1,0,1,2,3],[-1'
+        ',0,1,2,3],[-1,0,1,2,3],[-1,0,1,2,3,4],[-1,0,1,2,3,4],[-1,0,1,2,3,4]],"unversioned":{"fields":[["action",{}],["address-list",{"can_disable":t'
+        'rue}],["address-list-timeout",{"can_disable":true}],["chain",{}],["comment",{"can_disable":true,"remove_value":""}],["connection-bytes",{"ca'
+        'n_disable":true}],["connection-limit",{"can_disable":true}],["connection-mark",{"can_disable":true}],["connection-rate",{"can_disable":true}'
+        '],["connection-state",{"can_disable":true}],["connection-type",{"can_disable":true}],["content",{"can_disable":true}],["disabled",{"default"'
+        ':false}],["dscp",{"can_disable":true}],["dst-address",{"can_disable":true}],["dst-address-list",{"can_disable":true}],["dst-address-type",{"'
+        'can_disable":true}],["dst-limit",{"can_disable":true}],["dst-port",{"can_disable":true}],["headers",{"can_disable":true}],["hop-limit",{"can'
+        '_disable":true}],["icmp-options",{"can_disable":true}],["in-bridge-port",{"can_disable":true}],["in-bridge-port-list",{"can_disable":true}],'
+        '["in-interface",{"can_disable":true}],["in-interface-list",{"can_disable":true}],["ingress-priority",{"can_disable":true}],["ipsec-policy",{'
+        '"can_disable":true}],["jump-target",{"can_disable":true}],["limit",{"can_disable":true}],["log",{}],["log-prefix",{}],["nth",{"can_disable":'
+        'true}],["out-bridge-port",{"can_disable":true}],["out-bridge-port-list",{"can_disable":true}],["out-interface",{"can_disable":true}],["out-i'
+        'nterface-list",{"can_disable":true}],["packet-mark",{"can_disable":true}],["packet-size",{"can_disable":true}],["per-connection-classifier",'
+        '{"can_disable":true}],["port",{"can_disable":true}],["priority",{"can_disable":true}],["protocol",{"can_disable":true}],["random",{"can_disa'
+        'ble":true}],["reject-with",{}],["src-address",{"can_disable":true}],["src-address-list",{"can_disable":true}],["src-address-type",{"can_disa'
+        'ble":true}],["src-mac-address",{"can_disable":true}],["src-port",{"can_disable":true}],["tcp-flags",{"can_disable":true}],["tcp-mss",{"can_d'
+        'isable":true}],["time",{"can_disable":true}]],"fully_understood":true,"stratify_keys":["chain"],"supports_place_before":true,"versioned_fiel'
+        'ds":[[[["7.15",">="]],"connection-nat-state",{}],[[["7.15",">="]],"numbers",{"read_only":true}],[[["7.15",">="]],"routing-mark",{}],[[["7.15'
+        '",">="]],"tls-host",{}],[[["7.21",">="]],"tos",{}]]}}{"snapshots":[[-1,0,1],[-1,0,1],[-1,0,1],[-1,0,1],[-1,0,1,2],[-1,0,1,2],[-1,0,1,2]],"un'
+        'versioned":{"fields":[["action",{}],["address-list",{}],["address-list-timeout",{}],["chain",{}],["comment",{"can_disable":true,"remove_valu'
+        'e":""}],["connection-bytes",{"can_disable":true}],["connection-limit",{"can_disable":true}],["connection-mark",{"can_disable":true}],["conne'
+        'ction-rate",{"can_disable":true}],["connection-state",{"can_disable":true}],["connection-type",{"can_disable":true}],["content",{"can_disabl'
+        'e":true}],["disabled",{"default":false}],["dscp",{"can_disable":true}],["dst-address",{"can_disable":true}],["dst-address-list",{"can_disabl'
+        'e":true}],["dst-address-type",{"can_disable":true}],["dst-limit",{"can_disable":true}],["dst-port",{"can_disable":true}],["dst-prefix",{}],['
+        '"headers",{"can_disable":true}],["hop-limit",{"can_disable":true}],["icmp-options",{"can_disable":true}],["in-bridge-port",{"can_disable":tr'
+        'ue}],["in-bridge-port-list",{"can_disable":true}],["in-interface",{"can_disable":true}],["in-interface-list",{"can_disable":true}],["ingress'
+        '-priority",{"can_disable":true}],["ipsec-policy",{"can_disable":true}],["jump-target",{}],["limit",{"can_disable":true}],["log",{}],["log-pr'
+        'efix",{}],["new-connection-mark",{}],["new-dscp",{}],["new-hop-limit",{}],["new-mss",{}],["new-packet-mark",{}],["new-priority",{"can_disabl'
+        'e":true}],["new-routing-mark",{}],["nth",{"can_disable":true}],["out-bridge-port",{"can_disable":true}],["out-bridge-port-list",{"can_disabl'
+        'e":true}],["out-interface",{"can_disable":true}],["out-interface-list",{"can_disable":true}],["packet-mark",{"can_disable":true}],["packet-s'
+        'ize",{"can_disable":true}],["passthrough",{}],["per-connection-classifier",{"can_disable":true}],["port",{"can_disable":true}],["priority",{'
+        '"can_disable":true}],["protocol",{"can_disable":true}],["random",{"can_disable":true}],["routing-mark",{"can_disable":true}],["sniff-id",{}]'
+        ',["sniff-target",{}],["sniff-target-port",{}],["src-address",{"can_disable":true}],["src-address-list",{"can_disable":true}],["src-address-t'
+        'ype",{"can_disable":true}],["src-mac-address",{"can_disable":true}],["src-port",{"can_disable":true}],["src-prefix",{}],["tcp-flags",{"can_d'
+        'isable":true}],["tcp-mss",{"can_disable":true}],["time",{"can_disable":true}],["tls-host",{"can_disable":true}]],"fully_understood":true,"st'
+        'ratify_keys":["chain"],"supports_place_before":true,"versioned_fields":[[[["7.15",">="]],"connection-nat-state",{}],[[["7.15",">="]],"number'
+        's",{"read_only":true}],[[["7.21",">="]],"tos",{}]]}}{"snapshots":[[-1,0,1,3,4,5,6],[-1,0,1,3,4,5,6],[-1,0,1,3,4,5,6],[-1,0,1,3,4,6],[-1,0,1,'
+        '3,4,6,8],[-1,0,1,3,4,6,8],[-1,0,1,3,4,6,8]],"unversioned":{"fields":[["action",{}],["address-list",{}],["address-list-timeout",{}],["chain",'
+        '{}],["comment",{"can_disable":true,"remove_value":""}],["connection-bytes",{"can_disable":true}],["connection-limit",{"can_disable":true}],['
+        '"connection-mark",{"can_disable":true}],["connection-rate",{"can_disable":true}],["connection-state",{"can_disable":true}],["connection-type'
+        '",{"can_disable":true}],["content",{"can_disable":true}],["disabled",{"default":false}],["dscp",{"can_disable":true}],["dst-address",{"can_d'
+        'isable":true}],["dst-address-list",{"can_disable":true}],["dst-address-type",{"can_disable":true}],["dst-limit",{"can_disable":true}],["dst-'
+        'port",{"can_disable":true}],["icmp-options",{"can_disable":true}],["in-bridge-port",{"can_disable":true}],["in-bridge-port-list",{"can_disab'
+        'le":true}],["in-interface",{"can_disable":true}],["in-interface-list",{"can_disable":true}],["ingress-priority",{"can_disable":true}],["ipse'
+        'c-policy",{"can_disable":true}],["jump-target",{}],["limit",{"can_disable":true}],["log",{}],["log-prefix",{}],["out-bridge-port",{"can_disa'
+        'ble":true}],["out-bridge-port-list",{"can_disable":true}],["out-interface",{"can_disable":true}],["out-interface-list",{"can_disable":true}]'
+        ',["packet-mark",{"can_disable":true}],["packet-size",{"can_disable":true}],["per-connection-classifier",{"can_disable":true}],["port",{"can_'
+        'disable":true}],["priority",{"can_disable":true}],["protocol",{"can_disable":true}],["random",{"can_disable":true}],["routing-mark",{"can_di'
+        'sable":true}],["src-address",{"can_disable":true}],["src-address-list",{"can_disable":true}],["src-address-type",{"can_disable":true}],["src'
+        '-mac-address",{"can_disable":true}],["src-port",{"can_disable":true}],["tcp-flags",{"can_disable":true}],["tcp-mss",{"can_disable":true}],["'
+        'time",{"can_disable":true}],["to-ports",{"can_disable":true}]],"fully_understood":true,"stratify_keys":["chain"],"supports_place_before":tru'
+        'e,"versioned_fields":[[[["7.15",">="]],"headers",{}],[[["7.15",">="]],"hop-limit",{}],[[["7.15","<"]],"layer7-protocol",{"can_disable":true}'
+        '],[[["7.15",">="]],"nth",{}],[[["7.15",">="]],"numbers",{"read_only":true}],[[["7.16","<"]],"tls-host",{"can_disable":true}],[[["7.15",">="]'
+        '],"to-address",{}],[[["7.15","<"]],"to-addresses",{"can_disable":true}],[[["7.21",">="]],"tos",{}]]}}{"snapshots":[[-1,0],[-1,0],[-1,0],[-1,'
+        '0],[-1,0,1],[-1,0,1],[-1,0,1]],"unversioned":{"fields":[["action",{}],["address-list",{}],["address-list-timeout",{}],["chain",{}],["comment'
+        '",{"can_disable":true,"remove_value":""}],["content",{"can_disable":true}],["disabled",{"default":false}],["dscp",{"can_disable":true}],["ds'
+        't-address",{"can_disable":true}],["dst-address-list",{"can_disable":true}],["dst-address-type",{"can_disable":true}],["dst-limit",{"can_disa'
+        'ble":true}],["dst-port",{"can_disable":true}],["headers",{"can_disable":true}],["hop-limit",{"can_disable":true}],["icmp-options",{"can_disa'
+        'ble":true}],["in-bridge-port",{"can_disable":true}],["in-bridge-port-list",{"can_disable":true}],["in-interface",{"can_disable":true}],["in-'
+        'interface-list",{"can_disable":true}],["ingress-priority",{"can_disable":true}],["ipsec-policy",{"can_disable":true}],["jump-target",{}],["l'
+        'imit",{"can_disable":true}],["log",{}],["log-prefix",{}],["nth",{"can_disable":true}],["out-bridge-port",{"can_disable":true}],["out-bridge-'
+        'port-list",{"can_disable":true}],["out-interface",{"can_disable":true}],["out-interface-list",{"can_disable":true}],["packet-mark",{"can_dis'
+        'able":true}],["packet-size",{"can_disable":true}],["per-connection-classifier",{"can_disable":true}],["port",{"can_disable":true}],["priorit'
+        'y",{"can_disable":true}],["protocol",{"can_disable":true}],["random",{"can_disable":true}],["src-address",{"can_disable":true}],["src-addres'
+        's-list",{"can_disable":true}],["src-address-type",{"can_disable":true}],["src-mac-address",{"can_disable":true}],["src-port",{"can_disable":'
+        'true}],["tcp-flags",{"can_disable":true}],["tcp-mss",{"can_disable":true}],["time",{"can_disable":true}],["tls-host",{"can_disable":true}]],'
+        '"fully_understood":true,"stratify_keys":["chain"],"supports_place_before":true,"versioned_fields":[[[["7.15",">="]],"numbers",{"read_only":t'
+        'rue}],[[["7.21",">="]],"tos",{}]]}}{"snapshots":[[-1,0,1,2],[-1,0,1,2],[-1,0,1,2],[-1,0,1,2],[-1,0,1,2],[-1,0,1,2],[-1,0,1,2]],"unversioned"'
+        ':{"fields":[["advertise-dns",{"default":true}],["advertise-mac-address",{"default":true}],["disabled",{"default":false}],["dns",{"default":"'
+        '"}],["hop-limit",{"default":"unspecified"}],["interface",{}],["managed-address-configuration",{"default":false}],["mtu",{"default":"unspecif'
+        'ied"}],["other-configuration",{"default":false}],["ra-delay",{"default":"3s"}],["ra-interval",{"default":"3m20s-10m"}],["ra-lifetime",{"defa'
+        'ult":"30m"}],["ra-preference",{"default":"medium"}],["reachable-time",{"default":"unspecified"}],["retransmit-interval",{"default":"unspecif'
+        'ied"}]],"fully_understood":true,"primary_keys":["interface"],"versioned_fields":[[[["7.15",">="]],"comment",{}],[[["7.15",">="]],"numbers",{'
+        '"read_only":true}],[[["7.15",">="]],"pref64",{}]]}}{"snapshots":[[-1,1],[-1,1],[-1,1],[-1,1],[-1,1],[-1,1],[-1,1]],"unversioned":{"fields":['
+        '["6to4-interface",{"default":"none"}],["autonomous",{}],["comment",{"can_disable":true,"remove_value":""}],["disabled",{"default":false}],["'
+        'interface",{"required":true}],["on-link",{"default":true}],["preferred-lifetime",{}],["prefix",{}],["valid-lifetime",{}]],"fully_understood"'
+        ':true,"versioned_fields":[[[["7.22",">="]],"dhcp6-pd-preferred",{}],[[["7.15",">="]],"numbers",{"read_only":true}]]}}{"snapshots":[[-1],[-1]'
+        ',[-1],[-1],[-1],[-1],[-1]],"unversioned":{"fields":[["autonomous",{"default":true}],["preferred-lifetime",{"default":"1w"}],["valid-lifetime'
+        '",{"default":"4w2d"}]],"fully_understood":true,"single_value":true,"versioned_fields":[[[["7.22",">="]],"dhcp6-pd-preferred",{}]]}}{"snapsho'
+        'ts":[null,null,null,null,[0],[0],[0]],"versioned":[["7.20",">=",{"fields":[["address",{}],["comment",{}],["disabled",{}],["interface",{}],["'
+        'numbers",{"read_only":true}]],"fully_understood":true}]]}{"snapshots":[null,null,null,[0],[0],[0],[0]],"versioned":[["7.18",">=",{"fields":['
+        '["address",{}],["comment",{}],["disabled",{}],["interface",{}],["mac-address",{}],["numbers",{"read_only":true}]],"fully_understood":true}]]'
+        '}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["comment",{}],["name",{}],["numbers",{"read_only":true}],['
+        '"prefix",{}],["prefix-length",{}]],"fully_understood":true,"versioned_fields":[[[["7.22",">="]],"from-pool",{}]]}]]}{"snapshots":[[-1,7,10],'
+        '[-1,7,10],[-1,7,10],[-1,7,10],[-1,7,8,10],[-1,7,8,10],[-1,7,8,10]],"unversioned":{"fields":[["blackhole",{"can_disable":true}],["check-gatew'
+        'ay",{"can_disable":true}],["comment",{"can_disable":true,"remove_value":""}],["disabled",{"default":false}],["distance",{"default":1}],["dst'
+        '-address",{}],["gateway",{}],["routing-table",{"default":"main"}],["scope",{"default":30}],["target-scope",{"default":10}],["vrf-interface",'
+        '{"can_disable":true}]],"fully_understood":true,"versioned_fields":[[[["7.15","<"]],"bgp-as-path",{"can_disable":true}],[[["7.15","<"]],"bgp-'
+        'atomic-aggregate",{"can_disable":true}],[[["7.15","<"]],"bgp-communities",{"can_disable":true}],[[["7.15","<"]],"bgp-local-pref",{"can_disab'
+        'le":true}],[[["7.15","<"]],"bgp-med",{"can_disable":true}],[[["7.15","<"]],"bgp-origin",{"can_disable":true}],[[["7.15","<"]],"bgp-prepend",'
+        '{"can_disable":true}],[[["7.15",">="]],"numbers",{"read_only":true}],[[["7.20",">="]],"pref-src",{}],[[["7.15","<"]],"route-tag",{"can_disab'
+        'le":true}],[[["7.15",">="]],"suppress-hw-offload",{}],[[["7.15","<"]],"type",{"can_disable":true,"remove_value":"unicast"}]]}}{"snapshots":['
+        '[-1,3],[-1,3],[-1,3],[-1,1,2,4,5,6,7,8,9],[-1,0,1,2,4,5,6,7,8,9],[-1,0,1,2,4,5,6,7,8,9],[-1,0,1,2,4,5,6,7,8,9]],"unversioned":{"fields":[["a'
+        'ccept-redirects",{"default":"yes-if-forwarding-disabled"}],["accept-router-advertisements",{"default":"yes-if-forwarding-disabled"}],["disab'
+        'le-ipv6",{"default":false}],["forward",{"default":true}]],"fully_understood":true,"single_value":true,"versioned_fields":[[[["7.21",">="]],"'
+        'accept-router-advertisements-on",{}],[[["7.18",">="]],"allow-fast-path",{"default":true}],[[["7.17",">="]],"disable-link-local-address",{"de'
+        'fault":false}],[[["7.18","<"]],"max-neighbor-entries",{"default":8192}],[[["7.18",">="]],"max-neighbor-entries",{}],[[["7.18",">="]],"min-ne'
+        'ighbor-entries",{}],[[["7.16",">="]],"multipath-hash-policy",{"default":"l3"}],[[["7.18",">="]],"soft-max-neighbor-entries",{}],[[["7.17",">'
+        '="]],"stale-neighbor-detect-interval",{}],[[["7.17",">="]],"stale-neighbor-timeout",{"default":60}]]}}{"snapshots":[[0],[0],[0],[0],[0],[0],'
+        '[0]],"versioned":[["7.15",">=",{"fields":[["backlight-timeout",{}],["color-scheme",{}],["default-screen",{}],["enabled",{}],["flip-screen",{'
+        '}],["read-only-mode",{}],["time-interval",{}],["touch-screen",{}]],"fully_understood":true,"single_value":true}]]}{"snapshots":[[0],[0,0],[0'
+        ',0],[0,0],[0,0],[0,0],[0,0]],"versioned":[["7.15",">=",{"fields":[["disabled",{}],["interface",{}],["max-speed",{}],["timeout",{}]],"fully_u'
+        'nderstood":true,"versioned_fields":[[[["7.15.2",">="]],"numbers",{"read_only":true}]]}]]}{"snapshots":[[0],[0,0],[0,0],[0,0],[0,0],[0,0],[0,'
+        '0]],"versioned":[["7.15",">=",{"fields":[["interfaces",{}]],"fully_understood":true,"versioned_fields":[[[["7.15.2",">="]],"numbers",{"read_'
+        'only":true}]]}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["hide-pin-number",{}],["pin-number",{}]],"'
+        'fully_understood":true,"single_value":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["disabled",{}'
+        '],["numbers",{"depr":{"context":"write","msg":"The numbers field will be read-only from community.routeros 4.0.0 on.","version":"4.0.0"}}],['
+        '"timeout",{}]],"fully_understood":true,"has_identifier":true}]]}{"snapshots":[[0,3],[0,3],[0,3],[0,0,1,2,3],[0,0,1,2],[0,0,1,2],[0,0,1,2]],"'
+        'versioned":[["7.15",">=",{"fields":[["antenna",{}],["antenna-gain",{}],["channel-plan",{}],["disabled",{}],["forward",{}],["gateway-id",{}],'
+        '["lbt-enabled",{}],["listen-time",{}],["name",{}],["network",{}],["numbers",{"depr":{"context":"write","msg":"The numbers field will be read'
+        '-only from community.routeros 4.0.0 on.","version":"4.0.0"}}],["rssi-threshold",{}],["servers",{}],["spoof-gps",{}]],"fully_understood":true'
+        ',"has_identifier":true,"versioned_fields":[[[["7.16",">="]],"alt",{}],[[["7.16",">="]],"lat",{}],[[["7.16",">="]],"long",{}],[[["7.19","<"]]'
+        ',"src-address",{}]]}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["bandwidth",{}],["datarate",{}],["di'
+        'sabled",{}],["freq-off",{}],["numbers",{"depr":{"context":"write","msg":"The numbers field will be read-only from community.routeros 4.0.0 o'
+        'n.","version":"4.0.0"}}],["radio",{}],["spread-factor",{}]],"fully_understood":true,"has_identifier":true}]]}{"snapshots":[[0],[0],[0],[0,0]'
+        ',[0,0,1],[0,0,1],[0,0,1]],"versioned":[["7.15",">=",{"fields":[["joineuis",{}],["name",{}],["numbers",{"read_only":true}]],"fully_understood'
+        '":true,"versioned_fields":[[[["7.16",">="]],"logging",{}],[[["7.19",">="]],"type",{}]]}]]}{"snapshots":[[0],[0],[0],[0,0],[0,0,1],[0,0,1],[0'
+        ',0,1]],"versioned":[["7.15",">=",{"fields":[["name",{}],["netids",{}],["numbers",{"read_only":true}]],"fully_understood":true,"versioned_fie'
+        'lds":[[[["7.16",">="]],"logging",{}],[[["7.19",">="]],"type",{}]]}]]}{"snapshots":[[0,0,1],[0,0,1],[0,0,1],[0],[0],[0],[0]],"versioned":[["7'
+        '.15",">=",{"fields":[["center-freq",{}],["disabled",{}],["numbers",{"depr":{"context":"write","msg":"The numbers field will be read-only fro'
+        'm community.routeros 4.0.0 on.","version":"4.0.0"}}],["tx-freq-max",{}],["tx-freq-min",{}]],"fully_understood":true,"has_identifier":true,"v'
+        'ersioned_fields":[[[["7.17","<"]],"rssi-off",{}],[[["7.17","<"]],"tx-enabled",{}]]}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned"'
+        ':[["7.15",">=",{"fields":[["address",{}],["certificate",{}],["down-port",{}],["interval",{}],["joineui",{}],["key",{}],["name",{}],["netid",'
+        '{}],["numbers",{"read_only":true}],["port",{}],["protocol",{}],["ssl",{}],["up-port",{}]],"fully_understood":true}]]}{"snapshots":[null,null'
+        ',null,[0],[0,0],[0,0],[0,0]],"versioned":[["7.17",">=",{"fields":[["crc-errors",{}]],"fully_understood":true,"single_value":true,"versioned_'
+        'fields":[[[["7.19",">="]],"pckt-limit",{}]]}]]}{"snapshots":[null,null,null,null,null,null,null],"versioned":[["7.15",">=","Not supported an'
+        'ymore in version  >= 7.15"],["7.15","<",{"fields":[["allow-fast-path",{"default":true}],["dynamic-label-range",{"default":"16-1048575"}],["p'
+        'ropagate-ttl",{"default":true}]],"fully_understood":true,"single_value":true}]]}{"snapshots":[[-1,1,2],[-1,1,2],[-1,1,2],[-1,1,2],[-1,1,2],['
+        '-1,1,2],[-1,1,2]],"unversioned":{"fields":[["comment",{"can_disable":true,"remove_value":""}],["disabled",{"default":false}],["interface",{"'
+        'required":true}],["mpls-mtu",{"can_disable":true}]],"fully_understood":true,"versioned_fields":[[[["7.15","<"]],"info",{"can_disable":true}]'
+        ',[[["7.15",">="]],"input",{"can_disable":true}],[[["7.15",">="]],"numbers",{"read_only":true}]]}}{"snapshots":[[0,0],[0,0],[0,0],[0,0],[0,0]'
+        ',[0,0],[0,0]],"versioned":[["7.1",">=",{"fields":[["afi",{"can_disable":true}],["comment",{"can_disable":true,"remove_value":""}],["disabled'
+        '",{"default":false}],["distribute-for-default",{"can_disable":true}],["hop-limit",{"can_disable":true}],["loop-detect",{"can_disable":true}]'
+        ',["lsr-id",{"can_disable":true}],["path-vector-limit",{"can_disable":true}],["preferred-afi",{"can_disable":true}],["transport-addresses",{"'
+        'can_disable":true}],["use-explicit-null",{"can_disable":true}],["vrf",{}]],"fully_understood":true,"primary_keys":["vrf"],"versioned_fields"'
+        ':[[[["7.15",">="]],"numbers",{"read_only":true}]]}],["7.1","<",{"fields":[["distribute-for-default-route",{"default":false}],["enabled",{"de'
+        'fault":false}],["hop-limit",{"default":255}],["loop-detect",{"default":false}],["lsr-id",{"default":"0.0.0.0"}],["path-vector-limit",{"defau'
+        'lt":255}],["transport-address",{"default":"0.0.0.0"}],["use-explicit-null",{"default":false}]],"fully_understood":true,"single_value":true}]'
+        ']}{"snapshots":[[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0]],"unversioned":{"fields":[["accept",{"can_disable":true}],["comment",{"can_'
+        'disable":true,"remove_value":""}],["disabled",{"default":false}],["neighbor",{"can_disable":true}],["prefix",{"can_disable":true}],["vrf",{"'
+        'can_disable":true}]],"fully_understood":true,"versioned_fields":[[[["7.15",">="]],"numbers",{"read_only":true}]]}}{"snapshots":[[-1,0],[-1,0'
+        '],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0]],"unversioned":{"fields":[["advertise",{"default":""}],["comment",{"can_disable":true,"remove_value":""'
+        '}],["disabled",{"default":false}],["neighbor",{}],["prefix",{}],["vrf",{}]],"fully_understood":true,"versioned_fields":[[[["7.15",">="]],"nu'
+        'mbers",{"read_only":true}]]}}{"snapshots":[[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0]],"unversioned":{"fields":[["accept-dynamic-neigh'
+        'bors",{"can_disable":true}],["afi",{"can_disable":true}],["comment",{"can_disable":true,"remove_value":""}],["disabled",{"default":false}],['
+        '"hello-interval",{"can_disable":true}],["hold-time",{"can_disable":true}],["interface",{"required":true}],["transport-addresses",{"can_disab'
+        'le":true}]],"fully_understood":true,"versioned_fields":[[[["7.15",">="]],"numbers",{"read_only":true}]]}}{"snapshots":[[0],[0],[0],[0],[0],['
+        '0],[0]],"versioned":[["7.15",">=",{"fields":[["comment",{}],["disabled",{}],["dst-address",{"can_disable":true}],["label",{}],["numbers",{"r'
+        'ead_only":true}],["vrf",{"can_disable":true}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">'
+        '=",{"fields":[["comment",{}],["disabled",{}],["numbers",{"read_only":true}],["send-targeted",{"can_disable":true}],["transport",{}]],"fully_'
+        'understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["comment",{}],["disabled",{}],["dst-add'
+        'ress",{}],["label",{}],["nexthop",{}],["numbers",{"read_only":true}],["vrf",{"can_disable":true}]],"fully_understood":true}]]}{"snapshots":['
+        'null,null,null,[0],[0],[0],[0]],"versioned":[["7.17",">=",{"fields":[["chain",{"can_disable":true}],["comment",{}],["disabled",{}],["exp",{"'
+        'can_disable":true}],["numbers",{"read_only":true}],["set-exp",{"can_disable":true}],["set-mark",{"can_disable":true}]],"fully_understood":tr'
+        'ue}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["allow-fast-path",{}],["dynamic-label-range",{}],["pr'
+        'opagate-ttl",{}]],"fully_understood":true,"single_value":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fiel'
+        'ds":[["bandwidth",{"can_disable":true}],["blockade-k-factor",{"can_disable":true}],["comment",{}],["disabled",{}],["down-flood-thresholds",{'
+        '"can_disable":true}],["igp-flood-period",{"can_disable":true}],["interface",{}],["k-factor",{"can_disable":true}],["numbers",{"read_only":tr'
+        'ue}],["refresh-time",{"can_disable":true}],["resource-class",{"can_disable":true}],["te-metric",{"can_disable":true}],["up-flood-thresholds"'
+        ',{"can_disable":true}],["use-udp",{"can_disable":true}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":['
+        '["7.15",">=",{"fields":[["affinity-exclude",{"can_disable":true}],["affinity-include-all",{"can_disable":true}],["affinity-include-any",{"ca'
+        'n_disable":true}],["comment",{}],["disabled",{}],["holding-priority",{"can_disable":true}],["hops",{"can_disable":true}],["name",{}],["numbe'
+        'rs",{"read_only":true}],["record-route",{"can_disable":true}],["reoptimize-interval",{"can_disable":true}],["setup-priority",{"can_disable":'
+        'true}],["use-cspf",{"can_disable":true}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"'
+        'fields":[["affinity-exclude",{"can_disable":true}],["affinity-include-all",{"can_disable":true}],["affinity-include-any",{"can_disable":true'
+        '}],["auto-bandwidth-avg-interval",{"can_disable":true}],["auto-bandwidth-range",{"can_disable":true}],["auto-bandwidth-reserve",{"can_disabl'
+        'e":true}],["auto-bandwidth-update-interval",{"can_disable":true}],["bandwidth",{"can_disable":true}],["bandwidth-limit",{"can_disable":true}'
+        '],["comment",{}],["disabled",{}],["from-address",{"can_disable":true}],["holding-priority",{"can_disable":true}],["name",{}],["numbers",{"re'
+        'ad_only":true}],["primary-path",{"can_disable":true}],["primary-retry-interval",{"can_disable":true}],["record-route",{"can_disable":true}],'
+        '["reoptimize-interval",{"can_disable":true}],["secondary-paths",{"can_disable":true}],["secondary-standby",{"can_disable":true}],["setup-pri'
+        'ority",{"can_disable":true}],["to-address",{}],["vrf",{"can_disable":true}]],"fully_understood":true}]]}{"snapshots":[null,null,null,null,[0'
+        '],[0],[0]],"versioned":[["7.20",">=",{"fields":[["certificate",{"can_disable":true}],["comment",{}],["controllers",{}],["datapath-id",{}],["'
+        'disabled",{}],["isolate-controllers",{"can_disable":true}],["name",{}],["numbers",{"read_only":true}],["passive-port",{}],["verify-peer",{"c'
+        'an_disable":true}],["version",{}]],"fully_understood":true}]]}{"snapshots":[null,null,null,null,[0],[0],[0]],"versioned":[["7.20",">=",{"fie'
+        'lds":[["comment",{}],["disabled",{}],["interface",{}],["numbers",{"read_only":true}],["port-id",{}],["switch",{}]],"fully_understood":true}]'
+        ']}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["comment",{}],["fallback-to",{}],["name",{}],["numbers",{'
+        '"depr":{"context":"write","msg":"The numbers field will be read-only from community.routeros 4.0.0 on.","version":"4.0.0"}}]],"fully_underst'
+        'ood":true,"has_identifier":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["baud-rate",{}],["data-b'
+        'its",{}],["dtr",{}],["flow-control",{}],["name",{}],["numbers",{"depr":{"context":"write","msg":"The numbers field will be read-only from co'
+        'mmunity.routeros 4.0.0 on.","version":"4.0.0"}}],["parity",{}],["rts",{}],["stop-bits",{}]],"fully_understood":true,"has_identifier":true}]]'
+        '}{"snapshots":[null,null,null,null,null,null,null],"versioned":[["7.15",">=","Not supported anymore in version  >= 7.15"],["7.15","<",{"fiel'
+        'ds":[["directory",{"default":"firmware"}],["ignore-directip-modem",{"default":false}]],"fully_understood":true,"single_value":true}]]}{"snap'
+        'shots":[[-1,1,2],[-1,1,2],[-1,1,2],[-1,1,2],[-1,0,1,2],[-1,0,1,2],[-1,0,1,2]],"unversioned":{"fields":[["allowed-addresses",{"default":"0.0.'
+        '0.0/0"}],["channel",{"default":0}],["disabled",{"default":false}],["log-file",{"default":""}],["port",{"required":true}],["protocol",{"defau'
+        'lt":"rfc2217"}],["tcp-port",{"default":0}]],"fully_understood":true,"versioned_fields":[[[["7.21",">="]],"comment",{}],[[["7.15",">="]],"loc'
+        'al-address",{}],[[["7.15",">="]],"numbers",{"read_only":true}]]}}{"snapshots":[[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0]],"unversione'
+        'd":{"fields":[["accounting",{"default":true}],["interim-update",{"default":"0s"}],["use-circuit-id-in-nas-port-id",{"default":false}],["use-'
+        'radius",{"default":false}]],"fully_understood":true,"single_value":true,"versioned_fields":[[[["7.15",">="]],"enable-ipv6-accounting",{}]]}}'
+        '{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["address",{}],["comment",{}],["numbers",{"read_only":true}]'
+        ',["secret",{}]],"fully_understood":true}]]}{"snapshots":[[-1,2,4,6,7],[-1,2,4,6,7],[-1,2,4,6,7],[-1,0,1,2,4,6,7],[-1,0,1,2,3,4,5,6,7,8],[-1,'
+        '0,1,2,3,4,5,6,7,8],[-1,0,1,2,3,4,5,6,7,8]],"unversioned":{"fields":[["address-list",{"default":""}],["bridge",{"can_disable":true}],["bridge'
+        '-horizon",{"can_disable":true}],["bridge-learning",{"default":"default"}],["bridge-path-cost",{"can_disable":true}],["bridge-port-priority",'
+        '{"can_disable":true}],["change-tcp-mss",{"default":true}],["dns-server",{"can_disable":true}],["idle-timeout",{"can_disable":true}],["incomi'
+        'ng-filter",{"can_disable":true}],["insert-queue-before",{"can_disable":true}],["interface-list",{"can_disable":true}],["local-address",{"can'
+        '_disable":true}],["name",{"required":true}],["on-down",{"default":""}],["on-up",{"default":""}],["only-one",{"default":"default"}],["outgoin'
+        'g-filter",{"can_disable":true}],["parent-queue",{"can_disable":true}],["queue-type",{"can_disable":true}],["rate-limit",{"can_disable":true}'
+        '],["remote-address",{"can_disable":true}],["session-timeout",{"can_disable":true}],["use-compression",{"default":"default"}],["use-encryptio'
+        'n",{"default":"default"}],["use-ipv6",{"default":true}],["use-mpls",{"default":"default"}],["use-upnp",{"default":"default"}],["wins-server"'
+        ',{"can_disable":true}]],"fully_understood":true,"primary_keys":["name"],"versioned_fields":[[[["7.17",">="]],"bridge-port-trusted",{}],[[["7'
+        '.17",">="]],"bridge-port-vid",{}],[[["7.15",">="]],"comment",{}],[[["7.20",">="]],"dhcpv6-lease-time",{}],[[["7.15",">="]],"dhcpv6-pd-pool",'
+        '{}],[[["7.20",">="]],"dhcpv6-use-radius",{}],[[["7.15",">="]],"numbers",{"read_only":true}],[[["7.15",">="]],"remote-ipv6-prefix-pool",{}],['
+        '[["7.20",">="]],"remote-ipv6-prefix-reuse",{}]]}}{"snapshots":[[-1,0,1],[-1,0,1],[-1,0,1],[-1,0,1],[-1,0,1],[-1,0,1],[-1,0,1]],"unversioned"'
+        ':{"fields":[["caller-id",{"default":""}],["disabled",{"default":false}],["ipv6-routes",{"default":""}],["limit-bytes-in",{"default":0}],["li'
+        'mit-bytes-out",{"default":0}],["local-address",{"can_disable":true}],["name",{"required":true}],["password",{}],["profile",{"default":"defau'
+        'lt"}],["remote-address",{"can_disable":true}],["remote-ipv6-prefix",{"can_disable":true}],["routes",{"can_disable":true}],["service",{"defau'
+        'lt":"any"}]],"fully_understood":true,"primary_keys":["name"],"versioned_fields":[[[["7.15",">="]],"comment",{}],[[["7.15",">="]],"numbers",{'
+        '"read_only":true}]]}}{"snapshots":[[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0]],"unversioned":{"fields":[["interface",{"required":true}'
+        '],["queue",{"required":true}]],"fixed_entries":true,"fully_understood":true,"primary_keys":["interface"],"versioned_fields":[[[["7.15",">="]'
+        '],"numbers",{}]]}}{"snapshots":[[-1,0,1,2,3,4,5,6,7,8],[-1,0,1,2,3,4,5,6,7,8],[-1,0,1,2,3,4,5,6,7,8],[-1,0,1,2,3,4,5,6,7,8],[-1,0,1,2,3,4,5,'
+        '6,7,8],[-1,0,1,2,3,4,5,6,7,8],[-1,0,1,2,3,4,5,6,7,8]],"unversioned":{"fields":[["bucket-size",{"default":"0.1/0.1"}],["burst-limit",{"defaul'
+        't":"0/0"}],["burst-threshold",{"default":"0/0"}],["burst-time",{"default":"0s/0s"}],["comment",{"can_disable":true,"remove_value":""}],["dis'
+        'abled",{"default":false}],["dst",{"can_disable":true,"remove_value":""}],["limit-at",{"default":"0/0"}],["max-limit",{"default":"0/0"}],["na'
+        'me",{}],["packet-marks",{"default":""}],["parent",{"default":"none"}],["priority",{"default":"8/8"}],["queue",{"default":"default-small/defa'
+        'ult-small"}],["target",{"required":true}],["time",{"can_disable":true,"remove_value":""}]],"fully_understood":true,"primary_keys":["name"],"'
+        'versioned_fields":[[[["7.15",">="]],"numbers",{"read_only":true}],[[["7.15",">="]],"total-bucket-size",{}],[[["7.15",">="]],"total-burst-lim'
+        'it",{}],[[["7.15",">="]],"total-burst-threshold",{}],[[["7.15",">="]],"total-burst-time",{}],[[["7.15",">="]],"total-limit-at",{}],[[["7.15"'
+        ',">="]],"total-max-limit",{}],[[["7.15",">="]],"total-priority",{}],[[["7.15",">="]],"total-queue",{}]]}}{"snapshots":[[-1,0],[-1,0],[-1,0],'
+        '[-1,0],[-1,0],[-1,0],[-1,0]],"unversioned":{"fields":[["bucket-size",{"default":"0.1"}],["burst-limit",{"default":0}],["burst-threshold",{"d'
+        'efault":0}],["burst-time",{"default":"0s"}],["comment",{"can_disable":true,"remove_value":""}],["disabled",{"default":false}],["limit-at",{"'
+        'default":0}],["max-limit",{"default":0}],["name",{}],["packet-mark",{"default":""}],["parent",{"required":true}],["priority",{"default":8}],'
+        '["queue",{"default":"default-small"}]],"fully_understood":true,"primary_keys":["name"],"versioned_fields":[[[["7.15",">="]],"numbers",{"read'
+        '_only":true}]]}}{"snapshots":[[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0]],"unversioned":{"fields":[["bfifo-limit",{"default":15000}],['
+        '"cake-ack-filter",{"default":"none"}],["cake-atm",{"default":"none"}],["cake-autorate-ingress",{"can_disable":true}],["cake-bandwidth",{"can'
+        '_disable":true,"remove_value":0}],["cake-diffserv",{"default":"diffserv3"}],["cake-flowmode",{"default":"triple-isolate"}],["cake-memlimit",'
+        '{"default":0}],["cake-mpu",{"can_disable":true,"remove_value":""}],["cake-nat",{"can_disable":true,"remove_value":false}],["cake-overhead",{'
+        '"default":0}],["cake-overhead-scheme",{"can_disable":true,"remove_value":""}],["cake-rtt",{"default":"100ms"}],["cake-rtt-scheme",{"default"'
+        ':"none"}],["cake-wash",{"can_disable":true,"remove_value":false}],["codel-ce-threshold",{"can_disable":true,"remove_value":""}],["codel-ecn"'
+        ',{"can_disable":true,"remove_value":false}],["codel-interval",{"default":"100ms"}],["codel-limit",{"default":1000}],["codel-target",{"defaul'
+        't":"5ms"}],["fq-codel-ce-threshold",{"can_disable":true,"remove_value":""}],["fq-codel-ecn",{"default":true}],["fq-codel-flows",{"default":1'
+        '024}],["fq-codel-interval",{"default":"100ms"}],["fq-codel-limit",{"default":10240}],["fq-codel-memlimit",{"default":33554432}],["fq-codel-q'
+        'uantum",{"default":1514}],["fq-codel-target",{"default":"5ms"}],["kind",{"required":true}],["mq-pfifo-limit",{"default":50}],["name",{}],["p'
+        'cq-burst-rate",{"default":0}],["pcq-burst-threshold",{"default":0}],["pcq-burst-time",{"default":"10s"}],["pcq-classifier",{"can_disable":tr'
+        'ue,"remove_value":""}],["pcq-dst-address-mask",{"default":32}],["pcq-dst-address6-mask",{"default":128}],["pcq-limit",{"default":50}],["pcq-'
+        'rate",{"default":0}],["pcq-src-address-mask",{"default":32}],["pcq-src-address6-mask",{"default":128}],["pcq-total-limit",{"default":2000}],'
+        '["pfifo-limit",{"default":50}],["red-avg-packet",{"default":1000}],["red-burst",{"default":20}],["red-limit",{"default":60}],["red-max-thres'
+        'hold",{"default":50}],["red-min-threshold",{"default":10}],["sfq-allot",{"default":1514}],["sfq-perturb",{"default":5}]],"fully_understood":'
+        'true,"primary_keys":["name"],"versioned_fields":[[[["7.15",">="]],"numbers",{"read_only":true}]]}}{"snapshots":[[-1,0,2],[-1,0,2],[-1,0,2],['
+        '-1,0,2],[-1,0,1,2],[-1,0,1,2],[-1,0,1,2]],"unversioned":{"fields":[["accounting-backup",{"default":false}],["accounting-port",{"default":181'
+        '3}],["address",{"default":"0.0.0.0"}],["authentication-port",{"default":1812}],["called-id",{}],["certificate",{}],["comment",{"can_disable"'
+        ':true,"remove_value":""}],["disabled",{"default":false}],["domain",{}],["protocol",{"default":"udp"}],["realm",{}],["secret",{}],["service",'
+        '{}],["src-address",{"default":"0.0.0.0"}],["timeout",{"default":"300ms"}]],"fully_understood":true,"versioned_fields":[[[["7.15",">="]],"num'
+        'bers",{"read_only":true}],[[["7.19.6",">="]],"radsec-timeout",{"default":"3300ms"}],[[["7.15",">="]],"require-message-auth",{"default":"yes-'
+        'for-request-resp"}]]}}{"snapshots":[[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0]],"unversioned":{"fields":[["accept",{"default":false}],'
+        '["port",{"default":3799}]],"fully_understood":true,"single_value":true,"versioned_fields":[[[["7.15",">="]],"vrf",{}]]}}{"snapshots":[[0,1],'
+        '[0,1],[0,1],[0,1],[0,1],[0,1],[0,1]],"versioned":[["7.11",">=",{"fields":[["address-list",{}],["addresses",{}],["comment",{"can_disable":tru'
+        'e,"remove_value":""}],["copy-from",{"depr":{"context":"write","msg":"The copy-from field will be removed in community.routeros 4.0.0.","vers'
+        'ion":"4.0.0"},"write_only":true}],["disabled",{"default":false}],["forbid-bfd",{}],["interfaces",{}],["min-rx",{}],["min-tx",{}],["multiplie'
+        'r",{}],["place-before",{"depr":{"context":"write","msg":"The place-before field will be removed in community.routeros 4.0.0.","version":"4.0'
+        '.0"},"write_only":true}],["vrf",{}]],"fully_understood":true,"versioned_fields":[[[["7.15","<"]],"min-echo-rx",{}],[[["7.15",">="]],"numbers'
+        '",{"read_only":true}]]}]]}{"snapshots":[null,null,null,null,null,null,null],"versioned":[["7.15",">=","Not supported anymore in version  >= '
+        '7.15"],["7.15","<",{"fields":[["default",{}],["disabled",{}],["interface",{}],["interval",{}],["min-rx",{}],["multiplier",{}]],"unknown_mech'
+        'anism":true}]]}{"snapshots":[null,null,null,null,null,null,null],"versioned":[["7.15",">=","Not supported anymore in version  >= 7.15"],["7.'
+        '15","<",{"fields":[["advertise-filter",{}],["attribute-filter",{}],["disabled",{"default":false}],["include-igp",{"default":false}],["inheri'
+        't-attributes",{"default":true}],["instance",{"required":true}],["prefix",{"required":true}],["summary-only",{"default":true}],["suppress-fil'
+        'ter",{}]],"fully_understood":true,"primary_keys":["prefix"]}]]}{"snapshots":[[-1,0,1,3,4,12,14,17],[-1,0,1,3,4,12,14,17],[-1,0,1,3,4,12,14,1'
+        '7],[-1,0,1,3,4,12,14,17],[-1,0,2,7,8,9,10,11,13,14,16],[-1,0,2,6,7,8,9,10,11,13,14,16],[-1,0,2,6,7,8,9,10,11,13,14,16]],"unversioned":{"fiel'
+        'ds":[["as",{}],["cisco-vpls-nlri-len-fmt",{}],["comment",{}],["connect",{"default":true}],["disabled",{"default":false}],["hold-time",{}],["'
+        'input.accept-communities",{}],["input.accept-ext-communities",{}],["input.accept-large-communities",{}],["input.accept-nlri",{}],["input.aff'
+        'inity",{}],["input.allow-as",{}],["input.filter",{}],["input.limit-process-routes-ipv4",{}],["input.limit-process-routes-ipv6",{}],["keepali'
+        've-time",{}],["listen",{"default":true}],["local.address",{}],["local.port",{}],["local.role",{"required":true}],["local.ttl",{}],["multihop'
+        '",{}],["name",{"required":true}],["nexthop-choice",{}],["output.affinity",{}],["output.as-override",{}],["output.default-originate",{}],["ou'
+        'tput.default-prepend",{}],["output.filter-chain",{}],["output.filter-select",{}],["output.keep-sent-attributes",{}],["output.network",{}],["'
+        'output.no-client-to-client-reflection",{}],["output.no-early-cut",{}],["output.redistribute",{}],["output.remove-private-as",{}],["remote.ad'
+        'dress",{"required":true}],["remote.allowed-as",{}],["remote.as",{}],["remote.port",{}],["remote.ttl",{}],["routing-table",{}],["save-to",{}]'
+        ',["tcp-md5-key",{}],["templates",{}],["use-bfd",{}],["vrf",{}]],"fully_understood":true,"versioned_fields":[[[["7.22","<"]],"add-path-out",{'
+        '}],[[["7.19","<"]],"address-families",{}],[[["7.19",">="]],"afi",{}],[[["7.20","<"]],"cluster-id",{}],[[["7.19","<"]],"input.accept-unknown"'
+        ',{}],[[["7.22",">="]],"input.add-path",{}],[[["7.21.2",">="]],"input.attr-error-handling",{}],[[["7.19",">="]],"input.filter-communities",{}'
+        '],[[["7.19",">="]],"input.filter-ext-communities",{}],[[["7.19",">="]],"input.filter-large-communities",{}],[[["7.20",">="]],"input.filter-n'
+        'lri",{}],[[["7.19",">="]],"input.filter-unknown",{}],[[["7.20","<"]],"input.ignore-as-path-len",{}],[[["7.20",">="]],"instance",{"required":'
+        'true}],[[["7.15",">="]],"numbers",{"read_only":true}],[[["7.22",">="]],"output.add-path",{}],[[["7.20.1",">="]],"output.network-blackhole",{'
+        '}],[[["7.20","<"]],"router-id",{}]]}}{"snapshots":[null,null,null,null,[0],[0],[0]],"versioned":[["7.20",">=",{"fields":[["comment",{}],["di'
+        'sabled",{}],["export.route-targets",{}],["import.route-targets",{}],["instance",{}],["name",{}],["numbers",{"read_only":true}],["rd",{}],["v'
+        'ni",{}],["vrf",{}]],"fully_understood":true}]]}{"snapshots":[null,null,null,null,[0],[0],[0]],"versioned":[["7.20",">=",{"fields":[["as",{"c'
+        'an_disable":true}],["cluster-id",{"can_disable":true}],["comment",{}],["disabled",{"default":false}],["ignore-as-path-len",{"can_disable":tr'
+        'ue}],["name",{}],["numbers",{"read_only":true}],["router-id",{"can_disable":true}],["routing-table",{"can_disable":true}],["vrf",{"can_disab'
+        'le":true}]],"fully_understood":true,"versioned_fields":[[[["7.22",">="]],"multipath",{}]]}],["7.15","<",{"fields":[["as",{}],["client-to-cli'
+        'ent-reflection",{}],["cluster-id",{"can_disable":true}],["confederation",{"can_disable":true}],["disabled",{"default":false}],["ignore-as-pa'
+        'th-len",{}],["name",{}],["out-filter",{}],["redistribute-connected",{}],["redistribute-ospf",{}],["redistribute-other-bgp",{}],["redistribut'
+        'e-rip",{}],["redistribute-static",{}],["router-id",{}],["routing-table",{}]],"fully_understood":true,"primary_keys":["name"]}],["7.20","<","'
+        'Not supported from 7.15 until reintroduced in 7.20"]]}{"snapshots":[null,null,null,null,null,null,null],"versioned":[["7.15",">=","Not suppo'
+        'rted anymore in version  >= 7.15"],["7.15","<",{"fields":[["comment",{"can_disable":true,"remove_value":""}],["disabled",{"default":false}],'
+        '["network",{"required":true}],["synchronize",{"default":true}]],"fully_understood":true,"primary_keys":["network"]}]]}{"snapshots":[null,nul'
+        'l,null,null,null,null,null],"versioned":[["7.15",">=","Not supported anymore in version  >= 7.15"],["7.15","<",{"fields":[["address-families'
+        '",{"default":"ip"}],["allow-as-in",{"can_disable":true,"remove_value":""}],["as-override",{"default":false}],["cisco-vpls-nlri-len-fmt",{}],'
+        '["comment",{"can_disable":true,"remove_value":""}],["default-originate",{"default":"never"}],["disabled",{"default":false}],["hold-time",{"d'
+        'efault":"3m"}],["in-filter",{}],["instance",{}],["keepalive-time",{"can_disable":true,"remove_value":""}],["max-prefix-limit",{"can_disable"'
+        ':true,"remove_value":""}],["max-prefix-restart-time",{"can_disable":true,"remove_value":""}],["multihop",{"default":false}],["name",{}],["ne'
+        'xthop-choice",{"default":"default"}],["out-filter",{}],["passive",{"default":false}],["remote-address",{"required":true}],["remote-as",{"req'
+        'uired":true}],["remote-port",{"can_disable":true,"remove_value":""}],["remove-private-as",{"default":false}],["route-reflect",{"default":fal'
+        'se}],["tcp-md5-key",{}],["ttl",{"default":"default"}],["update-source",{"can_disable":true,"remove_value":"none"}],["use-bfd",{"default":fal'
+        'se}]],"fully_understood":true,"primary_keys":["name"]}]]}{"snapshots":[[-1,0,1,4,5,13,15,17,18,21],[-1,0,1,4,5,13,15,17,18,21],[-1,0,1,4,5,1'
+        '3,15,17,18,21],[-1,0,1,4,5,13,15,17,18,21],[-1,0,2,8,9,10,11,12,15,17,18,20],[-1,0,2,7,8,9,10,11,12,15,17,18,20],[-1,0,2,7,8,9,10,11,12,15,1'
+        '7,18,20]],"unversioned":{"fields":[["as",{}],["cisco-vpls-nlri-len-fmt",{}],["comment",{"can_disable":true,"remove_value":""}],["disabled",{'
+        '"default":false}],["hold-time",{"default":"3m"}],["input.accept-communities",{}],["input.accept-ext-communities",{}],["input.accept-large-co'
+        'mmunities",{}],["input.accept-nlri",{}],["input.affinity",{}],["input.allow-as",{}],["input.filter",{}],["input.limit-process-routes-ipv4",{'
+        '}],["input.limit-process-routes-ipv6",{}],["keepalive-time",{"default":"3m"}],["multihop",{"default":false}],["name",{}],["nexthop-choice",{'
+        '"default":"default"}],["output.affinity",{}],["output.default-originate",{"default":"never"}],["output.filter-chain",{}],["output.filter-sel'
+        'ect",{}],["output.keep-sent-attributes",{"default":false}],["output.network",{}],["output.no-client-to-client-reflection",{}],["output.no-ea'
+        'rly-cut",{}],["output.redistribute",{}],["output.remove-private-as",{"default":false}],["routing-table",{"default":"main"}],["save-to",{}],['
+        '"templates",{}],["use-bfd",{"default":false}],["vrf",{"default":"main"}]],"fully_understood":true,"primary_keys":["name"],"versioned_fields"'
+        ':[[[["7.22","<"]],"add-path-out",{}],[[["7.19","<"]],"address-families",{}],[[["7.19",">="]],"afi",{}],[[["7.15","<"]],"as-override",{"defau'
+        'lt":false}],[[["7.20","<"]],"cluster-id",{}],[[["7.19","<"]],"input.accept-unknown",{}],[[["7.22",">="]],"input.add-path",{}],[[["7.21.2",">'
+        '="]],"input.attr-error-handling",{}],[[["7.19",">="]],"input.filter-communities",{}],[[["7.19",">="]],"input.filter-ext-communities",{}],[[['
+        '"7.19",">="]],"input.filter-large-communities",{}],[[["7.20",">="]],"input.filter-nlri",{}],[[["7.19",">="]],"input.filter-unknown",{}],[[["'
+        '7.20","<"]],"input.ignore-as-path-len",{"default":false}],[[["7.15","<"]],"input.limit-nlri-diversity",{}],[[["7.15",">="]],"numbers",{"read'
+        '_only":true}],[[["7.22",">="]],"output.add-path",{}],[[["7.15",">="]],"output.as-override",{}],[[["7.15",">="]],"output.default-prepend",{}]'
+        ',[[["7.15","<"]],"output.default-prepent",{}],[[["7.20.1",">="]],"output.network-blackhole",{}],[[["7.20","<"]],"router-id",{"default":"main'
+        '"}]]}}{"snapshots":[[0],[0],[0],[0,0],[0,0],[0,0],[0,0]],"versioned":[["7.15",">=",{"fields":[["bridge",{}],["bridge-cost",{}],["bridge-hori'
+        'zon",{}],["cisco-id",{}],["comment",{}],["disabled",{}],["export-route-targets",{}],["import-route-targets",{}],["local-pref",{}],["name",{}'
+        '],["numbers",{"read_only":true}],["pw-control-word",{}],["pw-l2mtu",{}],["pw-type",{}],["rd",{}],["site-id",{}],["vrf",{}]],"fully_understoo'
+        'd":true,"versioned_fields":[[[["7.17",">="]],"bridge-pvid",{}]]}]]}{"snapshots":[[0,0],[0,0],[0,0],[0,0],[0,1],[0,1],[0,1]],"versioned":[["7'
+        '.15",">=",{"fields":[["comment",{}],["disabled",{}],["export.filter-chain",{}],["export.filter-select",{}],["export.redistribute",{}],["expo'
+        'rt.route-targets",{}],["import.filter-chain",{}],["import.route-targets",{}],["label-allocation-policy",{}],["name",{}],["numbers",{"read_on'
+        'ly":true}],["route-distinguisher",{}],["vrf",{}]],"fully_understood":true,"versioned_fields":[[[["7.20","<"]],"import.router-id",{}],[[["7.2'
+        '0",">="]],"instance",{}]]}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["comment",{}],["count",{}],["d'
+        'ealer-id",{}],["disabled",{}],["dst-address",{}],["gateway",{}],["instance-id",{}],["name",{}],["numbers",{"read_only":true}],["offset",{}],'
+        '["prefix-length",{}],["priv-offs",{}],["priv-size",{}],["scope",{}],["seed",{}],["target-scope",{}],["use-hold",{}]],"fully_understood":true'
+        '}]]}{"snapshots":[null,null,null,null,null,null,null],"versioned":[["7",">=","Not supported anymore in version  >= 7"],["7","<",{"fields":[['
+        '"action",{"default":"passthrough"}],["address-family",{"can_disable":true}],["append-bgp-communities",{"can_disable":true}],["append-route-t'
+        'argets",{"can_disable":true}],["bgp-as-path",{"can_disable":true}],["bgp-as-path-length",{"can_disable":true}],["bgp-atomic-aggregate",{"can'
+        '_disable":true}],["bgp-communities",{"can_disable":true}],["bgp-local-pref",{"can_disable":true}],["bgp-med",{"can_disable":true}],["bgp-ori'
+        'gin",{"can_disable":true}],["bgp-weight",{"can_disable":true}],["chain",{"required":true}],["comment",{"can_disable":true,"remove_value":""}'
+        '],["disabled",{"default":false}],["distance",{"can_disable":true}],["invert-match",{"default":false}],["jump-target",{}],["locally-originate'
+        'd-bgp",{"can_disable":true}],["match-chain",{"can_disable":true}],["ospf-type",{"can_disable":true}],["pref-src",{"can_disable":true}],["pre'
+        'fix",{"default":"0.0.0.0/0"}],["prefix-length",{"can_disable":true}],["protocol",{"can_disable":true}],["route-comment",{"can_disable":true}'
+        '],["route-tag",{"can_disable":true}],["route-targets",{"can_disable":true}],["routing-mark",{"can_disable":true}],["scope",{"can_disable":tr'
+        'ue}],["set-bgp-communities",{"can_disable":true}],["set-bgp-local-pref",{"can_disable":true}],["set-bgp-med",{"can_disable":true}],["set-bgp'
+        '-prepend",{"can_disable":true}],["set-bgp-prepend-path",{}],["set-bgp-weight",{"can_disable":true}],["set-check-gateway",{"can_disable":true'
+        '}],["set-disabled",{"can_disable":true}],["set-distance",{"can_disable":true}],["set-in-nexthop",{"can_disable":true}],["set-in-nexthop-dire'
+        'ct",{"can_disable":true}],["set-in-nexthop-ipv6",{"can_disable":true}],["set-in-nexthop-linklocal",{"can_disable":true}],["set-out-nexthop",'
+        '{"can_disable":true}],["set-out-nexthop-ipv6",{"can_disable":true}],["set-out-nexthop-linklocal",{"can_disable":true}],["set-pref-src",{"can'
+        '_disable":true}],["set-route-comment",{"can_disable":true}],["set-route-tag",{"can_disable":true}],["set-route-targets",{"can_disable":true}'
+        '],["set-routing-mark",{"can_disable":true}],["set-scope",{"can_disable":true}],["set-site-of-origin",{"can_disable":true}],["set-target-scop'
+        'e",{"can_disable":true}],["set-type",{"can_disable":true}],["set-use-te-nexthop",{"can_disable":true}],["site-of-origin",{"can_disable":true'
+        '}],["target-scope",{"can_disable":true}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"'
+        'fields":[["comment",{}],["communities",{}],["disabled",{}],["list",{}],["numbers",{"read_only":true}],["regexp",{}]],"fully_understood":true'
+        '}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["comment",{}],["communities",{}],["disabled",{}],["list'
+        '",{}],["numbers",{"read_only":true}],["regexp",{}]],"fully_understood":true}]]}{"snapshots":[[0,0],[0,0],[0,0],[0,0],[0,0],[0,0],[0,0]],"ver'
+        'sioned":[["7",">=",{"fields":[["comment",{"can_disable":true,"remove_value":""}],["communities",{"can_disable":true}],["disabled",{"can_disa'
+        'ble":true}],["list",{"required":true}],["regexp",{"can_disable":true}]],"fully_understood":true,"versioned_fields":[[[["7.15",">="]],"number'
+        's",{"read_only":true}]]}]]}{"snapshots":[[0,0],[0,0],[0,0],[0,0],[0,0],[0,0],[0,0]],"versioned":[["7",">=",{"fields":[["comment",{"can_disab'
+        'le":true,"remove_value":""}],["disabled",{"can_disable":true}],["list",{"required":true}],["range",{"can_disable":true}]],"fully_understood"'
+        ':true,"versioned_fields":[[[["7.15",">="]],"numbers",{"read_only":true}]]}]]}{"snapshots":[[0,0],[0,0],[0,0],[0,0],[0,0],[0,0],[0,0]],"versi'
+        'oned":[["7",">=",{"fields":[["chain",{"required":true}],["comment",{"can_disable":true,"remove_value":""}],["disabled",{"can_disable":true}]'
+        ',["rule",{"can_disable":true}]],"fully_understood":true,"versioned_fields":[[[["7.15",">="]],"numbers",{"read_only":true}]]}]]}{"snapshots":'
+        '[[0,0],[0,0],[0,0],[0,0],[0,0],[0,0],[0,0]],"versioned":[["7",">=",{"fields":[["chain",{"required":true}],["comment",{"can_disable":true,"re'
+        'move_value":""}],["disabled",{"can_disable":true}],["do-group-num",{"can_disable":true}],["do-group-prfx",{"can_disable":true}],["do-jump",{'
+        '"can_disable":true}],["do-select-num",{"can_disable":true}],["do-select-prfx",{"can_disable":true}],["do-take",{"can_disable":true}],["do-wh'
+        'ere",{"can_disable":true}]],"fully_understood":true,"versioned_fields":[[[["7.15",">="]],"numbers",{"read_only":true}]]}]]}{"snapshots":[[0]'
+        ',[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["disabled",{}],["exclude",{}],["groups",{}],["interfaces",{}],["numbers",{"r'
+        'ead_only":true}],["sources",{}]],"fully_understood":true}]]}{"snapshots":[[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0]],"unversioned":{"'
+        'fields":[["comment",{"can_disable":true,"remove_value":""}],["disabled",{"default":false}],["id",{}],["name",{}],["select-dynamic-id",{}],["'
+        'select-from-vrf",{}]],"fully_understood":true,"versioned_fields":[[[["7.15",">="]],"numbers",{"read_only":true}]]}}{"unversioned":{"fields":'
+        '[["query-interval",{}],["query-response-interval",{}],["quick-leave",{"default":false}]],"fully_understood":true,"single_value":true}}{"snap'
+        'shots":[[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0]],"unversioned":{"fields":[["alternative-subnets",{"default":""}],["comment",{"can_d'
+        'isable":true,"remove_value":""}],["disabled",{"default":false}],["interface",{}],["threshold",{}],["upstream",{"default":false}]],"fully_und'
+        'erstood":true,"primary_keys":["interface"],"versioned_fields":[[[["7.15",">="]],"numbers",{"read_only":true}]]}}{"snapshots":[[0],[0],[0],[0'
+        '],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["disabled",{}],["downstream-interfaces",{}],["group",{}],["numbers",{"read_only":true}]'
+        ',["source",{}],["upstream-interface",{}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"'
+        'fields":[["afi",{}],["areas",{}],["areas-max",{}],["comment",{}],["disabled",{}],["in-filter-chain",{"can_disable":true}],["l1.lsp-max-age",'
+        '{"can_disable":true}],["l1.lsp-max-size",{"can_disable":true}],["l1.lsp-refresh-interval",{"can_disable":true}],["l1.lsp-update-interval",{"'
+        'can_disable":true}],["l1.originate-default",{"can_disable":true}],["l1.out-filter-chain",{"can_disable":true}],["l1.out-filter-select",{"can'
+        '_disable":true}],["l1.redistribute",{"can_disable":true}],["l2.lsp-max-age",{"can_disable":true}],["l2.lsp-max-size",{"can_disable":true}],['
+        '"l2.lsp-update-interval",{"can_disable":true}],["l2.originate-default",{"can_disable":true}],["l2.out-filter-chain",{"can_disable":true}],["'
+        'l2.out-filter-select",{"can_disable":true}],["l2.redistribute",{"can_disable":true}],["name",{}],["numbers",{"read_only":true}],["system-id"'
+        ',{}],["vrf",{}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["hello-interval'
+        '",{"can_disable":true}],["instance",{}],["interface",{}],["l1.csnp-interval",{"can_disable":true}],["l1.hello-dr-interval",{"can_disable":tr'
+        'ue}],["l1.hello-interval",{"can_disable":true}],["l1.hello-multiplier",{"can_disable":true}],["l1.metric",{"can_disable":true}],["l1.passive'
+        '",{}],["l1.priority",{"can_disable":true}],["l1.psnp-interval",{"can_disable":true}],["l2.csnp-interval",{"can_disable":true}],["l2.hello-dr'
+        '-interval",{"can_disable":true}],["l2.hello-interval",{"can_disable":true}],["l2.hello-multiplier",{"can_disable":true}],["l2.metric",{"can_'
+        'disable":true}],["l2.passive",{}],["l2.priority",{"can_disable":true}],["l2.psnp-interval",{"can_disable":true}],["numbers",{"depr":{"contex'
+        't":"write","msg":"The numbers field will be read-only from community.routeros 4.0.0 on.","version":"4.0.0"}}],["ptp",{}],["ptp.3way-state",{'
+        '"can_disable":true}],["ptp.usage",{"can_disable":true}]],"fully_understood":true,"has_identifier":true}]]}{"snapshots":[[0],[0],[0],[0,0],[0'
+        ',0,1],[0,0,1],[0,0,1]],"versioned":[["7.15",">=",{"fields":[["bcast.l1.csnp-interval",{"can_disable":true}],["bcast.l1.hello-interval",{"can'
+        '_disable":true}],["bcast.l1.hello-interval-dr",{"can_disable":true}],["bcast.l1.hello-multiplier",{"can_disable":true}],["bcast.l1.metric",{'
+        '"can_disable":true}],["bcast.l1.priority",{"can_disable":true}],["bcast.l1.psnp-interval",{"can_disable":true}],["bcast.l2.csnp-interval",{"'
+        'can_disable":true}],["bcast.l2.hello-interval",{"can_disable":true}],["bcast.l2.hello-interval-dr",{"can_disable":true}],["bcast.l2.hello-mu'
+        'ltiplier",{"can_disable":true}],["bcast.l2.metric",{"can_disable":true}],["bcast.l2.priority",{"can_disable":true}],["bcast.l2.psnp-interval'
+        '",{"can_disable":true}],["comment",{}],["instance",{}],["interfaces",{"can_disable":true}],["levels",{}],["numbers",{"read_only":true}],["pt'
+        'p",{"can_disable":true}],["ptp.hello-3way",{"can_disable":true}],["ptp.hello-interval",{"can_disable":true}],["ptp.hello-multiplier",{"can_d'
+        'isable":true}],["ptp.l1.csnp-interval",{"can_disable":true}],["ptp.l1.metric",{"can_disable":true}],["ptp.l1.psnp-interval",{"can_disable":t'
+        'rue}],["ptp.l2.csnp-interval",{"can_disable":true}],["ptp.l2.metric",{"can_disable":true}],["ptp.l2.psnp-interval",{"can_disable":true}]],"f'
+        'ully_understood":true,"versioned_fields":[[[["7.17",">="]],"disabled",{}],[[["7.20",">="]],"passive",{"can_disable":true}]]}]]}{"snapshots":'
+        '[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["age",{}],["body",{"can_disable":true}],["checksum",{}],["instance",{}],'
+        '["level",{}],["lsp-id",{}],["numbers",{"depr":{"context":"write","msg":"The numbers field will be read-only from community.routeros 4.0.0 on'
+        '.","version":"4.0.0"}}],["sequence",{}]],"fully_understood":true,"has_identifier":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versio'
+        'ned":[["7.15",">=",{"fields":[["instance",{}],["interface",{}],["level-type",{}],["numbers",{"depr":{"context":"write","msg":"The numbers fi'
+        'eld will be read-only from community.routeros 4.0.0 on.","version":"4.0.0"}}],["snpa",{}],["srcid",{}],["state",{"can_disable":true}]],"full'
+        'y_understood":true,"has_identifier":true}]]}{"snapshots":[null,null,null,null,null,null,null],"versioned":[["7.15",">=","Not supported anymo'
+        're in version  >= 7.15"],["7.15","<",{"fields":[["bidirectional-timeout",{"default":2}],["gateway-class",{"default":"none"}],["gateway-keepa'
+        'live",{"default":"1m"}],["gateway-selection",{"default":"no-gateway"}],["origination-interval",{"default":"5s"}],["preferred-gateway",{"defa'
+        'ult":"0.0.0.0"}],["timeout",{"default":"1m"}],["ttl",{"default":50}]],"fully_understood":true,"single_value":true}]]}{"snapshots":[[-1,0],[-'
+        '1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0]],"unversioned":{"fields":[["area-id",{"default":"0.0.0.0"}],["comment",{"can_disable":true,"remove_v'
+        'alue":""}],["default-cost",{"can_disable":true}],["disabled",{"default":false}],["instance",{"required":true}],["name",{}],["no-summaries",{'
+        '"can_disable":true}],["nssa-translator",{"can_disable":true}],["type",{"default":"default"}]],"fully_understood":true,"primary_keys":["name"'
+        '],"versioned_fields":[[[["7.15",">="]],"numbers",{"read_only":true}]]}}{"snapshots":[[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0]],"unve'
+        'rsioned":{"fields":[["advertise",{"default":true}],["area",{}],["comment",{"can_disable":true,"remove_value":""}],["cost",{"can_disable":tru'
+        'e}],["disabled",{"default":false}],["prefix",{}]],"fully_understood":true,"primary_keys":["area","prefix"],"versioned_fields":[[[["7.15",">='
+        '"]],"numbers",{"read_only":true}]]}}{"snapshots":[[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0]],"unversioned":{"fields":[["comment",{"ca'
+        'n_disable":true,"remove_value":""}],["disabled",{"default":false}],["domain-id",{"can_disable":true}],["domain-tag",{"can_disable":true}],["'
+        'in-filter-chain",{"can_disable":true}],["mpls-te-address",{"can_disable":true}],["mpls-te-area",{"can_disable":true}],["name",{}],["originat'
+        'e-default",{"can_disable":true}],["out-filter-chain",{"can_disable":true}],["out-filter-select",{"can_disable":true}],["redistribute",{"can_'
+        'disable":true}],["router-id",{"default":"main"}],["routing-table",{"can_disable":true}],["use-dn",{"can_disable":true}],["version",{"default'
+        '":2}],["vrf",{"default":"main"}]],"fully_understood":true,"primary_keys":["name"],"versioned_fields":[[[["7.15",">="]],"numbers",{"read_only'
+        '":true}]]}}{"snapshots":[[-1,0,1],[-1,0,1],[-1,0,1],[-1,0,1],[-1,0,1],[-1,0,1],[-1,0,1]],"unversioned":{"fields":[["area",{"required":true}]'
+        ',["auth",{"can_disable":true}],["auth-id",{"can_disable":true}],["auth-key",{"can_disable":true}],["comment",{"can_disable":true,"remove_val'
+        'ue":""}],["cost",{"default":1}],["dead-interval",{"default":"40s"}],["disabled",{"default":false}],["hello-interval",{"default":"10s"}],["in'
+        'stance-id",{"default":0}],["interfaces",{"can_disable":true}],["networks",{"can_disable":true}],["passive",{"can_disable":true}],["prefix-li'
+        'st",{"can_disable":true}],["priority",{"default":128}],["retransmit-interval",{"default":"5s"}],["transmit-delay",{"default":"1s"}],["type",'
+        '{"default":"broadcast"}],["vlink-neighbor-id",{"can_disable":true}],["vlink-transit-area",{"can_disable":true}]],"fully_understood":true,"ve'
+        'rsioned_fields":[[[["7.15",">="]],"numbers",{"read_only":true}],[[["7.10",">="]],"use-bfd",{"can_disable":true,"default":false}]]}}{"snapsho'
+        'ts":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["comment",{}],["numbers",{"depr":{"context":"write","msg":"The numbe'
+        'rs field will be read-only from community.routeros 4.0.0 on.","version":"4.0.0"}}]],"fully_understood":true,"has_identifier":true,"modify_no'
+        't_supported":true}]]}{"snapshots":[[0,0],[0,0],[0,0],[0,0],[0,0],[0,0],[0,0]],"versioned":[["7",">=",{"fields":[["address",{"required":true}'
+        '],["area",{"required":true}],["comment",{"can_disable":true,"remove_value":""}],["disabled",{"default":false}],["instance-id",{"default":0}]'
+        ',["poll-interval",{"default":"2m"}]],"fully_understood":true,"versioned_fields":[[[["7.15",">="]],"numbers",{"read_only":true}]]}]]}{"snapsh'
+        'ots":[null,null,null,null,null,null,null],"versioned":[["7.15",">=","Not supported anymore in version  >= 7.15"],["7.15","<",{"fields":[["ar'
+        'ea-id",{}],["default",{}],["disabled",{}],["instance",{}],["name",{}],["type",{}]],"unknown_mechanism":true}]]}{"snapshots":[null,null,null,'
+        'null,null,null,null],"versioned":[["7.15",">=","Not supported anymore in version  >= 7.15"],["7.15","<",{"fields":[["default",{}],["disabled'
+        '",{}],["distribute-default",{}],["metric-bgp",{}],["metric-connected",{}],["metric-default",{}],["metric-other-ospf",{}],["metric-rip",{}],['
+        '"metric-static",{}],["name",{}],["redistribute-bgp",{}],["redistribute-connected",{}],["redistribute-other-ospf",{}],["redistribute-rip",{}]'
+        ',["redistribute-static",{}],["router-id",{}]],"unknown_mechanism":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">'
+        '=",{"fields":[["address",{}],["disabled",{}],["hashmask-length",{}],["instance",{}],["numbers",{"read_only":true}],["priority",{}],["scope4"'
+        ',{}],["scope6",{}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["address",{}'
+        '],["disabled",{}],["group",{}],["holdtime",{}],["instance",{}],["numbers",{"read_only":true}],["priority",{}]],"fully_understood":true}]]}{"'
+        'snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["instance",{}],["interfaces",{}],["numbers",{"depr":{"context'
+        '":"write","msg":"The numbers field will be read-only from community.routeros 4.0.0 on.","version":"4.0.0"}}]],"fully_understood":true,"has_i'
+        'dentifier":true}]]}{"snapshots":[[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0]],"unversioned":{"fields":[["afi",{"default":"ipv4"}],["bsm'
+        '-forward-back",{}],["crp-advertise-contained",{}],["disabled",{"default":false}],["name",{}],["rp-hash-mask-length",{}],["rp-static-override'
+        '",{"default":false}],["ssm-range",{}],["switch-to-spt",{"default":true}],["switch-to-spt-bytes",{"default":0}],["switch-to-spt-interval",{}]'
+        ',["vrf",{"default":"main"}]],"fully_understood":true,"primary_keys":["name"],"versioned_fields":[[[["7.15",">="]],"numbers",{"read_only":tru'
+        'e}]]}}{"snapshots":[[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0]],"unversioned":{"fields":[["disabled",{"default":false}],["hello-delay"'
+        ',{"default":"5s"}],["hello-period",{"default":"30s"}],["instance",{"required":true}],["interfaces",{"can_disable":true}],["join-prune-period'
+        '",{"default":"1m"}],["join-tracking-support",{"default":true}],["override-interval",{"default":"2s500ms"}],["priority",{"default":1}],["prop'
+        'agation-delay",{"default":"500ms"}],["source-addresses",{"can_disable":true}]],"fully_understood":true,"versioned_fields":[[[["7.15",">="]],'
+        '"numbers",{"read_only":true}]]}}{"snapshots":[[0],[0],[0],[0],[0,0],[0,0],[0,0]],"versioned":[["7.15",">=",{"fields":[["address",{}],["disab'
+        'led",{}],["group",{}],["instance",{}],["numbers",{"read_only":true}]],"fully_understood":true,"versioned_fields":[[[["7.20.5",">="]],"commen'
+        't",{}]]}]]}{"snapshots":[null,null,null,null,null,null,null],"versioned":[["7.15",">=","Not supported anymore in version  >= 7.15"],["7.15",'
+        '"<",{"fields":[["distribute-default",{"default":"never"}],["garbage-timer",{"default":"2m"}],["metric-bgp",{"default":1}],["metric-connected'
+        '",{"default":1}],["metric-default",{"default":1}],["metric-ospf",{"default":1}],["metric-static",{"default":1}],["redistribute-bgp",{"defaul'
+        't":false}],["redistribute-connected",{"default":false}],["redistribute-ospf",{"default":false}],["redistribute-static",{"default":false}],["'
+        'routing-table",{"default":"main"}],["timeout-timer",{"default":"3m"}],["update-timer",{"default":"30s"}]],"fully_understood":true,"single_va'
+        'lue":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["afi",{}],["disabled",{}],["in-filter-chain",{'
+        '"can_disable":true}],["name",{}],["numbers",{"read_only":true}],["originate-default",{"can_disable":true}],["out-filter-chain",{"can_disable'
+        '":true}],["out-filter-select",{"can_disable":true}],["redistribute",{"can_disable":true}],["route-gc-timeout",{}],["route-timeout",{}],["rou'
+        'ting-table",{"can_disable":true}],["update-interval",{}],["vrf",{}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"'
+        'versioned":[["7.15",">=",{"fields":[["cost",{}],["disabled",{}],["instance",{}],["interfaces",{"can_disable":true}],["key-chain",{"can_disab'
+        'le":true}],["mode",{"can_disable":true}],["numbers",{"read_only":true}],["password",{"can_disable":true}],["poison-reverse",{}],["source-add'
+        'resses",{"can_disable":true}],["split-horizon",{}],["use-bfd",{"can_disable":true}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0'
+        '],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["chain",{}],["disabled",{}],["key",{}],["key-id",{}],["numbers",{"read_only":true}],["v'
+        'alid-from",{}],["valid-till",{}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":'
+        '[["address",{}],["disabled",{}],["instance",{}],["numbers",{"read_only":true}]],"fully_understood":true}]]}{"unversioned":{"fields":[["distr'
+        'ibute-default",{"default":"never"}],["garbage-timer",{"default":"2m"}],["metric-bgp",{"default":1}],["metric-connected",{"default":1}],["met'
+        'ric-default",{"default":1}],["metric-ospf",{"default":1}],["metric-static",{"default":1}],["redistribute-bgp",{"default":false}],["redistrib'
+        'ute-connected",{"default":false}],["redistribute-ospf",{"default":false}],["redistribute-static",{"default":false}],["timeout-timer",{"defau'
+        'lt":"3m"}],["update-timer",{"default":"30s"}]],"fully_understood":true,"single_value":true}}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"vers'
+        'ioned":[["7.15",">=",{"fields":[["comment",{}],["disabled",{}],["numbers",{"depr":{"context":"write","msg":"The numbers field will be read-o'
+        'nly from community.routeros 4.0.0 on.","version":"4.0.0"}}]],"fully_understood":true,"has_identifier":true,"modify_not_supported":true}]]}{"'
+        'snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["action",{}],["comment",{}],["disabled",{}],["dst-address",{"'
+        'can_disable":true}],["interface",{"can_disable":true}],["min-prefix",{"can_disable":true}],["numbers",{"depr":{"context":"write","msg":"The '
+        'numbers field will be read-only from community.routeros 4.0.0 on.","version":"4.0.0"}}],["routing-mark",{"can_disable":true}],["src-address"'
+        ',{"can_disable":true}],["table",{}]],"fully_understood":true,"has_identifier":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned"'
+        ':[["7.15",">=",{"fields":[["address",{}],["comment",{}],["disabled",{}],["expire-interval",{}],["group",{}],["numbers",{"read_only":true}],['
+        '"port",{}],["preference",{}],["refresh-interval",{}],["retry-interval",{}],["vrf",{}]],"fully_understood":true}]]}{"snapshots":[[0,1],[0,1],'
+        '[0,1],[0,1],[0,1],[0,1],[0,1]],"versioned":[["7",">=",{"fields":[["action",{"can_disable":true}],["comment",{"can_disable":true,"remove_valu'
+        'e":""}],["disabled",{"default":false}],["dst-address",{"can_disable":true}],["interface",{"can_disable":true}],["min-prefix",{"can_disable":'
+        'true}],["routing-mark",{"can_disable":true}],["src-address",{"can_disable":true}],["table",{"can_disable":true}]],"fully_understood":true,"v'
+        'ersioned_fields":[[[["7.22",">="]],"chain",{}],[[["7.15",">="]],"numbers",{"read_only":true}],[[["7.22",">="]],"realm",{}],[[["7.22",">="]],'
+        '"vrf",{}]]}]]}{"snapshots":[[0],[0],[0],[0],[0,0,1,2,3,4],[0,0,1,2,3,4],[0,0,1,2,3,4]],"versioned":[["7.15",">=",{"fields":[["single-process'
+        '",{}]],"fully_understood":true,"single_value":true,"versioned_fields":[[[["7.21",">="]],"check-gateway-ping-count",{}],[[["7.21",">="]],"che'
+        'ck-gateway-ping-interval",{}],[[["7.21",">="]],"check-gateway-ping-timeout",{}],[[["7.19",">="]],"connected-in-chain",{}],[[["7.19",">="]],"'
+        'dynamic-in-chain",{}],[[["7.22",">="]],"policy-rules",{}]]}]]}{"snapshots":[[0,0],[0,0],[0,0],[0,0],[0,0],[0,0],[0,0]],"versioned":[["7",">='
+        '",{"fields":[["comment",{"can_disable":true,"remove_value":""}],["disabled",{"default":false}],["fib",{"can_disable":true}],["name",{"requir'
+        'ed":true}]],"fully_understood":true,"versioned_fields":[[[["7.15",">="]],"numbers",{"read_only":true}]]}]]}{"snapshots":[[1],[1],[1],null,nu'
+        'll,null,null],"versioned":[["7.16",">=","Not supported anymore in version  >= 7.16"],["7.15",">=",{"fields":[["enabled",{}]],"fully_understo'
+        'od":true,"single_value":true}]]}{"snapshots":[[-1,1,2,3],[-1,1,2,3],[-1,1,2,3],[-1,1,2,3],[-1,1,2,3],[-1,1,2,3],[-1,1,2,3]],"unversioned":{"'
+        'fields":[["contact",{"default":""}],["enabled",{"default":false}],["location",{"default":""}],["src-address",{"default":"::"}],["trap-commun'
+        'ity",{"default":"public"}],["trap-generators",{"default":"temp-exception"}],["trap-interfaces",{"default":""}],["trap-target",{"default":""}'
+        '],["trap-version",{"default":1}]],"fully_understood":true,"single_value":true,"versioned_fields":[[[["7.10","<"]],"engine-id",{"default":""}'
+        '],[[["7.10",">="]],"engine-id",{"read_only":true}],[[["7.10",">="]],"engine-id-suffix",{"default":""}],[[["7.3",">="]],"vrf",{"default":"mai'
+        'n"}]]}}{"snapshots":[[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0]],"unversioned":{"fields":[["addresses",{"default":"::/0"}],["authentic'
+        'ation-password",{"default":""}],["authentication-protocol",{"default":"MD5"}],["comment",{"can_disable":true,"remove_value":""}],["default",'
+        '{"read_only":true}],["disabled",{"default":false}],["encryption-password",{"default":""}],["encryption-protocol",{"default":"DES"}],["name",'
+        '{"required":true}],["read-access",{"default":true}],["security",{"default":"none"}],["write-access",{"default":false}]],"fully_understood":t'
+        'rue,"primary_keys":["name"],"versioned_fields":[[[["7.15",">="]],"numbers",{"read_only":true}]]}}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],'
+        '"versioned":[["7.15",">=",{"fields":[["channel",{}],["disabled",{}],["numbers",{"read_only":true}],["port",{}],["user",{}]],"fully_understoo'
+        'd":true}]]}{"snapshots":[[-1],[-1],[-1],[-1],[-1],[-1],[-1]],"unversioned":{"fields":[["date",{}],["time",{}],["time-zone-autodetect",{"defa'
+        'ult":true}],["time-zone-name",{"default":"manual"}]],"fully_understood":true,"single_value":true,"versioned_fields":[[[["7.15","<"]],"gmt-of'
+        'fset",{}]]}}{"unversioned":{"fields":[["dst-delta",{"default":"00:00"}],["dst-end",{"default":"jan/01/1970 00:00:00"}],["dst-start",{"defaul'
+        't":"jan/01/1970 00:00:00"}],["time-zone",{"default":"+00:00"}]],"fully_understood":true,"single_value":true}}{"snapshots":[[0],[0],[0],[0],['
+        '0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["channel",{}],["disabled",{}],["numbers",{"read_only":true}],["port",{}],["term",{}]],"ful'
+        'ly_understood":true}]]}{"snapshots":[null,null,[1],null,null,null,null],"versioned":[["7.16.1",">=","Not supported anymore in version  >= 7.'
+        '16.1"],["7.15.3",">=",{"fields":[["blank-interval",{}],["line-count",{}]],"fully_understood":true,"single_value":true}]]}{"snapshots":[[0],['
+        '0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["channel",{}],["coordinate-format",{}],["enabled",{}],["init-channel",{}],["in'
+        'it-string",{}],["port",{}],["set-system-time",{}]],"fully_understood":true,"single_value":true}]]}{"snapshots":[null,null,[1],null,null,null'
+        ',null],"versioned":[["7.16.1",">=","Not supported anymore in version  >= 7.16.1"],["7.15.3",">=",{"fields":[["multi-cpu",{}]],"fully_underst'
+        'ood":true,"single_value":true}]]}{"snapshots":[null,null,[1],null,null,null,null],"versioned":[["7.16.1",">=","Not supported anymore in vers'
+        'ion  >= 7.16.1"],["7.15.3",">=",{"fields":[["state-after-reboot",{}]],"fully_understood":true,"single_value":true}]]}{"snapshots":[[0],[0],['
+        '0],[0],[0],[0],[0]],"versioned":[["7.14",">=",{"fields":[["cpu-overtemp-check",{}],["cpu-overtemp-startup-delay",{}],["cpu-overtemp-threshol'
+        'd",{}],["fan-control-interval",{"default":30}],["fan-full-speed-temp",{"default":65}],["fan-min-speed-percent",{"default":12}],["fan-mode",{'
+        '}],["fan-on-threshold",{}],["fan-switch",{}],["fan-target-temp",{"default":58}],["use-fan",{}]],"fully_understood":true,"single_value":true}'
+        '],["7.14","<",{"fields":[["cpu-overtemp-check",{}],["cpu-overtemp-startup-delay",{}],["cpu-overtemp-threshold",{}],["fan-control-interval",{'
+        '"can_disable":true,"default":"30s"}],["fan-full-speed-temp",{"default":65}],["fan-min-speed-percent",{"default":0}],["fan-mode",{}],["fan-on'
+        '-threshold",{}],["fan-switch",{}],["fan-target-temp",{"default":58}],["use-fan",{}]],"fully_understood":true,"single_value":true}]]}{"unvers'
+        'ioned":{"fields":[["name",{"default":"Mikrotik"}]],"fully_understood":true,"single_value":true}}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"'
+        'versioned":[["7.15",">=",{"fields":[["disabled",{}],["interface",{}],["leds",{}],["modem-signal-threshold",{}],["numbers",{"read_only":true}'
+        '],["type",{}]],"fully_understood":true,"versioned_fields":[[[["7.22.1",">="]],"color",{}]]}]]}{"unversioned":{"fields":[["all-leds-off",{"de'
+        'fault":"never"}]],"fully_understood":true,"single_value":true}}{"snapshots":[[-1,1],[-1,1],[-1,1],[-1,1,2],[-1,1,2],[-1,1,2],[-1,1,2]],"unve'
+        'rsioned":{"fields":[["action",{"default":"memory"}],["disabled",{"default":false}],["prefix",{"default":""}],["topics",{"default":""}]],"ful'
+        'ly_understood":true,"versioned_fields":[[[["7.22",">="]],"comment",{}],[[["7.15",">="]],"numbers",{"read_only":true}],[[["7.17",">="]],"rege'
+        'x",{}]]}}{"snapshots":[[-1,1,3],[-1,1,3],[-1,1,3],[-1,2,3,4,5],[-1,2,3,4,5,7],[-1,2,3,4,5,7],[-1,2,3,4,5,7]],"unversioned":{"fields":[["comm'
+        'ent",{"can_disable":true,"remove_value":""}],["disk-file-count",{"default":2}],["disk-file-name",{"default":"log"}],["disk-lines-per-file",{'
+        '"default":1000}],["disk-stop-on-full",{"default":false}],["email-start-tls",{"default":false}],["email-to",{"default":""}],["memory-lines",{'
+        '"default":1000}],["memory-stop-on-full",{"default":false}],["name",{}],["remember",{"default":true}],["remote",{"default":"0.0.0.0"}],["remo'
+        'te-port",{"default":514}],["src-address",{"default":"0.0.0.0"}],["syslog-facility",{"default":"daemon"}],["syslog-severity",{"default":"auto'
+        '"}],["syslog-time-format",{"default":"bsd-syslog"}],["target",{"required":true}]],"fully_understood":true,"primary_keys":["name"],"versioned'
+        '_fields":[[[["7.22",">="]],"add-topics-string",{}],[[["7.18","<"]],"bsd-syslog",{"default":false}],[[["7.18",">="]],"cef-event-delimiter",{"'
+        'default":"\\r\\n"}],[[["7.15",">="]],"numbers",{"read_only":true}],[[["7.18",">="]],"remote-log-format",{"default":"default"}],[[["7.18",">='
+        '"]],"remote-protocol",{"default":"udp"}],[[["7.22",">="]],"script",{}],[[["7.19.6",">="]],"vrf",{"default":"main"}]]}}{"snapshots":[[-1,0],['
+        '-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0]],"unversioned":{"fields":[["note",{"default":""}],["show-at-login",{"default":true}]],"fully_unders'
+        'tood":true,"single_value":true,"versioned_fields":[[[["7.14",">="]],"show-at-cli-login",{"default":false}]]}}{"snapshots":[[-1],[-1],[-1],[-'
+        '1],[-1],[-1],[-1]],"unversioned":{"fields":[["enabled",{"default":false}],["mode",{"default":"unicast"}],["servers",{"default":""}],["vrf",{'
+        '"default":"main"}]],"fully_understood":true,"single_value":true,"versioned_fields":[[[["7.15","<"]],"primary-ntp",{"default":"0.0.0.0"}],[[['
+        '"7.15","<"]],"secondary-ntp",{"default":"0.0.0.0"}],[[["7.15","<"]],"server-dns-names",{"default":""}]]}}{"snapshots":[[-1,0],[-1,0],[-1,0],'
+        '[-1,0],[-1,0],[-1,0],[-1,0]],"unversioned":{"fields":[["address",{}],["auth-key",{"default":"none"}],["comment",{"can_disable":true,"remove_'
+        'value":""}],["disabled",{"default":false}],["iburst",{"default":true}],["max-poll",{"default":10}],["min-poll",{"default":6}]],"fully_unders'
+        'tood":true,"primary_keys":["address"],"versioned_fields":[[[["7.15",">="]],"numbers",{"read_only":true}]]}}{"snapshots":[[0],[0],[0],[0],[0]'
+        ',[0],[0]],"versioned":[["7.15",">=",{"fields":[["comment",{}],["key-id",{}],["key-val",{}],["numbers",{"read_only":true}]],"fully_understood'
+        '":true}]]}{"unversioned":{"fields":[["auth-key",{"default":"none"}],["broadcast",{"default":false}],["broadcast-addresses",{"default":""}],['
+        '"enabled",{"default":false}],["local-clock-stratum",{"default":5}],["manycast",{"default":false}],["multicast",{"default":false}],["use-loca'
+        'l-clock",{"default":false}],["vrf",{"default":"main"}]],"fully_understood":true,"single_value":true}}{"snapshots":[null,null,null,[1],[1],[1'
+        '],[1]],"versioned":[["7.22",">=","Not supported anymore in version 7.22"],["7.17",">=",{"fields":[["download",{}],["numbers",{"depr":{"conte'
+        'xt":"write","msg":"The numbers field will be read-only from community.routeros 4.0.0 on.","version":"4.0.0"}}]],"fully_understood":true,"has'
+        '_identifier":true}]]}{"snapshots":[null,null,null,[0],[0],[0],[0]],"versioned":[["7.17",">=",{"fields":[["check-interval",{}],["enabled",{}]'
+        ',["password",{}],["primary-server",{}],["secondary-server",{}],["user",{}]],"fully_understood":true,"single_value":true}]]}{"snapshots":[nul'
+        'l,null,null,[0],[0],[0],[0]],"versioned":[["7.17",">=",{"fields":[["address",{}],["numbers",{"read_only":true}],["user",{}]],"fully_understo'
+        'od":true,"versioned_fields":[[[["7.22",">="]],"password",{}]]}]]}{"unversioned":{"fields":[["channel",{"default":"stable"}],["installed-vers'
+        'ion",{"read_only":true}],["latest-version",{"read_only":true}],["status",{"read_only":true}]],"fully_understood":true,"single_value":true}}{'
+        '"snapshots":[null,null,null,null,[0],[0],[0]],"versioned":[["7.20",">=",{"fields":[["authorization",{}]],"fully_understood":true,"single_val'
+        'ue":true}]]}{"unversioned":{"fields":[["cpu",{}],["numbers",{"depr":{"context":"write","msg":"The numbers field will be read-only from commu'
+        'nity.routeros 4.0.0 on.","version":"4.0.0"}}]],"fully_understood":true,"has_identifier":true}}{"snapshots":[[-1,0],[-1,0],[-1,0],[-1,0],[-1,'
+        '0],[-1,0],[-1,0]],"unversioned":{"fields":[["disabled",{"default":false}],["name",{}]],"fixed_entries":true,"fully_understood":true,"primary'
+        '_keys":["name"],"versioned_fields":[[[["7.15",">="]],"numbers",{}]]}}{"snapshots":[[1],[1],[1],[1],null,null,null],"versioned":[["7.20",">="'
+        ',"Not supported anymore in version  >= 7.20"],["7.15",">=",{"fields":[["device",{}],["device-id",{}],["name",{}],["numbers",{"depr":{"contex'
+        't":"write","msg":"The numbers field will be read-only from community.routeros 4.0.0 on.","version":"4.0.0"}}],["ports",{}],["serial-number",'
+        '{}],["speed",{}],["usb-version",{}],["vendor",{}],["vendor-id",{}]],"fully_understood":true,"has_identifier":true}]]}{"snapshots":[[1],[1],['
+        '1],[1],null,null,null],"versioned":[["7.20",">=","Not supported anymore in version  >= 7.20"],["7.15",">=",{"fields":[["authorization",{}]],'
+        '"fully_understood":true,"single_value":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["enabled",{}'
+        '],["hold-time",{}],["on-event",{}]],"fully_understood":true,"single_value":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[['
+        '"7.15",">=",{"fields":[["enabled",{}],["hold-time",{}],["on-event",{}]],"fully_understood":true,"single_value":true}]]}{"snapshots":[[-1,0,1'
+        ',2,3,4,5,8],[-1,0,1,2,3,4,5,8],[-1,0,1,2,3,4,5,8],[-1,0,1,2,3,4,5,8],[-1,0,1,2,3,4,5,8],[-1,0,1,2,3,4,5,8],[-1,0,1,2,3,4,5,8]],"unversioned"'
+        ':{"fields":[["auto-upgrade",{"default":false}],["baud-rate",{"default":115200}],["boot-delay",{"default":"2s"}],["boot-device",{"default":"n'
+        'and-if-fail-then-ethernet"}],["boot-protocol",{"default":"bootp"}],["cpu-frequency",{}],["enable-jumper-reset",{"default":true}],["enter-set'
+        'up-on",{}],["force-backup-booter",{"default":false}],["preboot-etherboot",{"default":"disabled"}],["preboot-etherboot-server",{"default":"an'
+        'y"}],["protected-routerboot",{"default":"disabled"}],["reformat-hold-button",{"default":"20s"}],["reformat-hold-button-max",{"default":"10m"'
+        '}],["silent-boot",{"default":false}]],"fully_understood":true,"single_value":true,"versioned_fields":[[[["7.15",">="]],"boot-os",{"default":'
+        '"router-os"}],[[["7.15",">="]],"cpu-mode",{}],[[["7.15",">="]],"disable-pci",{}],[[["7.15",">="]],"etherboot-port",{}],[[["7.15",">="]],"gpi'
+        'o-function",{}],[[["7.15",">="]],"init-delay",{}],[[["7.15","<"]],"memory-frequency",{}],[[["7.22",">="]],"preferred-architecture",{}],[[["7'
+        '.15",">="]],"regulatory-domain-ce",{}]]}}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["type",{}],["usb-m'
+        'ode",{}]],"fully_understood":true,"single_value":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["e'
+        'nabled",{}],["hold-time",{}],["on-event",{}]],"fully_understood":true,"single_value":true}]]}{"snapshots":[[-1,0],[-1,0],[-1,0],[-1,0],[-1,0'
+        '],[-1,0],[-1,0]],"unversioned":{"fields":[["comment",{"can_disable":true,"remove_value":""}],["disabled",{"default":false}],["interval",{"de'
+        'fault":"0s"}],["name",{}],["on-event",{"default":""}],["policy",{"default":"ftp,reboot,read,write,policy,test,password,sniff,sensitive,romon'
+        '"}],["start-date",{}],["start-time",{}]],"fully_understood":true,"primary_keys":["name"],"versioned_fields":[[[["7.15",">="]],"numbers",{"re'
+        'ad_only":true}]]}}{"snapshots":[[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0]],"unversioned":{"fields":[["comment",{"can_disable":true,"r'
+        'emove_value":""}],["dont-require-permissions",{"default":false}],["name",{}],["owner",{}],["policy",{"default":"ftp,reboot,read,write,policy'
+        ',test,password,sniff,sensitive,romon"}],["source",{"default":""}]],"fully_understood":true,"primary_keys":["name"],"versioned_fields":[[[["7'
+        '.15",">="]],"numbers",{"read_only":true}]]}}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["comment",{}],['
+        '"numbers",{"depr":{"context":"write","msg":"The numbers field will be read-only from community.routeros 4.0.0 on.","version":"4.0.0"}}],["va'
+        'lue",{}]],"fully_understood":true,"has_identifier":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[['
+        '"comment",{}],["numbers",{"depr":{"context":"write","msg":"The numbers field will be read-only from community.routeros 4.0.0 on.","version":'
+        '"4.0.0"}}],["started",{}],["type",{}]],"fully_understood":true,"has_identifier":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versione'
+        'd":[["7.15",">=",{"fields":[["address-acquisition-mode",{}],["allow-from",{}],["allow-from-ports",{}],["allow-from-vlan",{}],["identity",{}]'
+        ',["static-ip-address",{}]],"fully_understood":true,"single_value":true}]]}{"snapshots":[[1],[1],[1],null,null,null,null],"versioned":[["7.17'
+        '",">=","Not supported anymore in version  >= 7.17"],["7.15",">=",{"fields":[["download",{}],["numbers",{"depr":{"context":"write","msg":"The'
+        ' numbers field will be read-only from community.routeros 4.0.0 on.","version":"4.0.0"}}]],"fully_understood":true,"has_identifier":true}]]}{'
+        '"snapshots":[[1,0],[1,0],[1,0],null,null,null,null],"versioned":[["7.17",">=","Not supported anymore in version  >= 7.17"],["7.17","<",{"fie'
+        'lds":[["check-interval",{"default":"1d"}],["enabled",{"default":false}],["primary-server",{"default":"0.0.0.0"}],["secondary-server",{"defau'
+        'lt":"0.0.0.0"}],["user",{"default":""}]],"fully_understood":true,"single_value":true,"versioned_fields":[[[["7.15",">="]],"password",{}]]}]]'
+        '}{"snapshots":[[1],[1],[1],null,null,null,null],"versioned":[["7.17",">=","Not supported anymore in version  >= 7.17"],["7.15",">=",{"fields'
+        '":[["address",{}],["numbers",{"read_only":true}],["user",{}]],"fully_understood":true}]]}{"snapshots":[[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-'
+        '1,0],[-1,0]],"unversioned":{"fields":[["alarm-setting",{"default":"immediate"}],["check-capabilities",{"can_disable":true,"remove_value":tru'
+        'e}],["comment",{"can_disable":true,"remove_value":""}],["disabled",{"default":true}],["min-runtime",{"default":"never"}],["name",{}],["offli'
+        'ne-time",{"default":"0s"}],["port",{"required":true}]],"fully_understood":true,"primary_keys":["name"],"versioned_fields":[[[["7.15",">="]],'
+        '"numbers",{"read_only":true}]]}}{"unversioned":{"fields":[["auto-send-supout",{"default":false}],["automatic-supout",{"default":true}],["pin'
+        'g-start-after-boot",{"default":"5m"}],["ping-timeout",{"default":"1m"}],["send-email-from",{"default":"none"}],["send-email-to",{"default":"'
+        'none"}],["send-smtp-server",{"default":"none"}],["watch-address",{"default":"none"}],["watchdog-timer",{"default":true}]],"fully_understood"'
+        ':true,"single_value":true}}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["append",{"can_disable":true}],['
+        '"file-name",{}],["max-lines",{}],["max-size",{}],["no-header-paging",{"can_disable":true}],["save-interval",{}],["save-timestamp",{"can_disa'
+        'ble":true}],["source",{}],["switch-to",{"can_disable":true}]],"fully_understood":true}]]}{"snapshots":[[-1],[-1],[-1],[-1,0,1],[-1,0,1],[-1,'
+        '0,1],[-1,0,1]],"unversioned":{"fields":[["allocate-udp-ports-from",{"default":2000}],["authenticate",{"default":true}],["enabled",{"default"'
+        ':true}],["max-sessions",{"default":100}]],"fully_understood":true,"single_value":true,"versioned_fields":[[[["7.18",">="]],"allowed-addresse'
+        's4",{}],[[["7.18",">="]],"allowed-addresses6",{}]]}}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["action'
+        '",{}],["case-id",{}],["case-name",{}],["comment",{}],["disabled",{}],["file-root",{}],["intercept-ip",{}],["intercept-port",{}],["limited-fi'
+        'le-hash-method",{}],["limited-file-stop-interval",{}],["numbers",{"read_only":true}],["pcap-file-hash-method",{}],["pcap-file-stop-count",{}'
+        '],["pcap-file-stop-interval",{}],["pcap-file-stop-size",{}]],"fully_understood":true}]]}{"snapshots":[[0,3],[0,3],[0,3],[0,3],[0,0,3],[0,0,3'
+        '],[0,0,3]],"versioned":[["7.12",">=",{"fields":[["from",{"default":"<>"}],["password",{"default":""}],["port",{"default":25}],["server",{"de'
+        'fault":"0.0.0.0"}],["tls",{"default":false}],["user",{"default":""}]],"fully_understood":true,"single_value":true,"versioned_fields":[[[["7.'
+        '21",">="]],"certificate-verification",{}],[[["7.15","<"]],"start-tls",{"default":false}],[[["7.15","<"]],"vfr",{"default":""}],[[["7.15",">='
+        '"]],"vrf",{}]]}],["7.12","<",{"fields":[["address",{"default":"0.0.0.0"}],["from",{"default":"<>"}],["password",{"default":""}],["port",{"de'
+        'fault":25}],["start-tls",{"default":false}],["tls",{"default":false}],["user",{"default":""}],["vfr",{"default":""}]],"fully_understood":tru'
+        'e,"single_value":true}]]}{"unversioned":{"fields":[["page-refresh",{"default":300}],["store-every",{"default":"5min"}]],"fully_understood":t'
+        'rue,"single_value":true}}{"snapshots":[[0,0],[0,0],[0,0],[0,0],[0,0],[0,0],[0,0]],"versioned":[["7",">=",{"fields":[["allow-address",{"defau'
+        'lt":"0.0.0.0/0"}],["comment",{"can_disable":true,"remove_value":""}],["disabled",{"default":false}],["interface",{"default":"all"}],["store-'
+        'on-disk",{"default":true}]],"fully_understood":true,"versioned_fields":[[[["7.15",">="]],"numbers",{"read_only":true}]]}]]}{"snapshots":[[0]'
+        ',[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["allow-address",{}],["allow-target",{}],["comment",{}],["disabled",{}],["num'
+        'bers",{"read_only":true}],["simple-queue",{}],["store-on-disk",{}]],"fully_understood":true}]]}{"snapshots":[[0,0],[0,0],[0,0],[0,0],[0,0],['
+        '0,0],[0,0]],"versioned":[["7",">=",{"fields":[["allow-address",{"default":"0.0.0.0/0"}],["comment",{"can_disable":true,"remove_value":""}],['
+        '"disabled",{"default":false}],["store-on-disk",{"default":true}]],"fully_understood":true,"versioned_fields":[[[["7.15",">="]],"numbers",{"r'
+        'ead_only":true}]]}]]}{"unversioned":{"fields":[["allowed-interface-list",{}]],"fully_understood":true,"single_value":true}}{"unversioned":{"'
+        'fields":[["allowed-interface-list",{}]],"fully_understood":true,"single_value":true}}{"unversioned":{"fields":[["enabled",{"default":true}]]'
+        ',"fully_understood":true,"single_value":true}}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["interface",{'
+        '}],["numbers",{"depr":{"context":"write","msg":"The numbers field will be read-only from community.routeros 4.0.0 on.","version":"4.0.0"}}],'
+        '["src-address",{}],["uptime",{}]],"fully_understood":true,"has_identifier":true}]]}{"snapshots":[[0,6],[0,6],[0,6],[0,0,1,4,5,6,7,8],[0,0,1,'
+        '2,3,4,5,6,7,8],[0,0,1,2,3,4,5,6,7,8],[0,0,1,2,3,4,5,6,7,8]],"versioned":[["7",">=",{"fields":[["certificate",{"can_disable":true}],["check-c'
+        'ertificate",{"can_disable":true}],["comment",{}],["disabled",{"default":false}],["down-script",{"can_disable":true}],["host",{"required":tru'
+        'e}],["http-codes",{"can_disable":true}],["interval",{"can_disable":true}],["name",{}],["packet-count",{"can_disable":true}],["packet-interva'
+        'l",{"can_disable":true}],["packet-size",{"can_disable":true}],["port",{"can_disable":true}],["src-address",{"can_disable":true}],["start-del'
+        'ay",{"can_disable":true}],["startup-delay",{"can_disable":true}],["test-script",{"can_disable":true}],["thr-avg",{"can_disable":true}],["thr'
+        '-http-time",{"can_disable":true}],["thr-jitter",{"can_disable":true}],["thr-loss-count",{"can_disable":true}],["thr-loss-percent",{"can_disa'
+        'ble":true}],["thr-max",{"can_disable":true}],["thr-stdev",{"can_disable":true}],["thr-tcp-conn-time",{"can_disable":true}],["timeout",{"can_'
+        'disable":true}],["type",{"default":"simple"}],["up-script",{"can_disable":true}]],"fully_understood":true,"versioned_fields":[[[["7.16",">="'
+        ']],"accept-icmp-time-exceeded",{"can_disable":true,"default":false}],[[["7.16",">="]],"dns-server",{"can_disable":true}],[[["7.20",">="]],"e'
+        'arly-failure-detection",{"can_disable":true}],[[["7.20",">="]],"early-success-detection",{"can_disable":true}],[[["7.17",">="]],"ignore-init'
+        'ial-down",{"can_disable":true}],[[["7.17",">="]],"ignore-initial-up",{"can_disable":true}],[[["7.15",">="]],"numbers",{"read_only":true}],[['
+        '["7.16",">="]],"record-type",{"can_disable":true}],[[["7.16",">="]],"ttl",{"can_disable":true,"default":255}]]}]]}{"unversioned":{"fields":['
+        '["enabled",{"default":false}],["id",{"default":"00:00:00:00:00:00"}],["secrets",{"default":""}]],"fully_understood":true,"single_value":true'
+        '}}{"snapshots":[[-1,0,1],[-1,0,1],[-1,0,1],[-1,0,1],[-1,0,1],[-1,0,1],[-1,0,1]],"unversioned":{"fields":[["cost",{}],["disabled",{}],["forbi'
+        'd",{}],["interface",{}],["secrets",{}]],"fully_understood":true,"versioned_fields":[[[["7.15",">="]],"comment",{}],[[["7.15",">="]],"numbers'
+        '",{"read_only":true}]]}}{"snapshots":[[-1,3],[-1,3],[-1,3],[-1,1,3],[-1,1,2,3],[-1,1,2,3],[-1,1,2,3]],"unversioned":{"fields":[["allowed-num'
+        'ber",{"default":""}],["channel",{"default":0}],["port",{"default":"none"}],["receive-enabled",{"default":false}],["secret",{"default":""}],['
+        '"sim-pin",{"default":""}]],"fully_understood":true,"single_value":true,"versioned_fields":[[[["7.15","<"]],"auto-erase",{"default":false}],['
+        '[["7.16",">="]],"polling",{}],[[["7.20",">="]],"remove-sent-sms-after-send",{}],[[["7.15",">="]],"sms-storage",{}]]}}{"snapshots":[[-1,0,1,2'
+        ',3,4,5,6,7,8,10,11],[-1,0,1,2,3,4,5,6,7,8,10,11],[-1,0,1,2,3,4,5,6,7,8,10,11],[-1,0,1,2,3,4,5,6,7,8,10,11],[-1,0,1,2,3,4,5,6,7,8,9,10,11],[-'
+        '1,0,1,2,3,4,5,6,7,8,9,10,11],[-1,0,1,2,3,4,5,6,7,8,9,10,11]],"unversioned":{"fields":[["file-limit",{"default":"1000KiB"}],["file-name",{"de'
+        'fault":""}],["filter-cpu",{"default":""}],["filter-direction",{"default":"any"}],["filter-interface",{"default":""}],["filter-ip-address",{"'
+        'default":""}],["filter-ip-protocol",{"default":""}],["filter-ipv6-address",{"default":""}],["filter-mac-address",{"default":""}],["filter-ma'
+        'c-protocol",{"default":""}],["filter-operator-between-entries",{"default":"or"}],["filter-port",{"default":""}],["filter-size",{"default":""'
+        '}],["filter-stream",{"default":false}],["memory-limit",{"default":"100KiB"}],["memory-scroll",{"default":true}],["only-headers",{"default":f'
+        'alse}],["streaming-enabled",{"default":false}],["streaming-server",{"default":"0.0.0.0:37008"}]],"fully_understood":true,"single_value":true'
+        ',"versioned_fields":[[[["7.15",">="]],"filter-dst-ip-address",{}],[[["7.15",">="]],"filter-dst-ipv6-address",{}],[[["7.15",">="]],"filter-ds'
+        't-mac-address",{}],[[["7.15",">="]],"filter-dst-port",{}],[[["7.15",">="]],"filter-src-ip-address",{}],[[["7.15",">="]],"filter-src-ipv6-add'
+        'ress",{}],[[["7.15",">="]],"filter-src-mac-address",{}],[[["7.15",">="]],"filter-src-port",{}],[[["7.15",">="]],"filter-vlan",{}],[[["7.19",'
+        '">="]],"max-packet-size",{}],[[["7.15",">="]],"quick-rows",{}],[[["7.15",">="]],"quick-show-frame",{}]]}}{"unversioned":{"fields":[["latency'
+        '-distribution-max",{"default":"100us"}],["measure-out-of-order",{"default":true}],["stats-samples-to-keep",{"default":100}],["test-id",{"def'
+        'ault":0}]],"fully_understood":true,"single_value":true}}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["co'
+        'mment",{}],["compute-checksum-from-offset",{}],["data",{}],["data-byte",{}],["header-stack",{}],["interface",{"can_disable":true}],["ip-dscp'
+        '",{"can_disable":true}],["ip-dst",{"can_disable":true}],["ip-frag-off",{"can_disable":true}],["ip-gateway",{"can_disable":true}],["ip-id",{"'
+        'can_disable":true}],["ip-protocol",{"can_disable":true}],["ip-src",{"can_disable":true}],["ip-ttl",{"can_disable":true}],["ipv6-dst",{"can_d'
+        'isable":true}],["ipv6-flow-label",{"can_disable":true}],["ipv6-gateway",{"can_disable":true}],["ipv6-hop-limit",{"can_disable":true}],["ipv6'
+        '-next-header",{"can_disable":true}],["ipv6-src",{"can_disable":true}],["ipv6-traffic-class",{"can_disable":true}],["mac-dst",{"can_disable":'
+        'true}],["mac-protocol",{"can_disable":true}],["mac-src",{"can_disable":true}],["name",{}],["numbers",{"read_only":true}],["port",{"can_disab'
+        'le":true}],["random-byte-offsets-and-masks",{}],["random-ranges",{}],["raw-header",{"can_disable":true}],["special-footer",{}],["tcp-ack",{"'
+        'can_disable":true}],["tcp-data-offset",{"can_disable":true}],["tcp-dst-port",{"can_disable":true}],["tcp-flags",{"can_disable":true}],["tcp-'
+        'src-port",{"can_disable":true}],["tcp-syn",{"can_disable":true}],["tcp-urgent-pointer",{"can_disable":true}],["tcp-window-size",{"can_disabl'
+        'e":true}],["udp-checksum",{"can_disable":true}],["udp-dst-port",{"can_disable":true}],["udp-src-port",{"can_disable":true}],["vlan-id",{"can'
+        '_disable":true}],["vlan-priority",{"can_disable":true}],["vlan-protocol",{"can_disable":true}]],"fully_understood":true}]]}{"snapshots":[[0]'
+        ',[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["disabled",{}],["interface",{}],["name",{}],["numbers",{"read_only":true}]],'
+        '"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["comment",{}],["compute-checksum'
+        '-from-offset",{}],["data",{}],["data-byte",{}],["header",{}],["ip-header-offset",{}],["ipv6-header-offset",{}],["name",{}],["numbers",{"read'
+        '_only":true}],["port",{"can_disable":true}],["random-byte-offsets-and-masks",{}],["random-ranges",{}],["special-footer",{}],["tcp-header-off'
+        'set",{}],["udp-compute-checksum",{}],["udp-header-offset",{}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versio'
+        'ned":[["7.15",">=",{"fields":[["cpu-core",{}],["disabled",{}],["id",{}],["mbps",{}],["name",{}],["numbers",{"read_only":true}],["packet-coun'
+        't",{}],["packet-size",{}],["port",{"can_disable":true}],["pps",{}],["tx-template",{}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],'
+        '[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["comment",{}],["disabled",{}],["interface",{}],["name",{}],["numbers",{"read_only":tr'
+        'ue}],["on-event",{}],["threshold",{}],["traffic",{}],["trigger",{}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"'
+        'versioned":[["7.15",">=",{"fields":[["acs-url",{}],["check-certificate",{}],["client-certificate",{}],["connection-request-password",{}],["c'
+        'onnection-request-port",{}],["connection-request-username",{}],["enabled",{}],["password",{}],["periodic-inform-enabled",{}],["periodic-info'
+        'rm-interval",{}],["provisioning-code",{}],["username",{}]],"fully_understood":true,"single_value":true}]]}{"snapshots":[[-1,2],[-1,2],[-1,2]'
+        ',[-1,0,1,2],[-1,0,1,2],[-1,0,1,2],[-1,0,1,2]],"unversioned":{"fields":[["address",{}],["comment",{"can_disable":true,"remove_value":""}],["d'
+        'isabled",{"default":false}],["expired",{"read_only":true}],["group",{}],["last-logged-in",{"read_only":true}],["name",{}],["password",{"writ'
+        'e_only":true}]],"fully_understood":true,"primary_keys":["name"],"versioned_fields":[[[["7.16",">="]],"inactivity-policy",{}],[[["7.16",">="]'
+        '],"inactivity-timeout",{}],[[["7.15",">="]],"numbers",{"read_only":true}]]}}{"unversioned":{"fields":[["accounting",{"default":true}],["defa'
+        'ult-group",{"default":"read"}],["exclude-groups",{"default":""}],["interim-update",{"default":"0s"}],["use-radius",{"default":false}]],"full'
+        'y_understood":true,"single_value":true}}{"snapshots":[null,null,null,null,[0],[0],[0]],"versioned":[["7.20",">=",{"fields":[],"fully_underst'
+        'ood":true,"modify_not_supported":true}]]}{"snapshots":[[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0],[-1,0]],"unversioned":{"fields":[["comment"'
+        ',{"can_disable":true,"remove_value":""}],["name",{}],["policy",{}],["skin",{"default":"default"}]],"fully_understood":true,"primary_keys":["'
+        'name"],"versioned_fields":[[[["7.15",">="]],"numbers",{"read_only":true}]]}}{"unversioned":{"fields":[["minimum-categories",{}],["minimum-pa'
+        'ssword-length",{}]],"fully_understood":true,"single_value":true}}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fiel'
+        'ds":[["comment",{}],["key",{}],["user",{}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0,0],[0,0],[0,0]],"versioned":[["7.15"'
+        ',">=",{"fields":[["accounting-port",{}],["authentication-port",{}],["certificate",{}],["enabled",{}],["require-message-auth",{}],["use-profi'
+        'les",{}]],"fully_understood":true,"single_value":true,"versioned_fields":[[[["7.21",">="]],"radsec-certificate",{}]]}]]}{"snapshots":[[0],[0'
+        '],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["paypal-allow",{}],["paypal-currency",{}],["paypal-password",{}],["paypal-signa'
+        'ture",{}],["paypal-use-sandbox",{}],["paypal-user",{}],["web-private-password",{}],["web-private-username",{}]],"fully_understood":true,"sin'
+        'gle_value":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["name",{}],["numbers",{"read_only":true}'
+        '],["packet-types",{}],["type-id",{}],["value-type",{}],["vendor-id",{}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0'
+        ']],"versioned":[["7.15",">=",{"fields":[["db-path",{}]],"fully_understood":true,"single_value":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0]'
+        ',[0]],"versioned":[["7.15",">=",{"fields":[["comment",{}],["download-limit",{}],["name",{}],["numbers",{"read_only":true}],["rate-limit-burs'
+        't-rx",{}],["rate-limit-burst-threshold-rx",{}],["rate-limit-burst-threshold-tx",{}],["rate-limit-burst-time-rx",{}],["rate-limit-burst-time-'
+        'tx",{}],["rate-limit-burst-tx",{}],["rate-limit-min-rx",{}],["rate-limit-min-tx",{}],["rate-limit-priority",{}],["rate-limit-rx",{}],["rate-'
+        'limit-tx",{}],["reset-counters-interval",{}],["reset-counters-start-time",{}],["transfer-limit",{}],["upload-limit",{}],["uptime-limit",{}]]'
+        ',"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["currency",{}],["method",{}],["'
+        'numbers",{"read_only":true}],["price",{}],["profile",{}],["trans-end",{}],["trans-start",{}],["trans-status",{}],["user",{}],["user-message"'
+        ',{}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["comment",{}],["name",{}],'
+        '["name-for-users",{}],["numbers",{"read_only":true}],["override-shared-users",{}],["price",{}],["starts-when",{}],["validity",{}]],"fully_un'
+        'derstood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["comment",{}],["from-time",{}],["limitati'
+        'on",{}],["numbers",{"read_only":true}],["profile",{}],["till-time",{}],["weekdays",{}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0]'
+        ',[0],[0,0],[0,0],[0,0]],"versioned":[["7.15",">=",{"fields":[["address",{}],["coa-port",{}],["comment",{}],["disabled",{}],["name",{}],["num'
+        'bers",{"read_only":true}],["shared-secret",{}]],"fully_understood":true,"versioned_fields":[[[["7.21",">="]],"protocol",{}]]}]]}{"snapshots"'
+        ':[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[],"fully_understood":true,"modify_not_supported":true}]]}{"snapshots":[['
+        '0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["attributes",{}],["caller-id",{}],["comment",{}],["disabled",{}],["group",'
+        '{}],["name",{}],["numbers",{"read_only":true}],["otp-secret",{}],["password",{}],["shared-users",{}]],"fully_understood":true}]]}{"snapshots'
+        '":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["attributes",{}],["comment",{}],["inner-auths",{}],["name",{}],["numbe'
+        'rs",{"read_only":true}],["outer-auths",{}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",'
+        '{"fields":[["profile",{}],["user",{}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fie'
+        'lds":[["comment",{}],["disabled",{}],["identity",{}],["interfaces",{}],["name",{}],["numbers",{"read_only":true}],["port",{}],["route-distan'
+        'ce",{}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["broadcast",{}],["comme'
+        'nt",{}],["disabled",{}],["instance",{}],["ip-range",{}],["ip6-6plane",{}],["ip6-range",{}],["ip6-rfc4193",{}],["mtu",{}],["multicast-limit",'
+        '{}],["name",{}],["network",{}],["numbers",{"read_only":true}],["private",{}],["routes",{}]],"fully_understood":true}]]}{"snapshots":[[0],[0]'
+        ',[0],[0],[0],[0],[0]],"versioned":[["7.15",">=",{"fields":[["authorized",{}],["bridge",{}],["comment",{}],["disabled",{}],["ip-address",{}],'
+        '["name",{}],["network",{}],["numbers",{"read_only":true}],["zt-address",{}]],"fully_understood":true}]]}{"snapshots":[[0],[0],[0],[0],[0],[0'
+        '],[0]],"versioned":[["7.15",">=",{"fields":[["allow-default",{}],["allow-global",{}],["allow-managed",{}],["arp-timeout",{}],["comment",{}],'
+        '["disable-running-check",{}],["disabled",{}],["instance",{}],["name",{}],["network",{}],["numbers",{"read_only":true}]],"fully_understood":t'
+        'rue}]]}'
+    ),
+), snapshots=(
+    ('7.15', '7.15.2'),
+    ('7.15.2', '7.15.3'),
+    ('7.15.3', '7.16'),
+    ('7.18', '7.19'),
+    ('7.21', '7.21.2'),
+    ('7.21.2', '7.21.3'),
+    ('7.21.3', '7.22'),
+))
+
+# List of (path, readable, backends) tuples, sorted by path
+PATH_CAPABILITIES = load_path_capabilities(
+    '[["app",true,[]],["app settings",true,["sync_single_value"]],["caps-man aaa",true,["sync_single_value"]],["caps-man access-list",true,["sync'
+    '_list"]],["caps-man actual-interface-configuration",true,[]],["caps-man channel",true,["sync_with_primary_keys"]],["caps-man configuration",'
+    'true,["sync_with_primary_keys"]],["caps-man datapath",true,["sync_with_primary_keys"]],["caps-man interface",true,["sync_list"]],["caps-man '
+    'manager",true,["sync_single_value"]],["caps-man manager interface",true,["sync_with_primary_keys"]],["caps-man provisioning",true,["sync_lis'
+    't"]],["caps-man rates",true,["sync_list"]],["caps-man security",true,["sync_with_primary_keys"]],["certificate",true,["sync_list"]],["certif'
+    'icate crl",true,["sync_list"]],["certificate scep-server",true,["sync_list"]],["certificate scep-server ra",true,["sync_list"]],["certificat'
+    'e settings",true,["sync_single_value"]],["console settings",true,["sync_single_value"]],["container",true,["sync_list","sync_with_primary_ke'
+    'ys"]],["container config",true,["sync_single_value"]],["container envs",true,["sync_list","sync_with_primary_keys"]],["container mounts",tru'
+    'e,["sync_list","sync_with_primary_keys"]],["disk",true,["sync_list"]],["disk btrfs filesystem",true,[]],["disk btrfs subvolume",true,["sync_'
+    'list"]],["disk btrfs transfer",true,["sync_list"]],["disk settings",true,["sync_single_value"]],["dude",true,["sync_single_value"]],["dude a'
+    'gent",true,["sync_list"]],["dude device",true,["sync_list"]],["dude device-type",true,["sync_list"]],["dude notification",true,["sync_list"]'
+    '],["dude probe",true,["sync_list"]],["dude ros address",true,["sync_list"]],["dude ros arp",true,["sync_list"]],["dude ros health",true,[]],'
+    '["dude ros interface",true,[]],["dude ros lease",true,["sync_list"]],["dude ros neighbor",true,[]],["dude ros queue",true,["sync_list"]],["d'
+    'ude ros resource",true,[]],["dude ros route",true,["sync_list"]],["dude ros routerboard",true,[]],["dude service",true,["sync_list"]],["file'
+    '",true,["sync_list"]],["file rsync-daemon",true,["sync_single_value"]],["file sync",true,["sync_list"]],["interface",true,[]],["interface 6t'
+    'o4",true,["sync_with_primary_keys"]],["interface amt",true,["sync_list"]],["interface bonding",true,["sync_with_primary_keys"]],["interface '
+    'bridge",true,["sync_with_primary_keys"]],["interface bridge calea",true,["sync_list"]],["interface bridge filter",true,["sync_list"]],["inte'
+    'rface bridge host",true,["sync_list"]],["interface bridge mdb",true,["sync_list"]],["interface bridge mlag",true,["sync_single_value"]],["in'
+    'terface bridge msti",true,["sync_list"]],["interface bridge nat",true,["sync_list"]],["interface bridge port",true,["sync_with_primary_keys"'
+    ']],["interface bridge port mst-override",true,["sync_list"]],["interface bridge port-controller",true,["sync_single_value"]],["interface bri'
+    'dge port-controller device",true,["sync_list"]],["interface bridge port-controller port",true,[]],["interface bridge port-extender",true,["s'
+    'ync_single_value"]],["interface bridge settings",true,["sync_single_value"]],["interface bridge vlan",true,["sync_with_primary_keys"]],["int'
+    'erface detect-internet",true,["sync_single_value"]],["interface dot1x client",true,["sync_with_primary_keys"]],["interface dot1x server",tru'
+    'e,["sync_list"]],["interface dot1x server active",true,[]],["interface eoip",true,["sync_with_primary_keys"]],["interface eoipv6",true,["syn'
+    'c_list"]],["interface ethernet",true,["sync_with_primary_keys"]],["interface ethernet poe",true,["sync_with_primary_keys"]],["interface ethe'
+    'rnet switch",true,["sync_single_value","sync_with_primary_keys"]],["interface ethernet switch acl",true,["sync_list"]],["interface ethernet '
+    'switch acl policer",true,["sync_list"]],["interface ethernet switch dscp-qos-map",true,["sync_list"]],["interface ethernet switch dscp-to-ds'
+    'cp",true,["sync_list"]],["interface ethernet switch egress-vlan-tag",true,["sync_list"]],["interface ethernet switch egress-vlan-translation'
+    '",true,["sync_list"]],["interface ethernet switch host",true,["sync_list"]],["interface ethernet switch ingress-port-policer",true,["sync_li'
+    'st"]],["interface ethernet switch ingress-vlan-translation",true,["sync_list"]],["interface ethernet switch l3hw-settings",true,["sync_singl'
+    'e_value"]],["interface ethernet switch l3hw-settings advanced",true,["sync_single_value"]],["interface ethernet switch mac-based-vlan",true,'
+    '["sync_list"]],["interface ethernet switch multicast-fdb",true,["sync_list"]],["interface ethernet switch one2one-vlan-switching",true,["syn'
+    'c_list"]],["interface ethernet switch policer-qos-map",true,["sync_list"]],["interface ethernet switch port",true,["sync_with_primary_keys"]'
+    '],["interface ethernet switch port-isolation",true,["sync_list","sync_with_primary_keys"]],["interface ethernet switch port-leakage",true,["'
+    'sync_list"]],["interface ethernet switch protocol-based-vlan",true,["sync_list"]],["interface ethernet switch qos map",true,["sync_list"]],['
+    '"interface ethernet switch qos map ip",true,["sync_list"]],["interface ethernet switch qos map vlan",true,["sync_list"]],["interface etherne'
+    't switch qos port",true,[]],["interface ethernet switch qos priority-flow-control",true,["sync_list"]],["interface ethernet switch qos profi'
+    'le",true,["sync_list"]],["interface ethernet switch qos settings",true,["sync_single_value"]],["interface ethernet switch qos tx-manager",tr'
+    'ue,["sync_list"]],["interface ethernet switch qos tx-manager queue",true,[]],["interface ethernet switch qos-group",true,["sync_list"]],["in'
+    'terface ethernet switch reserved-fdb",true,["sync_list"]],["interface ethernet switch rule",true,["sync_list"]],["interface ethernet switch '
+    'shaper",true,["sync_list"]],["interface ethernet switch stats",true,[]],["interface ethernet switch trunk",true,["sync_list"]],["interface e'
+    'thernet switch unicast-fdb",true,["sync_list"]],["interface ethernet switch vlan",true,["sync_list"]],["interface gre",true,["sync_with_prim'
+    'ary_keys"]],["interface gre6",true,["sync_with_primary_keys"]],["interface ipip",true,["sync_list"]],["interface ipipv6",true,["sync_list"]]'
+    ',["interface l2tp-client",true,["sync_with_primary_keys"]],["interface l2tp-ether",true,["sync_list"]],["interface l2tp-server",true,["sync_'
+    'list"]],["interface l2tp-server server",true,["sync_single_value"]],["interface list",true,["sync_with_primary_keys"]],["interface list memb'
+    'er",true,["sync_with_primary_keys"]],["interface lte",true,[]],["interface lte apn",true,["sync_list"]],["interface lte settings",true,["syn'
+    'c_single_value"]],["interface macsec",true,["sync_list"]],["interface macsec profile",true,["sync_list"]],["interface macvlan",true,["sync_l'
+    'ist"]],["interface mesh",true,["sync_list"]],["interface mesh port",true,["sync_list"]],["interface ovpn-client",true,["sync_with_primary_ke'
+    'ys"]],["interface ovpn-server",true,["sync_list"]],["interface ovpn-server server",true,["sync_list","sync_single_value"]],["interface ppp-c'
+    'lient",true,["sync_with_primary_keys"]],["interface ppp-server",true,["sync_list"]],["interface pppoe-client",true,["sync_with_primary_keys"'
+    ']],["interface pppoe-server",true,["sync_list"]],["interface pppoe-server server",true,["sync_with_primary_keys"]],["interface pptp-client",'
+    'true,["sync_list"]],["interface pptp-server",true,["sync_list"]],["interface pptp-server server",true,["sync_single_value"]],["interface sst'
+    'p-client",true,["sync_list"]],["interface sstp-server",true,["sync_list"]],["interface sstp-server server",true,["sync_single_value"]],["int'
+    'erface veth",true,["sync_with_primary_keys"]],["interface vlan",true,["sync_with_primary_keys"]],["interface vpls",true,["sync_list"]],["int'
+    'erface vrrp",true,["sync_with_primary_keys"]],["interface vxlan",true,["sync_list"]],["interface vxlan vteps",true,["sync_list"]],["interfac'
+    'e wifi",true,["sync_with_primary_keys"]],["interface wifi aaa",true,["sync_with_primary_keys"]],["interface wifi access-list",true,["sync_li'
+    'st"]],["interface wifi cap",true,["sync_single_value"]],["interface wifi capsman",true,["sync_single_value"]],["interface wifi channel",true'
+    ',["sync_with_primary_keys"]],["interface wifi configuration",true,["sync_with_primary_keys"]],["interface wifi datapath",true,["sync_with_pr'
+    'imary_keys"]],["interface wifi interworking",true,["sync_with_primary_keys"]],["interface wifi network",true,["sync_list"]],["interface wifi'
+    ' network radio",true,["sync_list"]],["interface wifi provisioning",true,["sync_list"]],["interface wifi radio settings",true,["sync_single_v'
+    'alue"]],["interface wifi security",true,["sync_with_primary_keys"]],["interface wifi security multi-passphrase",true,["sync_list"]],["interf'
+    'ace wifi steering",true,["sync_with_primary_keys"]],["interface wifi steering neighbor-group",true,[]],["interface wifiwave2",true,["sync_wi'
+    'th_primary_keys"]],["interface wifiwave2 aaa",true,["sync_with_primary_keys"]],["interface wifiwave2 access-list",true,["sync_list"]],["inte'
+    'rface wifiwave2 cap",true,["sync_single_value"]],["interface wifiwave2 capsman",true,["sync_single_value"]],["interface wifiwave2 channel",t'
+    'rue,["sync_with_primary_keys"]],["interface wifiwave2 configuration",true,["sync_with_primary_keys"]],["interface wifiwave2 datapath",true,['
+    '"sync_with_primary_keys"]],["interface wifiwave2 interworking",true,["sync_with_primary_keys"]],["interface wifiwave2 provisioning",true,["s'
+    'ync_with_primary_keys"]],["interface wifiwave2 security",true,["sync_with_primary_keys"]],["interface wifiwave2 steering",true,["sync_with_p'
+    'rimary_keys"]],["interface wireguard",true,["sync_with_primary_keys"]],["interface wireguard peers",true,["sync_with_primary_keys"]],["inter'
+    'face wireless",true,["sync_with_primary_keys"]],["interface wireless access-list",true,["sync_list"]],["interface wireless align",true,["syn'
+    'c_single_value"]],["interface wireless cap",true,["sync_single_value"]],["interface wireless channels",true,["sync_list"]],["interface wirel'
+    'ess connect-list",true,["sync_list"]],["interface wireless interworking-profiles",true,["sync_list"]],["interface wireless manual-tx-power-t'
+    'able",true,[]],["interface wireless nstreme",true,[]],["interface wireless nstreme-dual",true,["sync_list"]],["interface wireless security-p'
+    'rofiles",true,["sync_with_primary_keys"]],["interface wireless sniffer",true,["sync_single_value"]],["interface wireless snooper",true,["syn'
+    'c_single_value"]],["interface wireless wds",true,["sync_list"]],["iot bluetooth",true,[]],["iot bluetooth advertisers",true,[]],["iot blueto'
+    'oth advertisers ad-structures",true,["sync_list"]],["iot bluetooth peripheral-devices",true,[]],["iot bluetooth scanners",true,[]],["iot blu'
+    'etooth whitelist",true,["sync_list"]],["iot lora",true,[]],["iot lora channels",true,[]],["iot lora joineui",true,["sync_list"]],["iot lora '
+    'netid",true,["sync_list"]],["iot lora radios",true,[]],["iot lora servers",true,["sync_list"]],["iot lora traffic options",true,["sync_singl'
+    'e_value"]],["iot modbus",true,["sync_single_value"]],["iot modbus security-rules",true,["sync_list"]],["iot mqtt brokers",true,["sync_list"]'
+    '],["iot mqtt subscriptions",true,["sync_list"]],["ip accounting",true,["sync_single_value"]],["ip accounting web-access",true,["sync_single_'
+    'value"]],["ip address",true,["sync_with_primary_keys"]],["ip arp",true,["sync_list"]],["ip cloud",true,["sync_single_value"]],["ip cloud adv'
+    'anced",true,["sync_single_value"]],["ip cloud back-to-home-file",true,["sync_list"]],["ip cloud back-to-home-file settings",true,["sync_sing'
+    'le_value"]],["ip cloud back-to-home-user",true,["sync_list"]],["ip cloud back-to-home-users",true,["sync_list"]],["ip dhcp-client",true,["sy'
+    'nc_with_primary_keys"]],["ip dhcp-client option",true,["sync_with_primary_keys"]],["ip dhcp-relay",true,["sync_with_primary_keys"]],["ip dhc'
+    'p-server",true,["sync_with_primary_keys"]],["ip dhcp-server alert",true,["sync_list"]],["ip dhcp-server config",true,["sync_single_value"]],'
+    '["ip dhcp-server lease",true,["sync_with_primary_keys"]],["ip dhcp-server matcher",true,["sync_with_primary_keys"]],["ip dhcp-server network'
+    '",true,["sync_with_primary_keys"]],["ip dhcp-server option",true,["sync_with_primary_keys"]],["ip dhcp-server option sets",true,["sync_with_'
+    'primary_keys"]],["ip dns",true,["sync_single_value"]],["ip dns adlist",true,["sync_list"]],["ip dns forwarders",true,["sync_list"]],["ip dns'
+    ' static",true,["sync_list"]],["ip firewall address-list",true,["sync_with_primary_keys"]],["ip firewall calea",true,["sync_list"]],["ip fire'
+    'wall connection tracking",true,["sync_single_value"]],["ip firewall filter",true,["sync_list"]],["ip firewall layer7-protocol",true,["sync_w'
+    'ith_primary_keys"]],["ip firewall mangle",true,["sync_list"]],["ip firewall nat",true,["sync_list"]],["ip firewall raw",true,["sync_list"]],'
+    '["ip firewall service-port",true,["sync_with_primary_keys"]],["ip hotspot",true,["sync_with_primary_keys"]],["ip hotspot active",true,[]],["'
+    'ip hotspot ip-binding",true,["sync_list"]],["ip hotspot profile",true,["sync_with_primary_keys"]],["ip hotspot service-port",true,["sync_wit'
+    'h_primary_keys"]],["ip hotspot user",true,["sync_with_primary_keys"]],["ip hotspot user profile",true,["sync_with_primary_keys"]],["ip hotsp'
+    'ot walled-garden",true,["sync_list"]],["ip hotspot walled-garden ip",true,["sync_list"]],["ip ipsec active-peers",true,[]],["ip ipsec identi'
+    'ty",true,["sync_list"]],["ip ipsec key",true,[]],["ip ipsec key psk",true,["sync_list"]],["ip ipsec key qkd",true,["sync_single_value"]],["i'
+    'p ipsec key rsa",true,["sync_with_primary_keys"]],["ip ipsec mode-config",true,["sync_with_primary_keys"]],["ip ipsec peer",true,["sync_with'
+    '_primary_keys"]],["ip ipsec policy",true,["sync_list"]],["ip ipsec policy group",true,["sync_list"]],["ip ipsec profile",true,["sync_with_pr'
+    'imary_keys"]],["ip ipsec proposal",true,["sync_with_primary_keys"]],["ip ipsec settings",true,["sync_single_value"]],["ip kid-control",true,'
+    '["sync_list"]],["ip kid-control device",true,["sync_list"]],["ip media",true,["sync_list"]],["ip media settings",true,["sync_single_value"]]'
+    ',["ip nat-pmp",true,["sync_single_value"]],["ip nat-pmp interfaces",true,["sync_list"]],["ip neighbor discovery-settings",true,["sync_single'
+    '_value"]],["ip packing",true,["sync_list"]],["ip pool",true,["sync_with_primary_keys"]],["ip pool used",true,[]],["ip proxy",true,["sync_sin'
+    'gle_value"]],["ip proxy access",true,["sync_list"]],["ip proxy cache",true,["sync_list"]],["ip proxy cache-contents",true,[]],["ip proxy con'
+    'nections",true,[]],["ip proxy direct",true,["sync_list"]],["ip reverse-proxy",true,["sync_list"]],["ip route",true,["sync_list"]],["ip route'
+    ' rule",true,["sync_list"]],["ip route vrf",true,["sync_with_primary_keys"]],["ip service",true,["sync_with_primary_keys"]],["ip service webs'
+    'erver",true,["sync_single_value"]],["ip settings",true,["sync_single_value"]],["ip smb",true,["sync_single_value"]],["ip smb shares",true,["'
+    'sync_list"]],["ip smb users",true,["sync_list"]],["ip socks",true,["sync_single_value"]],["ip socks access",true,["sync_list"]],["ip socks c'
+    'onnections",true,[]],["ip socks users",true,["sync_list"]],["ip socksify",true,["sync_list"]],["ip ssh",true,["sync_single_value"]],["ip tft'
+    'p",true,["sync_list"]],["ip tftp settings",true,["sync_single_value"]],["ip traffic-flow",true,["sync_single_value"]],["ip traffic-flow ipfi'
+    'x",true,["sync_single_value"]],["ip traffic-flow target",true,["sync_list"]],["ip upnp",true,["sync_single_value"]],["ip upnp interfaces",tr'
+    'ue,["sync_with_primary_keys"]],["ip vrf",true,["sync_with_primary_keys"]],["ipv6 address",true,["sync_list"]],["ipv6 dhcp-client",true,["syn'
+    'c_with_primary_keys"]],["ipv6 dhcp-client option",true,["sync_list"]],["ipv6 dhcp-relay",true,["sync_list"]],["ipv6 dhcp-relay option",true,'
+    '["sync_list"]],["ipv6 dhcp-server",true,["sync_with_primary_keys"]],["ipv6 dhcp-server binding",true,["sync_list"]],["ipv6 dhcp-server optio'
+    'n",true,["sync_with_primary_keys"]],["ipv6 dhcp-server option sets",true,["sync_list"]],["ipv6 firewall address-list",true,["sync_with_prima'
+    'ry_keys"]],["ipv6 firewall filter",true,["sync_list"]],["ipv6 firewall mangle",true,["sync_list"]],["ipv6 firewall nat",true,["sync_list"]],'
+    '["ipv6 firewall raw",true,["sync_list"]],["ipv6 nd",true,["sync_with_primary_keys"]],["ipv6 nd prefix",true,["sync_list"]],["ipv6 nd prefix '
+    'default",true,["sync_single_value"]],["ipv6 nd proxy",true,["sync_list"]],["ipv6 neighbor",true,["sync_list"]],["ipv6 pool",true,["sync_list'
+    '"]],["ipv6 route",true,["sync_list"]],["ipv6 settings",true,["sync_single_value"]],["lcd",true,["sync_single_value"]],["lcd interface",true,'
+    '["sync_list"]],["lcd interface pages",true,["sync_list"]],["lcd pin",true,["sync_single_value"]],["lcd screen",true,[]],["lora",true,[]],["l'
+    'ora channels",true,[]],["lora joineui",true,["sync_list"]],["lora netid",true,["sync_list"]],["lora radios",true,[]],["lora servers",true,["'
+    'sync_list"]],["lora traffic options",true,["sync_single_value"]],["mpls",true,["sync_single_value"]],["mpls interface",true,["sync_list"]],['
+    '"mpls ldp",true,["sync_single_value","sync_with_primary_keys"]],["mpls ldp accept-filter",true,["sync_list"]],["mpls ldp advertise-filter",t'
+    'rue,["sync_list"]],["mpls ldp interface",true,["sync_list"]],["mpls ldp local-mapping",true,["sync_list"]],["mpls ldp neighbor",true,["sync_'
+    'list"]],["mpls ldp remote-mapping",true,["sync_list"]],["mpls mangle",true,["sync_list"]],["mpls settings",true,["sync_single_value"]],["mpl'
+    's traffic-eng interface",true,["sync_list"]],["mpls traffic-eng path",true,["sync_list"]],["mpls traffic-eng tunnel",true,["sync_list"]],["o'
+    'penflow",true,["sync_list"]],["openflow port",true,["sync_list"]],["partitions",true,[]],["port",true,[]],["port firmware",true,["sync_singl'
+    'e_value"]],["port remote-access",true,["sync_list"]],["ppp aaa",true,["sync_single_value"]],["ppp l2tp-secret",true,["sync_list"]],["ppp pro'
+    'file",true,["sync_with_primary_keys"]],["ppp secret",true,["sync_with_primary_keys"]],["queue interface",true,["sync_with_primary_keys"]],["'
+    'queue simple",true,["sync_with_primary_keys"]],["queue tree",true,["sync_with_primary_keys"]],["queue type",true,["sync_with_primary_keys"]]'
+    ',["radius",true,["sync_list"]],["radius incoming",true,["sync_single_value"]],["routing bfd configuration",true,["sync_list"]],["routing bfd'
+    ' interface",false,[]],["routing bgp aggregate",true,["sync_with_primary_keys"]],["routing bgp connection",true,["sync_list"]],["routing bgp '
+    'evpn",true,["sync_list"]],["routing bgp instance",true,["sync_list","sync_with_primary_keys"]],["routing bgp network",true,["sync_with_prima'
+    'ry_keys"]],["routing bgp peer",true,["sync_with_primary_keys"]],["routing bgp template",true,["sync_with_primary_keys"]],["routing bgp vpls"'
+    ',true,["sync_list"]],["routing bgp vpn",true,["sync_list"]],["routing fantasy",true,["sync_list"]],["routing filter",true,["sync_list"]],["r'
+    'outing filter community-ext-list",true,["sync_list"]],["routing filter community-large-list",true,["sync_list"]],["routing filter community-'
+    'list",true,["sync_list"]],["routing filter num-list",true,["sync_list"]],["routing filter rule",true,["sync_list"]],["routing filter select-'
+    'rule",true,["sync_list"]],["routing gmp",true,["sync_list"]],["routing id",true,["sync_list"]],["routing igmp-proxy",true,["sync_single_valu'
+    'e"]],["routing igmp-proxy interface",true,["sync_with_primary_keys"]],["routing igmp-proxy mfc",true,["sync_list"]],["routing isis instance"'
+    ',true,["sync_list"]],["routing isis interface",true,[]],["routing isis interface-template",true,["sync_list"]],["routing isis lsp",true,[]],'
+    '["routing isis neighbor",true,[]],["routing mme",true,["sync_single_value"]],["routing ospf area",true,["sync_with_primary_keys"]],["routing'
+    ' ospf area range",true,["sync_with_primary_keys"]],["routing ospf instance",true,["sync_with_primary_keys"]],["routing ospf interface-templa'
+    'te",true,["sync_list"]],["routing ospf neighbor",true,[]],["routing ospf static-neighbor",true,["sync_list"]],["routing ospf-v3 area",false,'
+    '[]],["routing ospf-v3 instance",false,[]],["routing pimsm bsr candidate",true,["sync_list"]],["routing pimsm bsr rp-candidate",true,["sync_l'
+    'ist"]],["routing pimsm igmp-interface-template",true,[]],["routing pimsm instance",true,["sync_with_primary_keys"]],["routing pimsm interfac'
+    'e-template",true,["sync_list"]],["routing pimsm static-rp",true,["sync_list"]],["routing rip",true,["sync_single_value"]],["routing rip inst'
+    'ance",true,["sync_list"]],["routing rip interface-template",true,["sync_list"]],["routing rip keys",true,["sync_list"]],["routing rip static'
+    '-neighbor",true,["sync_list"]],["routing ripng",true,["sync_single_value"]],["routing route",true,[]],["routing route rule",true,[]],["routi'
+    'ng rpki",true,["sync_list"]],["routing rule",true,["sync_list"]],["routing settings",true,["sync_single_value"]],["routing table",true,["syn'
+    'c_list"]],["rsync-daemon",true,["sync_single_value"]],["snmp",true,["sync_single_value"]],["snmp community",true,["sync_with_primary_keys"]]'
+    ',["special-login",true,["sync_list"]],["system clock",true,["sync_single_value"]],["system clock manual",true,["sync_single_value"]],["syste'
+    'm console",true,["sync_list"]],["system console screen",true,["sync_single_value"]],["system gps",true,["sync_single_value"]],["system hardw'
+    'are",true,["sync_single_value"]],["system health",true,["sync_single_value"]],["system health settings",true,["sync_single_value"]],["system'
+    ' identity",true,["sync_single_value"]],["system leds",true,["sync_list"]],["system leds settings",true,["sync_single_value"]],["system loggi'
+    'ng",true,["sync_list"]],["system logging action",true,["sync_with_primary_keys"]],["system note",true,["sync_single_value"]],["system ntp cl'
+    'ient",true,["sync_single_value"]],["system ntp client servers",true,["sync_with_primary_keys"]],["system ntp key",true,["sync_list"]],["syst'
+    'em ntp server",true,["sync_single_value"]],["system package local-update",true,[]],["system package local-update mirror",true,["sync_single_'
+    'value"]],["system package local-update update-package-source",true,["sync_list"]],["system package update",true,["sync_single_value"]],["sys'
+    'tem resource hardware usb-settings",true,["sync_single_value"]],["system resource irq",true,[]],["system resource irq rps",true,["sync_with_'
+    'primary_keys"]],["system resource usb",true,[]],["system resource usb settings",true,["sync_single_value"]],["system routerboard mode-button'
+    '",true,["sync_single_value"]],["system routerboard reset-button",true,["sync_single_value"]],["system routerboard settings",true,["sync_sing'
+    'le_value"]],["system routerboard usb",true,["sync_single_value"]],["system routerboard wps-button",true,["sync_single_value"]],["system sche'
+    'duler",true,["sync_with_primary_keys"]],["system script",true,["sync_with_primary_keys"]],["system script environment",true,[]],["system scr'
+    'ipt job",true,[]],["system swos",true,["sync_single_value"]],["system upgrade",true,[]],["system upgrade mirror",true,["sync_single_value"]]'
+    ',["system upgrade upgrade-package-source",true,["sync_list"]],["system ups",true,["sync_with_primary_keys"]],["system watchdog",true,["sync_'
+    'single_value"]],["task",true,["sync_list"]],["tool bandwidth-server",true,["sync_single_value"]],["tool calea",true,["sync_list"]],["tool e-'
+    'mail",true,["sync_single_value"]],["tool graphing",true,["sync_single_value"]],["tool graphing interface",true,["sync_list"]],["tool graphin'
+    'g queue",true,["sync_list"]],["tool graphing resource",true,["sync_list"]],["tool mac-server",true,["sync_single_value"]],["tool mac-server '
+    'mac-winbox",true,["sync_single_value"]],["tool mac-server ping",true,["sync_single_value"]],["tool mac-server sessions",true,[]],["tool netw'
+    'atch",true,["sync_list"]],["tool romon",true,["sync_single_value"]],["tool romon port",true,["sync_list"]],["tool sms",true,["sync_single_va'
+    'lue"]],["tool sniffer",true,["sync_single_value"]],["tool traffic-generator",true,["sync_single_value"]],["tool traffic-generator packet-tem'
+    'plate",true,["sync_list"]],["tool traffic-generator port",true,["sync_list"]],["tool traffic-generator raw-packet-template",true,["sync_list'
+    '"]],["tool traffic-generator stream",true,["sync_list"]],["tool traffic-monitor",true,["sync_list"]],["tr069-client",true,["sync_single_valu'
+    'e"]],["user",true,["sync_with_primary_keys"]],["user aaa",true,["sync_single_value"]],["user active",true,[]],["user group",true,["sync_with'
+    '_primary_keys"]],["user settings",true,["sync_single_value"]],["user ssh-keys",true,["sync_list"]],["user-manager",true,["sync_single_value"'
+    ']],["user-manager advanced",true,["sync_single_value"]],["user-manager attribute",true,["sync_list"]],["user-manager database",true,["sync_s'
+    'ingle_value"]],["user-manager limitation",true,["sync_list"]],["user-manager payment",true,["sync_list"]],["user-manager profile",true,["syn'
+    'c_list"]],["user-manager profile-limitation",true,["sync_list"]],["user-manager router",true,["sync_list"]],["user-manager session",true,[]]'
+    ',["user-manager user",true,["sync_list"]],["user-manager user group",true,["sync_list"]],["user-manager user-profile",true,["sync_list"]],["'
+    'zerotier",true,["sync_list"]],["zerotier controller",true,["sync_list"]],["zerotier controller member",true,["sync_list"]],["zerotier interf'
+    'ace",true,["sync_list"]]]'
+)
@@ -12,6 +12,7 @@ __metaclass__ = type
 import re
 
 from ansible.module_utils.common.text.converters import to_text
+from ansible.module_utils.six import string_types
 
 
 def value_to_str(value, compat_bool=False, none_to_empty=False):
@@ -92,6 +93,66 @@ def restrict_entry_accepted(entry, path_info, restrict_data, compat=True):
     return True
 
 
+def compose_proplist(path_info, fields=None):
+    """Return the properties to retrieve with ``.proplist`` when reading entries of a path.
+
+    Besides ``fields`` (all fields of ``path_info`` if not provided), ``.id``, ``dynamic`` and ``builtin``
+    are always retrieved, since they are needed to identify and filter entries.
+    """
+    result = ['.id', 'dynamic', 'builtin']
+    for field in (path_info.fields if fields is None else fields):
+        if field not in result:
+            result.append(field)
+    return result
+
+
+# Maximum number of selectors that are combined into one query
+MAX_QUERY_SELECTORS = 100
+
+
+def compose_query(selectors):
+    """Compose the query words for a print command that only returns entries matching one of ``selectors``.
+
+    Every selector is a tuple of ``(field, value)`` pairs that all must match.
+    """
+    words = []
+    for selector in selectors:
+        words.extend('?{0}={1}'.format(field, value_to_str(value, compat_bool=True)) for field, value in selector)
+        if len(selector) > 1:
+            words.append('?#{0}'.format('&' * (len(selector) - 1)))
+    if len(selectors) > 1:
+        words.append('?#{0}'.format('|' * (len(selectors) - 1)))
+    return words
+
+
+def get_restrict_selectors(path_info, restrict_data):
+    """Convert the rules of ``restrict_data`` that the router can evaluate into selectors for ``compose_query()``.
+
+    Every entry accepted by ``restrict_data`` matches one of the selectors, but not every entry matching a
+    selector is accepted. Returns ``None`` if no rule can be converted.
+    """
+    if restrict_data is None:
+        return None
+    selectors = [()]
+    for rule in restrict_data:
+        field_info = path_info.fields[rule['field']]
+        if rule['invert'] or rule['match_disabled'] or 'regex' in rule or 'values' not in rule:
+            continue
+        # Entries without the field are compared with these values, which the router does not know
+        if field_info.default is not None or field_info.absent_value is not None:
+            continue
+        # Other values are converted by librouteros, so they cannot be compared as-is on the router.
+        # The router might not distinguish empty values from unset fields, which are not accepted.
+        if not all(isinstance(value, string_types) and value for value in rule['values']):
+            continue
+        selectors = [selector + ((rule['field'], value), ) for selector in selectors for value in rule['values']]
+        if len(selectors) > MAX_QUERY_SELECTORS:
+            return None
+    if selectors == [()]:
+        return None
+    return selectors
+
+
 def restrict_argument_spec():
     return dict(
         restrict=dict(
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026, Felix Fontein (@felixfontein) <felix@fontein.de>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# The data inside here is private to this collection. If you use this from outside the collection,
+# you are on your own. There can be random changes to its format even in bugfix releases!
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+from collections import deque
+
+try:
+    from librouteros.exceptions import FatalError
+except ImportError:
+    # The modules using this module fail before sending anything if librouteros is not installed
+    class FatalError(Exception):
+        pass
+
+
+class PipelineTrapError(Exception):
+    """A command sent through a WritePipeline or stream_command() was answered with !trap."""
+
+    def __init__(self, message, category=None):
+        super(PipelineTrapError, self).__init__(message)
+        self.message = message
+        self.category = category
+
+    def __str__(self):
+        # Same format as librouteros' TrapError
+        return self.message.replace('\r\n', ',')
+
+
+def _parse_word(word):
+    # Same conversion as librouteros' parse_word(), which cannot be used since it fails for words
+    # without leading =, like .tag=1
+    key, value = (word[1:] if word.startswith('=') else word).split('=', 1)
+    try:
+        if str(int(value)) == value:
+            return key, int(value)
+    except ValueError:
+        pass
+    return key, {'yes': True, 'true': True, 'no': False, 'false': False}.get(value, value)
+
+
+def _read_sentence(api):
+    # Read the raw words with the protocol, since librouteros' Api.readSentence() cannot parse tags
+    try:
+        reply_word, words = api.protocol.readSentence()
+    except FatalError as e:
+        # The router closes the connection after !fatal, so the error cannot be assigned to a command
+        raise PipelineTrapError('The router closed the connection: {0}'.format(e), 'fatal')
+    return reply_word, dict(_parse_word(word) for word in words)
+
+
+def _compose_word(key, value):
+    # Same encoding as librouteros' compose_word(); 1 == True and 0 == False, so check for int first
+    if type(value) is int:
+        return '={0}={1}'.format(key, value)
+    return '={0}={1}'.format(key, {True: 'yes', False: 'no'}.get(value, value))
+
+
+class _Command(object):
+    __slots__ = ('rows', 'traps', 'error', 'done')
+
+    def __init__(self):
+        self.rows = []
+        self.traps = []
+        self.error = None
+        self.done = False
+
+
+class WritePipeline(object):
+    """Sends commands for one API path without waiting for the reply of every command.
+
+    Every command is sent with a tag, so that the replies can be assigned to the commands
+    even though up to ``window`` commands are unanswered at the same time.
+    """
+
+    def __init__(self, api_path, window):
+        self._api_path = api_path
+        self._api = api_path.api
+        self._window = window
+        self._next_tag = 0
+        self._in_flight = {}
+        self._failed = False
+
+    def _send(self, command, name, kwargs):
+        tag = self._next_tag
+        self._next_tag += 1
+        words = [_compose_word(key, value) for key, value in kwargs.items()]
+        words.append('.tag={0}'.format(tag))
+        self._api.protocol.writeSentence(self._api_path.join(name).path, *words)
+        self._in_flight[tag] = command
+
+    def _read(self):
+        try:
+            reply_word, words = _read_sentence(self._api)
+        except PipelineTrapError:
+            self._failed = True
+            raise
+        tag = words.pop('.tag', None)
+        try:
+            tag = int(tag)
+        except (TypeError, ValueError):
+            pass
+        command = self._in_flight.get(tag)
+        if command is None:
+            self._failed = True
+            raise PipelineTrapError('Received {reply_word} reply {for_tag}'.format(
+                reply_word=reply_word,
+                for_tag='without tag' if tag is None else 'for unknown tag {0}'.format(tag),
+            ))
+        if reply_word == '!trap':
+            command.traps.append(words)
+            self._failed = True
+        elif reply_word in ('!re', '!done') and words:
+            command.rows.append(words)
+        if reply_word == '!done':
+            command.done = True
+            del self._in_flight[tag]
+
+    def run(self, commands):
+        """Send ``(name, kwargs)`` tuples from ``commands`` and yield their replies in the same order.
+
+        Every reply is the list of rows returned for the command. If a command fails, the generator
+        raises the error when that command's turn comes, and no further commands are sent after the
+        failure has been noticed. Commands that have already been sent at that point may still have
+        been executed.
+        """
+        commands = iter(commands)
+        pending = deque()
+        sending = True
+        while True:
+            while sending and not self._failed and len(self._in_flight) < self._window:
+                try:
+                    name, kwargs = next(commands)
+                except StopIteration:
+                    sending = False
+                    break
+                command = _Command()
+                pending.append(command)
+                try:
+                    self._send(command, name, kwargs)
+                except UnicodeEncodeError as e:
+                    command.error = e
+                    command.done = True
+                    sending = False
+            if not pending:
+                return
+            command = pending.popleft()
+            while not command.done:
+                self._read()
+            if command.error is not None:
+                raise command.error
+            if command.traps:
+                trap = command.traps[0]
+                raise PipelineTrapError(trap.get('message', ''), trap.get('category'))
+            yield command.rows
+
+
+def stream_command(api_path, name, *words):
+    """Send a command for ``api_path`` and yield the rows of its reply while they are received.
+
+    librouteros reads the complete reply of a command before returning its first row; this only holds
+    one row at a time. If the command fails, PipelineTrapError is raised after the last row. If the
+    generator is closed early, the rest of the reply is read and discarded, so that the connection
+    can still be used.
+    """
+    api = api_path.api
+    api.protocol.writeSentence(api_path.join(name).path, *words)
+    trap = None
+    done = False
+    try:
+        while not done:
+            reply_word, row = _read_sentence(api)
+            done = reply_word == '!done'
+            if reply_word == '!trap':
+                if trap is None:
+                    trap = row
+            elif reply_word in ('!re', '!done') and row:
+                yield row
+    except GeneratorExit:
+        while not done:
+            reply_word, dummy = _read_sentence(api)
+            done = reply_word == '!done'
+        raise
+    if trap is not None:
+        raise PipelineTrapError(trap.get('message', ''), trap.get('category'))
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026, Felix Fontein (@felixfontein) <felix@fontein.de>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# The data inside here is private to this collection. If you use this from outside the collection,
+# you are on your own. There can be random changes to its format even in bugfix releases!
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+# Components of the candidate graph with more possible pairs than this are matched greedily
+DEFAULT_ASSIGNMENT_LIMIT = 10000
+
+
+def _find_components(edges):
+    parent = {}
+
+    def find(node):
+        root = node
+        while parent[root] != root:
+            root = parent[root]
+        while parent[node] != root:
+            parent[node], node = root, parent[node]
+        return root
+
+    for left, right, dummy in edges:
+        left = ('l', left)
+        right = ('r', right)
+        parent.setdefault(left, left)
+        parent.setdefault(right, right)
+        left_root = find(left)
+        right_root = find(right)
+        if left_root != right_root:
+            parent[right_root] = left_root
+
+    components = {}
+    for edge in edges:
+        components.setdefault(find(('l', edge[0])), []).append(edge)
+    return list(components.values())
+
+
+def _match_greedily(edges):
+    matched_left = set()
+    matched_right = set()
+    result = []
+    for left, right, dummy in sorted(edges, key=lambda edge: edge[2]):
+        if left in matched_left or right in matched_right:
+            continue
+        matched_left.add(left)
+        matched_right.add(right)
+        result.append((left, right))
+    return result
+
+
+def _solve_assignment(costs, column_count):
+    # Hungarian algorithm with potentials for a full cost matrix with len(costs) <= column_count.
+    # Returns the column assigned to every row.
+    row_count = len(costs)
+    infinity = float('inf')
+    u = [0] * (row_count + 1)
+    v = [0] * (column_count + 1)
+    # assigned_row[j] is the row (1-based) assigned to column j (1-based), 0 if none
+    assigned_row = [0] * (column_count + 1)
+    way = [0] * (column_count + 1)
+    for row in range(1, row_count + 1):
+        assigned_row[0] = row
+        column = 0
+        min_value = [infinity] * (column_count + 1)
+        used = [False] * (column_count + 1)
+        while True:
+            used[column] = True
+            current_row = assigned_row[column]
+            delta = infinity
+            next_column = 0
+            row_costs = costs[current_row - 1]
+            for j in range(1, column_count + 1):
+                if not used[j]:
+                    value = row_costs[j - 1] - u[current_row] - v[j]
+                    if value < min_value[j]:
+                        min_value[j] = value
+                        way[j] = column
+                    if min_value[j] < delta:
+                        delta = min_value[j]
+                        next_column = j
+            for j in range(column_count + 1):
+                if used[j]:
+                    u[assigned_row[j]] += delta
+                    v[j] -= delta
+                else:
+                    min_value[j] -= delta
+            column = next_column
+            if assigned_row[column] == 0:
+                break
+        while column:
+            previous_column = way[column]
+            assigned_row[column] = assigned_row[previous_column]
+            column = previous_column
+    result = [None] * row_count
+    for j in range(1, column_count + 1):
+        if assigned_row[j]:
+            result[assigned_row[j] - 1] = j - 1
+    return result
+
+
+def _match_optimally(edges):
+    lefts = sorted(set(edge[0] for edge in edges))
+    rights = sorted(set(edge[1] for edge in edges))
+    transposed = len(lefts) > len(rights)
+    if transposed:
+        edges = [(right, left, cost) for left, right, cost in edges]
+        lefts, rights = rights, lefts
+    left_ranks = dict((left, rank) for rank, left in enumerate(lefts))
+    right_ranks = dict((right, rank) for rank, right in enumerate(rights))
+
+    # The costs are ordered lexicographically by number of pairs, sum of the edge costs, and
+    # preferring to pair entries in the same order (the sum of left rank * right rank is maximal
+    # for pairing in order). Unmatched pairs get a cost larger than any of the others.
+    tie_scale = len(lefts) * len(lefts) * len(rights) + 1
+    max_cost = max(cost for dummy, dummy, cost in edges)
+    forbidden = (max_cost + 1) * tie_scale * (len(lefts) + 1)
+    costs = [[forbidden] * len(rights) for dummy in lefts]
+    allowed = set()
+    for left, right, cost in edges:
+        row = left_ranks[left]
+        column = right_ranks[right]
+        value = cost * tie_scale - row * column
+        if (row, column) not in allowed or value < costs[row][column]:
+            costs[row][column] = value
+            allowed.add((row, column))
+
+    result = []
+    for row, column in enumerate(_solve_assignment(costs, len(rights))):
+        if (row, column) in allowed:
+            pair = (lefts[row], rights[column])
+            result.append((pair[1], pair[0]) if transposed else pair)
+    return result
+
+
+def find_min_cost_matching(edges, assignment_limit=DEFAULT_ASSIGNMENT_LIMIT):
+    """Find a matching between left and right nodes with as many pairs as possible and minimal cost.
+
+    ``edges`` is a list of ``(left, right, cost)`` tuples with non-negative integer costs. Among
+    optimal matchings, the one pairing the nodes in their order is preferred.
+
+    Connected components of the graph with more than ``assignment_limit`` possible pairs are
+    matched greedily by increasing cost, with ties broken by the order of ``edges``.
+
+    Returns a list of ``(left, right)`` pairs.
+    """
+    result = []
+    for component in _find_components(edges):
+        left_count = len(set(edge[0] for edge in component))
+        right_count = len(set(edge[1] for edge in component))
+        if len(component) == 1 or left_count == 1 or right_count == 1:
+            # The best edge is optimal; the greedy matching finds the first best one
+            result.extend(_match_greedily(component))
+        elif left_count * right_count > assignment_limit:
+            result.extend(_match_greedily(component))
+        else:
+            result.extend(_match_optimally(component))
+    return result
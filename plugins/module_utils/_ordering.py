@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026, Felix Fontein (@felixfontein) <felix@fontein.de>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# The data inside here is private to this collection. If you use this from outside the collection,
+# you are on your own. There can be random changes to its format even in bugfix releases!
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+from bisect import bisect_left
+
+
+def find_longest_increasing_subsequence(values):
+    """Find a longest strictly increasing subsequence of ``values``.
+
+    Returns the indices of the elements of the subsequence in increasing order.
+    """
+    # tail_values[k] is the smallest last value of an increasing subsequence of length k + 1,
+    # and tail_indices[k] the index of that value
+    tail_values = []
+    tail_indices = []
+    predecessors = [None] * len(values)
+    for index, value in enumerate(values):
+        length = bisect_left(tail_values, value)
+        if length:
+            predecessors[index] = tail_indices[length - 1]
+        if length == len(tail_values):
+            tail_values.append(value)
+            tail_indices.append(index)
+        else:
+            tail_values[length] = value
+            tail_indices[length] = index
+    result = []
+    index = tail_indices[-1] if tail_indices else None
+    while index is not None:
+        result.append(index)
+        index = predecessors[index]
+    result.reverse()
+    return result
+
+
+def plan_moves(positions, new_positions=(), keep_last=False):
+    """Plan a minimal number of moves that bring a list into the desired order.
+
+    ``positions`` contains for every element of the current list its position in the desired order.
+    ``new_positions`` contains the desired positions of elements that still have to be created.
+    Together they must form a permutation of ``0, ..., len(positions) + len(new_positions) - 1``.
+
+    Elements forming a longest increasing subsequence of ``positions`` stay where they are; every
+    other element is moved or created once. A step is a tuple ``(block, destination)``, which means
+    that the elements with the desired positions in ``block`` are moved (or created) directly before
+    the element with desired position ``destination``, or at the end of the list if ``destination``
+    is ``None``. Consecutive elements whose current order is already correct are moved in one block;
+    elements to be created are always on their own. The steps have to be executed in the returned order.
+
+    If ``keep_last`` is true, no element is moved or created at the end of the list, unless the list is
+    empty. This is needed if the list is only part of a larger list, like the entries selected by
+    ``restrict``, since the end of the list would be behind all other elements of the larger list. The
+    existing element with the last desired position then stays where it is, which makes every other
+    existing element move before an element of the list; the number of moves is minimal under this
+    restriction. Elements to be created behind it are created before it, and it is then moved before
+    them with one additional step.
+    """
+    count = len(positions) + len(new_positions)
+    new_positions = set(new_positions)
+    moved = dict((position, index) for index, position in enumerate(positions))
+    # The existing element that stays where it is, so that nothing is placed at the end of the list
+    anchor = None
+    if keep_last and positions:
+        anchor = max(positions)
+        last = moved[anchor]
+        staying = find_longest_increasing_subsequence(positions[:last]) + [last]
+    else:
+        staying = find_longest_increasing_subsequence(positions)
+    for index in staying:
+        del moved[positions[index]]
+
+    steps = []
+    # The current block in descending order of positions
+    block = []
+
+    def finish_block():
+        if block:
+            destination = block[0] + 1
+            steps.append((block[::-1], destination if destination < count else None))
+            del block[:]
+
+    for position in range(count - 1, -1, -1):
+        if position in moved:
+            if block and moved[position] > moved[block[-1]]:
+                finish_block()
+            block.append(position)
+        else:
+            finish_block()
+            if position in new_positions:
+                steps.append(([position], position + 1 if position + 1 < count else anchor))
+            elif position == anchor and anchor + 1 < count:
+                # The elements behind the anchor have been created before it, so move it before them
+                steps.append(([anchor], anchor + 1))
+    finish_block()
+    return steps
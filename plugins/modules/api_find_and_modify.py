@@ -191,7 +191,7 @@ from ansible_collections.community.routeros.plugins.module_utils.api import (
     create_api,
 )
 
-from ansible_collections.community.routeros.plugins.module_utils._api_data import (
+from ansible_collections.community.routeros.plugins.module_utils._api_data_base import (
     split_path,
 )
 
@@ -199,6 +199,10 @@ from ansible_collections.community.routeros.plugins.module_utils._api_helper imp
     value_to_str,
 )
 
+from ansible_collections.community.routeros.plugins.module_utils._api_pipeline import (
+    stream_command,
+)
+
 try:
     from librouteros.exceptions import LibRouterosError
 except Exception:
@@ -280,7 +284,8 @@ def main():
 
     api_path = compose_api_path(api, path)
 
-    old_data, has_dynamic, has_builtin = filter_entries(list(api_path), ignore_dynamic=ignore_dynamic or False, ignore_builtin=ignore_builtin or False)
+    old_data, has_dynamic, has_builtin = filter_entries(
+        stream_command(api_path, 'print'), ignore_dynamic=ignore_dynamic or False, ignore_builtin=ignore_builtin or False)
     new_data = [entry.copy() for entry in old_data]
     if ignore_dynamic is None and has_dynamic:
         module.deprecate(
@@ -361,7 +366,8 @@ def main():
                         error=to_native(e),
                     )
                 )
-        new_data, has_dynamic, has_builtin = filter_entries(list(api_path), ignore_dynamic=ignore_dynamic or False, ignore_builtin=ignore_builtin or False)
+        new_data, has_dynamic, has_builtin = filter_entries(
+            stream_command(api_path, 'print'), ignore_dynamic=ignore_dynamic or False, ignore_builtin=ignore_builtin or False)
         if ignore_dynamic is None and has_dynamic:
             module.deprecate(
                 "The current default (false) of the ignore_dynamic function has been deprecated. It will change to `true` in community.routeros 4.0.0.",
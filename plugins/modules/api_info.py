@@ -675,18 +675,29 @@ from ansible_collections.community.routeros.plugins.module_utils.api import (
     get_api_version,
 )
 
-from ansible_collections.community.routeros.plugins.module_utils._api_data import (
-    PATHS,
-    join_path,
+from ansible_collections.community.routeros.plugins.module_utils._api_data_base import (
     split_path,
 )
 
+from ansible_collections.community.routeros.plugins.module_utils._api_data_cache import (
+    PATH_CAPABILITIES,
+    PATHS,
+)
+
 from ansible_collections.community.routeros.plugins.module_utils._api_helper import (
+    compose_proplist,
+    compose_query,
+    get_restrict_selectors,
     restrict_argument_spec,
     restrict_entry_accepted,
     validate_and_prepare_restrict,
 )
 
+from ansible_collections.community.routeros.plugins.module_utils._api_pipeline import (
+    PipelineTrapError,
+    stream_command,
+)
+
 from ansible_collections.community.routeros.plugins.module_utils._tagging import deprecate_value
 
 from ansible_collections.community.routeros.plugins.module_utils._hardware_detect import (
@@ -709,7 +720,7 @@ def compose_api_path(api, path):
 
 def main():
     module_args = dict(
-        path=dict(type='str', required=True, choices=sorted([join_path(path) for path in PATHS if PATHS[path].fully_understood])),
+        path=dict(type='str', required=True, choices=[path for path, readable, dummy in PATH_CAPABILITIES if readable]),
         unfiltered=dict(type='bool', default=False),
         handle_disabled=dict(type='str', choices=['exclamation', 'null-value', 'omit'], default='exclamation'),
         hide_defaults=dict(type='bool', default=True),
@@ -729,25 +740,33 @@ def main():
     api = create_api(module)
 
     path = split_path(module.params['path'])
-    versioned_path_info = PATHS.get(tuple(path))
-    if versioned_path_info is None:
-        module.fail_json(msg='Path /{path} is not yet supported'.format(path='/'.join(path)))
-    if versioned_path_info.hardware_detect:
-        hardware_variant_key = get_cached_or_detect(versioned_path_info.hardware_detect, api)
-        if hardware_variant_key not in versioned_path_info.hardware_variants:
-            module.fail_json(
-                msg='Path /{path} is not supported for detected hardware variant {variant}'.format(
-                    path='/'.join(path), variant=hardware_variant_key))
-        versioned_path_info = versioned_path_info.hardware_variants[hardware_variant_key]
-    if versioned_path_info.needs_version:
+    api_version = None
+    path_info = None
+    if PATHS.has_snapshots(tuple(path)):
+        # Use the pre-generated snapshot of the data for this version, if there is one
         api_version = get_api_version(api)
-        supported, not_supported_msg = versioned_path_info.provide_version(api_version)
-        if not supported:
-            msg = 'Path /{path} is not supported for API version {api_version}'.format(path='/'.join(path), api_version=api_version)
-            if not_supported_msg:
-                msg = '{0}: {1}'.format(msg, not_supported_msg)
-            module.fail_json(msg=msg)
-    path_info = versioned_path_info.get_data()
+        path_info = PATHS.get_snapshot(tuple(path), api_version, lambda hardware_detect: get_cached_or_detect(hardware_detect, api))
+    if path_info is None:
+        versioned_path_info = PATHS.get(tuple(path))
+        if versioned_path_info is None:
+            module.fail_json(msg='Path /{path} is not yet supported'.format(path='/'.join(path)))
+        if versioned_path_info.hardware_detect:
+            hardware_variant_key = get_cached_or_detect(versioned_path_info.hardware_detect, api)
+            if hardware_variant_key not in versioned_path_info.hardware_variants:
+                module.fail_json(
+                    msg='Path /{path} is not supported for detected hardware variant {variant}'.format(
+                        path='/'.join(path), variant=hardware_variant_key))
+            versioned_path_info = versioned_path_info.hardware_variants[hardware_variant_key]
+        if versioned_path_info.needs_version:
+            if api_version is None:
+                api_version = get_api_version(api)
+            supported, not_supported_msg = versioned_path_info.provide_version(api_version)
+            if not supported:
+                msg = 'Path /{path} is not supported for API version {api_version}'.format(path='/'.join(path), api_version=api_version)
+                if not_supported_msg:
+                    msg = '{0}: {1}'.format(msg, not_supported_msg)
+                module.fail_json(msg=msg)
+        path_info = versioned_path_info.get_data()
 
     handle_disabled = module.params['handle_disabled']
     hide_defaults = module.params['hide_defaults']
@@ -760,7 +779,15 @@ def main():
 
         result = []
         unfiltered = module.params['unfiltered']
-        for entry in api_path:
+        # Only retrieve the fields that are not filtered out anyway, and let the router
+        # evaluate the rules of restrict that it can evaluate
+        selectors = get_restrict_selectors(path_info, restrict_data)
+        words = [] if unfiltered else ['=.proplist={0}'.format(','.join(compose_proplist(path_info)))]
+        if selectors is not None:
+            words.extend(compose_query(selectors))
+        # Process the entries while they are received, so that the entries that are filtered out are not kept in memory
+        entries = stream_command(api_path, 'print', *words) if selectors != [] else []
+        for entry in entries:
             if not include_dynamic:
                 if entry.get('dynamic', False):
                     continue
@@ -801,7 +828,7 @@ def main():
             result.append(entry)
 
         module.exit_json(result=result)
-    except (LibRouterosError, UnicodeEncodeError) as e:
+    except (LibRouterosError, UnicodeEncodeError, PipelineTrapError) as e:
         module.fail_json(msg=to_native(e))
 
 
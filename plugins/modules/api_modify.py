@@ -591,6 +591,68 @@ options:
       - error
     default: create_only
     version_added: 2.10.0
+  pipeline_window:
+    description:
+      - The maximal number of modifications and creations of entries that are sent to the router before waiting for their replies.
+      - With the default V(1), every command is only sent after the reply of the previous command arrived.
+      - Larger values avoid waiting for a round trip per command, which helps when many entries are changed over a slow link.
+      - Entries are only created in a pipelined way for paths with primary keys and O(ensure_order=false), since otherwise the
+        order in which they are created matters. Moving entries is never pipelined.
+      - If a command fails, the module fails with the error of that command. Commands sent after the failing one may have
+        been executed nevertheless.
+    type: int
+    default: 1
+    version_added: 3.22.0
+  reread_after_changes:
+    description:
+      - Which entries to retrieve again after changes were made, to compute the RV(new_data) return value.
+      - V(all) retrieves all entries of the path again.
+      - V(changed) only retrieves the entries that have been created or modified, and takes the other entries from the data
+        retrieved before making changes. This reduces the amount of data transferred for large tables. Note that changes
+        RouterOS makes to other entries as a side-effect of the modifications are not reflected in RV(new_data) then.
+    type: str
+    choices:
+      - all
+      - changed
+    default: all
+    version_added: 3.22.0
+  read_entries:
+    description:
+      - Which existing entries to retrieve.
+      - V(all) retrieves all entries of the path.
+      - V(data) only retrieves the entries that can match entries in O(data). For paths with primary keys, like C(ip address),
+        these are the entries whose primary keys appear in O(data). For paths with stratify keys, like the C(chain) of
+        C(ip firewall filter), these are the entries whose stratify keys have values that appear in O(data). For other
+        paths, and for paths where one of these keys has a default value or can be absent, like the C(server) of
+        C(ip dhcp-server lease), all entries are retrieved.
+        This makes the run time proportional to the part of the path that is touched, instead of the size of the path.
+        If O(data) contains more than 100 distinct keys and these make up more than half of the entries of the path, all
+        entries are retrieved instead.
+        RV(old_data) and RV(new_data) only contain the retrieved entries.
+      - V(data) can only be used with O(handle_absent_entries=ignore), since the other choice needs to know all entries.
+      - Independent of this option, rules of O(restrict) that only allow specific values for fields without default value
+        are evaluated by the router.
+    type: str
+    choices:
+      - all
+      - data
+    default: all
+    version_added: 3.22.0
+  read_fields:
+    description:
+      - Which fields to retrieve for existing entries.
+      - V(all) retrieves all fields known for the path.
+      - V(data) only retrieves the fields used in O(data), the fields used to identify entries, and the fields used in O(restrict).
+        This reduces the amount of data transferred for paths with many fields, like C(interface ethernet).
+        RV(old_data) and RV(new_data) only contain these fields then.
+      - V(data) can only be used with O(handle_entries_content=ignore), since the other choices need to know all fields of
+        existing entries.
+    type: str
+    choices:
+      - all
+      - data
+    default: all
+    version_added: 3.22.0
   restrict:
     description:
       - Restrict operation to entries matching the following criteria.
@@ -709,24 +771,48 @@ from ansible_collections.community.routeros.plugins.module_utils.api import (
     get_api_version,
 )
 
-from ansible_collections.community.routeros.plugins.module_utils._api_data import (
-    PATHS,
+from ansible_collections.community.routeros.plugins.module_utils._api_data_base import (
+    get_backend_name,
     join_path,
     split_path,
 )
 
+from ansible_collections.community.routeros.plugins.module_utils._api_data_cache import (
+    PATH_CAPABILITIES,
+    PATHS,
+)
+
 from ansible_collections.community.routeros.plugins.module_utils._api_helper import (
+    MAX_QUERY_SELECTORS,
     apply_value_sanitizer,
+    compose_proplist,
+    compose_query,
+    get_restrict_selectors,
     restrict_argument_spec,
     restrict_entry_accepted,
     validate_and_prepare_restrict,
     value_to_str,
 )
 
+from ansible_collections.community.routeros.plugins.module_utils._api_pipeline import (
+    PipelineTrapError,
+    WritePipeline,
+    stream_command,
+)
+
 from ansible_collections.community.routeros.plugins.module_utils._hardware_detect import (
     get_cached_or_detect,
 )
 
+from ansible_collections.community.routeros.plugins.module_utils._matching import (
+    DEFAULT_ASSIGNMENT_LIMIT,
+    find_min_cost_matching,
+)
+
+from ansible_collections.community.routeros.plugins.module_utils._ordering import (
+    plan_moves,
+)
+
 HAS_ORDEREDDICT = True
 try:
     from collections import OrderedDict
@@ -751,28 +837,54 @@ def compose_api_path(api, path):
     return api_path
 
 
-def find_modifications(old_entry, new_entry, path_info, module, for_text='', return_none_instead_of_fail=False):
-    modifications = OrderedDict()
-    updated_entry = old_entry.copy()
+def canonicalize_entry(entry, path_info):
+    """Convert all values of an entry to the strings that are compared.
+
+    The values are converted with value_to_str() and the value canonicalizer of their field, if there is one.
+    """
+    canonicalizers = path_info.field_plan.canonicalizers
+    result = {}
+    for k, v in entry.items():
+        value = value_to_str(v)
+        canonicalizer = canonicalizers.get(k)
+        if value is not None and canonicalizer is not None:
+            value = canonicalizer(value)
+        result[k] = value
+    return result
+
+
+class _KeyCannotBeRemoved(Exception):
+    def __init__(self, key):
+        super(_KeyCannotBeRemoved, self).__init__(key)
+        self.key = key
+
+
+def iter_modifications(old_entry, new_entry, path_info, module, old_strings, new_strings, for_text=''):
+    """Yield the modifications needed to turn ``old_entry`` into ``new_entry``.
+
+    Every modification is a tuple ``(key, value, removes_key)``, where ``key`` and ``value`` are sent to the router,
+    and ``removes_key`` tells whether the modified key is no longer present in the entry afterwards.
+    ``old_strings`` and ``new_strings`` must be the results of canonicalize_entry() for the entries.
+    Raises _KeyCannotBeRemoved if a key has to be removed, but cannot be removed.
+    """
     for k, v in new_entry.items():
         if k == '.id':
             continue
         disabled_k = None
         if k.startswith('!'):
             disabled_k = k[1:]
-        elif v is None or value_to_str(v) == value_to_str(path_info.fields[k].remove_value):
+        elif v is None or new_strings[k] == path_info.fields[k].remove_value_str:
             disabled_k = k
         if disabled_k is not None:
             if disabled_k in old_entry:
                 if path_info.fields[disabled_k].remove_value is not None:
-                    modifications[disabled_k] = path_info.fields[disabled_k].remove_value
+                    yield disabled_k, path_info.fields[disabled_k].remove_value, True
                 else:
-                    modifications['!%s' % disabled_k] = ''
-                del updated_entry[disabled_k]
-            continue
-        if k not in old_entry and value_to_str(path_info.fields[k].default) == value_to_str(v) and not path_info.fields[k].can_disable:
+                    yield '!%s' % disabled_k, '', True
             continue
         key_info = path_info.fields[k]
+        if k not in old_entry and key_info.default_str == new_strings[k] and not key_info.can_disable:
+            continue
         if key_info.read_only:
             # handle_read_only must be 'validate'
             if old_entry.get(k) != v:
@@ -784,58 +896,85 @@ def find_modifications(old_entry, new_entry, path_info, module, for_text='', ret
             if module.params['handle_write_only'] == 'create_only':
                 # do not update this value
                 continue
-        if k not in old_entry or value_to_str(old_entry[k]) != value_to_str(v):
-            modifications[k] = v
-            updated_entry[k] = v
+        if k not in old_entry or old_strings[k] != new_strings[k]:
+            yield k, v, False
     handle_entries_content = module.params['handle_entries_content']
     if handle_entries_content != 'ignore':
         for k in old_entry:
             if k == '.id' or k in new_entry or ('!%s' % k) in new_entry or k not in path_info.fields:
                 continue
             field_info = path_info.fields[k]
-            if field_info.default is not None and field_info.default == old_entry[k]:
+            if field_info.default_str is not None and field_info.default_str == old_strings[k]:
                 continue
-            if field_info.remove_value is not None and field_info.remove_value == old_entry[k]:
+            if field_info.remove_value_str is not None and field_info.remove_value_str == old_strings[k]:
                 continue
             if field_info.can_disable:
                 if field_info.default is not None:
-                    modifications[k] = field_info.default
+                    yield k, field_info.default, True
                 elif field_info.remove_value is not None:
-                    modifications[k] = field_info.remove_value
+                    yield k, field_info.remove_value, True
                 else:
-                    modifications['!%s' % k] = ''
-                del updated_entry[k]
+                    yield '!%s' % k, '', True
             elif field_info.default is not None:
-                modifications[k] = field_info.default
-                updated_entry[k] = field_info.default
+                yield k, field_info.default, False
             elif handle_entries_content == 'remove':
-                if return_none_instead_of_fail:
-                    return None, None
-                module.fail_json(msg='Key "{key}" cannot be removed{for_text}.'.format(key=k, for_text=for_text))
-        for k in path_info.fields:
-            field_info = path_info.fields[k]
-            if k not in old_entry and k not in new_entry and field_info.can_disable and field_info.default is not None:
-                modifications[k] = field_info.default
-                updated_entry[k] = field_info.default
+                raise _KeyCannotBeRemoved(k)
+        for k, default in path_info.field_plan.disabled_defaults:
+            if k not in old_entry and k not in new_entry:
+                yield k, default, False
+
+
+def find_modifications(old_entry, new_entry, path_info, module, for_text='', return_none_instead_of_fail=False):
+    old_strings = canonicalize_entry(old_entry, path_info)
+    new_strings = canonicalize_entry(new_entry, path_info)
+    modifications = OrderedDict()
+    updated_entry = old_entry.copy()
+    try:
+        for k, v, removes_key in iter_modifications(old_entry, new_entry, path_info, module, old_strings, new_strings, for_text):
+            modifications[k] = v
+            if removes_key:
+                del updated_entry[k[1:] if k.startswith('!') else k]
+            else:
+                updated_entry[k] = v
+    except _KeyCannotBeRemoved as exc:
+        if return_none_instead_of_fail:
+            return None, None
+        module.fail_json(msg='Key "{key}" cannot be removed{for_text}.'.format(key=exc.key, for_text=for_text))
     return modifications, updated_entry
 
 
-def essentially_same_weight(old_entry, new_entry, path_info, module):
+def count_modifications(old_entry, new_entry, path_info, module, old_strings, new_strings):
+    """Count the modifications that find_modifications() would return, without creating them.
+
+    Returns ``None`` if find_modifications() with ``return_none_instead_of_fail=True`` would return ``None``.
+    ``old_strings`` and ``new_strings`` must be the results of canonicalize_entry() for the entries.
+    """
+    try:
+        return sum(1 for dummy in iter_modifications(old_entry, new_entry, path_info, module, old_strings, new_strings))
+    except _KeyCannotBeRemoved:
+        return None
+
+
+def essentially_same_weight(old_entry, new_entry, path_info, module, old_strings=None, new_strings=None):
+    if old_strings is None:
+        old_strings = canonicalize_entry(old_entry, path_info)
+    if new_strings is None:
+        new_strings = canonicalize_entry(new_entry, path_info)
     for k, v in new_entry.items():
         if k == '.id':
             continue
         disabled_k = None
         if k.startswith('!'):
             disabled_k = k[1:]
-        elif v is None or value_to_str(v) == value_to_str(path_info.fields[k].remove_value):
+        elif v is None or new_strings[k] == path_info.fields[k].remove_value_str:
             disabled_k = k
         if disabled_k is not None:
             if disabled_k in old_entry:
                 return None
             continue
-        if k not in old_entry and value_to_str(path_info.fields[k].default) == value_to_str(v):
+        if k not in old_entry and path_info.fields[k].default_str == new_strings[k]:
             continue
-        if k not in old_entry or value_to_str(old_entry[k]) != value_to_str(v):
+        if k not in old_entry or old_strings[k] != new_strings[k]:
             return None
     handle_entries_content = module.params['handle_entries_content']
     weight = 0
@@ -843,7 +982,7 @@ def essentially_same_weight(old_entry, new_entry, path_info, module):
         if k == '.id' or k in new_entry or ('!%s' % k) in new_entry or k not in path_info.fields:
             continue
         field_info = path_info.fields[k]
-        if field_info.default is not None and field_info.default == old_entry[k]:
+        if field_info.default_str is not None and field_info.default_str == old_strings[k]:
             continue
         if handle_entries_content != 'ignore':
             return None
@@ -853,13 +992,8 @@ def essentially_same_weight(old_entry, new_entry, path_info, module):
 
 
 def remove_read_only(entry, path_info):
-    to_remove = []
-    for real_k, v in entry.items():
-        k = real_k
-        if k.startswith('!'):
-            k = k[1:]
-        if path_info.fields[k].read_only:
-            to_remove.append(real_k)
+    read_only = path_info.field_plan.read_only
+    to_remove = [k for k in entry if (k[1:] if k.startswith('!') else k) in read_only]
     for k in to_remove:
         entry.pop(k)
 
@@ -869,6 +1003,7 @@ def format_pk(primary_keys, values):
 
 
 def polish_entry(entry, path_info, module, for_text):
+    field_plan = path_info.field_plan
     if '.id' in entry:
         entry.pop('.id')
     to_remove = []
@@ -891,42 +1026,36 @@ def polish_entry(entry, path_info, module, for_text):
         elif value is None:
             if not key_info.can_disable:
                 module.fail_json(msg='Key "{key}" must not be disabled (value null/~/None){for_text}.'.format(key=key, for_text=for_text))
-        if key_info.read_only:
+        if key in field_plan.read_only:
             if module.params['handle_read_only'] == 'error':
                 module.fail_json(msg='Key "{key}" is read-only{for_text}, and handle_read_only=error.'.format(key=key, for_text=for_text))
             if module.params['handle_read_only'] == 'ignore':
                 to_remove.append(real_key)
-        if key_info.write_only:
+        if key in field_plan.write_only:
             if module.params['handle_write_only'] == 'error':
                 module.fail_json(msg='Key "{key}" is write-only{for_text}, and handle_write_only=error.'.format(key=key, for_text=for_text))
-        if key_info.depr and key_info.depr.applies("write"):
-            key_info.depr.emit(module)
+        if key in field_plan.write_deprecations:
+            field_plan.write_deprecations[key].emit(module)
     for key in to_remove:
         entry.pop(key)
-    # Iterate over a snapshot of keys because we may update values in-place.
     # Disabled-key entries (!key) carry no meaningful value to sanitise and are
     # skipped. Type handling for all other values is delegated to the individual
     # sanitizer – see the value sanitizer CONTRACT in api_data.py.
-    for key in list(entry):
-        if key.startswith('!'):
-            continue
-        key_info = path_info.fields.get(key)
-        if key_info is None or key_info.value_sanitizer is None:
-            continue
-        entry[key] = apply_value_sanitizer(key_info, entry[key], key, module.warn)
-    for key, field_info in path_info.fields.items():
-        if field_info.required and key not in entry:
+    for key, key_info in field_plan.sanitized:
+        if key in entry:
+            entry[key] = apply_value_sanitizer(key_info, entry[key], key, module.warn)
+    for key in field_plan.required:
+        if key not in entry:
             module.fail_json(msg='Key "{key}" must be present{for_text}.'.format(key=key, for_text=for_text))
-    for require_list in path_info.required_one_of:
-        found_req_keys = [rk for rk in require_list if rk in entry]
-        if len(require_list) > 0 and not found_req_keys:
+    for require_list in field_plan.required_one_of:
+        if not any(rk in entry for rk in require_list):
             module.fail_json(
                 msg='Every element in data must contain one of {required_keys}. For example, the element{for_text} does not provide it.'.format(
                     required_keys=', '.join(['"{k}"'.format(k=k) for k in require_list]),
                     for_text=for_text,
                 )
             )
-    for exclusive_list in path_info.mutually_exclusive:
+    for exclusive_list in field_plan.mutually_exclusive:
         found_ex_keys = [ek for ek in exclusive_list if ek in entry]
         if len(found_ex_keys) > 1:
             module.fail_json(
@@ -945,27 +1074,115 @@ def remove_irrelevant_data(entry, path_info):
             del entry[k]
 
 
-def match_entries(new_entries, old_entries, path_info, module):
+def get_fingerprint(new_entry, new_strings, path_info, module, without_modifications):
+    """Describe which values an old entry must have to match new_entry.
+
+    Returns a signature, which is a tuple of ``(key, disabled)`` pairs, and a tuple of the values
+    that get_old_fingerprint() must return for an old entry and the signature. This is necessary
+    for essentially_same_weight() not returning None, and if ``without_modifications`` is true,
+    for find_modifications() not returning any modification. ``new_strings`` must be the result of
+    canonicalize_entry() for new_entry.
+    """
+    handle_write_only = module.params['handle_write_only']
+    requirements = []
+    for k, v in new_entry.items():
+        if k == '.id':
+            continue
+        disabled_k = None
+        if k.startswith('!'):
+            disabled_k = k[1:]
+        elif v is None or new_strings[k] == path_info.fields[k].remove_value_str:
+            disabled_k = k
+        if disabled_k is not None:
+            requirements.append((disabled_k, True, False))
+            continue
+        key_info = path_info.fields[k]
+        if without_modifications and (key_info.read_only or (key_info.write_only and handle_write_only == 'create_only')):
+            # find_modifications() never modifies these keys
+            continue
+        requirements.append((k, False, new_strings[k]))
+    requirements.sort()
+    return tuple((k, disabled) for k, disabled, value in requirements), tuple(value for k, disabled, value in requirements)
+
+
+def get_old_fingerprint(old_strings, signature, path_info, without_modifications):
+    result = []
+    for k, disabled in signature:
+        if disabled:
+            result.append(k in old_strings)
+        elif k in old_strings:
+            result.append(old_strings[k])
+        elif without_modifications and path_info.fields[k].can_disable:
+            # find_modifications() always sets such a key if it is not present
+            result.append(None)
+        else:
+            result.append(path_info.fields[k].default_str)
+    return tuple(result)
+
+
+def find_candidates(new_entries, new_strings, old_strings, path_info, module, without_modifications):
+    """For every new entry, find the indices of the old entries that have the same fingerprint.
+
+    ``new_strings`` and ``old_strings`` contain the results of canonicalize_entry() for the new and old entries.
+    """
+    fingerprints = [
+        get_fingerprint(new_entry, new_strings[new_index], path_info, module, without_modifications)
+        for new_index, (unused, new_entry) in enumerate(new_entries)
+    ]
+    indexes = {}
+    for signature, unused in fingerprints:
+        if signature in indexes:
+            continue
+        index = defaultdict(list)
+        for old_index, strings in enumerate(old_strings):
+            index[get_old_fingerprint(strings, signature, path_info, without_modifications)].append(old_index)
+        indexes[signature] = index
+    return [indexes[signature].get(fingerprint, []) for signature, fingerprint in fingerprints]
+
+
+def match_entries(new_entries, old_entries, path_info, module, assignment_limit=DEFAULT_ASSIGNMENT_LIMIT):
     matching_old_entries = [None for entry in new_entries]
     old_entries = list(old_entries)
+    # Convert every value only once, instead of once for every pair of entries that is compared
+    new_strings = [canonicalize_entry(new_entry, path_info) for unused, new_entry in new_entries]
+    old_strings = [canonicalize_entry(old_entry, path_info) for unused, old_entry in old_entries]
     matches = []
     handle_absent_entries = module.params['handle_absent_entries']
     if handle_absent_entries == 'remove':
+        # First match the entries that do not need modifications. These pairs have the lowest possible
+        # weight, and only old entries with the same fingerprint can be such a match.
+        candidates = find_candidates(new_entries, new_strings, old_strings, path_info, module, True)
+        for new_index, (unused, new_entry) in enumerate(new_entries):
+            for old_index in candidates[new_index]:
+                if old_entries[old_index] is None:
+                    continue
+                count = count_modifications(
+                    old_entries[old_index][1], new_entry, path_info, module, old_strings[old_index], new_strings[new_index])
+                if count == 0:
+                    matching_old_entries[new_index], old_entries[old_index] = old_entries[old_index], None
+                    break
         for new_index, (unused, new_entry) in enumerate(new_entries):
-            for old_index, (unused, old_entry) in enumerate(old_entries):
-                modifications, unused = find_modifications(old_entry, new_entry, path_info, module, return_none_instead_of_fail=True)
-                if modifications is not None:
-                    matches.append((new_index, old_index, len(modifications)))
+            if matching_old_entries[new_index] is not None:
+                continue
+            for old_index, index_entry in enumerate(old_entries):
+                if index_entry is None:
+                    continue
+                count = count_modifications(
+                    index_entry[1], new_entry, path_info, module, old_strings[old_index], new_strings[new_index])
+                if count is not None:
+                    matches.append((new_index, old_index, count))
     else:
+        # essentially_same_weight() only returns a weight for old entries with the same fingerprint
+        candidates = find_candidates(new_entries, new_strings, old_strings, path_info, module, False)
         for new_index, (unused, new_entry) in enumerate(new_entries):
-            for old_index, (unused, old_entry) in enumerate(old_entries):
-                weight = essentially_same_weight(old_entry, new_entry, path_info, module)
+            for old_index in candidates[new_index]:
+                weight = essentially_same_weight(
+                    old_entries[old_index][1], new_entry, path_info, module,
+                    old_strings=old_strings[old_index], new_strings=new_strings[new_index])
                 if weight is not None:
                     matches.append((new_index, old_index, weight))
-    matches.sort(key=lambda entry: entry[2])
-    for new_index, old_index, rating in matches:
-        if matching_old_entries[new_index] is not None or old_entries[old_index] is None:
-            continue
+    # Pair as many entries as possible with minimal total weight
+    for new_index, old_index in find_min_cost_matching(matches, assignment_limit=assignment_limit):
         matching_old_entries[new_index], old_entries[old_index] = old_entries[old_index], None
     unmatched_old_entries = [index_entry for index_entry in old_entries if index_entry is not None]
     return matching_old_entries, unmatched_old_entries
@@ -980,13 +1197,107 @@ def remove_dynamic(entries):
     return result
 
 
-def get_api_data(api_path, path_info):
-    entries = list(api_path)
-    for entry in entries:
-        for k, field_info in path_info.fields.items():
-            if field_info.absent_value is not None and k not in entry:
-                entry[k] = field_info.absent_value
-    return entries
+def fill_absent_values(entry, path_info, fields=None):
+    for k, field_info in path_info.fields.items():
+        if field_info.absent_value is not None and k not in entry and (fields is None or k in fields):
+            entry[k] = field_info.absent_value
+    return entry
+
+
+def get_read_fields(module, path_info, restrict_data):
+    """Return the fields to retrieve for existing entries, or ``None`` to retrieve all fields of the path."""
+    if module.params['read_fields'] != 'data':
+        return None
+    fields = set()
+    for entry in module.params['data']:
+        fields.update(key[1:] if key.startswith('!') else key for key in entry)
+    fields.update(path_info.primary_keys or ())
+    fields.update(path_info.stratify_keys or ())
+    fields.update(rule['field'] for rule in restrict_data or ())
+    return [field for field in path_info.fields if field in fields]
+
+
+def count_api_data(api_path):
+    """Return the number of entries of the path, or ``None`` if the router does not say."""
+    for row in api_path.api.rawCmd(api_path.join('print').path, '=count-only='):
+        if 'ret' in row:
+            return int(row['ret'])
+    return None
+
+
+def get_read_selectors(module, api_path, path_info, restrict_data, keys, key_values):
+    """Return the selectors for the existing entries to retrieve, or ``None`` to retrieve all entries.
+
+    ``key_values`` contains the values of ``keys`` of the entries in ``data``.
+    """
+    if module.params['read_entries'] == 'data' and keys:
+        key_values = set(key_values)
+        # librouteros converts values like 'yes' and 'true' to booleans, so the router might store them differently.
+        # The same holds for values of fields with a value canonicalizer.
+        canonicalizers = path_info.field_plan.canonicalizers
+        # The router does not return fields that have their default or absent value, so a query for such a value
+        # does not find these entries.
+        can_query = not any(
+            key in canonicalizers or path_info.fields[key].default is not None or path_info.fields[key].absent_value is not None
+            for key in keys
+        )
+        if can_query and not any(isinstance(value, bool) for values in key_values for value in values):
+            selectors = [tuple(zip(keys, values)) for values in key_values]
+            if len(selectors) <= MAX_QUERY_SELECTORS:
+                return selectors
+            # Every query makes the router look at all entries, so read everything at once if
+            # a large part of the entries is needed anyway
+            count = count_api_data(api_path)
+            if count is not None and 2 * len(selectors) <= count:
+                return selectors
+    return get_restrict_selectors(path_info, restrict_data)
+
+
+def iter_api_data(api_path, path_info, fields=None, selectors=None):
+    """Yield the entries of the path while they are received.
+
+    If ``selectors`` is not ``None``, only the entries matching one of the selectors are retrieved.
+    If more than ``MAX_QUERY_SELECTORS`` selectors are provided, several queries are sent, and the
+    entries are only ordered by their position in the path for every query.
+    """
+    proplist = '=.proplist={0}'.format(','.join(compose_proplist(path_info, fields)))
+    if selectors is None:
+        queries = [[]]
+    else:
+        queries = [compose_query(selectors[start:start + MAX_QUERY_SELECTORS]) for start in range(0, len(selectors), MAX_QUERY_SELECTORS)]
+    for query in queries:
+        for entry in stream_command(api_path, 'print', proplist, *query):
+            yield fill_absent_values(entry, path_info, fields)
+
+
+def get_api_data(api_path, path_info, fields=None, selectors=None):
+    return list(iter_api_data(api_path, path_info, fields, selectors))
+
+
+def get_api_data_for_ids(api_path, path_info, ids, fields=None):
+    """Retrieve the entries with the given IDs.
+
+    Returns a dictionary mapping IDs to entries, or ``None`` if not all entries could be found.
+    """
+    result = {}
+    for entry in get_api_data(api_path, path_info, fields, [(('.id', id), ) for id in ids]):
+        result[entry['.id']] = entry
+    if any(id not in result for id in ids):
+        return None
+    return result
+
+
+def get_changed_api_data(module, api_path, path_info, ids, fields=None):
+    """Retrieve the created and modified entries with the given IDs after changes were made.
+
+    Returns ``None`` if the whole path should be read again instead.
+    """
+    if module.params['reread_after_changes'] != 'changed':
+        return None
+    # An empty ID means that RouterOS did not return the ID of a new entry
+    if not all(ids):
+        return None
+    return get_api_data_for_ids(api_path, path_info, ids, fields)
 
 
 def prepare_for_add(entry, path_info):
@@ -1005,6 +1316,37 @@ def prepare_for_add(entry, path_info):
     return new_entry
 
 
+def run_writes(module, api_path, command, values_list, pipelined=True):
+    """Run the API command ``command`` (``add`` or ``set``) for every entry of ``values_list``.
+
+    Yields the result of every command in order: the ID of the new entry for ``add``, and ``None`` for ``set``.
+    Errors are raised when the result of the failing command is requested.
+    """
+    window = module.params['pipeline_window'] if pipelined else 1
+    if window <= 1:
+        for values in values_list:
+            if command == 'add':
+                yield api_path.add(**values)
+            else:
+                yield api_path.update(**values)
+        return
+    for rows in WritePipeline(api_path, window).run((command, values) for values in values_list):
+        if command == 'add':
+            yield str(rows[0]['ret']) if rows and 'ret' in rows[0] else ''
+        else:
+            yield None
+
+
+def move_entries(api_path, ids, destination_id):
+    if destination_id is None:
+        # Without destination, the entries are moved to the end
+        for res in api_path('move', numbers=','.join(ids)):
+            pass
+    else:
+        for res in api_path('move', numbers=','.join(ids), destination=destination_id):
+            pass
+
+
 def remove_rejected(data, path_info, restrict_data):
     return [
         entry for entry in data
@@ -1044,9 +1386,11 @@ def sync_list(module, api, path, path_info, restrict_data):
     stratified_data = dict(stratified_data)
 
     api_path = compose_api_path(api, path)
+    read_fields = get_read_fields(module, path_info, restrict_data)
+    read_selectors = get_read_selectors(module, api_path, path_info, restrict_data, stratify_keys, stratified_data)
 
-    old_data = get_api_data(api_path, path_info)
-    old_data = remove_dynamic(old_data)
+    # Filter the entries while they are received, so that the entries that are not needed are not kept in memory
+    old_data = remove_dynamic(iter_api_data(api_path, path_info, read_fields, read_selectors))
     old_data = remove_rejected(old_data, path_info, restrict_data)
     stratified_old_data = defaultdict(list)
     for index, entry in enumerate(old_data):
@@ -1055,6 +1399,7 @@ def sync_list(module, api, path, path_info, restrict_data):
     stratified_old_data = dict(stratified_old_data)
 
     create_list = []
+    create_index_list = []
     modify_list = []
     remove_list = []
 
@@ -1082,6 +1427,7 @@ def sync_list(module, api, path, path_info, restrict_data):
             else:
                 remove_read_only(new_entry, path_info)
                 create_list.append(new_entry)
+                create_index_list.append(index)
 
         if handle_absent_entries == 'remove':
             remove_list.extend(entry['.id'] for index, entry in unmatched_old_entries)
@@ -1098,20 +1444,34 @@ def sync_list(module, api, path, path_info, restrict_data):
     new_data.extend(create_list)
 
     reorder_list = []
+    # With ensure_order=true, create new entries directly at their position if the path allows it
+    create_in_place = module.params['ensure_order'] and path_info.supports_place_before
+    # With restrict, the entries are only part of the table, so they must not be moved or created at its end.
+    # New entries are then created while reordering, and moved to their position if they cannot be created there.
+    keep_last = restrict_data is not None
+    create_while_reordering = module.params['ensure_order'] and (create_in_place or keep_last)
     if module.params['ensure_order']:
-        for index, entry in enumerate(data):
-            if '.id' in entry:
-                def match(current_entry):
-                    return current_entry['.id'] == entry['.id']
-
-            else:
-                def match(current_entry):
-                    return current_entry is entry
-
-            current_index = next(current_index + index for current_index, current_entry in enumerate(new_data[index:]) if match(current_entry))
-            if current_index != index:
-                reorder_list.append((index, new_data[current_index], new_data[index]))
-                new_data.insert(index, new_data.pop(current_index))
+        # Since handle_absent_entries=remove, new_data contains exactly the entries of data:
+        # the existing ones ordered by their current position, followed by the created ones
+        index_by_id = dict((entry['.id'], index) for index, entry in enumerate(data) if '.id' in entry)
+        positions = [index_by_id[entry['.id']] for entry in new_data[:len(new_data) - len(create_list)]]
+        if create_while_reordering:
+            steps = plan_moves(positions, create_index_list, keep_last=keep_last)
+        else:
+            steps = plan_moves(positions + create_index_list)
+        created_positions = set(create_index_list) if create_while_reordering else set()
+        for block, destination in steps:
+            reorder_list.append((
+                block[0],
+                [data[position] for position in block],
+                data[destination] if destination is not None else None,
+                block[0] in created_positions,
+            ))
+        positions.extend(create_index_list)
+        new_data_in_order = [None] * len(new_data)
+        for position, entry in zip(positions, new_data):
+            new_data_in_order[position] = entry
+        new_data = new_data_in_order
 
     if not module.check_mode:
         if remove_list:
@@ -1124,42 +1484,71 @@ def sync_list(module, api, path, path_info, restrict_data):
                         error=to_native(e),
                     )
                 )
+        results = run_writes(module, api_path, 'set', modify_list)
         for modifications in modify_list:
             try:
-                api_path.update(**modifications)
-            except (LibRouterosError, UnicodeEncodeError) as e:
+                next(results)
+            except (LibRouterosError, UnicodeEncodeError, PipelineTrapError) as e:
                 module.fail_json(
                     msg='Error while modifying for ID {id}: {error}'.format(
                         id=modifications['.id'],
                         error=to_native(e),
                     )
                 )
-        for entry in create_list:
+        if not create_while_reordering:
+            for entry in create_list:
+                try:
+                    entry['.id'] = api_path.add(**prepare_for_add(entry, path_info))
+                except (LibRouterosError, UnicodeEncodeError) as e:
+                    module.fail_json(
+                        msg='Error while creating entry: {error}'.format(
+                            error=to_native(e),
+                        )
+                    )
+        for new_index, new_entries, old_entry, create in reorder_list:
+            if create:
+                new_entry = new_entries[0]
+                values = prepare_for_add(new_entry, path_info)
+                if create_in_place and old_entry is not None:
+                    values['place-before'] = old_entry['.id']
+                try:
+                    new_entry['.id'] = api_path.add(**values)
+                except (LibRouterosError, UnicodeEncodeError) as e:
+                    module.fail_json(
+                        msg='Error while creating entry: {error}'.format(
+                            error=to_native(e),
+                        )
+                    )
+                if create_in_place or old_entry is None:
+                    continue
+                # The entry has been appended to the table, so move it to its position
+            element_ids = [new_entry['.id'] for new_entry in new_entries]
             try:
-                entry['.id'] = api_path.add(**prepare_for_add(entry, path_info))
+                move_entries(api_path, element_ids, old_entry['.id'] if old_entry is not None else None)
             except (LibRouterosError, UnicodeEncodeError) as e:
-                module.fail_json(
-                    msg='Error while creating entry: {error}'.format(
+                if old_entry is None:
+                    msg = 'Error while moving entry ID {element_id} to the end: {error}'.format(
+                        element_id=', '.join(element_ids),
                         error=to_native(e),
                     )
-                )
-        for new_index, new_entry, old_entry in reorder_list:
-            try:
-                for res in api_path('move', numbers=new_entry['.id'], destination=old_entry['.id']):
-                    pass
-            except (LibRouterosError, UnicodeEncodeError) as e:
-                module.fail_json(
-                    msg='Error while moving entry ID {element_id} to position #{new_index} ID ({new_id}): {error}'.format(
-                        element_id=new_entry['.id'],
+                else:
+                    msg = 'Error while moving entry ID {element_id} to position #{new_index} ID ({new_id}): {error}'.format(
+                        element_id=', '.join(element_ids),
                         new_index=new_index,
                         new_id=old_entry['.id'],
                         error=to_native(e),
                     )
-                )
+                module.fail_json(msg=msg)
 
-        # For sake of completeness, retrieve the full new data:
+        # For sake of completeness, retrieve the new data:
         if modify_list or create_list or reorder_list:
-            new_data = remove_dynamic(get_api_data(api_path, path_info))
+            changed_ids = [modifications['.id'] for modifications in modify_list] + [entry['.id'] for entry in create_list]
+            changed_entries = get_changed_api_data(module, api_path, path_info, changed_ids, read_fields)
+            if changed_entries is None:
+                new_data = remove_dynamic(iter_api_data(api_path, path_info, read_fields, read_selectors))
+            else:
+                # new_data already has the order of the entries on the router
+                new_data = [changed_entries.get(entry['.id'], entry) for entry in new_data]
             new_data = remove_rejected(new_data, path_info, restrict_data)
 
     # Remove 'irrelevant' data
@@ -1235,9 +1624,13 @@ def sync_with_primary_keys(module, api, path, path_info, restrict_data):
         new_data_by_key[pks] = entry
 
     api_path = compose_api_path(api, path)
+    read_fields = get_read_fields(module, path_info, restrict_data)
+    read_selectors = get_read_selectors(
+        module, api_path, path_info, restrict_data, primary_keys,
+        [tuple(entry[primary_key] for primary_key in primary_keys) for entry in new_data_by_key.values()])
 
-    old_data = get_api_data(api_path, path_info)
-    old_data = remove_dynamic(old_data)
+    # Filter the entries while they are received, so that the entries that are not needed are not kept in memory
+    old_data = remove_dynamic(iter_api_data(api_path, path_info, read_fields, read_selectors))
     old_data = remove_rejected(old_data, path_info, restrict_data)
     old_data_by_key = OrderedDict()
     id_by_key = {}
@@ -1293,21 +1686,20 @@ def sync_with_primary_keys(module, api, path, path_info, restrict_data):
 
     reorder_list = []
     if module.params['ensure_order']:
-        index_by_key = dict()
-        for index, entry in enumerate(new_data):
-            index_by_key[tuple(value_to_str(entry[primary_key]) for primary_key in primary_keys)] = index
-        for index, source_entry in enumerate(data):
-            source_pks = tuple(value_to_str(source_entry[primary_key]) for primary_key in primary_keys)
-            source_index = index_by_key.pop(source_pks)
-            if index == source_index:
-                continue
-            entry = new_data[index]
-            pks = tuple(value_to_str(entry[primary_key]) for primary_key in primary_keys)
-            reorder_list.append((source_pks, index, pks))
-            for k, v in index_by_key.items():
-                if v >= index and v < source_index:
-                    index_by_key[k] = v + 1
-            new_data.insert(index, new_data.pop(source_index))
+        # Since handle_absent_entries=remove, new_data contains exactly the entries of data
+        keys = [tuple(value_to_str(entry[primary_key]) for primary_key in primary_keys) for entry in data]
+        index_by_key = dict((key, index) for index, key in enumerate(keys))
+        positions = [
+            index_by_key[tuple(value_to_str(entry[primary_key]) for primary_key in primary_keys)]
+            for entry in new_data
+        ]
+        # With restrict, the entries are only part of the table, so they must not be moved to its end
+        for block, destination in plan_moves(positions, keep_last=restrict_data is not None):
+            reorder_list.append(([keys[position] for position in block], block[0], keys[destination] if destination is not None else None))
+        new_data_in_order = [None] * len(new_data)
+        for position, entry in zip(positions, new_data):
+            new_data_in_order[position] = entry
+        new_data = new_data_in_order
 
     if not module.check_mode:
         if remove_list:
@@ -1323,10 +1715,11 @@ def sync_with_primary_keys(module, api, path, path_info, restrict_data):
                         error=to_native(e),
                     )
                 )
+        results = run_writes(module, api_path, 'set', [modifications for key, modifications in modify_list])
         for key, modifications in modify_list:
             try:
-                api_path.update(**modifications)
-            except (LibRouterosError, UnicodeEncodeError) as e:
+                next(results)
+            except (LibRouterosError, UnicodeEncodeError, PipelineTrapError) as e:
                 module.fail_json(
                     msg='Error while modifying for {identifier} (ID {id}): {error}'.format(
                         identifier=format_pk(primary_keys, key),
@@ -1334,37 +1727,59 @@ def sync_with_primary_keys(module, api, path, path_info, restrict_data):
                         error=to_native(e),
                     )
                 )
+        # Moves rely on the entries being created in order, so do not pipeline them with ensure_order=true
+        results = run_writes(
+            module, api_path, 'add', [prepare_for_add(entry, path_info) for entry in create_list],
+            pipelined=not module.params['ensure_order'])
         for entry in create_list:
             try:
-                entry['.id'] = api_path.add(**prepare_for_add(entry, path_info))
+                entry['.id'] = next(results)
                 # Store ID for primary keys
                 pks = tuple(entry[primary_key] for primary_key in primary_keys)
                 id_by_key[pks] = entry['.id']
-            except (LibRouterosError, UnicodeEncodeError) as e:
+            except (LibRouterosError, UnicodeEncodeError, PipelineTrapError) as e:
                 module.fail_json(
                     msg='Error while creating entry for {identifier}: {error}'.format(
                         identifier=format_pk(primary_keys, [entry[pk] for pk in primary_keys]),
                         error=to_native(e),
                     )
                 )
-        for element_pks, new_index, new_pks in reorder_list:
+        for element_pks_list, new_index, new_pks in reorder_list:
+            element_ids = [id_by_key[element_pks] for element_pks in element_pks_list]
+            new_id = id_by_key[new_pks] if new_pks is not None else None
             try:
-                element_id = id_by_key[element_pks]
-                new_id = id_by_key[new_pks]
-                for res in api_path('move', numbers=element_id, destination=new_id):
-                    pass
+                move_entries(api_path, element_ids, new_id)
             except (LibRouterosError, UnicodeEncodeError) as e:
-                module.fail_json(
-                    msg='Error while moving entry ID {element_id} to position of ID {new_id}: {error}'.format(
-                        element_id=element_id,
+                if new_id is None:
+                    msg = 'Error while moving entry ID {element_id} to the end: {error}'.format(
+                        element_id=', '.join(element_ids),
+                        error=to_native(e),
+                    )
+                else:
+                    msg = 'Error while moving entry ID {element_id} to position of ID {new_id}: {error}'.format(
+                        element_id=', '.join(element_ids),
                         new_id=new_id,
                         error=to_native(e),
                     )
-                )
+                module.fail_json(msg=msg)
 
-        # For sake of completeness, retrieve the full new data:
+        # For sake of completeness, retrieve the new data:
         if modify_list or create_list or reorder_list:
-            new_data = remove_dynamic(get_api_data(api_path, path_info))
+            changed_ids = [modifications['.id'] for key, modifications in modify_list] + [entry['.id'] for entry in create_list]
+            changed_entries = get_changed_api_data(module, api_path, path_info, changed_ids, read_fields)
+            if changed_entries is None:
+                new_data = remove_dynamic(iter_api_data(api_path, path_info, read_fields, read_selectors))
+            else:
+                # new_data already has the order of the entries on the router; the copies of the
+                # created entries have no ID, so look up the entries by their primary keys
+                changed_entries_by_key = dict(
+                    (tuple(value_to_str(entry[primary_key]) for primary_key in primary_keys), entry)
+                    for entry in changed_entries.values()
+                )
+                new_data = [
+                    changed_entries_by_key.get(tuple(value_to_str(entry[primary_key]) for primary_key in primary_keys), entry)
+                    for entry in new_data
+                ]
             new_data = remove_rejected(new_data, path_info, restrict_data)
 
     # Remove 'irrelevant' data
@@ -1402,8 +1817,9 @@ def sync_single_value(module, api, path, path_info, restrict_data):
     polish_entry(new_entry, path_info, module, '')
 
     api_path = compose_api_path(api, path)
+    read_fields = get_read_fields(module, path_info, restrict_data)
 
-    old_data = get_api_data(api_path, path_info)
+    old_data = get_api_data(api_path, path_info, read_fields)
     if len(old_data) != 1:
         module.fail_json(
             msg='Internal error: retrieving /{path} resulted in {count} elements. Expected exactly 1.'.format(
@@ -1424,7 +1840,7 @@ def sync_single_value(module, api, path, path_info, restrict_data):
             except (LibRouterosError, UnicodeEncodeError) as e:
                 module.fail_json(msg='Error while modifying: {error}'.format(error=to_native(e)))
             # Retrieve latest version
-            new_data = get_api_data(api_path, path_info)
+            new_data = get_api_data(api_path, path_info, read_fields)
             if len(new_data) == 1:
                 updated_entry = new_data[0]
 
@@ -1447,44 +1863,21 @@ def sync_single_value(module, api, path, path_info, restrict_data):
     )
 
 
+BACKENDS = {
+    'sync_list': sync_list,
+    'sync_with_primary_keys': sync_with_primary_keys,
+    'sync_single_value': sync_single_value,
+}
+
+
 def get_backend(path_info):
     if path_info is None:
         return None
-    if not path_info.fully_understood:
-        return None
-
-    if path_info.primary_keys:
-        return sync_with_primary_keys
-
-    if path_info.single_value:
-        return sync_single_value
-
-    if not path_info.has_identifier and not path_info.modify_not_supported:
-        return sync_list
-
-    return None
-
-
-def has_backend(versioned_path_info):
-    if not versioned_path_info.fully_understood:
-        return False
-
-    if versioned_path_info.hardware_variants is not None:
-        return any(has_backend(v) for v in versioned_path_info.hardware_variants.values())
-
-    if versioned_path_info.unversioned is not None:
-        return get_backend(versioned_path_info.unversioned) is not None
-
-    if versioned_path_info.versioned is not None:
-        for dummy, dummy, unversioned in versioned_path_info.versioned:
-            if unversioned and not isinstance(unversioned, str) and get_backend(unversioned) is not None:
-                return True
-
-    return False
+    return BACKENDS.get(get_backend_name(path_info))
 
 
 def main():
-    path_choices = sorted([join_path(path) for path, versioned_path_info in PATHS.items() if has_backend(versioned_path_info)])
+    path_choices = [path for path, dummy, backends in PATH_CAPABILITIES if backends]
     module_args = dict(
         path=dict(type='str', required=True, choices=path_choices),
         data=dict(type='list', elements='dict', required=True),
@@ -1493,6 +1886,10 @@ def main():
         ensure_order=dict(type='bool', default=False),
         handle_read_only=dict(type='str', default='error', choices=['ignore', 'validate', 'error']),
         handle_write_only=dict(type='str', default='create_only', choices=['create_only', 'always_update', 'error']),
+        pipeline_window=dict(type='int', default=1),
+        reread_after_changes=dict(type='str', choices=['all', 'changed'], default='all'),
+        read_fields=dict(type='str', choices=['all', 'data'], default='all'),
+        read_entries=dict(type='str', choices=['all', 'data'], default='all'),
     )
     module_args.update(api_argument_spec())
     module_args.update(restrict_argument_spec())
@@ -1503,6 +1900,12 @@ def main():
     )
     if module.params['ensure_order'] and module.params['handle_absent_entries'] == 'ignore':
         module.fail_json(msg='ensure_order=true requires handle_absent_entries=remove')
+    if module.params['pipeline_window'] < 1:
+        module.fail_json(msg='pipeline_window must be at least 1')
+    if module.params['read_fields'] == 'data' and module.params['handle_entries_content'] != 'ignore':
+        module.fail_json(msg='read_fields=data requires handle_entries_content=ignore')
+    if module.params['read_entries'] == 'data' and module.params['handle_absent_entries'] != 'ignore':
+        module.fail_json(msg='read_entries=data requires handle_absent_entries=ignore')
 
     if not HAS_ORDEREDDICT:
         # This should never happen for Python 2.7+
@@ -1512,25 +1915,33 @@ def main():
     api = create_api(module)
 
     path = split_path(module.params['path'])
-    versioned_path_info = PATHS.get(tuple(path))
-
-    if versioned_path_info.hardware_detect:
-        hardware_variant_key = get_cached_or_detect(versioned_path_info.hardware_detect, api)
-        if hardware_variant_key not in versioned_path_info.hardware_variants:
-            module.fail_json(
-                msg='Path /{path} is not supported for detected hardware variant {variant}'.format(
-                    path='/'.join(path), variant=hardware_variant_key))
-        versioned_path_info = versioned_path_info.hardware_variants[hardware_variant_key]
-
-    if versioned_path_info.needs_version:
+    api_version = None
+    path_info = None
+    if PATHS.has_snapshots(tuple(path)):
+        # Use the pre-generated snapshot of the data for this version, if there is one
         api_version = get_api_version(api)
-        supported, not_supported_msg = versioned_path_info.provide_version(api_version)
-        if not supported:
-            msg = 'Path /{path} is not supported for API version {api_version}'.format(path='/'.join(path), api_version=api_version)
-            if not_supported_msg:
-                msg = '{0}: {1}'.format(msg, not_supported_msg)
-            module.fail_json(msg=msg)
-    path_info = versioned_path_info.get_data()
+        path_info = PATHS.get_snapshot(tuple(path), api_version, lambda hardware_detect: get_cached_or_detect(hardware_detect, api))
+    if path_info is None:
+        versioned_path_info = PATHS.get(tuple(path))
+
+        if versioned_path_info.hardware_detect:
+            hardware_variant_key = get_cached_or_detect(versioned_path_info.hardware_detect, api)
+            if hardware_variant_key not in versioned_path_info.hardware_variants:
+                module.fail_json(
+                    msg='Path /{path} is not supported for detected hardware variant {variant}'.format(
+                        path='/'.join(path), variant=hardware_variant_key))
+            versioned_path_info = versioned_path_info.hardware_variants[hardware_variant_key]
+
+        if versioned_path_info.needs_version:
+            if api_version is None:
+                api_version = get_api_version(api)
+            supported, not_supported_msg = versioned_path_info.provide_version(api_version)
+            if not supported:
+                msg = 'Path /{path} is not supported for API version {api_version}'.format(path='/'.join(path), api_version=api_version)
+                if not_supported_msg:
+                    msg = '{0}: {1}'.format(msg, not_supported_msg)
+                module.fail_json(msg=msg)
+        path_info = versioned_path_info.get_data()
 
     backend = get_backend(path_info)
     if path_info is None or backend is None:
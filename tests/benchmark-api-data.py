@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2026, Felix Fontein (@felixfontein) <felix@fontein.de>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+'''
+Measures the cost of the API data in plugins/module_utils/ and prints the results as JSON.
+
+Every time is the minimum over several runs in milliseconds, every memory value is in bytes.
+Modules are compiled from source, since AnsiballZ does not ship bytecode. Use --output to
+write the results to a file, for example to compare them between two commits.
+'''
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+import types
+import typing as t
+
+from ansible_collections.community.routeros.plugins.module_utils import _api_data_base
+
+from ansible_collections.community.routeros.plugins.module_utils._api_data_base import (
+    Depr,
+    KeyInfo,
+)
+
+
+MODULE_UTILS = 'ansible_collections.community.routeros.plugins.module_utils'
+
+SOURCES = {
+    'api_data': 'plugins/module_utils/_api_data.py',
+    'api_data_cache': 'plugins/module_utils/_api_data_cache.py',
+}
+
+PATHS_TO_BENCHMARK = [
+    ('interface', 'bridge'),
+    ('ip', 'firewall', 'filter'),
+    ('ip', 'address'),
+    ('system', 'identity'),
+]
+
+VERSIONS = ['7.10', '7.15.3', '7.18.2', '7.22.1']
+
+
+def measure(func: t.Callable[[], t.Any], repeat: int) -> float:
+    best = None
+    for dummy in range(repeat):
+        start = time.perf_counter()
+        func()
+        duration = time.perf_counter() - start
+        if best is None or duration < best:
+            best = duration
+    return best * 1000
+
+
+def reset_shared_objects() -> None:
+    # KeyInfo and Depr objects are shared between paths; start every run without them
+    KeyInfo._instances.clear()
+    Depr._instances.clear()
+
+
+def load_module(name: str, code: types.CodeType) -> types.ModuleType:
+    module = types.ModuleType('{0}._{1}'.format(MODULE_UTILS, name))
+    exec(code, module.__dict__)
+    return module
+
+
+def benchmark_module(name: str, repeat: int) -> dict[str, t.Any]:
+    with open(SOURCES[name], 'r', encoding='utf-8') as f:
+        source = f.read()
+    code = compile(source, SOURCES[name], 'exec')
+
+    def create_all() -> None:
+        reset_shared_objects()
+        paths = load_module(name, code).PATHS
+        for dummy in paths.values():
+            pass
+
+    reset_shared_objects()
+    tracemalloc.start()
+    paths = load_module(name, code).PATHS
+    loaded = tracemalloc.get_traced_memory()[0]
+    for dummy in paths.values():
+        pass
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'source_size': len(source.encode('utf-8')),
+        'compile_ms': measure(lambda: compile(source, SOURCES[name], 'exec'), repeat),
+        'exec_ms': measure(lambda: load_module(name, code), repeat),
+        'create_all_paths_ms': measure(create_all, repeat),
+        'memory_after_import': loaded,
+        'memory_after_create_all_paths': current,
+        'memory_peak': peak,
+    }
+
+
+def benchmark_paths(repeat: int) -> dict[str, t.Any]:
+    with open(SOURCES['api_data_cache'], 'r', encoding='utf-8') as f:
+        code = compile(f.read(), SOURCES['api_data_cache'], 'exec')
+    paths = load_module('api_data_cache', code).PATHS
+    results = {}
+    for path in PATHS_TO_BENCHMARK:
+        path_results = {}
+        for version in VERSIONS:
+
+            def generic() -> None:
+                api_data = _api_data_base.load_api_data(paths._factories[path])
+                if api_data.needs_version:
+                    api_data.provide_version(version)
+                api_data.get_data()
+
+            def provide_version() -> None:
+                api_data.provide_version(version)
+                api_data.get_data()
+
+            def snapshot() -> None:
+                paths._decoded.clear()
+                paths.get_snapshot(path, version, lambda hardware_detect: None)
+
+            api_data = paths[path]
+            if api_data.needs_version:
+                supported = api_data.provide_version(version)[0]
+            else:
+                supported = api_data.unversioned.fully_understood
+            has_snapshot = paths.get_snapshot(path, version, lambda hardware_detect: None) is not None
+            path_results[version] = {
+                'supported': supported,
+                'load_provide_version_get_data_ms': measure(generic, repeat) if supported else None,
+                'provide_version_get_data_ms': measure(provide_version, repeat) if supported else None,
+                'get_snapshot_ms': measure(snapshot, repeat) if has_snapshot else None,
+            }
+        results[_api_data_base.join_path(path)] = path_results
+    return results
+
+
+def main(args: list[str]) -> int:
+    parser = argparse.ArgumentParser(description='Benchmark the API data in plugins/module_utils/.')
+    parser.add_argument('--repeat', type=int, default=5, help='number of runs for every time measurement')
+    parser.add_argument('--output', help='write the JSON results to this file instead of stdout')
+    parsed_args = parser.parse_args(args)
+
+    results = {
+        'python': platform.python_version(),
+        'modules': dict((name, benchmark_module(name, parsed_args.repeat)) for name in SOURCES),
+        'paths': benchmark_paths(parsed_args.repeat),
+    }
+    text = json.dumps(results, indent=2, sort_keys=True)
+    if parsed_args.output:
+        with open(parsed_args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2026, Felix Fontein (@felixfontein) <felix@fontein.de>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+'''
+Counts the API writes api_modify needs for generated tables, and prints the results as JSON.
+
+The 'matching' scenarios start with a generated firewall or mangle table on the router and change
+some of its rules to get the desired table. The entries are matched like in sync_list() for paths
+without primary keys, once greedily (the behavior before matching by minimal cost) and once with
+the default settings.
+
+The 'reorder' scenarios run sync_list() and sync_with_primary_keys() with ensure_order=true against
+a fake API holding large tables, and count the API calls and the time needed.
+'''
+
+import argparse
+import copy
+import json
+import random
+import sys
+import time
+import typing as t
+
+from ansible_collections.community.routeros.plugins.module_utils._api_data_cache import (
+    PATHS,
+)
+
+from ansible_collections.community.routeros.plugins.modules import api_modify
+
+
+PORTS = ['22', '53', '80', '123', '443', '8080', '8291', '1194', '51820']
+PROTOCOLS = ['tcp', 'udp']
+ACTIONS = ['accept', 'drop', 'reject', 'jump', 'log']
+INTERFACE_LISTS = ['WAN', 'LAN', 'MGMT']
+
+
+class ModuleExit(Exception):
+    pass
+
+
+# Default values of the api_modify options that the benchmarks do not set
+DEFAULT_PARAMS = {
+    'pipeline_window': 1,
+    'reread_after_changes': 'all',
+    'read_fields': 'all',
+    'read_entries': 'all',
+}
+
+
+class FakeModule:
+    def __init__(self, params: dict[str, t.Any]) -> None:
+        self.params = dict(DEFAULT_PARAMS, **params)
+        self.check_mode = False
+        self._diff = False
+
+    def fail_json(self, msg: str, **kwargs: t.Any) -> None:
+        raise Exception(msg)
+
+    def exit_json(self, **kwargs: t.Any) -> None:
+        raise ModuleExit(kwargs)
+
+
+def _compose_reply_word(key: str, value: t.Any) -> str:
+    # Similar to how RouterOS sends values
+    if isinstance(value, bool):
+        value = 'true' if value else 'false'
+    return '={0}={1}'.format(key, value)
+
+
+class FakeApiPath:
+    def __init__(self, entries: list[dict[str, t.Any]]) -> None:
+        self.entries = entries
+        self.calls: dict[str, int] = {}
+        self._new_id_counter = 0
+        self._replies: list[tuple[str, tuple[str, ...]]] = []
+
+    def _count(self, command: str) -> None:
+        self.calls[command] = self.calls.get(command, 0) + 1
+
+    def join(self, name: str) -> 'FakeApiPath':
+        return self
+
+    def __iter__(self) -> t.Iterator[dict[str, t.Any]]:
+        self._count('read')
+        return iter([dict(entry) for entry in self.entries])
+
+    @property
+    def api(self) -> 'FakeApiPath':
+        return self
+
+    @property
+    def protocol(self) -> 'FakeApiPath':
+        return self
+
+    @property
+    def path(self) -> str:
+        return '/fake'
+
+    def writeSentence(self, cmd: str, *words: str) -> None:  # noqa: N802
+        # Only print with .proplist is supported
+        keys = set(words[0][len('=.proplist='):].split(','))
+        self._replies = [
+            ('!re', tuple(_compose_reply_word(key, value) for key, value in entry.items() if key in keys and value is not None))
+            for entry in self
+        ]
+        self._replies.append(('!done', ()))
+
+    def readSentence(self) -> tuple[str, tuple[str, ...]]:  # noqa: N802
+        # Like librouteros' ApiProtocol.readSentence(), return the raw words
+        return self._replies.pop(0)
+
+    def _find(self, id: str) -> int:
+        return next(index for index, entry in enumerate(self.entries) if entry['.id'] == id)
+
+    def add(self, **kwargs: t.Any) -> str:
+        self._count('add')
+        place_before = kwargs.pop('place-before', None)
+        self._new_id_counter += 1
+        entry = dict(kwargs, **{'.id': '*NEW{0}'.format(self._new_id_counter)})
+        self.entries.insert(len(self.entries) if place_before is None else self._find(place_before), entry)
+        return entry['.id']
+
+    def update(self, **kwargs: t.Any) -> None:
+        self._count('update')
+
+    def remove(self, *ids: str) -> None:
+        self._count('remove')
+        ids_set = set(ids)
+        self.entries[:] = [entry for entry in self.entries if entry['.id'] not in ids_set]
+
+    def __call__(self, command: str, **kwargs: t.Any) -> t.Iterator[None]:
+        self._count(command)
+        ids = kwargs['numbers'].split(',')
+        id_set = set(ids)
+        entries = dict((entry['.id'], entry) for entry in self.entries if entry['.id'] in id_set)
+        self.entries[:] = [entry for entry in self.entries if entry['.id'] not in id_set]
+        index = len(self.entries) if 'destination' not in kwargs else self._find(kwargs['destination'])
+        self.entries[index:index] = [entries[id] for id in ids]
+        return iter([])
+
+
+class FakeApi:
+    def __init__(self, path: FakeApiPath) -> None:
+        self._path = path
+
+    def path(self) -> FakeApiPath:
+        return self._path
+
+
+def generate_filter_rule(rng: random.Random, index: int) -> dict[str, t.Any]:
+    rule = {
+        'chain': rng.choice(['input', 'forward', 'output']),
+        'action': rng.choice(ACTIONS[:3]),
+        'protocol': rng.choice(PROTOCOLS),
+        'dst-port': rng.choice(PORTS),
+        'in-interface-list': rng.choice(INTERFACE_LISTS),
+    }
+    if rng.random() < 0.5:
+        rule['src-address'] = '10.{0}.{1}.0/24'.format(rng.randint(0, 3), rng.randint(0, 15))
+    if rng.random() < 0.7:
+        rule['comment'] = 'rule {0}'.format(index)
+    return rule
+
+
+def generate_mangle_rule(rng: random.Random, index: int) -> dict[str, t.Any]:
+    rule = {
+        'chain': rng.choice(['prerouting', 'forward', 'postrouting']),
+        'action': rng.choice(['mark-connection', 'mark-packet', 'mark-routing']),
+        'passthrough': rng.random() < 0.5,
+    }
+    if rule['action'] == 'mark-connection':
+        rule['new-connection-mark'] = 'conn-{0}'.format(rng.randint(0, 5))
+        rule['connection-state'] = 'new'
+    elif rule['action'] == 'mark-packet':
+        rule['new-packet-mark'] = 'pkt-{0}'.format(rng.randint(0, 5))
+        rule['connection-mark'] = 'conn-{0}'.format(rng.randint(0, 5))
+    else:
+        rule['new-routing-mark'] = 'route-{0}'.format(rng.randint(0, 2))
+        rule['dst-address-list'] = 'list-{0}'.format(rng.randint(0, 7))
+    if rng.random() < 0.5:
+        rule['comment'] = 'mangle {0}'.format(index)
+    return rule
+
+
+def change_rule(rng: random.Random, rule: dict[str, t.Any], generate: t.Callable[[random.Random, int], dict[str, t.Any]]) -> dict[str, t.Any]:
+    rule = dict(rule)
+    other = generate(rng, rng.randint(0, 10000))
+    keys = [key for key in sorted(set(rule) | set(other)) if key != 'chain']
+    for key in rng.sample(keys, rng.randint(1, 2)):
+        if key in other:
+            rule[key] = other[key]
+        else:
+            rule.pop(key, None)
+    return rule
+
+
+def create_scenario(
+    rng: random.Random, generate: t.Callable[[random.Random, int], dict[str, t.Any]], size: int, change: float, add: float, remove: float,
+) -> tuple[list[dict[str, t.Any]], list[dict[str, t.Any]]]:
+    old_data = [generate(rng, index) for index in range(size)]
+    new_data = []
+    for rule in old_data:
+        value = rng.random()
+        if value < remove:
+            continue
+        if value < remove + change:
+            rule = change_rule(rng, rule, generate)
+        new_data.append(dict(rule))
+    for index in range(int(size * add)):
+        new_data.insert(rng.randint(0, len(new_data)), generate(rng, size + index))
+    for index, rule in enumerate(old_data):
+        rule['.id'] = '*{0:X}'.format(index + 1)
+    return old_data, new_data
+
+
+def count_writes(path_info: t.Any, old_data: list[dict[str, t.Any]], new_data: list[dict[str, t.Any]], params: dict[str, t.Any],
+                 assignment_limit: int) -> dict[str, t.Any]:
+    module = FakeModule(params)
+    old_data = copy.deepcopy(old_data)
+    new_data = copy.deepcopy(new_data)
+    for index, entry in enumerate(new_data):
+        api_modify.polish_entry(entry, path_info, module, ' at index {0}'.format(index + 1))
+    stratify_keys = path_info.stratify_keys or ()
+    strata: dict[tuple[t.Any, ...], tuple[list[t.Any], list[t.Any]]] = {}
+    for index, entry in enumerate(new_data):
+        strata.setdefault(tuple(entry[key] for key in stratify_keys), ([], []))[0].append((index, entry))
+    for index, entry in enumerate(old_data):
+        strata.setdefault(tuple(entry[key] for key in stratify_keys), ([], []))[1].append((index, entry))
+
+    result = {'updates': 0, 'modified_fields': 0, 'adds': 0, 'removes': 0}
+    start = time.perf_counter()
+    for new_entries, old_entries in strata.values():
+        matching, unmatched = api_modify.match_entries(new_entries, old_entries, path_info, module, assignment_limit=assignment_limit)
+        for (dummy, new_entry), old_entry in zip(new_entries, matching):
+            if old_entry is None:
+                result['adds'] += 1
+                continue
+            modifications, dummy = api_modify.find_modifications(old_entry[1], new_entry, path_info, module)
+            if modifications:
+                result['updates'] += 1
+                result['modified_fields'] += len(modifications)
+        if params['handle_absent_entries'] == 'remove':
+            result['removes'] += len(unmatched)
+    result['match_ms'] = (time.perf_counter() - start) * 1000
+    result['api_writes'] = result['updates'] + result['adds'] + (1 if result['removes'] else 0)
+    return result
+
+
+SCENARIOS = [
+    # name, path, generator, size, fraction of changed rules, fraction of added rules, fraction of removed rules
+    ('filter-small-edits', ('ip', 'firewall', 'filter'), generate_filter_rule, 200, 0.1, 0.0, 0.0),
+    ('filter-rework', ('ip', 'firewall', 'filter'), generate_filter_rule, 200, 0.4, 0.1, 0.1),
+    ('mangle-small-edits', ('ip', 'firewall', 'mangle'), generate_mangle_rule, 150, 0.1, 0.0, 0.0),
+    ('mangle-rework', ('ip', 'firewall', 'mangle'), generate_mangle_rule, 150, 0.4, 0.1, 0.1),
+]
+
+MODES = {
+    'ignore': dict(handle_absent_entries='ignore', handle_entries_content='ignore'),
+    'remove': dict(handle_absent_entries='remove', handle_entries_content='remove_as_much_as_possible'),
+}
+
+
+def generate_interface_list_member(index: int) -> dict[str, t.Any]:
+    return {
+        'list': 'list-{0}'.format(index % 50),
+        'interface': 'vlan{0}'.format(index),
+    }
+
+
+def generate_firewall_filter(index: int) -> dict[str, t.Any]:
+    return {
+        'chain': 'forward',
+        'action': 'accept',
+        'protocol': 'tcp',
+        'dst-address': '10.{0}.{1}.{2}'.format(index // 65536, index // 256 % 256, index % 256),
+        'dst-port': '443',
+    }
+
+
+def generate_dns_static(index: int) -> dict[str, t.Any]:
+    return {
+        'name': 'host{0}.example.com'.format(index),
+        'address': '10.{0}.{1}.{2}'.format(index // 65536, index // 256 % 256, index % 256),
+    }
+
+
+def reorder_scenario(rng: random.Random, name: str, size: int) -> tuple[list[int], list[int]]:
+    old_order = list(range(size))
+    new_order = list(old_order)
+    if name == 'move-first-to-end':
+        new_order.append(new_order.pop(0))
+    elif name == 'insert-at-top':
+        new_order.insert(0, size)
+    elif name == 'displace-1%':
+        for dummy in range(size // 100):
+            new_order.insert(rng.randrange(size), new_order.pop(rng.randrange(size)))
+    elif name == 'insert-100-in-middle':
+        new_order[size // 2:size // 2] = range(size, size + 100)
+    elif name == 'move-100-to-top':
+        new_order = new_order[size // 2:size // 2 + 100] + new_order[:size // 2] + new_order[size // 2 + 100:]
+    return old_order, new_order
+
+
+REORDER_PATHS = [
+    ('interface list member', ('interface', 'list', 'member'), generate_interface_list_member),
+    ('ip dns static', ('ip', 'dns', 'static'), generate_dns_static),
+    ('ip firewall filter', ('ip', 'firewall', 'filter'), generate_firewall_filter),
+]
+
+REORDER_SCENARIOS = ['move-first-to-end', 'insert-at-top', 'displace-1%', 'insert-100-in-middle', 'move-100-to-top']
+
+
+def generate_key(entry: dict[str, t.Any]) -> tuple[t.Any, ...]:
+    return tuple(sorted((key, value) for key, value in entry.items() if key != '.id'))
+
+
+def run_reorder(version: str, seed: int, size: int) -> dict[str, t.Any]:
+    results = {}
+    for path_name, path, generate in REORDER_PATHS:
+        api_data = PATHS[path]
+        api_data.provide_version(version)
+        path_info = api_data.get_data()
+        backend = api_modify.get_backend(path_info)
+        for scenario in REORDER_SCENARIOS:
+            old_order, new_order = reorder_scenario(random.Random(seed), scenario, size)
+            api_path = FakeApiPath([dict(generate(index), **{'.id': '*{0:X}'.format(index + 1)}) for index in old_order])
+            module = FakeModule({
+                'data': [generate(index) for index in new_order],
+                'handle_absent_entries': 'remove',
+                'handle_entries_content': 'remove',
+                'handle_read_only': 'error',
+                'handle_write_only': 'create_only',
+                'ensure_order': True,
+                'restrict': None,
+            })
+            start = time.perf_counter()
+            try:
+                backend(module, FakeApi(api_path), path, path_info, None)
+            except ModuleExit:
+                pass
+            duration = time.perf_counter() - start
+            if [generate_key(entry) for entry in api_path.entries] != [generate_key(entry) for entry in module.params['data']]:
+                raise Exception('Wrong order after {0} for {1}'.format(scenario, path_name))
+            results['{0}/{1}'.format(path_name, scenario)] = {
+                'entries': size,
+                'calls': api_path.calls,
+                'run_ms': duration * 1000,
+            }
+    return results
+
+
+def main(args: list[str]) -> int:
+    parser = argparse.ArgumentParser(description='Count the API writes of api_modify for generated tables.')
+    parser.add_argument('--version', default='7.18', help='RouterOS version to use the API data for')
+    parser.add_argument('--seed', type=int, default=1, help='seed for generating the tables')
+    parser.add_argument('--reorder-size', type=int, default=10000, help='number of entries for the reorder scenarios')
+    parser.add_argument('--output', help='write the JSON results to this file instead of stdout')
+    parsed_args = parser.parse_args(args)
+
+    matching_results = {}
+    for name, path, generate, size, change, add, remove in SCENARIOS:
+        api_data = PATHS[path]
+        api_data.provide_version(parsed_args.version)
+        path_info = api_data.get_data()
+        old_data, new_data = create_scenario(random.Random(parsed_args.seed), generate, size, change, add, remove)
+        for mode, mode_params in MODES.items():
+            params = dict(mode_params, handle_read_only='error', handle_write_only='create_only')
+            matching_results['{0}/{1}'.format(name, mode)] = {
+                'greedy': count_writes(path_info, old_data, new_data, params, assignment_limit=0),
+                'default': count_writes(path_info, old_data, new_data, params, assignment_limit=api_modify.DEFAULT_ASSIGNMENT_LIMIT),
+            }
+
+    results = {
+        'matching': matching_results,
+        'reorder': run_reorder(parsed_args.version, parsed_args.seed, parsed_args.reorder_size),
+    }
+    text = json.dumps(results, indent=2, sort_keys=True)
+    if parsed_args.output:
+        with open(parsed_args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
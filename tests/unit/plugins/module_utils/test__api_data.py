@@ -13,12 +13,23 @@ import pytest
 
 from ansible_collections.community.routeros.plugins.module_utils._api_data import (
     PATHS,
+    APIData,
+    Depr,
+    LazyPathDict,
     VersionedAPIData,
     KeyInfo,
     split_path,
     join_path,
 )
 
+from ansible_collections.community.routeros.plugins.module_utils._api_data_base import (
+    VALUE_CANONICALIZERS,
+    VALUE_SANITIZERS,
+    validate_api_data,
+)
+
+from ansible_collections.community.routeros.plugins.module_utils.version import LooseVersion
+
 
 def test_paths_sorted():
     if sys.version_info < (3, 6):
@@ -33,6 +44,173 @@ def test_paths_sorted():
     assert paths == s_paths
 
 
+def test_paths_valid():
+    for path, path_info in PATHS.items():
+        assert isinstance(path_info, APIData), path
+        assert PATHS[path] is path_info
+        validate_api_data(path_info)
+
+
+def test_lazy_path_dict():
+    calls = []
+
+    def factory(name):
+        def create():
+            calls.append(name)
+            return APIData(unversioned=VersionedAPIData(fields={name: KeyInfo()}))
+        return create
+
+    paths = LazyPathDict({
+        ('a',): factory('a'),
+        ('b',): factory('b'),
+    })
+    assert len(paths) == 2
+    assert list(paths) == [('a',), ('b',)]
+    assert list(paths.keys()) == [('a',), ('b',)]
+    assert ('a',) in paths
+    assert ('c',) not in paths
+    assert paths.get(('c',)) is None
+    assert calls == []
+
+    data = paths[('b',)]
+    assert list(data.unversioned.fields) == ['b']
+    assert paths.get(('b',)) is data
+    assert calls == ['b']
+
+    with pytest.raises(KeyError):
+        paths[('c',)]
+
+    assert [path for path, dummy in paths.items()] == [('a',), ('b',)]
+    assert list(paths.values())[1] is data
+    assert calls == ['b', 'a']
+
+
+def test_specialize_for_version_memoized():
+    data = VersionedAPIData(
+        fields={'a': KeyInfo()},
+        versioned_fields=[
+            ([('7.10', '>=')], 'b', KeyInfo()),
+            ([('7.12', '>='), ('7.14', '<')], 'c', KeyInfo()),
+            ([('7.15', '==')], 'd', KeyInfo()),
+        ],
+    )
+    v7_9 = data.specialize_for_version(LooseVersion('7.9'))
+    v7_10 = data.specialize_for_version(LooseVersion('7.10'))
+    assert list(v7_9.fields) == ['a']
+    assert list(v7_10.fields) == ['a', 'b']
+    assert data.specialize_for_version(LooseVersion('7.9')) is v7_9
+    assert data.specialize_for_version(LooseVersion('7.10')) is v7_10
+    # Versions between the same boundaries share the result
+    assert data.specialize_for_version(LooseVersion('6.49')) is v7_9
+    assert data.specialize_for_version(LooseVersion('7.11.2')) is v7_10
+
+    assert list(data.specialize_for_version(LooseVersion('7.12')).fields) == ['a', 'b', 'c']
+    assert list(data.specialize_for_version(LooseVersion('7.13.5')).fields) == ['a', 'b', 'c']
+    assert list(data.specialize_for_version(LooseVersion('7.14')).fields) == ['a', 'b']
+    assert list(data.specialize_for_version(LooseVersion('7.15')).fields) == ['a', 'b', 'd']
+    assert list(data.specialize_for_version(LooseVersion('7.15.1')).fields) == ['a', 'b']
+
+
+CANONICALIZE_DATA = [
+    ('duration', '5m', '300000ms'),
+    ('duration', '00:05:00', '300000ms'),
+    ('duration', '300', '300000ms'),
+    ('duration', '1w2d03:04:05.5', '788645500ms'),
+    ('duration', '1d', '86400000ms'),
+    ('duration', '24h', '86400000ms'),
+    ('duration', '500ms', '500ms'),
+    ('duration', 'none-static', 'none-static'),
+    ('duration', '', ''),
+    ('bool', 'true', 'yes'),
+    ('bool', 'False', 'no'),
+    ('bool', 'yes', 'yes'),
+    ('bool', 'auto', 'auto'),
+    ('mac', 'aa-bb-cc-dd-ee-0f', 'AA:BB:CC:DD:EE:0F'),
+    ('mac', 'aa:bb:cc:dd:ee:0f', 'AA:BB:CC:DD:EE:0F'),
+    ('mac', 'aa:bb-cc:dd:ee:0f', 'aa:bb-cc:dd:ee:0f'),
+    ('mac', '', ''),
+    ('ip', 'FD00:0:0::1', 'fd00::1'),
+    ('ip', 'fd00:0::1/64', 'fd00::1/64'),
+    ('ip', '192.168.88.1/255.255.255.0', '192.168.88.1/24'),
+    ('ip', '192.168.88.1', '192.168.88.1'),
+    ('ip', 'router.lan', 'router.lan'),
+    ('name_list', 'ether1, ether2,,', 'ether1,ether2'),
+    ('name_list', 'ether2,ether1', 'ether2,ether1'),
+]
+
+
+@pytest.mark.parametrize("name, value, expected", CANONICALIZE_DATA)
+def test_value_canonicalizers(name, value, expected):
+    canonicalizer = VALUE_CANONICALIZERS[name]
+    assert canonicalizer(value) == expected
+    assert canonicalizer(expected) == expected
+
+
+def test_field_plan():
+    data = VersionedAPIData(
+        fully_understood=True,
+        required_one_of=[['a', 'b'], []],
+        mutually_exclusive=[['b', 'c'], ['d']],
+        fields={
+            'a': KeyInfo(required=True),
+            'b': KeyInfo(read_only=True),
+            'c': KeyInfo(write_only=True),
+            'd': KeyInfo(can_disable=True, default='x', value_sanitizer=VALUE_SANITIZERS['ensure_leading_slash'],
+                         depr=Depr('4.0.0', 'msg', context='write')),
+            'e': KeyInfo(can_disable=True, remove_value='', value_canonicalizer=VALUE_CANONICALIZERS['mac'],
+                         depr=Depr('4.0.0', 'msg', context='read')),
+            'g': KeyInfo(default=True),
+        },
+        versioned_fields=[
+            ([('7.10', '>=')], 'f', KeyInfo(read_only=True)),
+        ],
+    )
+    plan = data.field_plan
+    assert data.field_plan is plan
+    assert plan.read_only == frozenset(['b'])
+    assert plan.write_only == frozenset(['c'])
+    assert plan.sanitized == (('d', data.fields['d']), )
+    assert list(plan.write_deprecations) == ['d']
+    assert plan.required == ('a', )
+    assert plan.required_one_of == (('a', 'b'), )
+    assert plan.mutually_exclusive == (('b', 'c'), )
+    assert plan.disabled_defaults == (('d', 'x'), )
+    assert plan.canonicalizers == {'e': VALUE_CANONICALIZERS['mac'], 'g': VALUE_CANONICALIZERS['bool']}
+    # Specialized data has its own plan
+    assert data.specialize_for_version(LooseVersion('7.10')).field_plan.read_only == frozenset(['b', 'f'])
+
+
+VERSIONED_SELECTION = [
+    ('6.48', False, 'old'),
+    ('7', True, 'exact'),
+    ('7.0.1', True, 'not-7.1'),
+    ('7.1', False, 'rest'),
+    ('7.1.5', True, 'not-7.1'),
+    ('7.10', True, 'new'),
+    ('8.0', True, 'new'),
+]
+
+
+@pytest.mark.parametrize("version, supported, expected", VERSIONED_SELECTION)
+def test_provide_version_selection(version, supported, expected):
+    def data(name):
+        return VersionedAPIData(fully_understood=True, fields={name: KeyInfo()})
+
+    api_data = APIData(versioned=[
+        ('7.10', '>=', data('new')),
+        ('7', '<', 'old'),
+        ('7', '==', data('exact')),
+        ('7.1', '!=', data('not-7.1')),
+        ('*', '*', VersionedAPIData(fields={'rest': KeyInfo()})),
+    ])
+    result = api_data.provide_version(version)
+    if expected == 'old':
+        assert result == (False, 'old')
+        return
+    assert result == (supported, None)
+    assert list(api_data.get_data().fields) == [expected]
+
+
 def test_api_data_errors():
     with pytest.raises(ValueError) as exc:
         VersionedAPIData()
@@ -60,6 +238,10 @@ def test_api_data_errors():
         VersionedAPIData(unknown_mechanism=True, fixed_entries=True)
     assert exc.value.args[0] == 'fixed_entries can only be used with primary_keys'
 
+    with pytest.raises(ValueError) as exc:
+        VersionedAPIData(primary_keys=['foo'], supports_place_before=True, fields={'foo': KeyInfo()})
+    assert exc.value.args[0] == 'supports_place_before cannot be combined with primary_keys or single_value'
+
     with pytest.raises(ValueError) as exc:
         VersionedAPIData(primary_keys=['foo'], fields={})
     assert exc.value.args[0] == 'Primary key foo must be in fields!'
@@ -124,6 +306,96 @@ def test_key_info_errors():
     assert exc.value.args[0] == 'read_only can not be combined with can_disable, remove_value, absent_value, default, or required'
 
 
+def test_key_info_shared():
+    assert KeyInfo() is KeyInfo()
+    assert KeyInfo(default='') is KeyInfo(default='')
+    assert KeyInfo(can_disable=True, remove_value='') is KeyInfo(remove_value='', can_disable=True)
+    assert KeyInfo(default=1) is not KeyInfo(default=True)
+    assert KeyInfo(default=0) is not KeyInfo(default=False)
+    assert KeyInfo(default=1).default == 1
+    assert KeyInfo(default=True).default is True
+    assert KeyInfo(default=[]) is not KeyInfo(default=[])
+    assert Depr('1.0.0', 'msg') is Depr('1.0.0', 'msg', context='all')
+    assert Depr('1.0.0', 'msg') is not Depr('1.0.0', 'msg', context='read')
+    assert KeyInfo(depr=Depr('1.0.0', 'msg')) is KeyInfo(depr=Depr('1.0.0', 'msg'))
+
+
+def test_shared_validated_once(monkeypatch):
+    calls = []
+    validate = Depr._validate
+
+    def counting_validate(*values):
+        calls.append(values)
+        validate(*values)
+
+    monkeypatch.setattr(Depr, '_validate', staticmethod(counting_validate))
+    depr = Depr('9.9.9', 'validated once', validate=False)
+    assert calls == []
+    assert Depr('9.9.9', 'validated once') is depr
+    assert Depr('9.9.9', 'validated once') is depr
+    assert calls == [('9.9.9', 'validated once', 'all')]
+    # Values that fail validation are never marked as validated, so they are rejected every time
+    Depr('9.9.9', 'invalid', context='foo', validate=False)
+    for dummy in range(2):
+        with pytest.raises(ValueError):
+            Depr('9.9.9', 'invalid', context='foo')
+
+
+def test_key_info_immutable():
+    key_info = KeyInfo(default='foo')
+    with pytest.raises(AttributeError):
+        key_info.default = 'bar'
+    with pytest.raises(AttributeError):
+        del key_info.default
+    with pytest.raises(AttributeError):
+        key_info.foo = 'bar'
+    with pytest.raises(AttributeError):
+        Depr('1.0.0', 'msg').msg = 'other'
+    assert key_info.default == 'foo'
+
+
+def test_key_info_derived_strings():
+    assert KeyInfo().default_str is None
+    assert KeyInfo(default=True).default_str == 'yes'
+    assert KeyInfo(default=1500).default_str == '1500'
+    assert KeyInfo(can_disable=True, remove_value=False).remove_value_str == 'no'
+    with pytest.raises(AttributeError):
+        KeyInfo(default='foo').default_str = 'bar'
+
+
+def test_validate():
+    key_info = KeyInfo(read_only=True, write_only=True, validate=False)
+    with pytest.raises(ValueError) as exc:
+        key_info.validate()
+    assert exc.value.args[0] == 'read_only and write_only cannot be used at the same time'
+    with pytest.raises(ValueError) as exc:
+        KeyInfo(read_only=True, write_only=True)
+    assert exc.value.args[0] == 'read_only and write_only cannot be used at the same time'
+
+    data = VersionedAPIData(primary_keys=('name', ), fields={}, validate=False)
+    with pytest.raises(ValueError) as exc:
+        data.validate()
+    assert exc.value.args[0] == 'Primary key name must be in fields!'
+
+    api_data = APIData(unversioned=VersionedAPIData(fields={'name': key_info}), validate=False)
+    with pytest.raises(ValueError) as exc:
+        validate_api_data(api_data)
+    assert exc.value.args[0] == 'read_only and write_only cannot be used at the same time'
+
+    api_data = APIData(versioned=[
+        ('7', '>=', VersionedAPIData(
+            fields={},
+            versioned_fields=[
+                ([('7.10', '>=')], 'name', KeyInfo()),
+                ([('7.12', '<')], 'name', KeyInfo(default='')),
+            ],
+        )),
+    ])
+    with pytest.raises(ValueError) as exc:
+        validate_api_data(api_data)
+    assert exc.value.args[0] == 'Versioned field "name" applies more than once for some versions'
+
+
 SPLIT_PATHS = [
     ('', [], ''),
     ('  ip  ', ['ip'], 'ip'),
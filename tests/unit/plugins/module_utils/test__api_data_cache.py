@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2026, Felix Fontein (@felixfontein) <felix@fontein.de>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.community.routeros.plugins.module_utils._api_data import (
+    PATHS,
+)
+
+from ansible_collections.community.routeros.plugins.module_utils._api_data_base import (
+    APIData,
+    Depr,
+    KeyInfo,
+    VersionedAPIData,
+    _canonicalize_duration,
+    _dump_versioned_api_data,
+    _sanitize_ensure_leading_slash,
+    dump_api_data,
+    get_backend_name,
+    get_path_capabilities,
+    join_path,
+    load_api_data,
+    pack_path_texts,
+    unpack_path_texts,
+)
+
+from ansible_collections.community.routeros.plugins.module_utils._api_data_cache import (
+    PATH_CAPABILITIES,
+    PATHS as CACHED_PATHS,
+)
+
+
+def test_cache_up_to_date():
+    # If this fails, run 'nox -Re update-docs'
+    assert list(CACHED_PATHS) == list(PATHS)
+    snapshots = [start for start, dummy in CACHED_PATHS._snapshots]
+    for path, path_info in PATHS.items():
+        assert dump_api_data(CACHED_PATHS[path]) == dump_api_data(path_info), path
+        assert CACHED_PATHS._factories[path] == dump_api_data(path_info, snapshots), path
+    assert [path for path, dummy, dummy in PATH_CAPABILITIES] == sorted(join_path(path) for path in PATHS)
+    for path, readable, backends in PATH_CAPABILITIES:
+        assert (readable, list(backends)) == get_path_capabilities(PATHS[tuple(path.split())]), path
+
+
+ROUNDTRIP_DATA = [
+    APIData(unversioned=VersionedAPIData(
+        fully_understood=True,
+        primary_keys=('name', ),
+        required_one_of=[['name', 'comment']],
+        mutually_exclusive=[['comment', 'disabled']],
+        fields={
+            'name': KeyInfo(value_sanitizer=_sanitize_ensure_leading_slash),
+            'comment': KeyInfo(can_disable=True, remove_value=''),
+            'disabled': KeyInfo(default=False),
+            'numbers': KeyInfo(depr=Depr('4.0.0', 'Deprecated.', context='write')),
+            'running': KeyInfo(read_only=True),
+            'timeout': KeyInfo(default='1d', value_canonicalizer=_canonicalize_duration),
+        },
+    )),
+    APIData(versioned=[
+        ('7.10', '>=', VersionedAPIData(
+            single_value=True,
+            fields={
+                'enabled': KeyInfo(default=0),
+            },
+            versioned_fields=[
+                ([('7.12', '>='), ('7.14', '<')], 'port', KeyInfo(required=True)),
+            ],
+        )),
+        ('7', '>=', 'not supported before 7.10'),
+        ('*', '*', None),
+    ]),
+    APIData(
+        hardware_detect='switch_chip_type',
+        hardware_variants={
+            'single': APIData(unversioned=VersionedAPIData(has_identifier=True, fields={'name': KeyInfo()})),
+            'multi': APIData(unversioned=VersionedAPIData(stratify_keys=('name', ), fields={'name': KeyInfo()})),
+        },
+    ),
+]
+
+
+@pytest.mark.parametrize("api_data", ROUNDTRIP_DATA)
+def test_dump_load_roundtrip(api_data):
+    text = dump_api_data(api_data)
+    loaded = load_api_data(text)
+    assert dump_api_data(loaded) == text
+    assert loaded.fully_understood == api_data.fully_understood
+    assert loaded.needs_version == api_data.needs_version
+    assert loaded.has_identifier == api_data.has_identifier
+
+
+def test_dump_load_values():
+    loaded = load_api_data(dump_api_data(ROUNDTRIP_DATA[0])).unversioned
+    assert loaded.primary_keys == ('name', )
+    assert loaded.required_one_of == [['name', 'comment']]
+    assert loaded.fields['name'].value_sanitizer is _sanitize_ensure_leading_slash
+    assert loaded.fields['comment'].remove_value == ''
+    assert loaded.fields['disabled'].default is False
+    assert loaded.fields['numbers'].depr.applies('write')
+    assert loaded.fields['numbers'].depr.msg == 'Deprecated.'
+    assert loaded.fields['timeout'].value_canonicalizer is _canonicalize_duration
+    assert loaded.fields['timeout'].default_str == '86400000ms'
+
+    loaded = load_api_data(dump_api_data(ROUNDTRIP_DATA[1]))
+    assert loaded.versioned[1] == ('7', '>=', 'not supported before 7.10')
+    assert loaded.versioned[2] == ('*', '*', None)
+    assert loaded.versioned[0][2].fields['enabled'].default == 0
+    assert loaded.provide_version('7.12') == (False, None)
+    assert list(loaded.get_data().fields) == ['enabled', 'port']
+    assert loaded.provide_version('7.14') == (False, None)
+    assert list(loaded.get_data().fields) == ['enabled']
+    assert loaded.provide_version('7.9') == (False, 'not supported before 7.10')
+
+
+def _get_snapshot_test_versions():
+    versions = []
+    for start, end in CACHED_PATHS._snapshots:
+        versions.extend([start, start + '.1'])
+        if end is not None:
+            versions.append(end)
+    return versions
+
+
+@pytest.mark.parametrize("version", _get_snapshot_test_versions())
+def test_snapshots(version):
+    for path, api_data in PATHS.items():
+        for hardware_variant in sorted(api_data.hardware_variants or [None]):
+            snapshot = CACHED_PATHS.get_snapshot(path, version, lambda hardware_detect: hardware_variant)
+            if hardware_variant is not None:
+                api_data = PATHS[path].hardware_variants[hardware_variant]
+            supported = api_data.provide_version(version)[0] if api_data.needs_version else api_data.unversioned.fully_understood
+            if snapshot is None:
+                assert not supported or not api_data.needs_version or CACHED_PATHS._find_snapshot(version) is None, path
+            else:
+                assert supported, path
+                assert _dump_versioned_api_data(snapshot) == _dump_versioned_api_data(api_data.get_data()), path
+
+
+def test_snapshots_fallback():
+    assert CACHED_PATHS.has_snapshots(('interface', 'bridge'))
+    assert not CACHED_PATHS.has_snapshots(('does', 'not', 'exist'))
+    assert CACHED_PATHS.get_snapshot(('interface', 'bridge'), '7.15.3', None) is not None
+    assert CACHED_PATHS.get_snapshot(('interface', 'bridge'), '7.10', None) is None
+    assert CACHED_PATHS.get_snapshot(('interface', 'bridge'), '7.16', None) is None
+
+
+def test_path_capabilities():
+    api_data = APIData(versioned=[
+        ('7.10', '>=', VersionedAPIData(fully_understood=True, primary_keys=('name', ), fields={'name': KeyInfo()})),
+        ('7.5', '>=', VersionedAPIData(fully_understood=True, fields={'name': KeyInfo()})),
+        ('7', '>=', VersionedAPIData(fully_understood=True, has_identifier=True, fields={'name': KeyInfo()})),
+        ('*', '*', 'not supported'),
+    ])
+    assert get_path_capabilities(api_data) == (True, ['sync_list', 'sync_with_primary_keys'])
+    api_data = APIData(unversioned=VersionedAPIData(single_value=True, fields={'name': KeyInfo()}))
+    assert get_path_capabilities(api_data) == (False, [])
+    assert get_backend_name(VersionedAPIData(fully_understood=True, single_value=True, fields={})) == 'sync_single_value'
+    assert get_backend_name(VersionedAPIData(fully_understood=True, modify_not_supported=True, fields={})) is None
+
+
+def test_pack_path_texts():
+    texts = {
+        ('a', ): '{"x":1}',
+        ('b', 'c'): '',
+        ('d', ): '"\u00e4"',
+    }
+    index, data = pack_path_texts(texts)
+    assert data == '{"x":1}"\u00e4"'
+    assert unpack_path_texts(index, data) == texts
+
+
+def test_dump_unknown_sanitizer():
+    api_data = APIData(unversioned=VersionedAPIData(fields={'name': KeyInfo(value_sanitizer=lambda value: value)}))
+    with pytest.raises(ValueError) as exc:
+        dump_api_data(api_data)
+    assert 'is not registered in VALUE_SANITIZERS' in exc.value.args[0]
+
+
+def test_dump_unknown_canonicalizer():
+    api_data = APIData(unversioned=VersionedAPIData(fields={'name': KeyInfo(value_canonicalizer=lambda value: value)}))
+    with pytest.raises(ValueError) as exc:
+        dump_api_data(api_data)
+    assert 'is not registered in VALUE_CANONICALIZERS' in exc.value.args[0]
@@ -17,6 +17,9 @@ from ansible_collections.community.routeros.plugins.module_utils._api_data impor
 )
 
 from ansible_collections.community.routeros.plugins.module_utils._api_helper import (
+    compose_proplist,
+    compose_query,
+    get_restrict_selectors,
     value_to_str,
     _test_rule_except_invert,
     validate_and_prepare_restrict,
@@ -385,3 +388,64 @@ def test_restrict_entry_accepted(entry, restrict_data, expected):
     result = restrict_entry_accepted(entry, TEST_PATH, restrict_data)
     print(repr(result))
     assert result == expected
+
+
+def test_compose_proplist():
+    path_info = PATHS[('ip', 'address')].get_data()
+    assert compose_proplist(path_info) == ['.id', 'dynamic', 'builtin'] + list(path_info.fields)
+    assert compose_proplist(path_info, ['address', 'dynamic']) == ['.id', 'dynamic', 'builtin', 'address']
+
+
+COMPOSE_QUERY = [
+    ([], []),
+    ([(('chain', 'input'), )], ['?chain=input']),
+    ([(('chain', 'input'), ), (('chain', 'forward'), )], ['?chain=input', '?chain=forward', '?#|']),
+    (
+        [(('list', 'a'), ('disabled', False)), (('list', 'b'), ('disabled', True))],
+        ['?list=a', '?disabled=false', '?#&', '?list=b', '?disabled=true', '?#&', '?#|'],
+    ),
+]
+
+
+@pytest.mark.parametrize("selectors, expected", COMPOSE_QUERY)
+def test_compose_query(selectors, expected):
+    assert compose_query(selectors) == expected
+
+
+GET_RESTRICT_SELECTORS = [
+    (None, None),
+    ([], None),
+    (
+        [{'field': 'chain', 'match_disabled': False, 'invert': False, 'values': ['input', 'forward']}],
+        [(('chain', 'input'), ), (('chain', 'forward'), )],
+    ),
+    (
+        [
+            {'field': 'chain', 'match_disabled': False, 'invert': False, 'values': ['input']},
+            {'field': 'comment', 'match_disabled': False, 'invert': False, 'values': ['a', 'b']},
+        ],
+        [(('chain', 'input'), ('comment', 'a')), (('chain', 'input'), ('comment', 'b'))],
+    ),
+    (
+        [{'field': 'chain', 'match_disabled': False, 'invert': False, 'values': []}],
+        [],
+    ),
+    # Rules that the router cannot evaluate are skipped
+    (
+        [
+            {'field': 'chain', 'match_disabled': False, 'invert': True, 'values': ['input']},
+            {'field': 'comment', 'match_disabled': True, 'invert': False, 'values': ['a']},
+            {'field': 'action', 'match_disabled': False, 'invert': False, 'values': ['accept'], 'regex': re.compile('d.*')},
+            {'field': 'log', 'match_disabled': False, 'invert': False, 'values': ['yes']},
+            {'field': 'port', 'match_disabled': False, 'invert': False, 'values': [22]},
+            {'field': 'comment', 'match_disabled': False, 'invert': False, 'values': ['a', '']},
+        ],
+        None,
+    ),
+]
+
+
+@pytest.mark.parametrize("restrict_data, expected", GET_RESTRICT_SELECTORS)
+def test_get_restrict_selectors(restrict_data, expected):
+    path_info = PATHS[('ip', 'firewall', 'filter')].get_data()
+    assert get_restrict_selectors(path_info, restrict_data) == expected
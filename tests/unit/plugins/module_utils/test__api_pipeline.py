@@ -0,0 +1,277 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2026, Felix Fontein (@felixfontein) <felix@fontein.de>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.community.routeros.plugins.module_utils._api_pipeline import (
+    PipelineTrapError,
+    WritePipeline,
+    stream_command,
+)
+
+
+class FakeApi(object):
+    """Answers every sentence with the reply of ``handler``; replies of unanswered sentences are
+    returned in reverse order to make sure that they are assigned by their tags."""
+
+    def __init__(self, handler):
+        self.protocol = self
+        self.sentences = []
+        self.max_unanswered = 0
+        self._handler = handler
+        self._unanswered = []
+
+    def writeSentence(self, cmd, *words):
+        for word in words:
+            word.encode('ascii')
+        tag = int(words[-1][len('.tag='):])
+        self.sentences.append((cmd, words[:-1]))
+        self._unanswered.append((tag, self._handler(cmd, words[:-1])))
+        self.max_unanswered = max(self.max_unanswered, len(self._unanswered))
+
+    def readSentence(self):
+        tag, replies = self._unanswered[-1]
+        reply_word, words = replies.pop(0)
+        if not replies:
+            self._unanswered.pop()
+        return reply_word, words + ('.tag={0}'.format(tag), )
+
+
+class FakePath(object):
+    def __init__(self, api, path='/ip/address'):
+        self.api = api
+        self.path = path
+
+    def join(self, *path):
+        return FakePath(self.api, '/'.join((self.path, ) + path))
+
+
+def handle(cmd, words):
+    if cmd.endswith('/add'):
+        return [('!re', ('=ret=*{0}'.format(len(words)), )), ('!done', ())]
+    if '=comment=fail' in words:
+        return [('!trap', ('=message=failure:\r\nbad comment', )), ('!done', ())]
+    return [('!done', ())]
+
+
+def test_run():
+    api = FakeApi(handle)
+    pipeline = WritePipeline(FakePath(api), 2)
+    commands = [
+        ('set', {'.id': '*1', 'disabled': True}),
+        ('add', {'address': '10.0.0.1/24', 'interface': 'ether1'}),
+        ('set', {'.id': '*2', 'mtu': 1500, 'disabled': False}),
+    ]
+    assert list(pipeline.run(commands)) == [[], [{'ret': '*2'}], []]
+    assert api.sentences == [
+        ('/ip/address/set', ('=.id=*1', '=disabled=yes')),
+        ('/ip/address/add', ('=address=10.0.0.1/24', '=interface=ether1')),
+        ('/ip/address/set', ('=.id=*2', '=mtu=1500', '=disabled=no')),
+    ]
+    assert api.max_unanswered == 2
+
+
+def test_run_trap():
+    api = FakeApi(handle)
+    pipeline = WritePipeline(FakePath(api), 10)
+    commands = [('set', {'.id': '*{0}'.format(index), 'comment': 'fail' if index == 3 else 'ok'}) for index in range(20)]
+    results = pipeline.run(commands)
+    for dummy in range(3):
+        assert next(results) == []
+    with pytest.raises(PipelineTrapError) as exc:
+        next(results)
+    assert str(exc.value) == 'failure:,bad comment'
+    # No commands are sent once the failure has been noticed
+    assert len(api.sentences) == 10
+
+
+def test_run_encode_error():
+    api = FakeApi(handle)
+    pipeline = WritePipeline(FakePath(api), 10)
+    commands = [('set', {'.id': '*1', 'comment': 'ok'}), ('set', {'.id': '*2', 'comment': u'ä'}), ('set', {'.id': '*3'})]
+    results = pipeline.run(commands)
+    assert next(results) == []
+    with pytest.raises(UnicodeEncodeError):
+        next(results)
+    assert len(api.sentences) == 1
+
+
+class FakeBrokenApi(object):
+    """Answers all sentences with the fixed ``replies``, independently of the tags that were sent.
+    Exceptions in ``replies`` are raised instead."""
+
+    def __init__(self, replies):
+        self.protocol = self
+        self.sentences = []
+        self._replies = list(replies)
+
+    def writeSentence(self, cmd, *words):
+        self.sentences.append((cmd, words))
+
+    def readSentence(self):
+        reply = self._replies.pop(0)
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+
+@pytest.mark.parametrize("reply, message", [
+    (('!done', ()), 'Received !done reply without tag'),
+    (('!re', ('.tag=17', '=ret=*1')), 'Received !re reply for unknown tag 17'),
+    (('!done', ('.tag=x', )), 'Received !done reply for unknown tag x'),
+])
+def test_run_bad_reply(reply, message):
+    api = FakeBrokenApi([reply])
+    pipeline = WritePipeline(FakePath(api), 10)
+    results = pipeline.run([('set', {'.id': '*{0}'.format(index)}) for index in range(20)])
+    with pytest.raises(PipelineTrapError) as exc:
+        next(results)
+    assert str(exc.value) == message
+    assert len(api.sentences) == 10
+
+
+def test_run_fatal():
+    exceptions = pytest.importorskip('librouteros.exceptions')
+    # librouteros raises FatalError when reading !fatal, instead of returning the sentence
+    api = FakeBrokenApi([exceptions.FatalError('session terminated on request')])
+    pipeline = WritePipeline(FakePath(api), 10)
+    results = pipeline.run([('set', {'.id': '*{0}'.format(index)}) for index in range(20)])
+    with pytest.raises(PipelineTrapError) as exc:
+        next(results)
+    assert str(exc.value) == 'The router closed the connection: session terminated on request'
+    assert exc.value.category == 'fatal'
+    assert len(api.sentences) == 10
+
+
+class FakeTransport(object):
+    """Returns the encoded ``replies`` when read from, like a socket transport of librouteros."""
+
+    def __init__(self, replies):
+        protocol = pytest.importorskip('librouteros.protocol')
+        self.written = []
+        self._data = b''.join(protocol.encode_sentence(*reply, encoding='ASCII') for reply in replies)
+
+    def write(self, data):
+        self.written.append(data)
+
+    def read(self, length):
+        data, self._data = self._data[:length], self._data[length:]
+        return data
+
+    def close(self):
+        pass
+
+
+def create_librouteros_path(replies):
+    api = pytest.importorskip('librouteros.api')
+    protocol = pytest.importorskip('librouteros.protocol')
+    transport = FakeTransport(replies)
+    return api.Api(protocol.ApiProtocol(transport, 'ASCII')).path('ip', 'address'), transport
+
+
+def test_run_librouteros():
+    path, transport = create_librouteros_path([
+        ('!done', '.tag=0'),
+        ('!re', '.tag=1', '=ret=*2'),
+        ('!done', '.tag=2'),
+        ('!done', '.tag=1'),
+    ])
+    commands = [
+        ('set', {'.id': '*1', 'disabled': True}),
+        ('add', {'address': '10.0.0.1/24', 'interface': 'ether1'}),
+        ('set', {'.id': '*2', 'mtu': 1500}),
+    ]
+    assert list(WritePipeline(path, 4).run(commands)) == [[], [{'ret': '*2'}], []]
+    assert len(transport.written) == 3
+
+
+def test_run_librouteros_fatal():
+    path, dummy = create_librouteros_path([
+        ('!done', '.tag=0'),
+        ('!fatal', 'session terminated on request'),
+    ])
+    results = WritePipeline(path, 4).run([('set', {'.id': '*{0}'.format(index)}) for index in range(3)])
+    assert next(results) == []
+    with pytest.raises(PipelineTrapError) as exc:
+        next(results)
+    assert str(exc.value) == 'The router closed the connection: session terminated on request'
+
+
+class FakeStreamApi(object):
+    """Replies to every sentence with ``replies``, and records how many sentences were read.
+    Exceptions in ``replies`` are raised instead."""
+
+    def __init__(self, replies):
+        self.protocol = self
+        self.sentences = []
+        self.read = 0
+        self._replies = replies
+
+    def writeSentence(self, cmd, *words):
+        self.sentences.append((cmd, words))
+
+    def readSentence(self):
+        reply = self._replies[self.read]
+        self.read += 1
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+
+def test_stream_command():
+    api = FakeStreamApi([('!re', ('=.id=*1', )), ('!empty', ()), ('!re', ('=.id=*2', )), ('!done', ())])
+    rows = stream_command(FakePath(api), 'print', '=.proplist=.id')
+    assert next(rows) == {'.id': '*1'}
+    # Rows are yielded while they are received
+    assert api.read == 1
+    assert list(rows) == [{'.id': '*2'}]
+    assert api.sentences == [('/ip/address/print', ('=.proplist=.id', ))]
+
+
+def test_stream_command_trap():
+    api = FakeStreamApi([('!re', ('=.id=*1', )), ('!trap', ('=message=no such command', )), ('!done', ())])
+    rows = stream_command(FakePath(api), 'print')
+    assert next(rows) == {'.id': '*1'}
+    with pytest.raises(PipelineTrapError) as exc:
+        next(rows)
+    assert str(exc.value) == 'no such command'
+
+
+def test_stream_command_close():
+    api = FakeStreamApi([('!re', ('=.id=*1', )), ('!re', ('=.id=*2', )), ('!re', ('=.id=*3', )), ('!done', ())])
+    rows = stream_command(FakePath(api), 'print')
+    assert next(rows) == {'.id': '*1'}
+    rows.close()
+    # The rest of the reply has been read
+    assert api.read == 4
+
+
+def test_stream_command_values():
+    api = FakeStreamApi([('!re', ('=.id=*1', '=mtu=1500', '=disabled=false', '=comment=007', '=name=a=b')), ('!done', ())])
+    assert list(stream_command(FakePath(api), 'print')) == [{'.id': '*1', 'mtu': 1500, 'disabled': False, 'comment': '007', 'name': 'a=b'}]
+
+
+def test_stream_command_fatal():
+    exceptions = pytest.importorskip('librouteros.exceptions')
+    api = FakeStreamApi([('!re', ('=.id=*1', )), exceptions.FatalError('out of memory')])
+    rows = stream_command(FakePath(api), 'print')
+    assert next(rows) == {'.id': '*1'}
+    with pytest.raises(PipelineTrapError) as exc:
+        next(rows)
+    assert str(exc.value) == 'The router closed the connection: out of memory'
+    assert exc.value.category == 'fatal'
+
+
+def test_stream_command_librouteros():
+    path, dummy = create_librouteros_path([
+        ('!re', '=.id=*1', '=disabled=true'),
+        ('!re', '=.id=*2', '=disabled=no'),
+        ('!done', ),
+    ])
+    assert list(stream_command(path, 'print')) == [{'.id': '*1', 'disabled': True}, {'.id': '*2', 'disabled': False}]
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2026, Felix Fontein (@felixfontein) <felix@fontein.de>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import itertools
+import random
+
+import pytest
+
+from ansible_collections.community.routeros.plugins.module_utils._matching import (
+    find_min_cost_matching,
+)
+
+
+def _evaluate(edges, matching):
+    costs = {}
+    for left, right, cost in edges:
+        costs[(left, right)] = min(cost, costs.get((left, right), cost))
+    assert len(set(left for left, dummy in matching)) == len(matching)
+    assert len(set(right for dummy, right in matching)) == len(matching)
+    return len(matching), -sum(costs[pair] for pair in matching)
+
+
+def _best(edges):
+    lefts = sorted(set(edge[0] for edge in edges))
+    rights = sorted(set(edge[1] for edge in edges))
+    pairs = set((left, right) for left, right, dummy in edges)
+    best = (0, 0)
+    for permutation in itertools.permutations(rights + [None] * len(lefts), len(lefts)):
+        matching = [(left, right) for left, right in zip(lefts, permutation) if (left, right) in pairs]
+        best = max(best, _evaluate(edges, matching))
+    return best
+
+
+FIXED_DATA = [
+    # The greedy matching would pair 'a' with 1, and leave 'b' without a partner
+    (
+        [('a', 1, 0), ('a', 2, 1), ('b', 1, 1)],
+        [('a', 2), ('b', 1)],
+    ),
+    # Equal entries are paired in order
+    (
+        [('a', 1, 0), ('a', 2, 0), ('b', 1, 0), ('b', 2, 0)],
+        [('a', 1), ('b', 2)],
+    ),
+    # Only one entry on one side: take the first best edge
+    (
+        [('a', 3, 2), ('a', 1, 1), ('a', 2, 1)],
+        [('a', 1)],
+    ),
+    # Independent components
+    (
+        [(1, 'x', 3), (2, 'y', 0)],
+        [(1, 'x'), (2, 'y')],
+    ),
+    (
+        [],
+        [],
+    ),
+]
+
+
+@pytest.mark.parametrize("edges, expected", FIXED_DATA)
+def test_find_min_cost_matching(edges, expected):
+    assert sorted(find_min_cost_matching(edges)) == expected
+
+
+def test_find_min_cost_matching_greedy():
+    edges = [('a', 1, 0), ('a', 2, 1), ('b', 1, 1)]
+    assert sorted(find_min_cost_matching(edges, assignment_limit=0)) == [('a', 1)]
+
+
+def test_find_min_cost_matching_random():
+    rng = random.Random(42)
+    for dummy in range(300):
+        left_count = rng.randint(1, 4)
+        right_count = rng.randint(1, 4)
+        edges = [
+            (left, right, rng.randint(0, 3))
+            for left in range(left_count)
+            for right in range(right_count)
+            if rng.random() < 0.6
+        ]
+        matching = find_min_cost_matching(edges)
+        assert _evaluate(edges, matching) == _best(edges), edges
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2026, Felix Fontein (@felixfontein) <felix@fontein.de>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import random
+
+import pytest
+
+from ansible_collections.community.routeros.plugins.module_utils._ordering import (
+    find_longest_increasing_subsequence,
+    plan_moves,
+)
+
+
+def _apply_moves(positions, steps):
+    current = list(positions)
+    for block, destination in steps:
+        for position in block:
+            if position in current:
+                current.remove(position)
+        index = len(current) if destination is None else current.index(destination)
+        current[index:index] = block
+    return current
+
+
+def _longest_increasing_subsequence_length(values):
+    lengths = []
+    for index, value in enumerate(values):
+        lengths.append(1 + max([lengths[other] for other in range(index) if values[other] < value] or [0]))
+    return max(lengths or [0])
+
+
+LIS_DATA = [
+    ([], []),
+    ([5], [0]),
+    ([3, 2, 0, 1], [2, 3]),
+    ([0, 1, 2], [0, 1, 2]),
+    ([2, 1, 0], [2]),
+    ([1, 5, 2, 3, 0, 4], [0, 2, 3, 5]),
+]
+
+
+@pytest.mark.parametrize("values, expected", LIS_DATA)
+def test_find_longest_increasing_subsequence(values, expected):
+    assert find_longest_increasing_subsequence(values) == expected
+
+
+PLAN_DATA = [
+    ([], [], []),
+    ([0, 1, 2], [], []),
+    # A new entry at the top is moved there, everything else stays
+    ([1, 2, 3, 0], [], [([0], 1)]),
+    ([3, 2, 0, 1], [], [([3], None), ([2], 3)]),
+    # Consecutive entries in the right order are moved together
+    ([2, 3, 4, 0, 1], [], [([0, 1], 2)]),
+    ([4, 3, 0, 1, 2], [], [([4], None), ([3], 4)]),
+    # Entries to create are placed on their own
+    ([1, 2], [0], [([0], 1)]),
+    ([0, 3, 1], [2, 4], [([4], None), ([3], 4), ([2], 3)]),
+]
+
+
+@pytest.mark.parametrize("positions, new_positions, expected", PLAN_DATA)
+def test_plan_moves(positions, new_positions, expected):
+    assert plan_moves(positions, new_positions) == expected
+    assert _apply_moves(positions, expected) == sorted(positions + new_positions)
+
+
+PLAN_KEEP_LAST_DATA = [
+    ([0, 1, 2], [], []),
+    # The last entry stays, so the others are moved before it instead of moving it to the end
+    ([3, 0, 1, 2], [], [([0, 1, 2], 3)]),
+    ([3, 2, 0, 1], [], [([2], 3), ([0, 1], 2)]),
+    ([1, 3, 0], [2], [([2], 3), ([0], 1)]),
+    # Entries to create at the end are created before the last entry, which is then moved before them
+    ([1, 0], [2], [([2], 1), ([1], 2), ([0], 1)]),
+    ([0, 1], [2, 3], [([3], 1), ([2], 3), ([1], 2)]),
+    # Without existing entries, there is nothing to place the entries to create before
+    ([], [0, 1], [([1], None), ([0], 1)]),
+]
+
+
+@pytest.mark.parametrize("positions, new_positions, expected", PLAN_KEEP_LAST_DATA)
+def test_plan_moves_keep_last(positions, new_positions, expected):
+    assert plan_moves(positions, new_positions, keep_last=True) == expected
+    assert _apply_moves(positions, expected) == sorted(positions + new_positions)
+
+
+def test_plan_moves_random():
+    rng = random.Random(42)
+    for dummy in range(300):
+        count = rng.randint(0, 12)
+        permutation = list(range(count))
+        rng.shuffle(permutation)
+        new_count = rng.randint(0, count)
+        positions = permutation[new_count:]
+        new_positions = permutation[:new_count]
+        steps = plan_moves(positions, new_positions)
+        assert _apply_moves(positions, steps) == list(range(count)), (positions, new_positions)
+        moved = sum(len(block) for block, dummy in steps)
+        assert moved == count - _longest_increasing_subsequence_length(positions), (positions, new_positions)
+        # Every entry to create is placed exactly once
+        assert sorted(block[0] for block, dummy in steps if block[0] in new_positions) == sorted(new_positions)
+
+
+def test_plan_moves_keep_last_random():
+    rng = random.Random(42)
+    for dummy in range(300):
+        count = rng.randint(0, 12)
+        permutation = list(range(count))
+        rng.shuffle(permutation)
+        new_count = rng.randint(0, count)
+        positions = permutation[new_count:]
+        new_positions = permutation[:new_count]
+        steps = plan_moves(positions, new_positions, keep_last=True)
+        assert _apply_moves(positions, steps) == list(range(count)), (positions, new_positions)
+        # Nothing is placed at the end, unless there are no existing entries
+        assert not positions or all(destination is not None for block, destination in steps), (positions, new_positions)
+        moved = sum(len(block) for block, dummy in steps)
+        if count - 1 in positions:
+            last = positions.index(count - 1)
+            expected = count - 1 - _longest_increasing_subsequence_length(positions[:last])
+        elif positions:
+            # The last existing entry stays, but is moved once behind the entries created after it
+            last = positions.index(max(positions))
+            expected = count - _longest_increasing_subsequence_length(positions[:last])
+        else:
+            expected = count
+        assert moved == expected, (positions, new_positions)
@@ -157,9 +157,141 @@ def massage_expected_result_data(values, path, keep_all=False, remove_dynamic=Fa
     return values
 
 
+def _format_value(value):
+    # Similar to how RouterOS prints values
+    if value is True:
+        return 'true'
+    if value is False:
+        return 'false'
+    return str(value)
+
+
+def _parse_value(value):
+    # Similar to librouteros' parse_word()
+    if value in ('yes', 'true'):
+        return True
+    if value in ('no', 'false'):
+        return False
+    return value
+
+
+def _compose_reply_word(key, value):
+    # API attribute words like .tag have no leading =
+    return '{0}{1}={2}'.format('' if key == '.tag' else '=', key, _format_value(value))
+
+
+def _matches_query(entry, query):
+    # Evaluate the query words like RouterOS does: ?key=value pushes the result of the comparison,
+    # and ?# combines the topmost results with & and |. All results must be true.
+    stack = []
+    for word in query:
+        if word.startswith('?#'):
+            for operation in word[2:]:
+                right = stack.pop()
+                left = stack.pop()
+                if operation == '&':
+                    stack.append(left and right)
+                elif operation == '|':
+                    stack.append(left or right)
+                else:
+                    raise FakeLibRouterosError('Unsupported query operation "%s"' % operation)
+        else:
+            key, value = word[1:].split('=', 1)
+            stack.append(key in entry and _format_value(entry[key]) == value)
+    return all(stack)
+
+
+def _print(entries, cmd, words):
+    # Run a print command with .proplist and query words on the given entries
+    command = cmd.rsplit('/', 1)[1]
+    if command != 'print':
+        raise FakeLibRouterosError('Unsupported command "%s"' % command)
+    keys = None
+    query = []
+    count_only = False
+    for word in words:
+        if word == '=count-only=':
+            count_only = True
+        elif word.startswith('=.proplist='):
+            keys = word[len('=.proplist='):].split(',')
+        elif word.startswith('?'):
+            query.append(word)
+        else:
+            raise FakeLibRouterosError('Unsupported word "%s"' % word)
+    entries = [entry for entry in entries if _matches_query(entry, query)]
+    if count_only:
+        return iter([{'ret': len(entries)}])
+    if keys is not None:
+        entries = [dict((key, value) for key, value in entry.items() if key in keys) for entry in entries]
+    return iter(entries)
+
+
+class FakeListPath(list):
+    """A list of entries that can also be read with print commands, like a librouteros Path."""
+
+    @property
+    def api(self):
+        return _FakeConnection(self)
+
+    def join(self, *path):
+        return _JoinedPath('/' + '/'.join(('fake', ) + path))
+
+
+class _JoinedPath(object):
+    def __init__(self, path):
+        self.path = path
+
+
+class _FakeConnection(object):
+    """Processes the sentences sent by WritePipeline and stream_command() for a fake path."""
+
+    def __init__(self, path):
+        self._path = path
+        self._replies = []
+        self.protocol = self
+
+    def writeSentence(self, cmd, *words):
+        command = cmd.rsplit('/', 1)[1]
+        if command == 'print':
+            try:
+                for row in _print(self._path, cmd, words):
+                    self._replies.append(('!re', row))
+            except FakeLibRouterosError as e:
+                self._replies.append(('!trap', {'message': e.message}))
+            self._replies.append(('!done', {}))
+            return
+        kwargs = {}
+        tag = None
+        for word in words:
+            if word.startswith('.tag='):
+                tag = int(word[len('.tag='):])
+                continue
+            key, value = word[1:].split('=', 1)
+            kwargs[key] = _parse_value(value)
+        try:
+            if command == 'add':
+                self._replies.append(('!re', {'ret': self._path.add(**kwargs), '.tag': tag}))
+            elif command == 'set':
+                self._path.update(**kwargs)
+            else:
+                raise FakeLibRouterosError('Unsupported command "%s"' % command)
+        except FakeLibRouterosError as e:
+            self._replies.append(('!trap', {'message': e.message, '.tag': tag}))
+        self._replies.append(('!done', {'.tag': tag}))
+
+    def readSentence(self):
+        reply_word, row = self._replies.pop(0)
+        # Like librouteros' ApiProtocol.readSentence(), return the raw words; RouterOS does not send unset values
+        return reply_word, tuple(_compose_reply_word(key, value) for key, value in row.items() if value is not None)
+
+    def rawCmd(self, cmd, *words):
+        return _print(self._path, cmd, words)
+
+
 class Path(object):
     def __init__(self, path, initial_values, read_only=False):
         self._path = path
+        self.api = _FakeConnection(self)
         versioned_path_info = PATHS[path]
         versioned_path_info.provide_version(FAKE_ROS_VERSION)
         self._path_info = versioned_path_info.get_data()
@@ -180,6 +312,9 @@ class Path(object):
     def __iter__(self):
         return [self._sanitize(entry) for entry in self._values].__iter__()
 
+    def join(self, *path):
+        return _JoinedPath('/' + '/'.join(self._path + path))
+
     def _find_id(self, id, required=False):
         for index, entry in enumerate(self._values):
             if entry['.id'] == id:
@@ -197,6 +332,7 @@ class Path(object):
             raise Exception('Trying to create new entry with ".id" field: %s' % repr(kwargs))
         if 'dynamic' in kwargs or 'builtin' in kwargs:
             raise Exception('Trying to add a dynamic or builtin entry')
+        place_before = kwargs.pop('place-before', None)
         self._new_id_counter += 1
         id = '*NEW%d' % self._new_id_counter
         entry = {
@@ -212,7 +348,12 @@ class Path(object):
                 raise ValueError('Trying to set read-only field "{field}"'.format(field=field))
             entry[field] = value
         _normalize_entry(entry, self._path_info, on_create=True)
-        self._values.append(entry)
+        if place_before is not None:
+            if not self._path_info.supports_place_before:
+                raise Exception('Trying to create entry with "place-before" for a path that does not support it')
+            self._values.insert(self._find_id(place_before, required=True), entry)
+        else:
+            self._values.append(entry)
         return id
 
     def remove(self, *args):
@@ -260,10 +401,15 @@ class Path(object):
         if self._path_info.fixed_entries or self._path_info.single_value:
             raise Exception('Cannot move entries')
         yield None  # make sure that nothing happens if the result isn't consumed
-        source_index = self._find_id(kwargs.pop('numbers'), required=True)
-        entry = self._values.pop(source_index)
-        dest_index = self._find_id(kwargs.pop('destination'), required=True)
-        self._values.insert(dest_index, entry)
+        ids = kwargs.pop('numbers').split(',')
+        entries = [self._values[self._find_id(id, required=True)] for id in ids]
+        for id in ids:
+            del self._values[self._find_id(id, required=True)]
+        if 'destination' in kwargs:
+            dest_index = self._find_id(kwargs.pop('destination'), required=True)
+        else:
+            dest_index = len(self._values)
+        self._values[dest_index:dest_index] = entries
 
 
 def create_fake_path(path, initial_values, read_only=False):
@@ -97,8 +97,6 @@ START_IP_FIREWALL_FILTER_OLD_DATA = massage_expected_result_data(START_IP_FIREWA
 START_IP_SERVICE = [
     # I removed all entryes not for 'api' and 'api-ssl'
     {
-        "certificate": None,
-        "tls-version": None,
         ".id": "*7",
         "address": "",
         "disabled": True,
@@ -122,10 +120,6 @@ START_IP_SERVICE = [
         "vrf": "main"
     },
     {
-        "address": None,
-        "certificate": None,
-        "max-sessions": None,
-        "tls-version": None,
         ".id": "*13",
         "connection": True,
         "dynamic": True,
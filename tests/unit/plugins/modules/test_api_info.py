@@ -10,7 +10,7 @@ from ansible_collections.community.internal_test_tools.tests.unit.compat.mock im
 from ansible_collections.community.internal_test_tools.tests.unit.plugins.modules.utils import set_module_args, AnsibleExitJson, AnsibleFailJson, ModuleTestCase
 
 from ansible_collections.community.routeros.tests.unit.plugins.modules.fake_api import (
-    FAKE_ROS_VERSION, FakeLibRouterosError, Key, fake_ros_api,
+    FAKE_ROS_VERSION, FakeLibRouterosError, FakeListPath, Key, fake_ros_api,
 )
 from ansible_collections.community.routeros.plugins.modules import api_info
 
@@ -63,7 +63,7 @@ class TestRouterosApiInfoModule(ModuleTestCase):
 
     @patch('ansible_collections.community.routeros.plugins.modules.api_info.compose_api_path')
     def test_empty_result(self, mock_compose_api_path):
-        mock_compose_api_path.return_value = []
+        mock_compose_api_path.return_value = FakeListPath([])
         with self.assertRaises(AnsibleExitJson) as exc:
             args = self.config_module_args.copy()
             args.update({
@@ -78,7 +78,7 @@ class TestRouterosApiInfoModule(ModuleTestCase):
 
     @patch('ansible_collections.community.routeros.plugins.modules.api_info.compose_api_path')
     def test_regular_result(self, mock_compose_api_path):
-        mock_compose_api_path.return_value = [
+        mock_compose_api_path.return_value = FakeListPath([
             {
                 'called-format': 'mac:ssid',
                 'interim-update': 'enabled',
@@ -88,7 +88,7 @@ class TestRouterosApiInfoModule(ModuleTestCase):
                 'foo': 'bar',
                 '.id': '*1',
             },
-        ]
+        ])
         with self.assertRaises(AnsibleExitJson) as exc:
             args = self.config_module_args.copy()
             args.update({
@@ -106,7 +106,7 @@ class TestRouterosApiInfoModule(ModuleTestCase):
 
     @patch('ansible_collections.community.routeros.plugins.modules.api_info.compose_api_path')
     def test_result_with_defaults(self, mock_compose_api_path):
-        mock_compose_api_path.return_value = [
+        mock_compose_api_path.return_value = FakeListPath([
             {
                 'called-format': 'mac:ssid',
                 'interim-update': 'enabled',
@@ -116,7 +116,7 @@ class TestRouterosApiInfoModule(ModuleTestCase):
                 'foo': 'bar',
                 '.id': '*1',
             },
-        ]
+        ])
         with self.assertRaises(AnsibleExitJson) as exc:
             args = self.config_module_args.copy()
             args.update({
@@ -139,7 +139,7 @@ class TestRouterosApiInfoModule(ModuleTestCase):
 
     @patch('ansible_collections.community.routeros.plugins.modules.api_info.compose_api_path')
     def test_full_result(self, mock_compose_api_path):
-        mock_compose_api_path.return_value = [
+        mock_compose_api_path.return_value = FakeListPath([
             {
                 'called-format': 'mac:ssid',
                 'interim-update': 'enabled',
@@ -149,7 +149,7 @@ class TestRouterosApiInfoModule(ModuleTestCase):
                 'foo': 'bar',
                 '.id': '*1',
             },
-        ]
+        ])
         with self.assertRaises(AnsibleExitJson) as exc:
             args = self.config_module_args.copy()
             args.update({
@@ -169,7 +169,7 @@ class TestRouterosApiInfoModule(ModuleTestCase):
 
     @patch('ansible_collections.community.routeros.plugins.modules.api_info.compose_api_path')
     def test_disabled_exclamation(self, mock_compose_api_path):
-        mock_compose_api_path.return_value = [
+        mock_compose_api_path.return_value = FakeListPath([
             {
                 'chain': 'input',
                 'in-interface-list': 'LAN',
@@ -183,7 +183,7 @@ class TestRouterosApiInfoModule(ModuleTestCase):
                 '.id': '*2',
                 'dynamic': True,
             },
-        ]
+        ])
         with self.assertRaises(AnsibleExitJson) as exc:
             args = self.config_module_args.copy()
             args.update({
@@ -265,14 +265,14 @@ class TestRouterosApiInfoModule(ModuleTestCase):
 
     @patch('ansible_collections.community.routeros.plugins.modules.api_info.compose_api_path')
     def test_disabled_null_value(self, mock_compose_api_path):
-        mock_compose_api_path.return_value = [
+        mock_compose_api_path.return_value = FakeListPath([
             {
                 'chain': 'input',
                 'in-interface-list': 'LAN',
                 '.id': '*1',
                 'dynamic': False,
             },
-        ]
+        ])
         with self.assertRaises(AnsibleExitJson) as exc:
             args = self.config_module_args.copy()
             args.update({
@@ -354,14 +354,14 @@ class TestRouterosApiInfoModule(ModuleTestCase):
 
     @patch('ansible_collections.community.routeros.plugins.modules.api_info.compose_api_path')
     def test_disabled_omit(self, mock_compose_api_path):
-        mock_compose_api_path.return_value = [
+        mock_compose_api_path.return_value = FakeListPath([
             {
                 'chain': 'input',
                 'in-interface-list': 'LAN',
                 '.id': '*1',
                 'dynamic': False,
             },
-        ]
+        ])
         with self.assertRaises(AnsibleExitJson) as exc:
             args = self.config_module_args.copy()
             args.update({
@@ -381,7 +381,7 @@ class TestRouterosApiInfoModule(ModuleTestCase):
 
     @patch('ansible_collections.community.routeros.plugins.modules.api_info.compose_api_path')
     def test_dynamic(self, mock_compose_api_path):
-        mock_compose_api_path.return_value = [
+        mock_compose_api_path.return_value = FakeListPath([
             {
                 'chain': 'input',
                 'in-interface-list': 'LAN',
@@ -395,7 +395,7 @@ class TestRouterosApiInfoModule(ModuleTestCase):
                 '.id': '*2',
                 'dynamic': True,
             },
-        ]
+        ])
         with self.assertRaises(AnsibleExitJson) as exc:
             args = self.config_module_args.copy()
             args.update({
@@ -426,7 +426,7 @@ class TestRouterosApiInfoModule(ModuleTestCase):
 
     @patch('ansible_collections.community.routeros.plugins.modules.api_info.compose_api_path')
     def test_builtin_exclude(self, mock_compose_api_path):
-        mock_compose_api_path.return_value = [
+        mock_compose_api_path.return_value = FakeListPath([
             {
                 '.id': '*2000000',
                 'name': 'all',
@@ -454,7 +454,7 @@ class TestRouterosApiInfoModule(ModuleTestCase):
                 'builtin': False,
                 'comment': 'defconf',
             },
-        ]
+        ])
         with self.assertRaises(AnsibleExitJson) as exc:
             args = self.config_module_args.copy()
             args.update({
@@ -476,7 +476,7 @@ class TestRouterosApiInfoModule(ModuleTestCase):
 
     @patch('ansible_collections.community.routeros.plugins.modules.api_info.compose_api_path')
     def test_builtin_include(self, mock_compose_api_path):
-        mock_compose_api_path.return_value = [
+        mock_compose_api_path.return_value = FakeListPath([
             {
                 '.id': '*2000000',
                 'name': 'all',
@@ -504,7 +504,7 @@ class TestRouterosApiInfoModule(ModuleTestCase):
                 'builtin': False,
                 'comment': 'defconf',
             },
-        ]
+        ])
         with self.assertRaises(AnsibleExitJson) as exc:
             args = self.config_module_args.copy()
             args.update({
@@ -540,7 +540,7 @@ class TestRouterosApiInfoModule(ModuleTestCase):
 
     @patch('ansible_collections.community.routeros.plugins.modules.api_info.compose_api_path')
     def test_absent(self, mock_compose_api_path):
-        mock_compose_api_path.return_value = [
+        mock_compose_api_path.return_value = FakeListPath([
             {
                 '.id': '*1',
                 'address': '192.168.88.2',
@@ -591,7 +591,7 @@ class TestRouterosApiInfoModule(ModuleTestCase):
                 'blocked': False,
                 'disabled': False,
             },
-        ]
+        ])
         with self.assertRaises(AnsibleExitJson) as exc:
             args = self.config_module_args.copy()
             args.update({
@@ -629,7 +629,7 @@ class TestRouterosApiInfoModule(ModuleTestCase):
 
     @patch('ansible_collections.community.routeros.plugins.modules.api_info.compose_api_path')
     def test_default_disable_1(self, mock_compose_api_path):
-        mock_compose_api_path.return_value = [
+        mock_compose_api_path.return_value = FakeListPath([
             {
                 '.id': '*10',
                 'name': 'gre-tunnel3',
@@ -675,7 +675,7 @@ class TestRouterosApiInfoModule(ModuleTestCase):
                 'disabled': False,
                 'comment': 'foo',
             },
-        ]
+        ])
         with self.assertRaises(AnsibleExitJson) as exc:
             args = self.config_module_args.copy()
             args.update({
@@ -715,7 +715,7 @@ class TestRouterosApiInfoModule(ModuleTestCase):
 
     @patch('ansible_collections.community.routeros.plugins.modules.api_info.compose_api_path')
     def test_default_disable_2(self, mock_compose_api_path):
-        mock_compose_api_path.return_value = [
+        mock_compose_api_path.return_value = FakeListPath([
             {
                 '.id': '*10',
                 'name': 'gre-tunnel3',
@@ -761,7 +761,7 @@ class TestRouterosApiInfoModule(ModuleTestCase):
                 'disabled': False,
                 'comment': 'foo',
             },
-        ]
+        ])
         with self.assertRaises(AnsibleExitJson) as exc:
             args = self.config_module_args.copy()
             args.update({
@@ -818,7 +818,7 @@ class TestRouterosApiInfoModule(ModuleTestCase):
 
     @patch('ansible_collections.community.routeros.plugins.modules.api_info.compose_api_path')
     def test_restrict_1(self, mock_compose_api_path):
-        mock_compose_api_path.return_value = [
+        mock_compose_api_path.return_value = FakeListPath([
             {
                 'chain': 'input',
                 'in-interface-list': 'LAN',
@@ -832,7 +832,7 @@ class TestRouterosApiInfoModule(ModuleTestCase):
                 '.id': '*2',
                 'dynamic': False,
             },
-        ]
+        ])
         with self.assertRaises(AnsibleExitJson) as exc:
             args = self.config_module_args.copy()
             args.update({
@@ -861,7 +861,7 @@ class TestRouterosApiInfoModule(ModuleTestCase):
 
     @patch('ansible_collections.community.routeros.plugins.modules.api_info.compose_api_path')
     def test_restrict_2(self, mock_compose_api_path):
-        mock_compose_api_path.return_value = [
+        mock_compose_api_path.return_value = FakeListPath([
             {
                 'chain': 'input',
                 'in-interface-list': 'LAN',
@@ -881,7 +881,57 @@ class TestRouterosApiInfoModule(ModuleTestCase):
                 'dynamic': False,
                 '.id': '*3',
             },
-        ]
+        ])
+        with self.assertRaises(AnsibleExitJson) as exc:
+            args = self.config_module_args.copy()
+            args.update({
+                'path': 'ip firewall filter',
+                'handle_disabled': 'omit',
+                'restrict': [{
+                    'field': 'chain',
+                    'values': ['forward'],
+                }],
+            })
+            with set_module_args(args):
+                self.module.main()
+
+        result = exc.exception.args[0]
+        self.assertEqual(result['changed'], False)
+        self.assertEqual(result['result'], [
+            {
+                'chain': 'forward',
+                'action': 'drop',
+                'in-interface': 'sfp1',
+                '.id': '*2',
+            },
+        ])
+
+    @patch('ansible_collections.community.routeros.tests.unit.plugins.modules.fake_api._matches_query', new=lambda entry, query: True)
+    @patch('ansible_collections.community.routeros.plugins.modules.api_info.compose_api_path')
+    def test_restrict_2_router_returns_more(self, mock_compose_api_path):
+        # The router ignores the query, for example since it compares values in another way;
+        # the entries must still be filtered locally
+        mock_compose_api_path.return_value = FakeListPath([
+            {
+                'chain': 'input',
+                'in-interface-list': 'LAN',
+                'dynamic': False,
+                '.id': '*1',
+            },
+            {
+                'chain': 'forward',
+                'action': 'drop',
+                'in-interface': 'sfp1',
+                '.id': '*2',
+                'dynamic': False,
+            },
+            {
+                'chain': 'Forward',
+                'action': 'drop',
+                'dynamic': False,
+                '.id': '*3',
+            },
+        ])
         with self.assertRaises(AnsibleExitJson) as exc:
             args = self.config_module_args.copy()
             args.update({
@@ -908,7 +958,7 @@ class TestRouterosApiInfoModule(ModuleTestCase):
 
     @patch('ansible_collections.community.routeros.plugins.modules.api_info.compose_api_path')
     def test_restrict_3(self, mock_compose_api_path):
-        mock_compose_api_path.return_value = [
+        mock_compose_api_path.return_value = FakeListPath([
             {
                 'chain': 'input',
                 'in-interface-list': 'LAN',
@@ -942,7 +992,7 @@ class TestRouterosApiInfoModule(ModuleTestCase):
                 'dynamic': False,
                 '.id': '*5',
             },
-        ]
+        ])
         with self.assertRaises(AnsibleExitJson) as exc:
             args = self.config_module_args.copy()
             args.update({
@@ -6,12 +6,15 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import pytest
+
 from ansible_collections.community.internal_test_tools.tests.unit.compat.mock import patch, MagicMock
 from ansible_collections.community.internal_test_tools.tests.unit.plugins.modules.utils import set_module_args, AnsibleExitJson, AnsibleFailJson, ModuleTestCase
 
 from ansible_collections.community.routeros.tests.unit.plugins.modules.fake_api import (
     FAKE_ROS_VERSION, FakeLibRouterosError, fake_ros_api, massage_expected_result_data, create_fake_path,
 )
+from ansible_collections.community.routeros.plugins.module_utils._api_data_base import KeyInfo, VersionedAPIData
 from ansible_collections.community.routeros.plugins.modules import api_modify
 
 
@@ -48,7 +51,7 @@ START_IP_DNS_STATIC = [
         'comment': '',
         'name': 'foobar',
         'type': 'SRV',
-        'srv-port': '123',
+        'srv-port': 123,
         'srv-priority': 5,
         'srv-target': '192.168.88.23',
         'srv-weight': 15,
@@ -58,6 +61,24 @@ START_IP_DNS_STATIC = [
 
 START_IP_DNS_STATIC_OLD_DATA = massage_expected_result_data(START_IP_DNS_STATIC, ('ip', 'dns', 'static'), remove_dynamic=True)
 
+START_IP_DNS_STATIC_REMATCH = [
+    {
+        '.id': '*1',
+        'name': 'a',
+        'address': '10.0.0.1',
+        'dynamic': False,
+    },
+    {
+        '.id': '*2',
+        'name': 'b',
+        'address': '10.0.0.2',
+        'cname': 'x',
+        'dynamic': False,
+    },
+]
+
+START_IP_DNS_STATIC_REMATCH_OLD_DATA = massage_expected_result_data(START_IP_DNS_STATIC_REMATCH, ('ip', 'dns', 'static'), remove_dynamic=True)
+
 START_IP_SETTINGS = [
     {
         'accept-redirects': True,
@@ -301,6 +322,57 @@ START_INTERFACE_GRE = [
 
 START_INTERFACE_GRE_OLD_DATA = massage_expected_result_data(START_INTERFACE_GRE, ('interface', 'gre'))
 
+START_IP_FIREWALL_FILTER = [
+    {
+        '.id': '*1',
+        'chain': 'input',
+        'action': 'accept',
+        'connection-state': 'established,related',
+        'disabled': False,
+    },
+    {
+        '.id': '*2',
+        'chain': 'input',
+        'action': 'drop',
+        'connection-state': 'invalid',
+        'disabled': False,
+    },
+    {
+        '.id': '*3',
+        'chain': 'input',
+        'action': 'accept',
+        'protocol': 'icmp',
+        'disabled': False,
+    },
+    {
+        '.id': '*4',
+        'chain': 'input',
+        'action': 'drop',
+        'disabled': False,
+    },
+]
+
+START_IP_FIREWALL_FILTER_OLD_DATA = massage_expected_result_data(START_IP_FIREWALL_FILTER, ('ip', 'firewall', 'filter'))
+
+START_IP_FIREWALL_FILTER_FORWARD = [
+    {
+        '.id': '*5',
+        'chain': 'forward',
+        'action': 'accept',
+        'connection-state': 'established,related',
+        'disabled': False,
+    },
+    {
+        '.id': '*6',
+        'chain': 'forward',
+        'action': 'drop',
+        'connection-state': 'invalid',
+        'disabled': False,
+    },
+]
+
+START_IP_FIREWALL_FILTER_FORWARD_OLD_DATA = massage_expected_result_data(START_IP_FIREWALL_FILTER_FORWARD, ('ip', 'firewall', 'filter'))
+
 
 class TestRouterosApiModifyModule(ModuleTestCase):
 
@@ -367,6 +439,37 @@ class TestRouterosApiModifyModule(ModuleTestCase):
         self.assertEqual(result['failed'], True)
         self.assertEqual(result['msg'], 'Unknown key "foo" at index 1.')
 
+    def test_invalid_pipeline_window(self):
+        with self.assertRaises(AnsibleFailJson) as exc:
+            args = self.config_module_args.copy()
+            args.update({
+                'path': 'ip dns static',
+                'data': [],
+                'pipeline_window': 0,
+            })
+            with set_module_args(args):
+                self.module.main()
+
+        result = exc.exception.args[0]
+        self.assertEqual(result['failed'], True)
+        self.assertEqual(result['msg'], 'pipeline_window must be at least 1')
+
+    def test_invalid_read_fields(self):
+        with self.assertRaises(AnsibleFailJson) as exc:
+            args = self.config_module_args.copy()
+            args.update({
+                'path': 'ip dns static',
+                'data': [],
+                'handle_entries_content': 'remove',
+                'read_fields': 'data',
+            })
+            with set_module_args(args):
+                self.module.main()
+
+        result = exc.exception.args[0]
+        self.assertEqual(result['failed'], True)
+        self.assertEqual(result['msg'], 'read_fields=data requires handle_entries_content=ignore')
+
     def test_invalid_disabled_and_enabled_option(self):
         with self.assertRaises(AnsibleFailJson) as exc:
             args = self.config_module_args.copy()
@@ -568,6 +671,53 @@ class TestRouterosApiModifyModule(ModuleTestCase):
         self.assertEqual(result['old_data'], START_IP_DNS_STATIC_OLD_DATA)
         self.assertEqual(result['new_data'], START_IP_DNS_STATIC_OLD_DATA)
 
+    @patch('ansible_collections.community.routeros.plugins.modules.api_modify.compose_api_path',
+           new=create_fake_path(('ip', 'dns', 'static'), START_IP_DNS_STATIC, read_only=True))
+    def test_sync_list_idempotent_canonical(self):
+        with self.assertRaises(AnsibleExitJson) as exc:
+            args = self.config_module_args.copy()
+            args.update({
+                'path': 'ip dns static',
+                'data': [
+                    {
+                        'comment': 'defconf',
+                        'name': 'router',
+                        'address': '192.168.88.1',
+                        'ttl': '24h',
+                    },
+                    {
+                        'name': 'foo',
+                        'comment': '',
+                        'address': '192.168.88.2',
+                        'disabled': 'false',
+                    },
+                    {
+                        'name': 'router',
+                        '!comment': None,
+                        'text': 'Router Text Entry',
+                        'ttl': '1d00:00:00',
+                    },
+                    {
+                        'name': 'foobar',
+                        'type': 'SRV',
+                        'srv-port': 123,
+                        'srv-priority': '5',
+                        'srv-target': '192.168.88.23',
+                        'srv-weight': '15',
+                        'ttl': 86400,
+                    },
+                ],
+                'handle_absent_entries': 'remove',
+                'handle_entries_content': 'remove',
+            })
+            with set_module_args(args):
+                self.module.main()
+
+        result = exc.exception.args[0]
+        self.assertEqual(result['changed'], False)
+        self.assertEqual(result['old_data'], START_IP_DNS_STATIC_OLD_DATA)
+        self.assertEqual(result['new_data'], START_IP_DNS_STATIC_OLD_DATA)
+
     @patch('ansible_collections.community.routeros.plugins.modules.api_modify.compose_api_path',
            new=create_fake_path(('ip', 'dns', 'static'), START_IP_DNS_STATIC, read_only=True))
     def test_sync_list_idempotent_3(self):
@@ -654,7 +804,7 @@ class TestRouterosApiModifyModule(ModuleTestCase):
                 '.id': '*9',
                 'name': 'foobar',
                 'type': 'SRV',
-                'srv-port': '123',
+                'srv-port': 123,
                 'srv-priority': 5,
                 'srv-target': '192.168.88.23',
                 'srv-weight': 15,
@@ -731,7 +881,7 @@ class TestRouterosApiModifyModule(ModuleTestCase):
                 '.id': '*9',
                 'name': 'foobar',
                 'type': 'SRV',
-                'srv-port': '123',
+                'srv-port': 123,
                 'srv-priority': 5,
                 'srv-target': '192.168.88.23',
                 'srv-weight': 15,
@@ -809,7 +959,7 @@ class TestRouterosApiModifyModule(ModuleTestCase):
                 '.id': '*9',
                 'name': 'foobar',
                 'type': 'SRV',
-                'srv-port': '123',
+                'srv-port': 123,
                 'srv-priority': 5,
                 'srv-target': '192.168.88.23',
                 'srv-weight': 15,
@@ -882,8 +1032,57 @@ class TestRouterosApiModifyModule(ModuleTestCase):
         ])
 
     @patch('ansible_collections.community.routeros.plugins.modules.api_modify.compose_api_path',
-           new=create_fake_path(('ip', 'dns', 'static'), START_IP_DNS_STATIC, read_only=True))
-    def test_sync_list_modify_2_check(self):
+           new=create_fake_path(('ip', 'dns', 'static'), START_IP_DNS_STATIC_REMATCH))
+    def test_sync_list_modify_rematch(self):
+        # Pairing the second entry with *1 needs fewer changes, but then the first entry cannot be
+        # paired at all, since the CNAME of *2 cannot be removed. This would need three writes.
+        with self.assertRaises(AnsibleExitJson) as exc:
+            args = self.config_module_args.copy()
+            args.update({
+                'path': 'ip dns static',
+                'data': [
+                    {
+                        'name': 'c',
+                        'address': '10.0.0.3',
+                    },
+                    {
+                        'name': 'a',
+                        'address': '10.0.0.1',
+                        'cname': 'y',
+                    },
+                ],
+                'handle_absent_entries': 'remove',
+                'handle_entries_content': 'remove',
+            })
+            with set_module_args(args):
+                self.module.main()
+
+        result = exc.exception.args[0]
+        self.assertEqual(result['changed'], True)
+        self.assertEqual(result['old_data'], START_IP_DNS_STATIC_REMATCH_OLD_DATA)
+        self.assertEqual(result['new_data'], [
+            {
+                '.id': '*1',
+                'name': 'c',
+                'address': '10.0.0.3',
+                'ttl': '1d',
+                'disabled': False,
+                'match-subdomain': False,
+            },
+            {
+                '.id': '*2',
+                'name': 'a',
+                'address': '10.0.0.1',
+                'cname': 'y',
+                'ttl': '1d',
+                'disabled': False,
+                'match-subdomain': False,
+            },
+        ])
+
+    @patch('ansible_collections.community.routeros.plugins.modules.api_modify.compose_api_path',
+           new=create_fake_path(('ip', 'dns', 'static'), START_IP_DNS_STATIC))
+    def test_sync_list_modify_2_pipelined(self):
         with self.assertRaises(AnsibleExitJson) as exc:
             args = self.config_module_args.copy()
             args.update({
@@ -905,7 +1104,7 @@ class TestRouterosApiModifyModule(ModuleTestCase):
                 ],
                 'handle_absent_entries': 'remove',
                 'handle_entries_content': 'remove',
-                '_ansible_check_mode': True,
+                'pipeline_window': 2,
             })
             with set_module_args(args):
                 self.module.main()
@@ -942,29 +1141,22 @@ class TestRouterosApiModifyModule(ModuleTestCase):
 
     @patch('ansible_collections.community.routeros.plugins.modules.api_modify.compose_api_path',
            new=create_fake_path(('ip', 'dns', 'static'), START_IP_DNS_STATIC))
-    def test_sync_list_modify_3(self):
+    def test_sync_list_reread_changed(self):
         with self.assertRaises(AnsibleExitJson) as exc:
             args = self.config_module_args.copy()
             args.update({
                 'path': 'ip dns static',
                 'data': [
-                    {
-                        '!comment': None,
-                        'name': 'router',
-                        'address': '192.168.88.1',
-                    },
                     {
                         'name': 'router',
-                        'cname': 'router.com.',
+                        'text': 'Router Text Entry 2',
                     },
                     {
-                        'name': 'foo',
-                        'address': '192.168.88.2',
-                        'ttl': '1d',
+                        'name': 'baz',
+                        'address': '192.168.88.3',
                     },
                 ],
-                'handle_absent_entries': 'remove',
-                'handle_entries_content': 'remove',
+                'reread_after_changes': 'changed',
             })
             with set_module_args(args):
                 self.module.main()
@@ -975,51 +1167,79 @@ class TestRouterosApiModifyModule(ModuleTestCase):
         self.assertEqual(result['new_data'], [
             {
                 '.id': '*1',
+                'comment': 'defconf',
                 'name': 'router',
                 'address': '192.168.88.1',
+                'disabled': False,
                 'ttl': '1d',
+                'match-subdomain': False,
+            },
+            {
+                '.id': '*A',
+                'name': 'router',
+                'text': 'Router Text Entry',
                 'disabled': False,
+                'ttl': '1d',
                 'match-subdomain': False,
             },
             {
                 '.id': '*7',
                 'name': 'foo',
                 'address': '192.168.88.2',
+                'disabled': False,
                 'ttl': '1d',
+                'match-subdomain': False,
+            },
+            {
+                '.id': '*9',
+                'name': 'foobar',
+                'type': 'SRV',
+                'srv-port': 123,
+                'srv-priority': 5,
+                'srv-target': '192.168.88.23',
+                'srv-weight': 15,
                 'disabled': False,
+                'ttl': '1d',
                 'match-subdomain': False,
             },
             {
                 '.id': '*NEW1',
                 'name': 'router',
-                'cname': 'router.com.',
+                'text': 'Router Text Entry 2',
+                'disabled': False,
                 'ttl': '1d',
+                'match-subdomain': False,
+            },
+            {
+                '.id': '*NEW2',
+                'name': 'baz',
+                'address': '192.168.88.3',
                 'disabled': False,
+                'ttl': '1d',
                 'match-subdomain': False,
             },
         ])
 
     @patch('ansible_collections.community.routeros.plugins.modules.api_modify.compose_api_path',
            new=create_fake_path(('ip', 'dns', 'static'), START_IP_DNS_STATIC, read_only=True))
-    def test_sync_list_modify_3_check(self):
+    def test_sync_list_modify_2_check(self):
         with self.assertRaises(AnsibleExitJson) as exc:
             args = self.config_module_args.copy()
             args.update({
                 'path': 'ip dns static',
                 'data': [
                     {
-                        '!comment': None,
+                        'comment': '',
                         'name': 'router',
                         'address': '192.168.88.1',
                     },
                     {
                         'name': 'router',
-                        'cname': 'router.com.',
+                        'text': 'Router Text Entry 2',
                     },
                     {
                         'name': 'foo',
                         'address': '192.168.88.2',
-                        'ttl': '1d',
                     },
                 ],
                 'handle_absent_entries': 'remove',
@@ -1041,6 +1261,14 @@ class TestRouterosApiModifyModule(ModuleTestCase):
                 'disabled': False,
                 'match-subdomain': False,
             },
+            {
+                '.id': '*A',
+                'name': 'router',
+                'text': 'Router Text Entry 2',
+                'ttl': '1d',
+                'disabled': False,
+                'match-subdomain': False,
+            },
             {
                 '.id': '*7',
                 'name': 'foo',
@@ -1049,32 +1277,29 @@ class TestRouterosApiModifyModule(ModuleTestCase):
                 'disabled': False,
                 'match-subdomain': False,
             },
-            {
-                'name': 'router',
-                'cname': 'router.com.',
-            },
         ])
 
     @patch('ansible_collections.community.routeros.plugins.modules.api_modify.compose_api_path',
            new=create_fake_path(('ip', 'dns', 'static'), START_IP_DNS_STATIC))
-    def test_sync_list_modify_4(self):
+    def test_sync_list_modify_3(self):
         with self.assertRaises(AnsibleExitJson) as exc:
             args = self.config_module_args.copy()
             args.update({
                 'path': 'ip dns static',
                 'data': [
                     {
+                        '!comment': None,
                         'name': 'router',
                         'address': '192.168.88.1',
                     },
                     {
                         'name': 'router',
-                        'comment': 'defconf',
-                        'text': 'Router Text Entry 2',
+                        'cname': 'router.com.',
                     },
                     {
                         'name': 'foo',
                         'address': '192.168.88.2',
+                        'ttl': '1d',
                     },
                 ],
                 'handle_absent_entries': 'remove',
@@ -1096,18 +1321,17 @@ class TestRouterosApiModifyModule(ModuleTestCase):
                 'match-subdomain': False,
             },
             {
-                '.id': '*A',
-                'comment': 'defconf',
-                'name': 'router',
-                'text': 'Router Text Entry 2',
+                '.id': '*7',
+                'name': 'foo',
+                'address': '192.168.88.2',
                 'ttl': '1d',
                 'disabled': False,
                 'match-subdomain': False,
             },
             {
-                '.id': '*7',
-                'name': 'foo',
-                'address': '192.168.88.2',
+                '.id': '*NEW1',
+                'name': 'router',
+                'cname': 'router.com.',
                 'ttl': '1d',
                 'disabled': False,
                 'match-subdomain': False,
@@ -1116,24 +1340,25 @@ class TestRouterosApiModifyModule(ModuleTestCase):
 
     @patch('ansible_collections.community.routeros.plugins.modules.api_modify.compose_api_path',
            new=create_fake_path(('ip', 'dns', 'static'), START_IP_DNS_STATIC, read_only=True))
-    def test_sync_list_modify_4_check(self):
+    def test_sync_list_modify_3_check(self):
         with self.assertRaises(AnsibleExitJson) as exc:
             args = self.config_module_args.copy()
             args.update({
                 'path': 'ip dns static',
                 'data': [
                     {
+                        '!comment': None,
                         'name': 'router',
                         'address': '192.168.88.1',
                     },
                     {
                         'name': 'router',
-                        'comment': 'defconf',
-                        'text': 'Router Text Entry 2',
+                        'cname': 'router.com.',
                     },
                     {
                         'name': 'foo',
                         'address': '192.168.88.2',
+                        'ttl': '1d',
                     },
                 ],
                 'handle_absent_entries': 'remove',
@@ -1155,15 +1380,6 @@ class TestRouterosApiModifyModule(ModuleTestCase):
                 'disabled': False,
                 'match-subdomain': False,
             },
-            {
-                '.id': '*A',
-                'comment': 'defconf',
-                'name': 'router',
-                'text': 'Router Text Entry 2',
-                'ttl': '1d',
-                'disabled': False,
-                'match-subdomain': False,
-            },
             {
                 '.id': '*7',
                 'name': 'foo',
@@ -1172,18 +1388,141 @@ class TestRouterosApiModifyModule(ModuleTestCase):
                 'disabled': False,
                 'match-subdomain': False,
             },
+            {
+                'name': 'router',
+                'cname': 'router.com.',
+            },
         ])
 
     @patch('ansible_collections.community.routeros.plugins.modules.api_modify.compose_api_path',
            new=create_fake_path(('ip', 'dns', 'static'), START_IP_DNS_STATIC))
-    def test_sync_list_delete(self):
+    def test_sync_list_modify_4(self):
         with self.assertRaises(AnsibleExitJson) as exc:
             args = self.config_module_args.copy()
             args.update({
                 'path': 'ip dns static',
                 'data': [
                     {
-                        'comment': 'defconf',
+                        'name': 'router',
+                        'address': '192.168.88.1',
+                    },
+                    {
+                        'name': 'router',
+                        'comment': 'defconf',
+                        'text': 'Router Text Entry 2',
+                    },
+                    {
+                        'name': 'foo',
+                        'address': '192.168.88.2',
+                    },
+                ],
+                'handle_absent_entries': 'remove',
+                'handle_entries_content': 'remove',
+            })
+            with set_module_args(args):
+                self.module.main()
+
+        result = exc.exception.args[0]
+        self.assertEqual(result['changed'], True)
+        self.assertEqual(result['old_data'], START_IP_DNS_STATIC_OLD_DATA)
+        self.assertEqual(result['new_data'], [
+            {
+                '.id': '*1',
+                'name': 'router',
+                'address': '192.168.88.1',
+                'ttl': '1d',
+                'disabled': False,
+                'match-subdomain': False,
+            },
+            {
+                '.id': '*A',
+                'comment': 'defconf',
+                'name': 'router',
+                'text': 'Router Text Entry 2',
+                'ttl': '1d',
+                'disabled': False,
+                'match-subdomain': False,
+            },
+            {
+                '.id': '*7',
+                'name': 'foo',
+                'address': '192.168.88.2',
+                'ttl': '1d',
+                'disabled': False,
+                'match-subdomain': False,
+            },
+        ])
+
+    @patch('ansible_collections.community.routeros.plugins.modules.api_modify.compose_api_path',
+           new=create_fake_path(('ip', 'dns', 'static'), START_IP_DNS_STATIC, read_only=True))
+    def test_sync_list_modify_4_check(self):
+        with self.assertRaises(AnsibleExitJson) as exc:
+            args = self.config_module_args.copy()
+            args.update({
+                'path': 'ip dns static',
+                'data': [
+                    {
+                        'name': 'router',
+                        'address': '192.168.88.1',
+                    },
+                    {
+                        'name': 'router',
+                        'comment': 'defconf',
+                        'text': 'Router Text Entry 2',
+                    },
+                    {
+                        'name': 'foo',
+                        'address': '192.168.88.2',
+                    },
+                ],
+                'handle_absent_entries': 'remove',
+                'handle_entries_content': 'remove',
+                '_ansible_check_mode': True,
+            })
+            with set_module_args(args):
+                self.module.main()
+
+        result = exc.exception.args[0]
+        self.assertEqual(result['changed'], True)
+        self.assertEqual(result['old_data'], START_IP_DNS_STATIC_OLD_DATA)
+        self.assertEqual(result['new_data'], [
+            {
+                '.id': '*1',
+                'name': 'router',
+                'address': '192.168.88.1',
+                'ttl': '1d',
+                'disabled': False,
+                'match-subdomain': False,
+            },
+            {
+                '.id': '*A',
+                'comment': 'defconf',
+                'name': 'router',
+                'text': 'Router Text Entry 2',
+                'ttl': '1d',
+                'disabled': False,
+                'match-subdomain': False,
+            },
+            {
+                '.id': '*7',
+                'name': 'foo',
+                'address': '192.168.88.2',
+                'ttl': '1d',
+                'disabled': False,
+                'match-subdomain': False,
+            },
+        ])
+
+    @patch('ansible_collections.community.routeros.plugins.modules.api_modify.compose_api_path',
+           new=create_fake_path(('ip', 'dns', 'static'), START_IP_DNS_STATIC))
+    def test_sync_list_delete(self):
+        with self.assertRaises(AnsibleExitJson) as exc:
+            args = self.config_module_args.copy()
+            args.update({
+                'path': 'ip dns static',
+                'data': [
+                    {
+                        'comment': 'defconf',
                         'name': 'router',
                         'address': '192.168.88.1',
                     },
@@ -1735,6 +2074,310 @@ class TestRouterosApiModifyModule(ModuleTestCase):
             },
         ])
 
+    @patch('ansible_collections.community.routeros.plugins.modules.api_modify.compose_api_path',
+           new=create_fake_path(('ip', 'address'), START_IP_ADDRESS))
+    def test_sync_primary_key_cru_pipelined(self):
+        with self.assertRaises(AnsibleExitJson) as exc:
+            args = self.config_module_args.copy()
+            args.update({
+                'path': 'ip address',
+                'data': [
+                    {
+                        'address': '10.10.0.0/16',
+                        'interface': 'WIFI',
+                    },
+                    {
+                        'address': '192.168.1.0/24',
+                        'interface': 'LAN',
+                        'disabled': True,
+                    },
+                    {
+                        'address': '192.168.88.0/24',
+                        'interface': 'bridge',
+                        'comment': 'foo',
+                    },
+                ],
+                'handle_absent_entries': 'remove',
+                'handle_entries_content': 'remove',
+                'pipeline_window': 3,
+            })
+            with set_module_args(args):
+                self.module.main()
+
+        result = exc.exception.args[0]
+        self.assertEqual(result['changed'], True)
+        self.assertEqual(result['old_data'], START_IP_ADDRESS_OLD_DATA)
+        self.assertEqual(result['new_data'], [
+            {
+                '.id': '*1',
+                'comment': 'foo',
+                'address': '192.168.88.0/24',
+                'interface': 'bridge',
+                'disabled': False,
+            },
+            {
+                '.id': '*3',
+                'address': '192.168.1.0/24',
+                'interface': 'LAN',
+                'disabled': True,
+            },
+            {
+                '.id': '*NEW1',
+                'address': '10.10.0.0/16',
+                'interface': 'WIFI',
+                'disabled': False,
+            },
+        ])
+
+    @patch('ansible_collections.community.routeros.plugins.modules.api_modify.compose_api_path',
+           new=create_fake_path(('ip', 'address'), START_IP_ADDRESS))
+    def test_sync_primary_key_reread_changed(self):
+        with self.assertRaises(AnsibleExitJson) as exc:
+            args = self.config_module_args.copy()
+            args.update({
+                'path': 'ip address',
+                'data': [
+                    {
+                        'address': '192.168.1.0/24',
+                        'interface': 'LAN',
+                        'disabled': True,
+                    },
+                    {
+                        'address': '10.10.0.0/16',
+                        'interface': 'WIFI',
+                    },
+                ],
+                'reread_after_changes': 'changed',
+            })
+            with set_module_args(args):
+                self.module.main()
+
+        result = exc.exception.args[0]
+        self.assertEqual(result['changed'], True)
+        self.assertEqual(result['old_data'], START_IP_ADDRESS_OLD_DATA)
+        self.assertEqual(result['new_data'], [
+            {
+                '.id': '*1',
+                'address': '192.168.88.0/24',
+                'interface': 'bridge',
+                'disabled': False,
+            },
+            {
+                '.id': '*3',
+                'address': '192.168.1.0/24',
+                'interface': 'LAN',
+                'disabled': True,
+            },
+            {
+                '.id': '*F',
+                'address': '10.0.0.0/16',
+                'interface': 'WAN',
+                'disabled': True,
+            },
+            {
+                '.id': '*NEW1',
+                'address': '10.10.0.0/16',
+                'interface': 'WIFI',
+                'disabled': False,
+            },
+        ])
+
+    @patch('ansible_collections.community.routeros.plugins.modules.api_modify.compose_api_path',
+           new=create_fake_path(('ip', 'address'), START_IP_ADDRESS))
+    def test_sync_primary_key_read_fields_data(self):
+        with self.assertRaises(AnsibleExitJson) as exc:
+            args = self.config_module_args.copy()
+            args.update({
+                'path': 'ip address',
+                'data': [
+                    {
+                        'address': '192.168.1.0/24',
+                        'interface': 'LAN',
+                        'comment': 'foo',
+                    },
+                    {
+                        'address': '10.10.0.0/16',
+                        'interface': 'WIFI',
+                    },
+                ],
+                'read_fields': 'data',
+            })
+            with set_module_args(args):
+                self.module.main()
+
+        result = exc.exception.args[0]
+        self.assertEqual(result['changed'], True)
+        self.assertEqual(result['old_data'], [
+            {
+                '.id': '*1',
+                'address': '192.168.88.0/24',
+                'interface': 'bridge',
+            },
+            {
+                '.id': '*3',
+                'address': '192.168.1.0/24',
+                'interface': 'LAN',
+            },
+            {
+                '.id': '*F',
+                'address': '10.0.0.0/16',
+                'interface': 'WAN',
+            },
+        ])
+        self.assertEqual(result['new_data'], [
+            {
+                '.id': '*1',
+                'address': '192.168.88.0/24',
+                'interface': 'bridge',
+            },
+            {
+                '.id': '*3',
+                'address': '192.168.1.0/24',
+                'interface': 'LAN',
+                'comment': 'foo',
+            },
+            {
+                '.id': '*F',
+                'address': '10.0.0.0/16',
+                'interface': 'WAN',
+            },
+            {
+                '.id': '*NEW1',
+                'address': '10.10.0.0/16',
+                'interface': 'WIFI',
+            },
+        ])
+
+    @patch('ansible_collections.community.routeros.plugins.modules.api_modify.compose_api_path',
+           new=create_fake_path(('ip', 'address'), START_IP_ADDRESS))
+    def test_sync_primary_key_read_entries_data(self):
+        with self.assertRaises(AnsibleExitJson) as exc:
+            args = self.config_module_args.copy()
+            args.update({
+                'path': 'ip address',
+                'data': [
+                    {
+                        'address': '192.168.1.0/24',
+                        'interface': 'LAN',
+                        'comment': 'foo',
+                    },
+                    {
+                        'address': '10.10.0.0/16',
+                        'interface': 'WIFI',
+                    },
+                ],
+                'read_entries': 'data',
+            })
+            with set_module_args(args):
+                self.module.main()
+
+        result = exc.exception.args[0]
+        self.assertEqual(result['changed'], True)
+        self.assertEqual(result['old_data'], START_IP_ADDRESS_OLD_DATA[1:2])
+        self.assertEqual(result['new_data'], [
+            {
+                '.id': '*3',
+                'address': '192.168.1.0/24',
+                'interface': 'LAN',
+                'comment': 'foo',
+                'disabled': False,
+            },
+            {
+                '.id': '*NEW1',
+                'address': '10.10.0.0/16',
+                'interface': 'WIFI',
+                'disabled': False,
+            },
+        ])
+
+    @patch('ansible_collections.community.routeros.plugins.modules.api_modify.MAX_QUERY_SELECTORS', new=1)
+    @patch('ansible_collections.community.routeros.plugins.modules.api_modify.compose_api_path',
+           new=create_fake_path(('ip', 'address'), START_IP_ADDRESS + [
+               {
+                   '.id': '*10',
+                   'address': '10.0.1.0/24',
+                   'interface': 'LAN',
+                   'disabled': False,
+               },
+           ]))
+    def test_sync_primary_key_read_entries_data_chunked(self):
+        with self.assertRaises(AnsibleExitJson) as exc:
+            args = self.config_module_args.copy()
+            args.update({
+                'path': 'ip address',
+                'data': [
+                    {
+                        'address': '10.0.1.0/24',
+                        'interface': 'LAN',
+                    },
+                    {
+                        'address': '192.168.88.0/24',
+                        'interface': 'bridge',
+                    },
+                ],
+                'read_entries': 'data',
+            })
+            with set_module_args(args):
+                self.module.main()
+
+        result = exc.exception.args[0]
+        self.assertEqual(result['changed'], False)
+        # Every key is queried on its own
+        self.assertEqual(sorted(entry['.id'] for entry in result['old_data']), ['*1', '*10'])
+
+    @patch('ansible_collections.community.routeros.plugins.modules.api_modify.MAX_QUERY_SELECTORS', new=1)
+    @patch('ansible_collections.community.routeros.plugins.modules.api_modify.compose_api_path',
+           new=create_fake_path(('ip', 'address'), START_IP_ADDRESS))
+    def test_sync_primary_key_read_entries_data_fallback(self):
+        with self.assertRaises(AnsibleExitJson) as exc:
+            args = self.config_module_args.copy()
+            args.update({
+                'path': 'ip address',
+                'data': [
+                    {
+                        'address': '192.168.1.0/24',
+                        'interface': 'LAN',
+                    },
+                    {
+                        'address': '192.168.88.0/24',
+                        'interface': 'bridge',
+                    },
+                ],
+                'read_entries': 'data',
+            })
+            with set_module_args(args):
+                self.module.main()
+
+        result = exc.exception.args[0]
+        self.assertEqual(result['changed'], False)
+        # The keys make up more than half of the entries, so all entries are read
+        self.assertEqual(result['old_data'], START_IP_ADDRESS_OLD_DATA)
+
+    @patch('ansible_collections.community.routeros.plugins.modules.api_modify.compose_api_path',
+           new=create_fake_path(('ip', 'dhcp-server', 'lease'), START_IP_DHCP_SERVER_LEASE, read_only=True))
+    def test_sync_primary_key_read_entries_data_absent_value(self):
+        with self.assertRaises(AnsibleExitJson) as exc:
+            args = self.config_module_args.copy()
+            args.update({
+                'path': 'ip dhcp-server lease',
+                'data': [
+                    {
+                        'address': '0.0.0.1',
+                        'mac-address': '00:00:00:00:00:01',
+                        'server': 'all',
+                    },
+                ],
+                'read_entries': 'data',
+            })
+            with set_module_args(args):
+                self.module.main()
+
+        result = exc.exception.args[0]
+        # The router does not return the absent value of 'server', so the entries cannot be queried by it
+        self.assertEqual(result['changed'], False)
+        self.assertEqual(result['old_data'], START_IP_DHCP_SERVER_LEASE_OLD_DATA)
+        self.assertEqual(result['new_data'], START_IP_DHCP_SERVER_LEASE_OLD_DATA)
+
     @patch('ansible_collections.community.routeros.plugins.modules.api_modify.compose_api_path',
            new=create_fake_path(('ip', 'address'), START_IP_ADDRESS, read_only=True))
     def test_sync_primary_key_cru_check(self):
@@ -2134,3 +2777,474 @@ class TestRouterosApiModifyModule(ModuleTestCase):
         self.assertEqual(result['changed'], False)
         self.assertEqual(result['old_data'], START_INTERFACE_GRE_OLD_DATA)
         self.assertEqual(result['new_data'], START_INTERFACE_GRE_OLD_DATA)
+
+    @patch('ansible_collections.community.routeros.plugins.modules.api_modify.compose_api_path',
+           new=create_fake_path(('ip', 'firewall', 'filter'), START_IP_FIREWALL_FILTER + START_IP_FIREWALL_FILTER_FORWARD))
+    def test_sync_list_read_entries_data(self):
+        with self.assertRaises(AnsibleExitJson) as exc:
+            args = self.config_module_args.copy()
+            args.update({
+                'path': 'ip firewall filter',
+                'data': [
+                    {
+                        'chain': 'forward',
+                        'action': 'accept',
+                        'connection-state': 'established,related',
+                    },
+                    {
+                        'chain': 'forward',
+                        'action': 'accept',
+                        'protocol': 'icmp',
+                    },
+                ],
+                'read_entries': 'data',
+            })
+            with set_module_args(args):
+                self.module.main()
+
+        result = exc.exception.args[0]
+        self.assertEqual(result['changed'], True)
+        self.assertEqual(result['old_data'], START_IP_FIREWALL_FILTER_FORWARD_OLD_DATA)
+        self.assertEqual(result['new_data'], START_IP_FIREWALL_FILTER_FORWARD_OLD_DATA + [
+            {
+                '.id': '*NEW1',
+                'chain': 'forward',
+                'action': 'accept',
+                'protocol': 'icmp',
+                'disabled': False,
+                'log': False,
+                'log-prefix': '',
+            },
+        ])
+
+    @patch('ansible_collections.community.routeros.plugins.modules.api_modify.compose_api_path',
+           new=create_fake_path(('ip', 'firewall', 'filter'), START_IP_FIREWALL_FILTER + START_IP_FIREWALL_FILTER_FORWARD))
+    def test_sync_list_restrict_chain(self):
+        with self.assertRaises(AnsibleExitJson) as exc:
+            args = self.config_module_args.copy()
+            args.update({
+                'path': 'ip firewall filter',
+                'data': [
+                    {
+                        'chain': 'forward',
+                        'action': 'accept',
+                        'connection-state': 'established,related',
+                    },
+                ],
+                'handle_absent_entries': 'remove',
+                'handle_entries_content': 'remove',
+                'restrict': [
+                    {
+                        'field': 'chain',
+                        'values': ['forward'],
+                    },
+                ],
+            })
+            with set_module_args(args):
+                self.module.main()
+
+        result = exc.exception.args[0]
+        self.assertEqual(result['changed'], True)
+        self.assertEqual(result['old_data'], START_IP_FIREWALL_FILTER_FORWARD_OLD_DATA)
+        self.assertEqual(result['new_data'], START_IP_FIREWALL_FILTER_FORWARD_OLD_DATA[:1])
+
+    @patch('ansible_collections.community.routeros.tests.unit.plugins.modules.fake_api._matches_query', new=lambda entry, query: True)
+    def test_sync_list_restrict_chain_router_returns_more(self):
+        # The router ignores the query, for example since it compares values in another way;
+        # the entries of other chains must still not be removed
+        create_path = create_fake_path(('ip', 'firewall', 'filter'), START_IP_FIREWALL_FILTER + START_IP_FIREWALL_FILTER_FORWARD)
+        paths = []
+
+        def compose_api_path(api, path):
+            paths.append(create_path(api, path))
+            return paths[-1]
+
+        with patch('ansible_collections.community.routeros.plugins.modules.api_modify.compose_api_path', new=compose_api_path):
+            with self.assertRaises(AnsibleExitJson) as exc:
+                args = self.config_module_args.copy()
+                args.update({
+                    'path': 'ip firewall filter',
+                    'data': [
+                        {
+                            'chain': 'forward',
+                            'action': 'accept',
+                            'connection-state': 'established,related',
+                        },
+                    ],
+                    'handle_absent_entries': 'remove',
+                    'handle_entries_content': 'remove',
+                    'restrict': [
+                        {
+                            'field': 'chain',
+                            'values': ['forward'],
+                        },
+                    ],
+                })
+                with set_module_args(args):
+                    self.module.main()
+
+        result = exc.exception.args[0]
+        self.assertEqual(result['changed'], True)
+        self.assertEqual(result['old_data'], START_IP_FIREWALL_FILTER_FORWARD_OLD_DATA)
+        self.assertEqual(result['new_data'], START_IP_FIREWALL_FILTER_FORWARD_OLD_DATA[:1])
+        self.assertEqual([entry['.id'] for entry in paths[0]], ['*1', '*2', '*3', '*4', '*5'])
+
+    def test_sync_list_reorder_restrict(self):
+        # The entries of the input chain are followed by the ones of the forward chain
+        create_path = create_fake_path(('ip', 'firewall', 'filter'), START_IP_FIREWALL_FILTER + START_IP_FIREWALL_FILTER_FORWARD)
+        paths = []
+
+        def compose_api_path(api, path):
+            paths.append(create_path(api, path))
+            return paths[-1]
+
+        with patch('ansible_collections.community.routeros.plugins.modules.api_modify.compose_api_path', new=compose_api_path):
+            with self.assertRaises(AnsibleExitJson) as exc:
+                args = self.config_module_args.copy()
+                args.update({
+                    'path': 'ip firewall filter',
+                    'data': [
+                        {
+                            'chain': 'input',
+                            'action': 'drop',
+                            'connection-state': 'invalid',
+                        },
+                        {
+                            'chain': 'input',
+                            'action': 'accept',
+                            'protocol': 'icmp',
+                        },
+                        {
+                            'chain': 'input',
+                            'action': 'drop',
+                        },
+                        {
+                            'chain': 'input',
+                            'action': 'accept',
+                            'connection-state': 'established,related',
+                        },
+                    ],
+                    'handle_absent_entries': 'remove',
+                    'handle_entries_content': 'remove',
+                    'ensure_order': True,
+                    'restrict': [
+                        {
+                            'field': 'chain',
+                            'values': ['input'],
+                        },
+                    ],
+                })
+                with set_module_args(args):
+                    self.module.main()
+
+        result = exc.exception.args[0]
+        self.assertEqual(result['changed'], True)
+        self.assertEqual([entry['.id'] for entry in result['new_data']], ['*2', '*3', '*4', '*1'])
+        # The entries of the input chain must not be moved behind the ones of the forward chain
+        self.assertEqual([entry['.id'] for entry in paths[0]], ['*2', '*3', '*4', '*1', '*5', '*6'])
+
+    def test_sync_list_create_restrict(self):
+        # The entries of the input chain are followed by the ones of the forward chain
+        create_path = create_fake_path(('ip', 'firewall', 'filter'), START_IP_FIREWALL_FILTER + START_IP_FIREWALL_FILTER_FORWARD)
+        paths = []
+
+        def compose_api_path(api, path):
+            paths.append(create_path(api, path))
+            return paths[-1]
+
+        with patch('ansible_collections.community.routeros.plugins.modules.api_modify.compose_api_path', new=compose_api_path):
+            with self.assertRaises(AnsibleExitJson) as exc:
+                args = self.config_module_args.copy()
+                args.update({
+                    'path': 'ip firewall filter',
+                    'data': [
+                        {
+                            'chain': 'input',
+                            'action': 'accept',
+                            'connection-state': 'established,related',
+                        },
+                        {
+                            'chain': 'input',
+                            'action': 'drop',
+                            'connection-state': 'invalid',
+                        },
+                        {
+                            'chain': 'input',
+                            'action': 'accept',
+                            'protocol': 'icmp',
+                        },
+                        {
+                            'chain': 'input',
+                            'action': 'drop',
+                        },
+                        {
+                            'chain': 'input',
+                            'action': 'log',
+                        },
+                    ],
+                    'handle_absent_entries': 'remove',
+                    'handle_entries_content': 'remove',
+                    'ensure_order': True,
+                    'restrict': [
+                        {
+                            'field': 'chain',
+                            'values': ['input'],
+                        },
+                    ],
+                })
+                with set_module_args(args):
+                    self.module.main()
+
+        result = exc.exception.args[0]
+        self.assertEqual(result['changed'], True)
+        self.assertEqual([entry['.id'] for entry in result['new_data']], ['*1', '*2', '*3', '*4', '*NEW1'])
+        # The new last entry of the input chain must not be created behind the ones of the forward chain
+        self.assertEqual([entry['.id'] for entry in paths[0]], ['*1', '*2', '*3', '*4', '*NEW1', '*5', '*6'])
+
+    def test_sync_list_create_restrict_without_place_before(self):
+        create_path = create_fake_path(('ip', 'dns', 'static'), START_IP_DNS_STATIC)
+        paths = []
+
+        def compose_api_path(api, path):
+            paths.append(create_path(api, path))
+            return paths[-1]
+
+        with patch('ansible_collections.community.routeros.plugins.modules.api_modify.compose_api_path', new=compose_api_path):
+            with self.assertRaises(AnsibleExitJson) as exc:
+                args = self.config_module_args.copy()
+                args.update({
+                    'path': 'ip dns static',
+                    'data': [
+                        {
+                            'comment': 'defconf',
+                            'name': 'router',
+                            'address': '192.168.88.1',
+                        },
+                        {
+                            'name': 'router',
+                            'text': 'Router Text Entry',
+                        },
+                        {
+                            'name': 'router',
+                            'address': '192.168.88.3',
+                        },
+                    ],
+                    'handle_absent_entries': 'remove',
+                    'handle_entries_content': 'remove',
+                    'ensure_order': True,
+                    'restrict': [
+                        {
+                            'field': 'name',
+                            'values': ['router'],
+                        },
+                    ],
+                })
+                with set_module_args(args):
+                    self.module.main()
+
+        result = exc.exception.args[0]
+        self.assertEqual(result['changed'], True)
+        self.assertEqual([entry['.id'] for entry in result['new_data']], ['*1', '*A', '*NEW1'])
+        # The new entry is appended, and then moved in front of the entries that do not match the restrictions
+        self.assertEqual([entry['.id'] for entry in paths[0]], ['*1', '*A', '*NEW1', '*7', '*8', '*9'])
+
+    def test_invalid_read_entries(self):
+        with self.assertRaises(AnsibleFailJson) as exc:
+            args = self.config_module_args.copy()
+            args.update({
+                'path': 'ip firewall filter',
+                'data': [],
+                'handle_absent_entries': 'remove',
+                'handle_entries_content': 'remove',
+                'read_entries': 'data',
+            })
+            with set_module_args(args):
+                self.module.main()
+
+        result = exc.exception.args[0]
+        self.assertEqual(result['failed'], True)
+        self.assertEqual(result['msg'], 'read_entries=data requires handle_absent_entries=ignore')
+
+    @patch('ansible_collections.community.routeros.plugins.modules.api_modify.compose_api_path',
+           new=create_fake_path(('ip', 'firewall', 'filter'), START_IP_FIREWALL_FILTER))
+    def test_sync_list_reorder_place_before(self):
+        with self.assertRaises(AnsibleExitJson) as exc:
+            args = self.config_module_args.copy()
+            args.update({
+                'path': 'ip firewall filter',
+                'data': [
+                    {
+                        'chain': 'input',
+                        'action': 'accept',
+                        'connection-state': 'established,related',
+                    },
+                    {
+                        'chain': 'input',
+                        'action': 'accept',
+                        'protocol': 'tcp',
+                        'dst-port': '22',
+                    },
+                    {
+                        'chain': 'input',
+                        'action': 'accept',
+                        'protocol': 'icmp',
+                    },
+                    {
+                        'chain': 'input',
+                        'action': 'drop',
+                        'connection-state': 'invalid',
+                    },
+                    {
+                        'chain': 'input',
+                        'action': 'drop',
+                    },
+                ],
+                'handle_absent_entries': 'remove',
+                'handle_entries_content': 'remove',
+                'ensure_order': True,
+            })
+            with set_module_args(args):
+                self.module.main()
+
+        result = exc.exception.args[0]
+        self.assertEqual(result['changed'], True)
+        self.assertEqual(result['old_data'], START_IP_FIREWALL_FILTER_OLD_DATA)
+        self.assertEqual(result['new_data'], [
+            {
+                '.id': '*1',
+                'chain': 'input',
+                'action': 'accept',
+                'connection-state': 'established,related',
+                'disabled': False,
+                'log': False,
+                'log-prefix': '',
+            },
+            {
+                '.id': '*NEW1',
+                'chain': 'input',
+                'action': 'accept',
+                'protocol': 'tcp',
+                'dst-port': 22,
+                'disabled': False,
+                'log': False,
+                'log-prefix': '',
+            },
+            {
+                '.id': '*3',
+                'chain': 'input',
+                'action': 'accept',
+                'protocol': 'icmp',
+                'disabled': False,
+                'log': False,
+                'log-prefix': '',
+            },
+            {
+                '.id': '*2',
+                'chain': 'input',
+                'action': 'drop',
+                'connection-state': 'invalid',
+                'disabled': False,
+                'log': False,
+                'log-prefix': '',
+            },
+            {
+                '.id': '*4',
+                'chain': 'input',
+                'action': 'drop',
+                'disabled': False,
+                'log': False,
+                'log-prefix': '',
+            },
+        ])
+
+
+def test_count_modifications():
+    path_info = VersionedAPIData(
+        fully_understood=True,
+        fields={
+            'name': KeyInfo(),
+            'mtu': KeyInfo(default=1500),
+            'comment': KeyInfo(can_disable=True, remove_value=''),
+            'disabled': KeyInfo(default=False),
+            'arp': KeyInfo(can_disable=True, default='enabled'),
+            'note': KeyInfo(),
+        },
+    )
+    old_entries = [
+        {'.id': '*1', 'name': 'a', 'mtu': 1500, 'comment': 'x', 'disabled': False},
+        {'.id': '*2', 'name': 'a', 'note': 'foo'},
+        {'.id': '*3', 'name': 'b', 'mtu': 1400, 'arp': 'disabled', 'disabled': True},
+        {'.id': '*4'},
+    ]
+    new_entries = [
+        {'name': 'a', 'mtu': 1500, 'comment': 'x', 'disabled': False},
+        {'name': 'a', 'mtu': '1500', '!comment': None, 'disabled': 'no'},
+        {'name': 'b', 'comment': '', 'arp': None},
+        {'mtu': 1400, 'disabled': True, 'note': 'foo'},
+    ]
+    for handle_entries_content in ('ignore', 'remove', 'remove_as_much_as_possible'):
+        module = MagicMock()
+        module.params = {'handle_entries_content': handle_entries_content, 'handle_write_only': 'update'}
+        for old_entry in old_entries:
+            for new_entry in new_entries:
+                modifications, dummy = api_modify.find_modifications(
+                    old_entry, new_entry, path_info, module, return_none_instead_of_fail=True)
+                count = api_modify.count_modifications(
+                    old_entry, new_entry, path_info, module,
+                    api_modify.canonicalize_entry(old_entry, path_info), api_modify.canonicalize_entry(new_entry, path_info))
+                assert count == (None if modifications is None else len(modifications)), (old_entry, new_entry)
+
+
+def test_match_entries_saves_writes():
+    path_info = VersionedAPIData(
+        fully_understood=True,
+        fields={
+            'name': KeyInfo(),
+            'address': KeyInfo(),
+            'cname': KeyInfo(),
+        },
+    )
+    module = MagicMock()
+    module.params = {'handle_absent_entries': 'remove', 'handle_entries_content': 'remove', 'handle_write_only': 'update'}
+    new_entries = [
+        (0, {'name': 'c', 'address': '10.0.0.3'}),
+        (1, {'name': 'a', 'address': '10.0.0.1', 'cname': 'y'}),
+    ]
+    old_entries = [
+        (0, {'.id': '*1', 'name': 'a', 'address': '10.0.0.1'}),
+        (1, {'.id': '*2', 'name': 'b', 'address': '10.0.0.2', 'cname': 'x'}),
+    ]
+
+    def count_writes(assignment_limit):
+        matching, unmatched = api_modify.match_entries(new_entries, old_entries, path_info, module, assignment_limit=assignment_limit)
+        writes = len(unmatched)
+        for (dummy, new_entry), old_index_entry in zip(new_entries, matching):
+            if old_index_entry is None:
+                writes += 1
+            elif api_modify.find_modifications(old_index_entry[1], new_entry, path_info, module)[0]:
+                writes += 1
+        return writes
+
+    # The greedy matching (assignment_limit=0) pairs the cheapest pair first, and then has to add and remove an entry
+    assert count_writes(0) == 3
+    assert count_writes(api_modify.DEFAULT_ASSIGNMENT_LIMIT) == 2
+
+
+@pytest.mark.parametrize("chain_info, expected", [
+    (KeyInfo(), [(('chain', 'forward'), )]),
+    # The router leaves out the chain of entries that have the default or absent value, so they cannot be queried
+    (KeyInfo(default='forward'), None),
+    (KeyInfo(absent_value='forward'), None),
+])
+def test_get_read_selectors_stratify_keys(chain_info, expected):
+    path_info = VersionedAPIData(
+        fully_understood=True,
+        stratify_keys=('chain', ),
+        fields={
+            'chain': chain_info,
+            'action': KeyInfo(),
+        },
+    )
+    module = MagicMock()
+    module.params = {'read_entries': 'data'}
+    assert api_modify.get_read_selectors(module, None, path_info, None, ('chain', ), [('forward', )]) == expected
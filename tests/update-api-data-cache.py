@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2026, Felix Fontein (@felixfontein) <felix@fontein.de>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+'''
+Updates plugins/module_utils/_api_data_cache.py from the PATHS in module_utils._api_data.
+
+The cache contains every path as a compact JSON string. All strings are concatenated to one
+long string literal with an index of the paths, since that is a lot faster to compile than the
+whole PATHS literal, or than a dictionary with an entry for every path. Only the APIData objects
+of the paths that are used are created from the strings. All APIData objects are created (and thus
+validated) by this script before the cache is written.
+
+For the RouterOS release trains in SNAPSHOT_VERSIONS, the cache also stores which part of the
+API data applies. The modules use that to create the data for these versions directly, without
+evaluating the version conditions of the path at runtime.
+
+Finally, the cache contains the capabilities of all paths. The modules use them for the choices
+of their ``path`` option.
+'''
+
+import sys
+import typing as t
+
+from ansible_collections.community.routeros.plugins.module_utils._api_data import (
+    PATHS,
+)
+
+from ansible_collections.community.routeros.plugins.module_utils._api_data_base import (
+    dump_api_data,
+    dump_path_capabilities,
+    pack_path_texts,
+)
+
+from ansible_collections.community.routeros.plugins.module_utils.version import LooseVersion
+
+
+CACHE_FILE = 'plugins/module_utils/_api_data_cache.py'
+
+LINE_LENGTH = 140
+
+# The RouterOS release trains to create snapshots for
+SNAPSHOT_VERSIONS = ('7.15', '7.18', '7.21')
+
+HEADER = '''# -*- coding: utf-8 -*-
+# Copyright (c) 2026, Felix Fontein (@felixfontein) <felix@fontein.de>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# The data inside here is private to this collection. If you use this from outside the collection,
+# you are on your own. There can be random changes to its format even in bugfix releases!
+
+# This file is generated by tests/update-api-data-cache.py from the PATHS in _api_data.py.
+# DO NOT EDIT MANUALLY! Modify _api_data.py instead and run 'nox -Re update-docs'.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+from ansible_collections.community.routeros.plugins.module_utils._api_data_base import (
+    CachedPathDict,
+    load_path_capabilities,
+    unpack_path_texts,
+)
+
+'''
+
+
+def quote_chunks(text: str) -> list[str]:
+    chunks = []
+    current: list[str] = []
+    length = 0
+    for char in text:
+        if char in ('\\', "'"):
+            char = '\\' + char
+        if length + len(char) > LINE_LENGTH:
+            chunks.append("'{0}'".format(''.join(current)))
+            current = []
+            length = 0
+        current.append(char)
+        length += len(char)
+    chunks.append("'{0}'".format(''.join(current)))
+    return chunks
+
+
+def get_condition_versions() -> list[str]:
+    versions = set()
+    for api_data in PATHS.values():
+        for variant in (api_data.hardware_variants or {None: api_data}).values():
+            entries = [variant.unversioned]
+            for other_version, comparator, entry in variant.versioned or []:
+                if comparator != '*':
+                    versions.add(other_version)
+                entries.append(entry)
+            for entry in entries:
+                if entry is None or isinstance(entry, str):
+                    continue
+                for conditions, dummy, dummy in entry.versioned_fields:
+                    versions.update(other_version for other_version, dummy in conditions)
+    return sorted(versions, key=LooseVersion)
+
+
+def get_snapshot_ranges() -> list[tuple[str, t.Optional[str]]]:
+    """
+    Split the release trains into ranges without version conditions inside them.
+    The API data selected is the same for all versions of such a range.
+    """
+    condition_versions = get_condition_versions()
+    ranges = []
+    for train in SNAPSHOT_VERSIONS:
+        train_version = LooseVersion(train).version
+        start = train
+        end = None
+        for version in condition_versions:
+            parsed_version = LooseVersion(version).version
+            if parsed_version <= train_version:
+                continue
+            if parsed_version[:len(train_version)] != train_version:
+                end = version
+                break
+            ranges.append((start, version))
+            start = version
+        ranges.append((start, end))
+    # Conditions other than >= and < would select different data for the start of a range
+    # than for the versions after it
+    for api_data in PATHS.values():
+        for start, dummy in ranges:
+            if dump_api_data(api_data, [start]) != dump_api_data(api_data, [start + '.0']):
+                raise ValueError('Cannot create snapshot starting at {start}'.format(start=start))
+    return ranges
+
+
+def create_cache() -> str:
+    snapshots = get_snapshot_ranges()
+    index, data = pack_path_texts(dict(
+        (path, dump_api_data(api_data, [start for start, dummy in snapshots])) for path, api_data in PATHS.items()
+    ))
+    lines = [HEADER, 'PATHS = CachedPathDict(unpack_path_texts(', '    (']
+    lines.extend('        {chunk}'.format(chunk=chunk) for chunk in quote_chunks(index))
+    lines.extend(['    ),', '    ('])
+    lines.extend('        {chunk}'.format(chunk=chunk) for chunk in quote_chunks(data))
+    lines.extend(['    ),', '), snapshots=('])
+    for start, end in snapshots:
+        lines.append('    ({start!r}, {end!r}),'.format(start=start, end=end))
+    lines.append('))')
+    lines.append('')
+    lines.append('# List of (path, readable, backends) tuples, sorted by path')
+    lines.append('PATH_CAPABILITIES = load_path_capabilities(')
+    lines.extend('    {chunk}'.format(chunk=chunk) for chunk in quote_chunks(dump_path_capabilities(PATHS)))
+    lines.append(')')
+    return '\n'.join(lines) + '\n'
+
+
+def main(args: list[str]) -> int:
+    content = create_cache()
+    try:
+        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+            changed = f.read() != content
+    except FileNotFoundError:
+        changed = True
+    if not changed:
+        return 0
+
+    print(f'{CACHE_FILE} has been updated')
+    with open(CACHE_FILE, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+    if "--lint" in args:
+        print("Run 'nox -Re update-docs'!")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))